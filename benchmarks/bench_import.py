@@ -0,0 +1,70 @@
+"""Measure the startup time of tranqu.
+
+Each case runs in a fresh interpreter, so that nothing is already imported.
+The "all backends" case imports every built-in transpiler and converter,
+which is what `import tranqu` cost before backends were imported lazily.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+
+_ALL_BACKENDS = """
+import tranqu
+from tranqu import device_converter, program_converter, transpiler
+tranqu.Tranqu()
+for package in (device_converter, program_converter, transpiler):
+    for name in package.__all__:
+        getattr(package, name)
+"""
+
+CASES = {
+    "import tranqu": "import tranqu",
+    "Tranqu()": "import tranqu; tranqu.Tranqu()",
+    "Tranqu() + qiskit transpiler": (
+        "import tranqu; tranqu.Tranqu(); from tranqu.transpiler import QiskitTranspiler"
+    ),
+    "Tranqu() + all backends": _ALL_BACKENDS,
+}
+
+
+def measure(code: str, repeat: int) -> list[float]:
+    """Run code in new interpreters and return the wall-clock times.
+
+    Returns:
+        list[float]: The time of each run in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    """Print the median and minimum startup time of each case."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("pass", args.repeat))
+    print(f"{'case':<32} {'median':>9} {'min':>9}")  # noqa: T201
+    print(f"{'(empty interpreter)':<32} {baseline:>8.3f}s")  # noqa: T201
+    for name, code in CASES.items():
+        times = measure(code, args.repeat)
+        print(  # noqa: T201
+            f"{name:<32} {statistics.median(times):>8.3f}s {min(times):>8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compare ways of producing bound circuits of a parametric ansatz.
+
+Each case builds a hardware-efficient ansatz with RY and RZ layers and CX
+ladders, transpiles it for a 27-qubit generic device and measures the number
+of bound circuits produced per second by:
+
+- transpiling every bound circuit with `Tranqu.transpile()`,
+- binding the transpiled template with `QuantumCircuit.assign_parameters()`,
+- `ParametricResult.bind()` one set of values at a time,
+- `ParametricResult.bind_many()` for all sets of values at once.
+
+Usage:
+    python benchmarks/bench_parametric.py [--sizes 5x2,20x4] [--circuits N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.circuit import ParameterVector  # type: ignore[import-untyped]
+from qiskit.providers.fake_provider import (  # type: ignore[import-untyped]
+    GenericBackendV2,
+)
+
+from tranqu import Tranqu
+
+DEFAULT_SIZES = ((5, 2), (20, 4))
+# Re-transpiling is slow, so it only produces a few circuits
+TRANSPILED_CIRCUITS = 10
+
+
+def ansatz(n_qubits: int, n_layers: int) -> QuantumCircuit:
+    """Build a hardware-efficient ansatz with two rotation angles per qubit and layer.
+
+    Returns:
+        QuantumCircuit: The circuit.
+
+    """
+    theta = ParameterVector("theta", 2 * n_qubits * n_layers)
+    circuit = QuantumCircuit(n_qubits, n_qubits)
+    angles = iter(theta)
+    for _ in range(n_layers):
+        for qubit in range(n_qubits):
+            circuit.ry(next(angles), qubit)
+            circuit.rz(next(angles), qubit)
+        for qubit in range(n_qubits - 1):
+            circuit.cx(qubit, qubit + 1)
+    circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def report(method: str, n_circuits: int, seconds: float) -> None:
+    """Print the number of circuits per second of a method."""
+    print(f"  {method:<18}{n_circuits / seconds:>10,.0f}/s")  # noqa: T201
+
+
+def run_case(tranqu: Tranqu, size: tuple[int, int], n_circuits: int) -> None:
+    """Measure and print the rates of one ansatz size."""
+    circuit = ansatz(*size)
+    device = GenericBackendV2(27, seed=0)
+    values = np.random.default_rng(0).uniform(
+        -np.pi, np.pi, (n_circuits, circuit.num_parameters)
+    )
+    parametric = tranqu.transpile_parametric(
+        circuit, transpiler_lib="qiskit", device=device
+    )
+    template = parametric.transpiled_program
+    print(  # noqa: T201
+        f"{size[0]} qubits x {size[1]} layers, {circuit.num_parameters} parameters:"
+    )
+
+    start = time.perf_counter()
+    for row in values[:TRANSPILED_CIRCUITS]:
+        tranqu.transpile(
+            circuit.assign_parameters(row), transpiler_lib="qiskit", device=device
+        )
+    report("transpile", TRANSPILED_CIRCUITS, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for row in values:
+        template.assign_parameters(dict(zip(circuit.parameters, row, strict=True)))
+    report("assign_parameters", n_circuits, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for row in values:
+        parametric.bind(row)
+    report("bind", n_circuits, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    parametric.bind_many(values)
+    report("bind_many", n_circuits, time.perf_counter() - start)
+
+
+def parse_size(size: str) -> tuple[int, int]:
+    """Parse a QUBITSxLAYERS pair, e.g., "5x2".
+
+    Returns:
+        tuple[int, int]: The number of qubits and the number of layers.
+
+    """
+    n_qubits, n_layers = size.split("x")
+    return int(n_qubits), int(n_layers)
+
+
+def main() -> None:
+    """Parse the arguments and run every case."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        help="comma-separated QUBITSxLAYERS pairs, e.g., 5x2,20x4",
+    )
+    parser.add_argument("--circuits", type=int, default=1_000)
+    args = parser.parse_args()
+
+    sizes: tuple[tuple[int, int], ...] = DEFAULT_SIZES
+    if args.sizes:
+        sizes = tuple(parse_size(size) for size in args.sizes.split(","))
+
+    tranqu = Tranqu()
+    for size in sizes:
+        run_case(tranqu, size, args.circuits)
+
+
+if __name__ == "__main__":
+    main()
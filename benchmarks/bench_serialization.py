@@ -0,0 +1,127 @@
+"""Compare the serialization of `TranspileResult` with pickle.
+
+Each case transpiles a random circuit with the Qiskit transpiler and measures
+the size of the serialized result and the median time of a round trip,
+i.e., serializing and deserializing it, with pickle, `to_bytes()` and
+`to_json()` in each wire format.
+
+Usage:
+    python benchmarks/bench_serialization.py [--sizes 5x100,20x1000] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle  # noqa: S403
+import random
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu import Tranqu, TranspileResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SIZES = ((5, 100), (20, 1_000), (100, 10_000))
+
+
+def random_circuit(n_qubits: int, n_gates: int, seed: int = 0) -> QuantumCircuit:
+    """Build a random circuit of H, RZ and CX gates followed by measurements.
+
+    Returns:
+        QuantumCircuit: The circuit.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    circuit = QuantumCircuit(n_qubits, n_qubits)
+    for _ in range(n_gates):
+        if rng.random() < 0.3:  # noqa: PLR2004
+            control, target = rng.sample(range(n_qubits), 2)
+            circuit.cx(control, target)
+        elif rng.random() < 0.5:  # noqa: PLR2004
+            circuit.h(rng.randrange(n_qubits))
+        else:
+            circuit.rz(rng.random(), rng.randrange(n_qubits))
+    circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def codecs() -> dict[str, tuple[Callable, Callable]]:
+    """Return the serialization functions to compare, keyed by name.
+
+    Returns:
+        dict[str, tuple[Callable, Callable]]: The serialize and deserialize
+            functions of each codec.
+
+    """
+    return {
+        "pickle": (pickle.dumps, pickle.loads),  # noqa: S301
+        "to_bytes (qpy)": (TranspileResult.to_bytes, TranspileResult.from_bytes),
+        "to_bytes (openqasm3)": (
+            lambda result: result.to_bytes("openqasm3"),
+            TranspileResult.from_bytes,
+        ),
+        "to_json (qpy)": (TranspileResult.to_json, TranspileResult.from_json),
+        "to_json (openqasm3)": (
+            lambda result: result.to_json("openqasm3"),
+            TranspileResult.from_json,
+        ),
+    }
+
+
+def measure(
+    result: TranspileResult,
+    serialize: Callable,
+    deserialize: Callable,
+    repeat: int,
+) -> tuple[int, float]:
+    """Measure the size and the median round trip time of one codec.
+
+    Returns:
+        tuple[int, float]: The size in bytes and the time in seconds.
+
+    """
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = serialize(result)
+        deserialize(data)
+        times.append(time.perf_counter() - start)
+        size = len(data)
+    return size, statistics.median(times)
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: tuple(
+            tuple(int(part) for part in size.lower().split("x"))
+            for size in value.split(",")
+        ),
+        default=DEFAULT_SIZES,
+        help="Circuit sizes as QUBITSxGATES, separated by commas",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tranqu = Tranqu()
+    print(f"{'case':<18} {'codec':<22} {'size':>10} {'round trip':>12}")  # noqa: T201
+    for n_qubits, n_gates in args.sizes:
+        result = tranqu.transpile(random_circuit(n_qubits, n_gates), "qiskit", "qiskit")
+        result.stats.to_dict()
+        for name, (serialize, deserialize) in codecs().items():
+            size, seconds = measure(result, serialize, deserialize, args.repeat)
+            print(  # noqa: T201
+                f"{n_qubits}q{n_gates}g".ljust(18),
+                f"{name:<22} {size:>10,} {seconds * 1e3:>10.2f}ms",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Benchmark `Tranqu.transpile()` over transpilers, program formats and devices.
+
+Each case transpiles a synthetic circuit and reports the median wall-clock and
+CPU time of every stage, as recorded in `TranspileResult.timings` and
+`TranspileResult.cpu_timings`, and the peak memory allocated through Python
+during one extra run under `tracemalloc`. Memory that a backend allocates
+outside the Python allocator, e.g., in Rust or C++, is not included.
+
+Cases that fail, e.g., because the ouqu-tp binary is not installed, are reported
+with their error and skipped when comparing.
+
+Usage:
+    # Run the default grid and save a baseline
+    python benchmarks/bench_transpile.py --output .benchmarks/baseline.json
+
+    # Run again and report cases that became slower than the baseline
+    python benchmarks/bench_transpile.py --compare .benchmarks/baseline.json
+
+    # Run a part of the full grid, up to 1000 qubits and 10^6 gates
+    python benchmarks/bench_transpile.py --full --transpiler qiskit --device-lib none
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import version
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.providers.fake_provider import (  # type: ignore[import-untyped]
+    GenericBackendV2,
+)
+from qiskit.transpiler import CouplingMap  # type: ignore[import-untyped]
+
+from tranqu import Tranqu
+from tranqu.program_converter import (
+    QiskitToOpenqasm3ProgramConverter,
+    QiskitToTketProgramConverter,
+)
+
+TRANSPILERS = ("qiskit", "tket", "ouqu-tp")
+PROGRAM_LIBS = ("qiskit", "tket", "openqasm3")
+DEVICE_LIBS = ("none", "qiskit", "oqtopus")
+DEFAULT_SIZES = ((5, 100), (20, 1_000), (100, 10_000))
+FULL_SIZES = (*DEFAULT_SIZES, (500, 100_000), (1_000, 1_000_000))
+
+# Stages shorter than this are too noisy to compare
+MIN_COMPARED_SECONDS = 1e-3
+
+
+@dataclass
+class CaseResult:
+    """The measurements of one benchmark case."""
+
+    transpiler: str
+    program_lib: str
+    device_lib: str
+    n_qubits: int
+    n_gates: int
+    total: float | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    cpu_timings: dict[str, float] = field(default_factory=dict)
+    peak_memory: int | None = None
+    error: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Returns the identifier of the case, used to match baselines."""
+        return (
+            f"{self.transpiler}/{self.program_lib}/{self.device_lib}/"
+            f"{self.n_qubits}q{self.n_gates}g"
+        )
+
+
+def synthetic_circuit(n_qubits: int, n_gates: int, seed: int = 0) -> QuantumCircuit:
+    """Build a random circuit of 1-qubit and CX gates followed by measurements.
+
+    Returns:
+        QuantumCircuit: The circuit.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    circuit = QuantumCircuit(n_qubits, n_qubits)
+    for _ in range(n_gates):
+        if n_qubits > 1 and rng.random() < 0.3:  # noqa: PLR2004
+            control, target = rng.sample(range(n_qubits), 2)
+            circuit.cx(control, target)
+            continue
+        qubit = rng.randrange(n_qubits)
+        gate = rng.choice(("h", "sx", "rz"))
+        if gate == "rz":
+            circuit.rz(rng.uniform(0, math.pi), qubit)
+        else:
+            getattr(circuit, gate)(qubit)
+    circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def program_in(program_lib: str, circuit: QuantumCircuit) -> Any:  # noqa: ANN401
+    """Convert the circuit to the program format of the case.
+
+    Returns:
+        Any: The program.
+
+    """
+    if program_lib == "openqasm3":
+        return QiskitToOpenqasm3ProgramConverter().convert(circuit)
+    if program_lib == "tket":
+        return QiskitToTketProgramConverter().convert(circuit)
+    return circuit
+
+
+def device_in(device_lib: str, n_qubits: int) -> Any | None:  # noqa: ANN401
+    """Build a device with a line of qubits in the device format of the case.
+
+    Returns:
+        Any | None: The device, or None for the case without a device.
+
+    """
+    if device_lib == "qiskit":
+        return GenericBackendV2(
+            num_qubits=n_qubits,
+            coupling_map=CouplingMap.from_line(n_qubits),
+            seed=0,
+        )
+    if device_lib == "oqtopus":
+        return {
+            "device_id": f"line_{n_qubits}",
+            "qubits": [
+                {
+                    "id": qubit,
+                    "fidelity": 0.999,
+                    "meas_error": {"prob_meas1_prep0": 0.01, "prob_meas0_prep1": 0.02},
+                    "gate_duration": {"x": 60.0, "sx": 30.0, "rz": 0},
+                }
+                for qubit in range(n_qubits)
+            ],
+            "couplings": [
+                {
+                    "control": qubit,
+                    "target": qubit + 1,
+                    "fidelity": 0.99,
+                    "gate_duration": {"cx": 300.0},
+                }
+                for qubit in range(n_qubits - 1)
+            ],
+        }
+    return None
+
+
+def run_case(case: CaseResult, repeat: int, *, measure_memory: bool) -> None:
+    """Run one case and store its measurements in it."""
+    circuit = synthetic_circuit(case.n_qubits, case.n_gates)
+    program = program_in(case.program_lib, circuit)
+    device = device_in(case.device_lib, case.n_qubits)
+    # Devices are converted on every run so that conversion is measured
+    tranqu = Tranqu(device_cache_size=0)
+
+    def transpile() -> Any:  # noqa: ANN401
+        result = tranqu.transpile(
+            program,
+            program_lib=case.program_lib,
+            transpiler_lib=case.transpiler,
+            device=device,
+            device_lib=None if device is None else case.device_lib,
+        )
+        result.stats.to_dict()
+        return result
+
+    try:
+        # The first run imports the backends and is not measured
+        transpile()
+        totals: list[float] = []
+        timings: list[dict[str, float]] = []
+        cpu_timings: list[dict[str, float]] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = transpile()
+            totals.append(time.perf_counter() - start)
+            timings.append(result.timings)
+            cpu_timings.append(result.cpu_timings)
+
+        if measure_memory:
+            tracemalloc.start()
+            try:
+                transpile()
+                case.peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as error:  # noqa: BLE001
+        case.error = f"{type(error).__name__}: {error}"
+        return
+
+    case.total = statistics.median(totals)
+    case.timings = _median_by_stage(timings)
+    case.cpu_timings = _median_by_stage(cpu_timings)
+
+
+def compare(
+    results: list[CaseResult], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Find cases and stages that became slower than in the baseline.
+
+    Returns:
+        list[str]: A description of each regression.
+
+    """
+    baseline_cases = {
+        _case_name(case): case for case in baseline["results"] if not case["error"]
+    }
+    regressions = []
+    for case in results:
+        previous = baseline_cases.get(case.name)
+        if previous is None or case.error is not None:
+            continue
+
+        measured = {"total": case.total, **case.timings}
+        expected = {"total": previous["total"], **previous["timings"]}
+        for stage, seconds in measured.items():
+            previous_seconds = expected.get(stage)
+            if (
+                seconds is None
+                or previous_seconds is None
+                or previous_seconds < MIN_COMPARED_SECONDS
+            ):
+                continue
+            ratio = seconds / previous_seconds
+            if ratio > threshold:
+                regressions.append(
+                    f"{case.name} {stage}: {previous_seconds * 1e3:.2f} ms -> "
+                    f"{seconds * 1e3:.2f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark grid and print, save or compare the results."""
+    args = _parse_args()
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    cases = [
+        CaseResult(transpiler, program_lib, device_lib, n_qubits, n_gates)
+        for (n_qubits, n_gates), transpiler, program_lib, device_lib in product(
+            sizes,
+            args.transpiler or TRANSPILERS,
+            args.program_lib or PROGRAM_LIBS,
+            args.device_lib or DEVICE_LIBS,
+        )
+    ]
+
+    for case in cases:
+        run_case(case, args.repeat, measure_memory=not args.no_memory)
+        _print_case(case)
+
+    output = {"metadata": _metadata(args), "results": [asdict(c) for c in cases]}
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(output, indent=2), encoding="utf-8")
+        print(f"Saved {len(cases)} cases to {args.output}")  # noqa: T201
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(cases, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")  # noqa: T201
+        if regressions:
+            sys.exit(1)
+        print(f"No stage is more than {args.threshold}x slower than the baseline.")  # noqa: T201
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transpiler", action="append", choices=TRANSPILERS)
+    parser.add_argument("--program-lib", action="append", choices=PROGRAM_LIBS)
+    parser.add_argument("--device-lib", action="append", choices=DEVICE_LIBS)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        help="Circuit sizes as QUBITSxGATES, separated by commas, e.g., 5x100,20x1000",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Include 500 and 1000 qubit circuits"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the peak memory run"
+    )
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="A JSON baseline to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Report stages slower than the baseline by this factor",
+    )
+    return parser.parse_args()
+
+
+def _parse_sizes(value: str) -> tuple[tuple[int, int], ...]:
+    sizes = []
+    for size in value.split(","):
+        n_qubits, n_gates = size.lower().split("x")
+        sizes.append((int(n_qubits), int(n_gates)))
+    return tuple(sizes)
+
+
+def _median_by_stage(timings: list[dict[str, float]]) -> dict[str, float]:
+    stages = {stage for stage_timings in timings for stage in stage_timings}
+    return {
+        stage: statistics.median(t.get(stage, 0.0) for t in timings)
+        for stage in sorted(stages)
+    }
+
+
+def _case_name(case: dict[str, Any]) -> str:
+    return CaseResult(
+        case["transpiler"],
+        case["program_lib"],
+        case["device_lib"],
+        case["n_qubits"],
+        case["n_gates"],
+    ).name
+
+
+def _metadata(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "versions": {
+            package: version(package)
+            for package in ("tranqu", "qiskit", "pytket", "pytket-qiskit", "ouqu-tp")
+        },
+    }
+
+
+def _print_case(case: CaseResult) -> None:
+    if case.error is not None:
+        print(f"{case.name:<40} ERROR {case.error[:80]}")  # noqa: T201
+        return
+
+    stages = " ".join(
+        f"{stage}={seconds * 1e3:.1f}/{case.cpu_timings.get(stage, 0.0) * 1e3:.1f}"
+        for stage, seconds in case.timings.items()
+    )
+    memory = "" if case.peak_memory is None else f" peak={case.peak_memory >> 10}KiB"
+    print(  # noqa: T201
+        f"{case.name:<40} total={(case.total or 0.0) * 1e3:.1f}ms{memory} "
+        f"[wall/cpu ms] {stages}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,38 @@
 from importlib.metadata import version
 
+from .openqasm3_io import read_openqasm3, write_openqasm3
+from .parametric import ParametricResult
+from .portfolio import Candidate, PortfolioEntry, PortfolioResult
+from .result_codec import read_results_jsonl, write_results_jsonl
 from .tranqu import Tranqu
 from .tranqu_error import TranquError
+from .transpile_cache import (
+    DiskTranspileCache,
+    InMemoryTranspileCache,
+    TranspileCache,
+)
+from .transpile_observer import StageTiming, TranspileContext, TranspileObserver
 from .transpile_result import TranspileResult
+from .worker_pool import TranquWorkerPool
 
-__all__ = ["Tranqu", "TranquError", "TranspileResult"]
+__all__ = [
+    "Candidate",
+    "DiskTranspileCache",
+    "InMemoryTranspileCache",
+    "ParametricResult",
+    "PortfolioEntry",
+    "PortfolioResult",
+    "StageTiming",
+    "Tranqu",
+    "TranquError",
+    "TranquWorkerPool",
+    "TranspileCache",
+    "TranspileContext",
+    "TranspileObserver",
+    "TranspileResult",
+    "read_openqasm3",
+    "read_results_jsonl",
+    "write_openqasm3",
+    "write_results_jsonl",
+]
 __version__ = version("tranqu")
@@ -0,0 +1,211 @@
+"""Provides the executor behind the asyncio methods of `Tranqu`.
+
+Transpilation is CPU-bound and blocking, so `Tranqu.transpile_async()` and
+`Tranqu.transpile_as_completed()` hand each request to a thread pool owned by
+the Tranqu instance and await the result without blocking the event loop.
+
+A request that has not started when it is cancelled or times out is removed
+from the pool. A request that is already running cannot be interrupted: it
+runs to completion in its worker thread and its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .tranqu_error import TranquError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+_T = TypeVar("_T")
+
+
+class AsyncTranspileError(TranquError):
+    """Base exception for errors related to asynchronous transpilation."""
+
+
+class TranspileTimeoutError(AsyncTranspileError, TimeoutError):
+    """Raised when a transpilation does not finish within its timeout."""
+
+
+class InvalidConcurrencyError(AsyncTranspileError):
+    """Raised when a concurrency limit or a worker count is less than 1."""
+
+
+class AsyncTranspileExecutor:
+    """Runs blocking transpilation calls on a thread pool for asyncio callers.
+
+    The pool is created on first use and can be shut down with `shutdown()`,
+    after which the next call creates a new one.
+
+    Args:
+        max_workers (int | None): The number of worker threads, which limits
+            how many transpilations run at the same time across all callers.
+            If None, the default of `ThreadPoolExecutor` is used.
+
+    Raises:
+        InvalidConcurrencyError: If max_workers is less than 1.
+
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        _validate_limit("max_workers", max_workers)
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """Returns the number of worker threads.
+
+        Returns:
+            int: The number of worker threads.
+
+        """
+        return self._max_workers
+
+    async def run(
+        self,
+        func: Callable[[], _T],
+        *,
+        timeout: float | None = None,
+    ) -> _T:
+        """Run a blocking function on the pool and await its result.
+
+        Args:
+            func (Callable[[], _T]): The function to run.
+            timeout (float | None): The number of seconds to wait, including
+                the time spent waiting for a free worker. If None, there is
+                no limit.
+
+        Returns:
+            _T: The return value of the function.
+
+        Raises:
+            TranspileTimeoutError: If the function does not finish in time.
+
+        """
+        future = asyncio.get_running_loop().run_in_executor(self._get_pool(), func)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as error:
+            msg = f"Transpilation did not finish within {timeout} seconds."
+            raise TranspileTimeoutError(msg) from error
+
+    async def as_completed(
+        self,
+        funcs: Iterable[Callable[[], _T]],
+        *,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, _T]]:
+        """Run blocking functions on the pool and yield results as they finish.
+
+        Functions are taken from `funcs` only as running ones finish, so that
+        a long iterable is not submitted at once. A max_concurrency less than 1
+        raises `InvalidConcurrencyError`. If a function raises or
+        times out, the error is raised from the iterator and the functions
+        that are still pending are cancelled, as they are when the iterator
+        is closed early.
+
+        Args:
+            funcs (Iterable[Callable[[], _T]]): The functions to run.
+            timeout (float | None): The number of seconds to wait for each
+                function. If None, there is no limit.
+            max_concurrency (int | None): The maximum number of functions
+                submitted at the same time. If None, the number of workers.
+
+        Yields:
+            tuple[int, _T]: The position of the function in `funcs` and
+                its return value, in order of completion.
+
+        """
+        _validate_limit("max_concurrency", max_concurrency)
+        limit = max_concurrency or self._max_workers
+
+        async def run_indexed(index: int, func: Callable[[], _T]) -> tuple[int, _T]:
+            return index, await self.run(func, timeout=timeout)
+
+        pending: set[asyncio.Future[tuple[int, _T]]] = set()
+        try:
+            for index, func in enumerate(funcs):
+                pending.add(asyncio.ensure_future(run_indexed(index, func)))
+                while len(pending) >= limit:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for result in _results_in_order(done):
+                        yield result
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for result in _results_in_order(done):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down the pool.
+
+        Args:
+            wait (bool): Whether to wait for running functions to finish.
+                Defaults to True.
+
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the pool or the lock.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        return {"max_workers": self._max_workers}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore an executor from a pickled state.
+
+        Args:
+            state (dict[str, Any]): The pickled state.
+
+        """
+        self._max_workers = state["max_workers"]
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="tranqu-async",
+                )
+            return self._pool
+
+
+def _results_in_order(
+    done: set[asyncio.Future[tuple[int, _T]]],
+) -> list[tuple[int, _T]]:
+    # Results that finish together are yielded in input order
+    return sorted((task.result() for task in done), key=itemgetter(0))
+
+
+def _validate_limit(name: str, value: int | None) -> None:
+    if value is not None and value < 1:
+        msg = f"{name} must be at least 1, got {value}."
+        raise InvalidConcurrencyError(msg)
@@ -0,0 +1,314 @@
+"""Provides deduplication of the programs of a batch transpilation.
+
+`Tranqu.transpile_many()` with `dedup` transpiles each distinct program once and
+fans the results back out to the inputs, in input order:
+
+- "identical": Programs with the same content, including the global phase,
+  and the same options and device are transpiled once. The content is
+  identified by the fingerprint that the transpile cache uses. Each of them
+  gets a shallow copy of the result, which shares the statistics and mapping
+  but has its own program reference, so releasing the program of one does
+  not affect the others.
+- "structure": In addition, Qiskit circuits that differ only in the angles of
+  their gates, as in a parameter sweep, are transpiled once as a template in
+  which every angle and the global phase are `Parameter`s. The values of each
+  circuit are then bound into the transpiled template. The results of a
+  template share its statistics and mapping.
+
+Templates need a transpiler that supports parameters, such as Qiskit's, that
+takes Qiskit circuits without conversion and returns a Qiskit circuit or no
+program. Otherwise, programs are only deduplicated when they are identical.
+A template is transpiled without its values, so optimizations that depend on
+particular values, e.g., removing rotations by zero, do not apply. The bound
+circuits then have the gates of the template, and their statistics are those
+of the template. They can have more gates than a transpilation of a single
+circuit, e.g., of a point of a sweep where an angle is zero. A circuit that no
+other circuit shares a template with is transpiled as it is.
+
+Example:
+    To transpile a sweep of 1,000 angles with a single Qiskit transpilation:
+
+        results = tranqu.transpile_many(
+            [ansatz(theta) for theta in np.linspace(0, np.pi, 1_000)],
+            transpiler_lib="qiskit",
+            device=FakeSantiagoV2(),
+            dedup="structure",
+        )
+
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from numbers import Real
+from typing import TYPE_CHECKING, Any
+
+from .batch_executor import BatchError, BatchItem
+from .fingerprint import FingerprintError, fingerprint
+from .lazy_import import loaded_attribute
+from .transpile_result import TranspileResult
+from .transpiler_dispatcher import OUTPUT_LIB_INPUT, OUTPUT_LIB_NATIVE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+
+DEDUP_IDENTICAL = "identical"
+DEDUP_STRUCTURE = "structure"
+DEDUP_MODES = (DEDUP_IDENTICAL, DEDUP_STRUCTURE)
+
+_QISKIT_LIB = "qiskit"
+_PARAMETER_PREFIX = "tranqu_value_"
+_GLOBAL_PHASE = f"{_PARAMETER_PREFIX}global_phase"
+
+
+class UnknownDedupModeError(BatchError):
+    """Raised when an unsupported deduplication mode is specified."""
+
+
+def validate_dedup(mode: str | None) -> None:
+    """Check that a deduplication mode is supported.
+
+    Args:
+        mode (str | None): None, "identical" or "structure".
+
+    Raises:
+        UnknownDedupModeError: If the mode is not supported.
+
+    """
+    if mode is not None and mode not in DEDUP_MODES:
+        msg = f"Unknown dedup mode: {mode}. Please specify one of {DEDUP_MODES}."
+        raise UnknownDedupModeError(msg)
+
+
+def supports_templates(
+    transpiler: Any,  # noqa: ANN401
+    program_lib: str | None,
+    output_lib: str | None,
+) -> bool:
+    """Check whether templates can be transpiled and bound for a batch.
+
+    Args:
+        transpiler (Any): The transpiler of the batch.
+        program_lib (str | None): The library of the programs, if given.
+        output_lib (str | None): The library of the returned programs.
+
+    Returns:
+        bool: True if the transpiler supports parameters and both takes and
+            returns Qiskit circuits, or returns no program.
+
+    """
+    return (
+        getattr(transpiler, "supports_parameters", False)
+        and getattr(transpiler, "program_lib", None) == _QISKIT_LIB
+        and program_lib in {None, _QISKIT_LIB}
+        and output_lib in {None, OUTPUT_LIB_INPUT, OUTPUT_LIB_NATIVE, _QISKIT_LIB}
+    )
+
+
+@dataclass(frozen=True)
+class _Slot:
+    """Where the result of one input comes from.
+
+    Args:
+        item (int): The index of the transpiled item.
+        values (dict[str, float] | None): The values to bind into the result
+            of a template, or None if the result is used as it is.
+
+    """
+
+    item: int
+    values: dict[str, float] | None = None
+
+
+class DedupPlan:
+    """The distinct items of a batch and how their results map to the inputs.
+
+    Args:
+        items (list[BatchItem]): The items to transpile.
+        slots (list[_Slot]): The source of the result of each input.
+
+    """
+
+    def __init__(self, items: list[BatchItem], slots: list[_Slot]) -> None:
+        self.items = items
+        self._slots = slots
+
+    def fan_out(self, results: Sequence[TranspileResult]) -> list[TranspileResult]:
+        """Return the result of each input, binding the values of templates.
+
+        Args:
+            results (Sequence[TranspileResult]): The results of `items`, in order.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as the inputs.
+                Inputs that share a result get a shallow copy each.
+
+        """
+        group_sizes = [0] * len(self.items)
+        for slot in self._slots:
+            group_sizes[slot.item] += 1
+
+        return [
+            _share(results[slot.item], group_sizes[slot.item])
+            if slot.values is None
+            else _bind(results[slot.item], slot.values, group_sizes[slot.item])
+            for slot in self._slots
+        ]
+
+
+def plan_dedup(
+    items: Sequence[BatchItem],
+    identify: Callable[[Any], tuple[Any, str | None]],
+    *,
+    mode: str,
+    templates: bool,
+) -> DedupPlan:
+    """Group the items of a batch by their content.
+
+    Args:
+        items (Sequence[BatchItem]): The items of the batch.
+        identify (Callable[[Any], tuple[Any, str | None]]): Reads a program and
+            returns it with its fingerprint, or None if it has none.
+        mode (str): "identical" or "structure".
+        templates (bool): Whether the transpiler can transpile templates and
+            return Qiskit circuits to bind them into. Ignored unless `mode` is
+            "structure".
+
+    Returns:
+        DedupPlan: The distinct items and the source of each result.
+
+    """
+    # A program cannot be a circuit of a library that has not been imported
+    quantum_circuit = None
+    if mode == DEDUP_STRUCTURE and templates:
+        quantum_circuit = loaded_attribute("qiskit", "QuantumCircuit")
+
+    # Inputs are grouped first, so that single circuits are not templated
+    groups: dict[Any, list[int]] = {}
+    keys: list[Any] = []
+    programs: list[Any] = []
+    values: list[dict[str, float] | None] = []
+    for index, item in enumerate(items):
+        program, key, bound = item.program, None, None
+        if quantum_circuit is not None and isinstance(program, quantum_circuit):
+            program, bound = parametrize_circuit(program)
+        program, program_key = identify(program)
+        setting_key = _setting_key(item)
+        if program_key is not None and setting_key is not None:
+            key = (program_key, setting_key)
+            groups.setdefault(key, []).append(index)
+        keys.append(key)
+        programs.append(program)
+        values.append(bound)
+
+    unique_items: list[BatchItem] = []
+    slots: list[_Slot] = []
+    first_items: dict[Any, int] = {}
+    for index, item in enumerate(items):
+        key = keys[index]
+        is_template = values[index] is not None
+        if key is not None and key in first_items:
+            slots.append(_Slot(first_items[key], values[index]))
+            continue
+        if is_template and (key is None or len(groups[key]) == 1):
+            # A template is only worth transpiling for several circuits
+            unique_items.append(item)
+            slots.append(_Slot(len(unique_items) - 1))
+            continue
+        if key is not None:
+            first_items[key] = len(unique_items)
+        unique_items.append(replace(item, program=programs[index]))
+        slots.append(_Slot(len(unique_items) - 1, values[index]))
+
+    return DedupPlan(unique_items, slots)
+
+
+def parametrize_circuit(circuit: Any) -> tuple[Any, dict[str, float]]:  # noqa: ANN401
+    """Replace the angles of the standard gates of a Qiskit circuit by parameters.
+
+    The parameters are named by their position, so circuits that differ only
+    in their angles have equal templates. The global phase is a parameter too.
+
+    Args:
+        circuit (QuantumCircuit): The circuit.
+
+    Returns:
+        tuple[QuantumCircuit, dict[str, float]]: The template and the value of
+            each of its new parameters, keyed by name.
+
+    """
+    from qiskit.circuit import (  # type: ignore[import-untyped]  # noqa: PLC0415
+        Parameter,
+    )
+
+    values: dict[str, float] = {}
+    template = circuit.copy_empty_like()
+    if isinstance(circuit.global_phase, Real):
+        template.global_phase = Parameter(_GLOBAL_PHASE)
+        values[_GLOBAL_PHASE] = float(circuit.global_phase)
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if getattr(operation, "_standard_gate", None) is None or not all(
+            isinstance(param, Real) for param in operation.params
+        ):
+            template.append(instruction, copy=False)
+            continue
+
+        gate = operation.to_mutable()
+        params = []
+        for param in operation.params:
+            name = f"{_PARAMETER_PREFIX}{len(values)}"
+            values[name] = float(param)
+            params.append(Parameter(name))
+        gate.params = params
+        template.append(gate, instruction.qubits, instruction.clbits, copy=False)
+
+    return template, values
+
+
+def _setting_key(item: BatchItem) -> tuple[str, int] | None:
+    # Devices are compared by identity, as they are shared or given per program
+    try:
+        return fingerprint(item.transpiler_options or {}), id(item.device)
+    except FingerprintError:
+        return None
+
+
+def _share(result: TranspileResult, group_size: int) -> TranspileResult:
+    # Copies keep releasing the program of one input from affecting the others
+    return result if group_size == 1 else result.copy()
+
+
+def _bind(
+    result: TranspileResult, values: dict[str, float], group_size: int
+) -> TranspileResult:
+    start, cpu_start = time.perf_counter(), time.thread_time()
+    program = result.transpiled_program
+    if program is not None:
+        # Parameters that the transpiler removed with their gates are skipped
+        program = program.assign_parameters(
+            {
+                parameter: values[parameter.name]
+                for parameter in program.parameters
+                if parameter.name in values
+            },
+            inplace=False,
+        )
+
+    # The template's work is shared by the results bound from it
+    timings = {stage: seconds / group_size for stage, seconds in result.timings.items()}
+    timings["bind"] = time.perf_counter() - start
+    cpu_timings = {
+        stage: seconds / group_size for stage, seconds in result.cpu_timings.items()
+    }
+    cpu_timings["bind"] = time.thread_time() - cpu_start
+    return TranspileResult(
+        program,
+        lambda: result.to_dict()["stats"],
+        result.virtual_physical_mapping.to_dict(),
+        timings,
+        cpu_timings,
+        tier=result.tier,
+    )
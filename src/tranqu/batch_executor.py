@@ -0,0 +1,275 @@
+"""Provides helpers for transpiling many programs on an executor pool.
+
+`Tranqu.transpile_many()` uses these helpers to expand shared or per-program
+options and devices into individual work items, and to run the items on
+a thread pool or a process pool. Results are always returned in input order.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from itertools import starmap
+from typing import TYPE_CHECKING, Any
+
+from .tranqu_error import TranquError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Sequence
+
+    from .tranqu import Tranqu
+    from .transpile_result import TranspileResult
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class BatchError(TranquError):
+    """Base exception for errors related to batch transpilation."""
+
+
+class BatchSizeMismatchError(BatchError):
+    """Raised when per-program values do not match the number of programs."""
+
+
+class UnknownExecutorError(BatchError):
+    """Raised when an unsupported executor kind is specified."""
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """A single unit of work in a batch transpilation.
+
+    Args:
+        program (Any): The program to be transpiled.
+        transpiler_options (dict[str, Any] | None): Options for this program.
+        device (Any | None): The device for this program.
+
+    """
+
+    program: Any
+    transpiler_options: dict[str, Any] | None
+    device: Any | None
+
+
+def is_per_program(value: Any) -> bool:  # noqa: ANN401
+    """Check whether a batch argument holds one value per program.
+
+    Lists and tuples are treated as per-program values. Every other value,
+    including dictionaries such as oqtopus devices, is shared by all programs.
+
+    Args:
+        value (Any): The argument passed to `transpile_many()`.
+
+    Returns:
+        bool: True if the value holds one entry per program.
+
+    """
+    return isinstance(value, list | tuple)
+
+
+def expand_batch_items(
+    programs: Iterable[Any],
+    transpiler_options: dict[str, Any] | Sequence[dict[str, Any] | None] | None,
+    device: Any | None,  # noqa: ANN401
+) -> list[BatchItem]:
+    """Expand programs and shared or per-program arguments into batch items.
+
+    Args:
+        programs (Iterable[Any]): The programs to be transpiled.
+        transpiler_options: Options shared by all programs, or a list with
+            one entry per program.
+        device (Any | None): A device shared by all programs, or a list with
+            one entry per program.
+
+    Returns:
+        list[BatchItem]: One item per program, in input order.
+
+    """
+    program_list = list(programs)
+    options_list = _expand("transpiler_options", transpiler_options, program_list)
+    device_list = _expand("device", device, program_list)
+
+    return list(
+        starmap(BatchItem, zip(program_list, options_list, device_list, strict=True))
+    )
+
+
+def run_batch(
+    tranqu: Tranqu,
+    items: Sequence[BatchItem],
+    transpile_kwargs: dict[str, Any],
+    *,
+    executor: str,
+    max_workers: int | None,
+) -> list[TranspileResult]:
+    """Transpile each batch item on an executor pool.
+
+    Args:
+        tranqu (Tranqu): The Tranqu instance whose registrations are used.
+            With a process pool, it is sent once to each worker process.
+        items (Sequence[BatchItem]): The work items.
+        transpile_kwargs (dict[str, Any]): Keyword arguments shared by all items
+            and passed to `Tranqu.transpile()`, such as `program_lib`,
+            `transpiler_lib` and `device_lib`.
+        executor (str): "thread" or "process".
+        max_workers (int | None): The maximum number of workers. If None,
+            the default of the underlying executor is used.
+
+    Returns:
+        list[TranspileResult]: The results, in the same order as `items`.
+
+    """
+    if not items:
+        return []
+
+    tasks = [(item, transpile_kwargs) for item in items]
+    with create_executor(executor, max_workers, tranqu) as pool:
+        if isinstance(pool, ProcessPoolExecutor):
+            return list(pool.map(_transpile_in_worker, tasks))
+        return list(pool.map(lambda task: _transpile_item(tranqu, *task), tasks))
+
+
+def submit_item(
+    pool: Executor,
+    tranqu: Tranqu,
+    item: BatchItem,
+    transpile_kwargs: dict[str, Any],
+) -> Future[TranspileResult]:
+    """Submit a single batch item to an executor created by `create_executor()`.
+
+    Args:
+        pool (Executor): The executor.
+        tranqu (Tranqu): The Tranqu instance whose registrations are used.
+            A process pool uses the copy it was created with.
+        item (BatchItem): The work item.
+        transpile_kwargs (dict[str, Any]): Keyword arguments passed to
+            `Tranqu.transpile()`. See `run_batch()`.
+
+    Returns:
+        Future[TranspileResult]: The future result of the item.
+
+    """
+    if isinstance(pool, ProcessPoolExecutor):
+        return pool.submit(_transpile_in_worker, (item, transpile_kwargs))
+    return pool.submit(_transpile_item, tranqu, item, transpile_kwargs)
+
+
+def validate_executor(executor: str) -> None:
+    """Check that the executor kind is supported.
+
+    Args:
+        executor (str): The executor kind to check.
+
+    Raises:
+        UnknownExecutorError: If the executor kind is not supported.
+
+    """
+    if executor not in EXECUTOR_KINDS:
+        msg = (
+            f"Unknown executor: {executor}. "
+            f"Please specify one of {', '.join(EXECUTOR_KINDS)}."
+        )
+        raise UnknownExecutorError(msg)
+
+
+def create_executor(
+    executor: str,
+    max_workers: int | None,
+    tranqu: Tranqu,
+) -> Executor:
+    """Create an executor of the specified kind.
+
+    Args:
+        executor (str): "thread" or "process".
+        max_workers (int | None): The maximum number of workers.
+        tranqu (Tranqu): The Tranqu instance installed in each worker process
+            when a process pool is created.
+
+    Returns:
+        Executor: A new executor.
+
+    """
+    validate_executor(executor)
+
+    if executor == "process":
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(tranqu,),
+        )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def terminate_workers(executor: Executor) -> bool:
+    """Terminate the worker processes of a process pool.
+
+    Items that are running are interrupted, and the pool can no longer be used.
+    Threads cannot be interrupted, so a thread pool is left as it is.
+
+    Args:
+        executor (Executor): The executor created by `create_executor()`.
+
+    Returns:
+        bool: True if the executor is a process pool and its workers were
+            terminated.
+
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+        return False
+
+    # ProcessPoolExecutor has no public way to stop its workers before 3.14
+    processes = list((executor._processes or {}).values())  # noqa: SLF001
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+    return True
+
+
+def _expand(name: str, value: Any, programs: list[Any]) -> list[Any]:  # noqa: ANN401
+    if not is_per_program(value):
+        return [value] * len(programs)
+
+    if len(value) != len(programs):
+        msg = (
+            f"The number of {name} ({len(value)}) does not match "
+            f"the number of programs ({len(programs)})."
+        )
+        raise BatchSizeMismatchError(msg)
+
+    return list(value)
+
+
+def _transpile_item(
+    tranqu: Tranqu,
+    item: BatchItem,
+    transpile_kwargs: dict[str, Any],
+) -> TranspileResult:
+    return tranqu.transpile(
+        item.program,
+        transpiler_options=item.transpiler_options,
+        device=item.device,
+        **transpile_kwargs,
+    )
+
+
+_worker_tranqu: Tranqu | None = None
+
+
+def _initialize_worker(tranqu: Tranqu) -> None:
+    global _worker_tranqu  # noqa: PLW0603
+    _worker_tranqu = tranqu
+
+
+def _transpile_in_worker(
+    task: tuple[BatchItem, dict[str, Any]],
+) -> TranspileResult:
+    if _worker_tranqu is None:  # pragma: no cover
+        msg = "The worker process has not been initialized."
+        raise BatchError(msg)
+    return _transpile_item(_worker_tranqu, *task)
@@ -0,0 +1,287 @@
+"""Provides a weighted graph of converters for finding conversion paths.
+
+Each registered converter is an edge between two libraries. The weight of an
+edge is the cost hint given at registration. An edge without one is assumed to
+cost `DEFAULT_COST`, so that an untried direct converter is not passed over for
+a longer chain. A library can be given a transit penalty, which is added, in
+units of that assumed cost, whenever a path passes through it rather than
+starting or ending there. This keeps text formats such as OpenQASM3, which
+are printed and parsed again on every hop, out of the middle of a path when
+a binary format connects the same libraries. The cheapest path
+between two libraries is found with Dijkstra's algorithm and memoized until
+a converter is registered.
+
+Paths only depend on the registered converters, so the same request always
+takes the same path. A graph created with `adaptive=True` instead weighs an
+edge by its measured latency once a conversion has been timed, and an edge
+with neither a measurement nor a hint by the average measured edge. Its paths
+can then change from run to run, whenever a measured latency changes
+noticeably.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Collection
+
+DEFAULT_COST = 1.0
+"""The cost of a converter when no cost hint or measurement is available."""
+
+LATENCY_SMOOTHING = 0.2
+"""The weight of a new measurement in the moving average of a latency."""
+
+
+@dataclass
+class _Edge:
+    cost_hint: float | None
+    latency: float | None = None
+
+    def cost(self, unknown_cost: float) -> float:
+        if self.latency is not None:
+            return self.latency
+        if self.cost_hint is not None:
+            return self.cost_hint
+        return unknown_cost
+
+
+class ConversionGraph:
+    """A directed graph whose edges are converters between libraries.
+
+    Paths are compared by total cost, then by number of hops, then by
+    the order in which the converters were registered.
+
+    Args:
+        adaptive (bool): Whether measured latencies are used to weigh edges.
+            If False (default), `record_latency()` is ignored and paths are
+            chosen from the cost hints alone.
+
+    """
+
+    def __init__(self, *, adaptive: bool = False) -> None:
+        self._adaptive = adaptive
+        self._edges: dict[str, dict[str, _Edge]] = {}
+        self._paths: dict[tuple[str, str], tuple[str, ...] | None] = {}
+        self._transit_penalties: dict[str, float] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Returns a counter that changes whenever the cheapest paths may change.
+
+        Returns:
+            int: The current version.
+
+        """
+        return self._version
+
+    def add_edge(self, from_lib: str, to_lib: str, cost: float | None = None) -> None:
+        """Add or replace the edge for a converter.
+
+        Args:
+            from_lib (str): The library the converter converts from.
+            to_lib (str): The library the converter converts to.
+            cost (float | None): An estimate of the conversion time in seconds,
+                used until a latency is measured.
+
+        """
+        with self._lock:
+            self._edges.setdefault(from_lib, {})[to_lib] = _Edge(cost_hint=cost)
+            self._invalidate()
+
+    def sync_edges(self, pairs: Collection[tuple[str, str]]) -> None:
+        """Make the edges match the converters that are registered.
+
+        Edges that are not in `pairs` are removed, and pairs without an edge
+        are added without a cost hint, so that every edge of a path has
+        a converter.
+
+        Args:
+            pairs (Collection[tuple[str, str]]): The source and target library
+                of every registered converter.
+
+        """
+        with self._lock:
+            stale = [
+                (from_lib, to_lib)
+                for from_lib, edges in self._edges.items()
+                for to_lib in edges
+                if (from_lib, to_lib) not in pairs
+            ]
+            missing = [
+                (from_lib, to_lib)
+                for from_lib, to_lib in pairs
+                if to_lib not in self._edges.get(from_lib, {})
+            ]
+            if not stale and not missing:
+                return
+
+            for from_lib, to_lib in stale:
+                del self._edges[from_lib][to_lib]
+            for from_lib, to_lib in missing:
+                self._edges.setdefault(from_lib, {})[to_lib] = _Edge(cost_hint=None)
+            self._invalidate()
+
+    def set_transit_penalty(self, lib: str, penalty: float) -> None:
+        """Make paths that pass through a library more expensive.
+
+        Args:
+            lib (str): The library to penalize as an intermediate hop.
+            penalty (float): The extra cost of passing through the library, as
+                a multiple of the cost assumed for an untried converter.
+                0 removes the penalty.
+
+        """
+        with self._lock:
+            if penalty:
+                self._transit_penalties[lib] = penalty
+            else:
+                self._transit_penalties.pop(lib, None)
+            self._invalidate()
+
+    def record_latency(self, from_lib: str, to_lib: str, seconds: float) -> None:
+        """Record the measured time of a conversion.
+
+        The latency of an edge is a moving average of its measurements. Memoized
+        paths are discarded when the average crosses a power of two. Ignored
+        unless the graph is adaptive.
+
+        Args:
+            from_lib (str): The library the converter converts from.
+            to_lib (str): The library the converter converts to.
+            seconds (float): The measured time of the conversion.
+
+        """
+        if not self._adaptive:
+            return
+
+        with self._lock:
+            edge = self._edges.get(from_lib, {}).get(to_lib)
+            if edge is None:
+                return
+
+            previous = edge.latency
+            if previous is None:
+                edge.latency = seconds
+            else:
+                edge.latency = previous + LATENCY_SMOOTHING * (seconds - previous)
+
+            if previous is None or _bucket(previous) != _bucket(edge.latency):
+                self._invalidate()
+
+    def shortest_path(self, from_lib: str, to_lib: str) -> tuple[str, ...] | None:
+        """Find the cheapest path between two libraries.
+
+        Args:
+            from_lib (str): The library to convert from.
+            to_lib (str): The library to convert to.
+
+        Returns:
+            tuple[str, ...] | None: The libraries along the path, starting with
+                `from_lib` and ending with `to_lib`, or None if there is no path.
+                If both libraries are the same, the path is `(from_lib,)`.
+
+        """
+        key = (from_lib, to_lib)
+        with self._lock:
+            if key not in self._paths:
+                self._paths[key] = self._search(from_lib, to_lib)
+            return self._paths[key]
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the lock.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        with self._lock:
+            return {
+                "adaptive": self._adaptive,
+                "edges": self._edges,
+                "transit_penalties": self._transit_penalties,
+                "version": self._version,
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a graph from a pickled state.
+
+        Args:
+            state (dict[str, Any]): The pickled state.
+
+        """
+        self._adaptive = state.get("adaptive", False)
+        self._edges = state["edges"]
+        self._transit_penalties = state.get("transit_penalties", {})
+        self._paths = {}
+        self._version = state["version"]
+        self._lock = threading.Lock()
+
+    def _search(self, from_lib: str, to_lib: str) -> tuple[str, ...] | None:
+        if from_lib == to_lib:
+            return (from_lib,)
+
+        unknown_cost = self._average_latency()
+
+        # Entries are (cost, hops, tie breaker, library, path)
+        tie_breaker = count()
+        queue: list[tuple[float, int, int, str, tuple[str, ...]]] = [
+            (0.0, 0, next(tie_breaker), from_lib, (from_lib,))
+        ]
+        settled: set[str] = set()
+
+        while queue:
+            cost, hops, _, lib, path = heapq.heappop(queue)
+            if lib == to_lib:
+                return path
+            if lib in settled:
+                continue
+            settled.add(lib)
+
+            for next_lib, edge in self._edges.get(lib, {}).items():
+                if next_lib not in settled:
+                    transit = 0.0
+                    if next_lib != to_lib:
+                        transit = (
+                            self._transit_penalties.get(next_lib, 0.0) * unknown_cost
+                        )
+                    heapq.heappush(
+                        queue,
+                        (
+                            cost + edge.cost(unknown_cost) + transit,
+                            hops + 1,
+                            next(tie_breaker),
+                            next_lib,
+                            (*path, next_lib),
+                        ),
+                    )
+
+        return None
+
+    def _average_latency(self) -> float:
+        latencies = [
+            edge.latency
+            for edges in self._edges.values()
+            for edge in edges.values()
+            if edge.latency is not None
+        ]
+        if not latencies:
+            return DEFAULT_COST
+        return sum(latencies) / len(latencies)
+
+    def _invalidate(self) -> None:
+        self._paths.clear()
+        self._version += 1
+
+
+def _bucket(seconds: float) -> int | None:
+    if seconds <= 0:
+        return None
+    return math.floor(math.log2(seconds))
@@ -0,0 +1,227 @@
+"""Provides transpilation with a timeout and fallback configurations.
+
+`Tranqu.transpile()` with a `timeout` runs the request on a worker and, if it
+does not finish in time, retries it with the next fallback configuration, e.g.,
+a lower optimization level or a different transpiler. Each configuration, or
+tier, gets the full timeout. The result records the tier that produced it in
+`TranspileResult.tier`, and `DeadlineExceededError` is raised if every tier
+times out.
+
+A worker is either a thread or a process:
+
+- A thread starts at no cost, but cannot be stopped. A tier that times out
+  keeps running in the background until it finishes, and its result is
+  discarded.
+- A process receives a copy of the Tranqu instance and is terminated when its
+  tier times out, so that no CPU time is spent on it afterwards. Starting it
+  costs more, especially where processes are spawned instead of forked.
+
+Example:
+    To fall back to Qiskit's optimization level 1, then to tket, if level 3
+    takes longer than a minute:
+
+        result = tranqu.transpile(
+            circuit,
+            transpiler_lib="qiskit",
+            transpiler_options={"optimization_level": 3},
+            timeout=60,
+            fallbacks=[
+                Candidate("qiskit", {"optimization_level": 1}),
+                "tket",
+            ],
+        )
+        print(result.tier)
+
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any
+
+from .portfolio import Candidate
+from .tranqu_error import TranquError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+    from multiprocessing.connection import Connection
+
+    from .tranqu import Tranqu
+    from .transpile_result import TranspileResult
+
+TIMEOUT_EXECUTORS = ("thread", "process")
+
+
+class DeadlineError(TranquError):
+    """Base exception for errors related to transpilation with a timeout."""
+
+
+class DeadlineExceededError(DeadlineError, TimeoutError):
+    """Raised when every tier of a transpilation timed out."""
+
+
+class UnknownTimeoutExecutorError(DeadlineError):
+    """Raised when an unsupported worker kind is specified."""
+
+
+def default_fallbacks(
+    transpiler_lib: str, transpiler_options: dict[str, Any] | None
+) -> list[Candidate]:
+    """Return the fallback used when a timeout is given without fallbacks.
+
+    The fallback is the same transpiler at optimization level 0. There is none
+    if optimization level 0 was requested.
+
+    Args:
+        transpiler_lib (str): The requested transpiler.
+        transpiler_options (dict[str, Any] | None): The requested options.
+
+    Returns:
+        list[Candidate]: The fallbacks, in order.
+
+    """
+    options = transpiler_options or {}
+    if options.get("optimization_level") == 0:
+        return []
+    return [Candidate(transpiler_lib, {**options, "optimization_level": 0})]
+
+
+def transpile_with_deadline(  # noqa: PLR0913
+    tranqu: Tranqu,
+    program: Any,  # noqa: ANN401
+    tiers: Sequence[tuple[str, dict[str, Any] | None]],
+    transpile_kwargs: dict[str, Any],
+    *,
+    timeout: float,
+    executor: str,
+) -> TranspileResult:
+    """Transpile a program with each tier in turn until one finishes in time.
+
+    Args:
+        tranqu (Tranqu): The Tranqu instance whose registrations are used.
+        program (Any): The program to transpile.
+        tiers (Sequence[tuple[str, dict[str, Any] | None]]): The transpiler
+            library and options of each tier, the requested one first.
+        transpile_kwargs (dict[str, Any]): Keyword arguments passed to
+            `Tranqu.transpile()` for every tier, except `transpiler_lib` and
+            `transpiler_options`.
+        timeout (float): The number of seconds each tier may take.
+        executor (str): "thread" or "process".
+
+    Returns:
+        TranspileResult: The result of the first tier that finished in time,
+            with `tier` set to its position.
+
+    Raises:
+        UnknownTimeoutExecutorError: If the worker kind is not supported.
+        DeadlineExceededError: If every tier timed out.
+
+    """
+    if executor not in TIMEOUT_EXECUTORS:
+        msg = (
+            f"Unknown executor: {executor}. "
+            f"Please specify one of {', '.join(TIMEOUT_EXECUTORS)}."
+        )
+        raise UnknownTimeoutExecutorError(msg)
+
+    run = _run_in_process if executor == "process" else _run_in_thread
+    start = time.perf_counter()
+    for tier, (transpiler_lib, transpiler_options) in enumerate(tiers):
+        kwargs = {
+            **transpile_kwargs,
+            "transpiler_lib": transpiler_lib,
+            "transpiler_options": transpiler_options,
+        }
+        try:
+            result = run(tranqu, program, kwargs, timeout)
+        except FutureTimeoutError:
+            continue
+        result.tier = tier
+        return result
+
+    msg = (
+        f"Every tier of the transpilation timed out after {timeout} seconds "
+        f"each ({time.perf_counter() - start:.1f} seconds in total): "
+        + ", ".join(lib for lib, _ in tiers)
+    )
+    raise DeadlineExceededError(msg)
+
+
+def _run_in_thread(
+    tranqu: Tranqu,
+    program: Any,  # noqa: ANN401
+    kwargs: dict[str, Any],
+    timeout: float,
+) -> TranspileResult:
+    future: Future[TranspileResult] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(tranqu.transpile(program, **kwargs))
+        except BaseException as error:  # noqa: BLE001
+            future.set_exception(error)
+
+    # A daemon thread does not keep the interpreter alive after a timeout
+    threading.Thread(target=run, name="tranqu-deadline", daemon=True).start()
+    return future.result(timeout=timeout)
+
+
+def _run_in_process(
+    tranqu: Tranqu,
+    program: Any,  # noqa: ANN401
+    kwargs: dict[str, Any],
+    timeout: float,
+) -> TranspileResult:
+    context = multiprocessing.get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_transpile_in_child,
+        args=(tranqu, program, kwargs, sender),
+        name="tranqu-deadline",
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise FutureTimeoutError
+        result, error = receiver.recv()
+    except EOFError:
+        msg = f"The worker process exited with code {process.exitcode}."
+        raise DeadlineError(msg) from None
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+    if error is not None:
+        raise error
+    return result
+
+
+def _transpile_in_child(
+    tranqu: Tranqu,
+    program: Any,  # noqa: ANN401
+    kwargs: dict[str, Any],
+    sender: Connection,
+) -> None:
+    try:
+        outcome: tuple[Any, BaseException | None] = (
+            tranqu.transpile(program, **kwargs),
+            None,
+        )
+    except Exception as error:  # noqa: BLE001
+        outcome = (None, error)
+
+    try:
+        sender.send(outcome)
+    except Exception as error:  # noqa: BLE001
+        # The result or the error could not be pickled
+        sender.send((None, DeadlineError(f"{type(error).__name__}: {error}")))
+    finally:
+        sender.close()
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+from tranqu.lazy_import import lazy_module_getattr
+
+from .device_conversion_cache import DeviceConversionCache
 from .device_converter import DeviceConverter
 from .device_converter_manager import (
     DeviceConverterAlreadyRegisteredError,
@@ -6,13 +11,27 @@ from .device_converter_manager import (
     DeviceConverterNotFoundError,
 )
 from .oqtopus_to_ouqu_tp_device_converter import OqtopusToOuquTpDeviceConverter
-from .oqtopus_to_qiskit_device_converter import OqtoqusToQiskitDeviceConverter
 from .pass_through_device_converter import PassThroughDeviceConverter
-from .qiskit_device import QiskitDevice
-from .qiskit_to_ouqu_tp_device_converter import QiskitToOuquTpDeviceConverter
-from .qiskit_to_tket_device_converter import QiskitToTketDeviceConverter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .oqtopus_to_qiskit_device_converter import OqtoqusToQiskitDeviceConverter
+    from .qiskit_device import QiskitDevice
+    from .qiskit_to_ouqu_tp_device_converter import QiskitToOuquTpDeviceConverter
+    from .qiskit_to_tket_device_converter import QiskitToTketDeviceConverter
+
+# Converters that import their backend library are imported on first access
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "OqtoqusToQiskitDeviceConverter": ".oqtopus_to_qiskit_device_converter",
+        "QiskitDevice": ".qiskit_device",
+        "QiskitToOuquTpDeviceConverter": ".qiskit_to_ouqu_tp_device_converter",
+        "QiskitToTketDeviceConverter": ".qiskit_to_tket_device_converter",
+    },
+)
 
 __all__ = [
+    "DeviceConversionCache",
     "DeviceConverter",
     "DeviceConverterAlreadyRegisteredError",
     "DeviceConverterError",
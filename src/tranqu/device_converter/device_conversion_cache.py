@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from tranqu.fingerprint import FingerprintError, fingerprint
+from tranqu.transpile_cache import CacheStats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Hashable
+
+_VERSION = "version"
+_CONTENT = "content"
+_IDENTITY = "identity"
+
+
+class DeviceConversionCache:
+    """Keeps converted devices so that they are built only once.
+
+    Converting a device, e.g., building a Qiskit `Target` from an oqtopus
+    device, is expensive while the device itself changes rarely.
+    Entries are keyed on the source and target library and on
+    a caller-supplied version tag, if any. Without a tag, JSON-like devices
+    (such as oqtopus dictionaries) are keyed on a hash of their content, and
+    other device objects (such as Qiskit backends) on their identity.
+
+    Args:
+        max_size (int): The maximum number of converted devices to keep.
+            When it is exceeded, the least recently used entry is evicted.
+            If 0, converted devices are not kept.
+
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[Any, Any]] = (
+            OrderedDict()
+        )
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters of this cache.
+
+        Returns:
+            CacheStats: The counters.
+
+        """
+        return self._stats
+
+    def get_or_convert(
+        self,
+        device: Any,  # noqa: ANN401
+        *,
+        from_lib: str,
+        to_lib: str,
+        convert: Callable[[Any], Any],
+        version: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Return the converted device, converting it only on a cache miss.
+
+        Args:
+            device (Any): The device to convert.
+            from_lib (str): The library of the device.
+            to_lib (str): The library to convert the device to.
+            convert (Callable[[Any], Any]): Converts the device on a cache miss.
+            version (str | None): A tag that identifies the content of the device,
+                e.g., a calibration timestamp. If None, the device content
+                or identity is used.
+
+        Returns:
+            Any: The converted device.
+
+        """
+        key = self._key(device, from_lib=from_lib, to_lib=to_lib, version=version)
+        if key is None:
+            return convert(device)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[1]
+            self._stats.misses += 1
+
+        converted_device = convert(device)
+
+        with self._lock:
+            # Keep the source object alive so that its id cannot be reused
+            source = device if key[2] == _IDENTITY else None
+            self._entries[key] = (source, converted_device)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+        return converted_device
+
+    def clear(self) -> None:
+        """Remove all converted devices. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the lock or the entries.
+
+        Identity keys are only meaningful in the process that created them,
+        so a copy sent to another process starts empty.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        return {"max_size": self._max_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a cache from a pickled state.
+
+        Args:
+            state (dict[str, Any]): The pickled state.
+
+        """
+        self._max_size = state["max_size"]
+        self._entries = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _key(
+        self,
+        device: Any,  # noqa: ANN401
+        *,
+        from_lib: str,
+        to_lib: str,
+        version: str | None,
+    ) -> tuple[Hashable, ...] | None:
+        if self._max_size <= 0:
+            return None
+
+        if version is not None:
+            return (from_lib, to_lib, _VERSION, version)
+
+        if isinstance(device, dict | list | str):
+            try:
+                return (from_lib, to_lib, _CONTENT, fingerprint(device))
+            except FingerprintError:
+                return None
+
+        return (from_lib, to_lib, _IDENTITY, id(device))
@@ -1,3 +1,5 @@
+from tranqu.conversion_graph import ConversionGraph
+from tranqu.lazy_import import LazyFactory
 from tranqu.tranqu_error import TranquError
 
 from .device_converter import DeviceConverter
@@ -36,10 +38,32 @@ class DeviceConverterManager:
     Provides methods to register, retrieve, and check converters between devices.
     Converters are used to perform conversions from a specific source device
     to a target device.
+
+    Args:
+        adaptive_routing (bool): Whether conversion paths are chosen by the
+            measured latencies of the converters rather than by their cost
+            hints alone. Adaptive paths can change from run to run.
+            Defaults to False.
+
     """
 
-    def __init__(self) -> None:
-        self._converters: dict[tuple[str, str], DeviceConverter] = {}
+    def __init__(self, *, adaptive_routing: bool = False) -> None:
+        self._converters: dict[tuple[str, str], DeviceConverter | LazyFactory] = {}
+        self._graph = ConversionGraph(adaptive=adaptive_routing)
+
+    @property
+    def revision(self) -> int:
+        """Returns a counter that changes whenever the conversion paths may change.
+
+        It changes when a converter is registered or removed, or, with adaptive
+        routing, when a measured latency changes enough to affect path selection.
+
+        Returns:
+            int: The current revision.
+
+        """
+        self._graph.sync_edges(self._converters.keys())
+        return self._graph.version
 
     def has_converter(self, from_lib: str, to_lib: str) -> bool:
         """Check if a converter exists between the specified devices.
@@ -85,24 +109,33 @@ class DeviceConverterManager:
             msg = f"Converter not found for conversion from {from_lib} to {to_lib}."
             raise DeviceConverterNotFoundError(msg)
 
+        if isinstance(converter, LazyFactory):
+            converter = converter.create()
+            self._converters[from_lib, to_lib] = converter
+
         return converter
 
     def register_converter(
         self,
         from_lib: str,
         to_lib: str,
-        converter: DeviceConverter,
+        converter: DeviceConverter | LazyFactory,
         *,
         allow_override: bool = False,
+        cost: float | None = None,
     ) -> None:
         """Register a converter between the specified devices.
 
         Args:
             from_lib (str): The name of the source device
             to_lib (str): The name of the target device
-            converter (DeviceConverter): The converter instance to register
+            converter (DeviceConverter | LazyFactory): The converter instance to
+              register, or a `LazyFactory` that creates it on first use.
             allow_override (bool): When False, prevents overwriting existing
               registrations. Defaults to False.
+            cost (float | None): An estimate of the conversion time in seconds,
+              used to choose between conversion paths until the converter
+              has been timed. Defaults to None.
 
         Raises:
             DeviceConverterAlreadyRegisteredError:
@@ -119,3 +152,33 @@ class DeviceConverterManager:
             raise DeviceConverterAlreadyRegisteredError(msg)
 
         self._converters[key] = converter
+        self._graph.add_edge(from_lib, to_lib, cost)
+
+    def find_path(self, from_lib: str, to_lib: str) -> tuple[str, ...] | None:
+        """Find the cheapest chain of converters between two libraries.
+
+        Args:
+            from_lib (str): The library to convert from.
+            to_lib (str): The library to convert to.
+
+        Returns:
+            tuple[str, ...] | None: The libraries along the path, starting with
+                `from_lib` and ending with `to_lib`, or None if no chain of
+                registered converters connects them.
+
+        """
+        self._graph.sync_edges(self._converters.keys())
+        return self._graph.shortest_path(from_lib, to_lib)
+
+    def record_latency(self, from_lib: str, to_lib: str, seconds: float) -> None:
+        """Record the measured time of a conversion for adaptive path selection.
+
+        Ignored unless the manager was created with `adaptive_routing=True`.
+
+        Args:
+            from_lib (str): The library the converter converts from.
+            to_lib (str): The library the converter converts to.
+            seconds (float): The measured time of the conversion.
+
+        """
+        self._graph.record_latency(from_lib, to_lib, seconds)
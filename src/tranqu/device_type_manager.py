@@ -1,5 +1,6 @@
 from typing import Any
 
+from .lazy_import import loaded_attribute
 from .tranqu_error import TranquError
 
 
@@ -12,6 +13,9 @@ class DeviceTypeManager:
 
     def __init__(self) -> None:
         self._type_registry: dict[type[Any], str] = {}
+        self._resolved_types: dict[type[Any], str] = {}
+        # Types registered by name, keyed by (module name, type name)
+        self._lazy_types: dict[tuple[str, str], str] = {}
 
     def register_type(
         self, device_lib: str, device_type: type[Any], *, allow_override: bool = False
@@ -29,7 +33,7 @@ class DeviceTypeManager:
                 and allow_override is False.
 
         """
-        if not allow_override and device_lib in self._type_registry.values():
+        if not allow_override and self._is_registered(device_lib):
             msg = (
                 f"Library '{device_lib}' is already registered. "
                 "Use allow_override=True to force registration."
@@ -37,6 +41,43 @@ class DeviceTypeManager:
             raise DeviceLibraryAlreadyRegisteredError(msg)
 
         self._type_registry[device_type] = device_lib
+        self._resolved_types = dict(self._type_registry)
+
+    def register_lazy_type(
+        self,
+        device_lib: str,
+        module_name: str,
+        type_name: str,
+        *,
+        allow_override: bool = False,
+    ) -> None:
+        """Register a device type by name without importing its module.
+
+        The type is looked up when a device is resolved after its module has
+        been imported, since no device can be an instance of it before that.
+
+        Args:
+            device_lib (str): Library identifier
+            module_name (str): The absolute name of the module that defines
+              the type, e.g., "qiskit.providers".
+            type_name (str): The name of the type in the module,
+              e.g., "BackendV2".
+            allow_override (bool): When False, prevents overwriting existing
+              registrations. Defaults to False.
+
+        Raises:
+            DeviceLibraryAlreadyRegisteredError: If the library is already registered
+                and allow_override is False.
+
+        """
+        if not allow_override and self._is_registered(device_lib):
+            msg = (
+                f"Library '{device_lib}' is already registered. "
+                "Use allow_override=True to force registration."
+            )
+            raise DeviceLibraryAlreadyRegisteredError(msg)
+
+        self._lazy_types[module_name, type_name] = device_lib
 
     def resolve_lib(self, device: Any) -> str | None:  # noqa: ANN401
         """Resolve library based on device type.
@@ -48,8 +89,38 @@ class DeviceTypeManager:
             str | None: Library identifier for registered device type, None otherwise
 
         """
-        for device_type, lib in self._type_registry.items():
-            if isinstance(device, device_type):
+        device_class = type(device)
+        lib = self._resolved_types.get(device_class)
+        if lib is not None:
+            return lib
+
+        if self._lazy_types:
+            self._load_lazy_types()
+
+        # Subclasses of registered types are remembered, since the class
+        # hierarchy does not change. Virtual subclasses are checked every time.
+        for base in device_class.__mro__[1:]:
+            lib = self._type_registry.get(base)
+            if lib is not None:
+                self._resolved_types[device_class] = lib
                 return lib
 
+        for registered_type, registered_lib in self._type_registry.items():
+            if isinstance(device, registered_type):
+                return registered_lib
+
         return None
+
+    def _is_registered(self, device_lib: str) -> bool:
+        return (
+            device_lib in self._type_registry.values()
+            or device_lib in self._lazy_types.values()
+        )
+
+    def _load_lazy_types(self) -> None:
+        for (module_name, type_name), device_lib in list(self._lazy_types.items()):
+            device_type = loaded_attribute(module_name, type_name)
+            if device_type is not None:
+                self._lazy_types.pop((module_name, type_name), None)
+                self._type_registry[device_type] = device_lib
+                self._resolved_types[device_type] = device_lib
@@ -0,0 +1,83 @@
+"""Provides stable content fingerprints for programs, options and devices.
+
+A fingerprint is a SHA-256 hex digest of a canonical representation of a value.
+JSON-like values (dictionaries, lists, strings, numbers) are serialized as
+canonical JSON with sorted keys, so equal contents always produce the same
+fingerprint. Any other object is represented by the digest of its pickled form.
+"""
+
+import hashlib
+import json
+import pickle  # noqa: S403
+from typing import Any
+
+from .tranqu_error import TranquError
+
+
+class FingerprintError(TranquError):
+    """Raised when a value cannot be fingerprinted."""
+
+
+def fingerprint(value: Any) -> str:  # noqa: ANN401
+    """Calculate the fingerprint of a value.
+
+    Args:
+        value (Any): The value to fingerprint.
+
+    Returns:
+        str: A SHA-256 hex digest of the canonical representation of the value.
+
+    """
+    if isinstance(value, str):
+        return _digest(value.encode())
+    if isinstance(value, bytes):
+        return _digest(value)
+
+    return _digest(canonical_json(value).encode())
+
+
+def canonical_json(value: Any) -> str:  # noqa: ANN401
+    """Serialize a value as canonical JSON.
+
+    Dictionary keys are sorted and tuples are treated as lists.
+    Values that are not JSON serializable are replaced by the fingerprint of
+    their pickled form.
+
+    Args:
+        value (Any): The value to serialize.
+
+    Returns:
+        str: The canonical JSON text.
+
+    """
+    return json.dumps(
+        _canonicalize(value),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def _canonicalize(value: Any) -> Any:  # noqa: ANN401
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _canonicalize(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonicalize(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((_canonicalize(item) for item in value), key=repr)
+
+    return {"__pickle__": _digest(_pickle(value))}
+
+
+def _pickle(value: Any) -> bytes:  # noqa: ANN401
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        msg = f"Cannot fingerprint a value of type {type(value).__name__}."
+        raise FingerprintError(msg) from error
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
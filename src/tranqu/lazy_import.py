@@ -0,0 +1,123 @@
+"""Provides helpers for importing backend libraries only when they are used.
+
+Importing Qiskit, pytket and ouqu-tp takes seconds, so `import tranqu` and
+`Tranqu()` must not do it. The built-in transpilers and converters are
+registered as `LazyFactory` objects, which import their module when
+the transpiler or converter is first fetched, and the packages that export them
+resolve those names on first access.
+
+Built-in transpilers and converters hold no per-instance state, so their
+factories are shared: every `Tranqu` in a process fetches the same instance, and
+creating another `Tranqu` costs no backend construction.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Mapping
+
+_shared_instances: dict[tuple[str, str, tuple[tuple[str, Any], ...]], Any] = {}
+_shared_instances_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class LazyFactory:
+    """Creates an object from a class that is imported on first use.
+
+    A factory can be pickled without importing the class, so that a `Tranqu`
+    sent to another process imports only the backends that process uses.
+
+    Args:
+        module_name (str): The absolute name of the module that defines the class.
+        class_name (str): The name of the class.
+        kwargs (dict[str, Any]): Keyword arguments passed to the class.
+            They must be hashable if `shared` is True.
+        shared (bool): When True, all factories with the same class and
+            arguments return one instance per process. Only use it for objects
+            that are safe to use from several `Tranqu` instances and threads.
+            Defaults to False.
+
+    """
+
+    module_name: str
+    class_name: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    shared: bool = False
+
+    def create(self) -> Any:  # noqa: ANN401
+        """Import the class and create an instance of it.
+
+        Returns:
+            Any: The new instance, or the instance shared by equal factories
+                if `shared` is True.
+
+        """
+        if not self.shared:
+            return self._new_instance()
+
+        key = (self.module_name, self.class_name, tuple(sorted(self.kwargs.items())))
+        with _shared_instances_lock:
+            instance = _shared_instances.get(key)
+            if instance is None:
+                instance = self._new_instance()
+                _shared_instances[key] = instance
+            return instance
+
+    def _new_instance(self) -> Any:  # noqa: ANN401
+        cls = getattr(importlib.import_module(self.module_name), self.class_name)
+        return cls(**self.kwargs)
+
+
+def loaded_attribute(module_name: str, attribute: str) -> Any | None:  # noqa: ANN401
+    """Get an attribute of a module only if the module has been imported.
+
+    An object cannot be an instance of a class whose module was never imported,
+    so type checks can skip classes that this returns None for.
+
+    Args:
+        module_name (str): The absolute name of the module.
+        attribute (str): The name of the attribute.
+
+    Returns:
+        Any | None: The attribute, or None if the module has not been imported
+            or does not have it yet.
+
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+    return getattr(module, attribute, None)
+
+
+def lazy_module_getattr(
+    package: str, attributes: Mapping[str, str]
+) -> Callable[[str], Any]:
+    """Create a module `__getattr__` that imports attributes on first access.
+
+    Args:
+        package (str): The name of the package, i.e., `__name__`.
+        attributes (Mapping[str, str]): The modules, relative to the package,
+            that define each lazily imported attribute.
+
+    Returns:
+        Callable[[str], Any]: The `__getattr__` function for the package.
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401, N807
+        module_name = attributes.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
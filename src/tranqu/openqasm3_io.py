@@ -0,0 +1,124 @@
+"""Provides reading and writing of OpenQASM3 programs from files and streams.
+
+A program in the "openqasm3" library can be given to `Tranqu.transpile()` as
+a string, or as a path, a text or binary file object, or an iterable of lines.
+Such a source is read once, before the program is converted, so the text is held
+in memory only once for the parser.
+
+To write a large program back to disk without building its text as a string,
+request the program in Qiskit's format with `output_lib="qiskit"` and write it
+with `write_openqasm3()`, which serializes the circuit directly to the stream:
+
+    result = tranqu.transpile(
+        Path("large.qasm"),
+        program_lib="openqasm3",
+        transpiler_lib="qiskit",
+        output_lib="qiskit",
+    )
+    write_openqasm3(result.transpiled_program, Path("large_transpiled.qasm"))
+
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Any, TypeAlias
+
+from .lazy_import import loaded_attribute
+from .tranqu_error import TranquError
+
+Openqasm3Source: TypeAlias = (
+    str | bytes | os.PathLike[str] | IO[str] | IO[bytes] | Iterable[str]
+)
+"""The types of OpenQASM3 programs that `read_openqasm3()` reads."""
+
+
+class Openqasm3IOError(TranquError):
+    """Raised when an OpenQASM3 program cannot be read or written."""
+
+
+def read_openqasm3(source: Openqasm3Source) -> str:
+    """Read the text of an OpenQASM3 program.
+
+    Args:
+        source (Openqasm3Source): The program text, a path to a file that
+            contains it, a text or binary file object, UTF-8 encoded bytes, or
+            an iterable of lines that end with their line breaks, such as an
+            open file.
+
+    Returns:
+        str: The program text.
+
+    Raises:
+        Openqasm3IOError: If the source is not one of the supported types.
+
+    """
+    if isinstance(source, str):
+        return source
+    if isinstance(source, os.PathLike):
+        return Path(source).read_text(encoding="utf-8")
+
+    text: Any
+    if hasattr(source, "read"):
+        text = source.read()
+    elif isinstance(source, bytes):
+        text = source
+    elif isinstance(source, Iterable):
+        text = "".join(source)
+    else:
+        msg = f"Cannot read an OpenQASM3 program from {type(source).__name__}."
+        raise Openqasm3IOError(msg)
+
+    if isinstance(text, bytes):
+        return text.decode("utf-8")
+    return text
+
+
+def write_openqasm3(
+    program: Any,  # noqa: ANN401
+    destination: os.PathLike[str] | IO[str],
+) -> None:
+    """Write a program as OpenQASM3 to a file or a text stream.
+
+    Qiskit and tket circuits are serialized directly to the destination, so
+    their text is never held in memory as a whole. Other programs raise
+    `Openqasm3IOError`.
+
+    Args:
+        program (Any): OpenQASM3 text, a Qiskit `QuantumCircuit` or
+            a tket `Circuit`.
+        destination (os.PathLike[str] | IO[str]): The path of the file to write,
+            or a text stream to write to.
+
+    """
+    if isinstance(destination, os.PathLike):
+        with Path(destination).open("w", encoding="utf-8") as stream:
+            _write(program, stream)
+    else:
+        _write(program, destination)
+
+
+def _write(program: Any, stream: IO[str]) -> None:  # noqa: ANN401
+    if isinstance(program, str):
+        stream.write(program)
+        return
+
+    # A program cannot be a circuit of a library that has not been imported
+    tket_circuit = loaded_attribute("pytket", "Circuit")
+    if tket_circuit is not None and isinstance(program, tket_circuit):
+        from pytket.extensions.qiskit import (  # type: ignore[attr-defined]  # noqa: PLC0415
+            tk_to_qiskit,
+        )
+
+        program = tk_to_qiskit(program)
+
+    quantum_circuit = loaded_attribute("qiskit", "QuantumCircuit")
+    if quantum_circuit is None or not isinstance(program, quantum_circuit):
+        msg = f"Cannot write {type(program).__name__} as OpenQASM3."
+        raise Openqasm3IOError(msg)
+
+    from qiskit.qasm3 import dump  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    dump(program, stream)
@@ -0,0 +1,291 @@
+"""Provides transpilation of parametric circuits that are bound many times.
+
+`Tranqu.transpile_parametric()` transpiles a Qiskit circuit with symbolic
+`Parameter`s once and returns a `ParametricResult`. Its `bind()` and
+`bind_many()` methods produce executable circuits for concrete values without
+transpiling again, e.g., in every iteration of a VQE loop. The statistics and
+`virtual_physical_mapping` do not depend on the values and are computed once.
+
+Binding is vectorized. Every parametrized angle of the transpiled circuit is an
+expression of the input parameters, which is affine for most gates, e.g.,
+`theta / 2 + pi`. When the result is created, each angle is replaced by a slot
+of its own, and the affine expressions are turned into a matrix. The values of
+all slots of many circuits are then computed with a single matrix product in
+NumPy, and each circuit is bound positionally. Expressions that are not affine,
+e.g., `sin(theta)`, are evaluated one circuit at a time.
+
+The transpiler must keep parameters symbolic, as Qiskit's does. A template is
+transpiled without its values, so optimizations that depend on particular
+values, e.g., removing rotations by zero, do not apply.
+
+Example:
+    To bind 1,000 sets of values for an ansatz with parameters `theta`:
+
+        parametric = tranqu.transpile_parametric(
+            ansatz, transpiler_lib="qiskit", device=FakeSantiagoV2()
+        )
+        circuits = parametric.bind_many(rng.uniform(0, 2 * np.pi, (1_000, 8)))
+        print(parametric.parameters, parametric.stats.after.n_gates_2q)
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from numbers import Real
+from typing import TYPE_CHECKING, Any
+
+from .lazy_import import loaded_attribute
+from .tranqu_error import TranquError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    import numpy as np
+
+    from .transpile_result import NestedDictAccessor, TranspileResult
+
+_SLOT_PREFIX = "tranqu_slot_"
+
+
+class ParametricError(TranquError):
+    """Base exception for errors related to parametric transpilation."""
+
+
+class ParametersNotSupportedError(ParametricError):
+    """Raised when the transpiler does not keep parameters symbolic."""
+
+
+class ParameterValuesError(ParametricError):
+    """Raised when the values to bind do not match the parameters."""
+
+
+def parameter_names(program: Any) -> list[str] | None:  # noqa: ANN401
+    """Return the names of the parameters of a Qiskit circuit in order.
+
+    Args:
+        program (Any): The program.
+
+    Returns:
+        list[str] | None: The names, in the order of `QuantumCircuit.parameters`,
+            or None if the program is not a Qiskit circuit.
+
+    """
+    quantum_circuit = loaded_attribute("qiskit", "QuantumCircuit")
+    if quantum_circuit is None or not isinstance(program, quantum_circuit):
+        return None
+    return [parameter.name for parameter in program.parameters]
+
+
+class ParametricResult:
+    """The result of transpiling a parametric circuit, to be bound many times.
+
+    Args:
+        result (TranspileResult): The result of transpiling the circuit with
+            its parameters kept symbolic. Its program is a Qiskit circuit.
+        parameters (Sequence[str] | None): The names of the parameters, in the
+            order of the values given to `bind()` and `bind_many()`. If None,
+            the parameters of the transpiled circuit are used. Parameters that
+            the transpiler removed with their gates still take a value, which
+            is ignored.
+
+    """
+
+    def __init__(
+        self,
+        result: TranspileResult,
+        parameters: Sequence[str] | None = None,
+    ) -> None:
+        import numpy as np  # noqa: PLC0415
+
+        program = result.transpiled_program
+        if parameters is None:
+            parameters = [parameter.name for parameter in program.parameters]
+
+        self._result = result
+        self._parameters = tuple(parameters)
+        self._columns = {name: column for column, name in enumerate(self._parameters)}
+        unknown = [
+            parameter.name
+            for parameter in program.parameters
+            if parameter.name not in self._columns
+        ]
+        if unknown:
+            msg = f"The transpiled circuit has unknown parameters: {unknown}."
+            raise ParameterValuesError(msg)
+
+        # Circuits with parameters outside standard gates are bound as they are
+        template, expressions = _slot_template(program) or (
+            program,
+            list(program.parameters),
+        )
+        self._template = template
+        self._matrix = np.zeros((len(expressions), len(self._parameters)))
+        self._offset = np.zeros(len(expressions))
+        # Slots whose expressions are not affine, with their parameters' columns
+        self._nonaffine: list[tuple[int, Any, list[Any], list[int]]] = []
+        for slot, expression in enumerate(expressions):
+            self._compile_expression(slot, expression)
+
+    @property
+    def result(self) -> TranspileResult:
+        """TranspileResult: The result of transpiling the parametric circuit."""
+        return self._result
+
+    @property
+    def transpiled_program(self) -> Any:  # noqa: ANN401
+        """QuantumCircuit: The transpiled circuit with symbolic parameters."""
+        return self._result.transpiled_program
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """tuple[str, ...]: The names of the parameters, in the order of values."""
+        return self._parameters
+
+    @property
+    def stats(self) -> NestedDictAccessor:
+        """NestedDictAccessor: The statistics, shared by every bound circuit."""
+        return self._result.stats
+
+    @property
+    def virtual_physical_mapping(self) -> NestedDictAccessor:
+        """NestedDictAccessor: The mapping, shared by every bound circuit."""
+        return self._result.virtual_physical_mapping
+
+    def bind(self, values: Sequence[float] | Mapping[Any, float]) -> Any:  # noqa: ANN401
+        """Bind values to the parameters and return an executable circuit.
+
+        Args:
+            values (Sequence[float] | Mapping[Any, float]): A value for each
+                parameter, in the order of `parameters`, or keyed by parameter
+                name or `Parameter`.
+
+        Returns:
+            QuantumCircuit: The transpiled circuit with the values bound.
+
+        Raises:
+            ParameterValuesError: If a value is missing or a key is not
+                a parameter.
+
+        """
+        if not isinstance(values, Mapping):
+            return self.bind_many([values])[0]
+
+        by_name = {getattr(key, "name", key): value for key, value in values.items()}
+        missing = [name for name in self._parameters if name not in by_name]
+        unknown = [name for name in by_name if name not in self._columns]
+        if missing or unknown:
+            msg = (
+                f"The values do not match the parameters: "
+                f"missing {missing}, unknown {unknown}."
+            )
+            raise ParameterValuesError(msg)
+        return self.bind_many([[by_name[name] for name in self._parameters]])[0]
+
+    def bind_many(self, values: Any) -> list[Any]:  # noqa: ANN401
+        """Bind rows of values to the parameters and return executable circuits.
+
+        Args:
+            values (Any): A 2D array-like with a row for each circuit and
+                a column for each parameter, in the order of `parameters`.
+
+        Returns:
+            list[QuantumCircuit]: The transpiled circuit with the values of
+                each row bound, in row order.
+
+        Raises:
+            ParameterValuesError: If the values do not have one column per
+                parameter.
+
+        """
+        import numpy as np  # noqa: PLC0415
+
+        rows = np.asarray(values, dtype=float)
+        if rows.ndim != 2 or rows.shape[1] != len(self._parameters):  # noqa: PLR2004
+            msg = (
+                f"Expected an array of shape (n, {len(self._parameters)}), "
+                f"but got one of shape {rows.shape}."
+            )
+            raise ParameterValuesError(msg)
+
+        if not self._offset.size:
+            return [self._template.copy() for _ in range(len(rows))]
+        return [
+            self._template.assign_parameters(row) for row in self._slot_values(rows)
+        ]
+
+    def _slot_values(self, rows: np.ndarray) -> list[list[float]]:
+        slot_values = rows @ self._matrix.T + self._offset
+        for slot, expression, parameters, columns in self._nonaffine:
+            slot_values[:, slot] = [
+                float(expression.bind(dict(zip(parameters, row, strict=True))))
+                for row in rows[:, columns].tolist()
+            ]
+        # Python floats bind faster than NumPy scalars
+        return slot_values.tolist()
+
+    def _compile_expression(self, slot: int, expression: Any) -> None:  # noqa: ANN401
+        parameters = list(expression.parameters)
+        coefficients = []
+        for parameter in parameters:
+            gradient = expression.gradient(parameter)
+            if not isinstance(gradient, Real):
+                self._nonaffine.append((
+                    slot,
+                    expression,
+                    parameters,
+                    [self._columns[parameter.name] for parameter in parameters],
+                ))
+                return
+            coefficients.append(float(gradient))
+
+        for parameter, coefficient in zip(parameters, coefficients, strict=True):
+            self._matrix[slot, self._columns[parameter.name]] += coefficient
+        self._offset[slot] = float(expression.bind(dict.fromkeys(parameters, 0.0)))
+
+
+def _slot_template(program: Any) -> tuple[Any, list[Any]] | None:  # noqa: ANN401
+    # Each parametrized angle becomes a slot, named so that slots sort in order.
+    # Returns None if an instruction other than a standard gate has parameters.
+    from qiskit.circuit import (  # type: ignore[import-untyped]  # noqa: PLC0415
+        Parameter,
+        ParameterExpression,
+    )
+
+    expressions: list[Any] = []
+    width = len(str(_count_angles(program)))
+
+    def slot(expression: Any) -> Any:  # noqa: ANN401
+        expressions.append(expression)
+        return Parameter(f"{_SLOT_PREFIX}{len(expressions) - 1:0{width}d}")
+
+    template = program.copy_empty_like()
+    if (
+        isinstance(program.global_phase, ParameterExpression)
+        and program.global_phase.parameters
+    ):
+        template.global_phase = slot(program.global_phase)
+
+    for instruction in program.data:
+        operation = instruction.operation
+        if not any(_is_symbolic(param) for param in operation.params):
+            template.append(instruction, copy=False)
+            continue
+        if getattr(operation, "_standard_gate", None) is None:
+            return None
+
+        gate = operation.to_mutable()
+        gate.params = [
+            slot(param) if _is_symbolic(param) else param for param in operation.params
+        ]
+        template.append(gate, instruction.qubits, instruction.clbits, copy=False)
+
+    return template, expressions
+
+
+def _count_angles(program: Any) -> int:  # noqa: ANN401
+    return 1 + sum(len(instruction.operation.params) for instruction in program.data)
+
+
+def _is_symbolic(param: Any) -> bool:  # noqa: ANN401
+    return bool(getattr(param, "parameters", None))
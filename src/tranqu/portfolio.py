@@ -0,0 +1,382 @@
+"""Provides best-of-N transpilation over a portfolio of candidate transpilers.
+
+`Tranqu.transpile_best()` transpiles the same program with several candidates,
+i.e., a transpiler library with its options and optionally a seed, on a thread
+or process pool, scores every result with an objective over its "after"
+statistics and returns the best result with a leaderboard of all candidates.
+
+An objective is the name of a statistic, such as "n_gates_2q", a sequence of
+names compared in order, or a function of a `TranspileResult`. Lower scores are
+better, so to maximize a value, e.g., "success_probability", return its negation
+from a function.
+
+With a time budget, candidates that have not finished when the budget runs out
+are cut off as soon as at least one candidate has a score. Candidates that have
+not started are cancelled. On a process pool, the worker processes are then
+terminated, so that running candidates use no more CPU time. A candidate that
+is already running on a thread cannot be interrupted and finishes in the
+background, but its result is discarded.
+
+Example:
+    To keep the result with the fewest 2-qubit gates, then the lowest depth:
+
+        result = tranqu.transpile_best(
+            circuit,
+            candidates=[
+                "tket",
+                *(Candidate("qiskit", {"optimization_level": 3}, seed=seed)
+                  for seed in range(4)),
+            ],
+            objective=("n_gates_2q", "depth"),
+            device=FakeSantiagoV2(),
+            time_budget=30,
+        )
+        print(result.candidate, result.best.stats.after.n_gates_2q)
+        for entry in result.leaderboard:
+            print(entry.candidate, entry.status, entry.score)
+
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from .batch_executor import (
+    BatchItem,
+    create_executor,
+    submit_item,
+    terminate_workers,
+)
+from .tranqu_error import TranquError
+from .transpile_result import TranspileResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+    from .tranqu import Tranqu
+
+Objective: TypeAlias = str | Sequence[str] | Callable[[TranspileResult], Any]
+"""An objective to minimize: a statistic, statistics in order, or a function."""
+
+DEFAULT_OBJECTIVE = ("n_gates_2q", "depth")
+"""The objective of `Tranqu.transpile_best()` when none is given."""
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_CUT_OFF = "cut_off"
+
+
+class PortfolioError(TranquError):
+    """Base exception for errors related to best-of-N transpilation."""
+
+
+class NoCandidateError(PortfolioError):
+    """Raised when no candidates are given."""
+
+
+class SeedNotSupportedError(PortfolioError):
+    """Raised when a candidate has a seed but its transpiler takes none."""
+
+
+class UnknownObjectiveError(PortfolioError):
+    """Raised when the objective names a statistic that the results lack."""
+
+
+class NoCandidateSucceededError(PortfolioError):
+    """Raised when every candidate failed."""
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A transpiler configuration to try in `Tranqu.transpile_best()`.
+
+    Args:
+        transpiler_lib (str): The name of the transpiler.
+        transpiler_options (dict[str, Any] | None): Options passed to
+            the transpiler.
+        seed (int | None): A seed for the transpiler's randomness, passed as
+            the option named by the transpiler's `seed_option`, e.g.,
+            "seed_transpiler" for Qiskit.
+
+    """
+
+    transpiler_lib: str
+    transpiler_options: dict[str, Any] | None = None
+    seed: int | None = None
+
+    def __str__(self) -> str:
+        """Return a short description, e.g., "qiskit(seed=1)".
+
+        Returns:
+            str: The description.
+
+        """
+        options = self.transpiler_options or {}
+        arguments = [f"{key}={value!r}" for key, value in options.items()]
+        if self.seed is not None:
+            arguments.append(f"seed={self.seed}")
+        if not arguments:
+            return self.transpiler_lib
+        return f"{self.transpiler_lib}({', '.join(arguments)})"
+
+
+@dataclass(frozen=True)
+class PortfolioEntry:
+    """The outcome of one candidate, without its transpiled program.
+
+    Args:
+        candidate (Candidate): The candidate.
+        status (str): "ok" if it was scored, "failed" if it raised an error,
+            or "cut_off" if it did not finish within the time budget.
+        score (Any): The value of the objective, or None unless it is "ok".
+        seconds (float | None): The time the candidate spent in the transpile
+            pipeline, as the sum of its result's timings, or None unless
+            it is "ok".
+        error (str | None): The error of a failed candidate.
+
+    """
+
+    candidate: Candidate
+    status: str
+    score: Any = None
+    seconds: float | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class PortfolioResult:
+    """The outcome of `Tranqu.transpile_best()`.
+
+    Args:
+        best (TranspileResult): The result with the lowest score. Ties go to
+            the candidate that was given first.
+        candidate (Candidate): The candidate that produced `best`.
+        leaderboard (list[PortfolioEntry]): Every candidate, the scored ones
+            from best to worst, followed by those cut off and those failed.
+
+    """
+
+    best: TranspileResult
+    candidate: Candidate
+    leaderboard: list[PortfolioEntry]
+
+
+def as_candidate(candidate: str | Candidate) -> Candidate:
+    """Convert the name of a transpiler to a candidate with default options.
+
+    Args:
+        candidate (str | Candidate): A transpiler library or a candidate.
+
+    Returns:
+        Candidate: The candidate.
+
+    """
+    if isinstance(candidate, str):
+        return Candidate(candidate)
+    return candidate
+
+
+def candidate_options(
+    candidate: Candidate, seed_option: str | None
+) -> dict[str, Any] | None:
+    """Return the transpiler options of a candidate, including its seed.
+
+    Args:
+        candidate (Candidate): The candidate.
+        seed_option (str | None): The name of the transpiler's seed option.
+
+    Returns:
+        dict[str, Any] | None: The options to pass to the transpiler.
+
+    Raises:
+        SeedNotSupportedError: If the candidate has a seed and the transpiler
+            has no seed option.
+
+    """
+    if candidate.seed is None:
+        return candidate.transpiler_options
+    if seed_option is None:
+        msg = (
+            f"Candidate {candidate} has a seed, but the transpiler "
+            f"'{candidate.transpiler_lib}' does not take one."
+        )
+        raise SeedNotSupportedError(msg)
+    return {**(candidate.transpiler_options or {}), seed_option: candidate.seed}
+
+
+def create_scorer(objective: Objective) -> Callable[[TranspileResult], Any]:
+    """Create a function that scores a result by an objective.
+
+    Args:
+        objective (Objective): The name of a statistic, a sequence of names
+            compared in order, or a function of a result.
+
+    Returns:
+        Callable[[TranspileResult], Any]: A function that returns the score
+            of a result. Lower is better.
+
+    """
+    if callable(objective):
+        return objective
+
+    names = (objective,) if isinstance(objective, str) else tuple(objective)
+
+    def score(result: TranspileResult) -> Any:  # noqa: ANN401
+        after = result.to_dict()["stats"].get("after", {})
+        missing = [name for name in names if name not in after]
+        if missing:
+            msg = (
+                f"The statistics have no {', '.join(missing)}. "
+                f"Available: {', '.join(after)}. Metrics must be requested "
+                "through the metrics argument."
+            )
+            raise UnknownObjectiveError(msg)
+        values = tuple(after[name] for name in names)
+        return values[0] if len(values) == 1 else values
+
+    return score
+
+
+def run_portfolio(  # noqa: PLR0913 PLR0917
+    tranqu: Tranqu,
+    program: Any,  # noqa: ANN401
+    candidates: Sequence[Candidate],
+    options: Sequence[dict[str, Any] | None],
+    device: Any | None,  # noqa: ANN401
+    transpile_kwargs: dict[str, Any],
+    *,
+    objective: Objective,
+    time_budget: float | None,
+    executor: str,
+    max_workers: int | None,
+) -> PortfolioResult:
+    """Transpile a program with each candidate and keep the best result.
+
+    If every candidate fails, `NoCandidateSucceededError` is raised from
+    the first error.
+
+    Args:
+        tranqu (Tranqu): The Tranqu instance whose registrations are used.
+        program (Any): The program to transpile.
+        candidates (Sequence[Candidate]): The candidates to try.
+        options (Sequence[dict[str, Any] | None]): The transpiler options of
+            each candidate, including its seed.
+        device (Any | None): The device shared by all candidates.
+        transpile_kwargs (dict[str, Any]): Keyword arguments passed to
+            `Tranqu.transpile()` for every candidate, except `transpiler_lib`.
+        objective (Objective): The objective to minimize.
+        time_budget (float | None): The number of seconds after which
+            unfinished candidates are cut off, once any candidate has a score.
+            Cut-off candidates on a process pool are terminated. If None,
+            every candidate runs to completion.
+        executor (str): "thread" or "process".
+        max_workers (int | None): The maximum number of pool workers.
+
+    Returns:
+        PortfolioResult: The best result and the leaderboard.
+
+    Raises:
+        NoCandidateError: If no candidates are given.
+
+    """
+    if not candidates:
+        msg = "At least one candidate is required."
+        raise NoCandidateError(msg)
+
+    board = _Scoreboard(candidates, create_scorer(objective))
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+    pool = create_executor(executor, max_workers, tranqu)
+    pending: set[Future[TranspileResult]] = set()
+    try:
+        indices = {
+            submit_item(
+                pool,
+                tranqu,
+                BatchItem(program, options[index], device),
+                {**transpile_kwargs, "transpiler_lib": candidate.transpiler_lib},
+            ): index
+            for index, candidate in enumerate(candidates)
+        }
+        pending = set(indices)
+        while pending:
+            timeout = None
+            if deadline is not None and board.best is not None:
+                timeout = max(0.0, deadline - time.perf_counter())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                board.record(indices[future], future)
+    finally:
+        for future in pending:
+            future.cancel()
+        # Terminated workers leave nothing running to wait for
+        terminated = bool(pending) and terminate_workers(pool)
+        pool.shutdown(wait=not pending or terminated, cancel_futures=True)
+
+    for future in pending:
+        board.cut_off(indices[future])
+    return board.result()
+
+
+class _Scoreboard:
+    """Collects the entries of the candidates and keeps only the best result."""
+
+    def __init__(
+        self,
+        candidates: Sequence[Candidate],
+        score: Callable[[TranspileResult], Any],
+    ) -> None:
+        self._candidates = candidates
+        self._score = score
+        self._entries: dict[int, PortfolioEntry] = {}
+        self._first_error: BaseException | None = None
+        self.best: tuple[Any, int, TranspileResult] | None = None
+
+    def record(self, index: int, future: Future[TranspileResult]) -> None:
+        candidate = self._candidates[index]
+        error = future.exception()
+        if error is not None:
+            self._first_error = self._first_error or error
+            self._entries[index] = PortfolioEntry(
+                candidate, STATUS_FAILED, error=f"{type(error).__name__}: {error}"
+            )
+            return
+
+        result = future.result()
+        score = self._score(result)
+        self._entries[index] = PortfolioEntry(
+            candidate, STATUS_OK, score, sum(result.timings.values())
+        )
+        # Only the best result is kept, so the others can be released
+        if self.best is None or (score, index) < self.best[:2]:
+            self.best = (score, index, result)
+
+    def cut_off(self, index: int) -> None:
+        self._entries[index] = PortfolioEntry(self._candidates[index], STATUS_CUT_OFF)
+
+    def result(self) -> PortfolioResult:
+        if self.best is None:
+            msg = "Every candidate failed: " + "; ".join(
+                f"{entry.candidate}: {entry.error}" for entry in self._entries.values()
+            )
+            raise NoCandidateSucceededError(msg) from self._first_error
+
+        _, index, result = self.best
+        return PortfolioResult(result, self._candidates[index], self._leaderboard())
+
+    def _leaderboard(self) -> list[PortfolioEntry]:
+        order = {STATUS_OK: 0, STATUS_CUT_OFF: 1, STATUS_FAILED: 2}
+
+        def key(index: int) -> tuple[Any, ...]:
+            entry = self._entries[index]
+            if entry.status == STATUS_OK:
+                return (order[entry.status], entry.score, index)
+            return (order[entry.status], index)
+
+        return [self._entries[index] for index in sorted(self._entries, key=key)]
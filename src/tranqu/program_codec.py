@@ -0,0 +1,242 @@
+"""Provides a compact wire format for sending programs and results between processes.
+
+Pickling a `QuantumCircuit` or a tket `Circuit` copies its whole object graph.
+Programs are therefore encoded in their libraries' own serialization formats
+before they are sent to a worker process:
+
+- Qiskit circuits as QPY bytes. QPY keeps parameters, the global phase and
+  the layout of transpiled circuits, which an OpenQASM3 round trip does not.
+- tket circuits as their JSON dictionary.
+- OpenQASM3 programs and other strings as they are.
+
+Qiskit and tket circuits can instead be encoded as OpenQASM3 text by choosing
+the "openqasm3" wire format, which is portable but loses what OpenQASM3 cannot
+express. They are decoded back to the library they came from.
+Any other program is sent as is and pickled by the transport.
+A `TranspileResult` is encoded with its statistics computed, since the function
+that computes them lazily cannot leave the process that created it.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Any
+
+from .lazy_import import loaded_attribute
+from .tranqu_error import TranquError
+from .transpile_result import TranspileResult
+
+ENCODING_QPY = "qpy"
+ENCODING_TKET_JSON = "tket_json"
+ENCODING_QISKIT_OPENQASM3 = "qiskit_openqasm3"
+ENCODING_TKET_OPENQASM3 = "tket_openqasm3"
+ENCODING_TEXT = "text"
+ENCODING_OBJECT = "object"
+
+WIRE_FORMAT_QPY = "qpy"
+WIRE_FORMAT_TKET_JSON = "tket_json"
+WIRE_FORMAT_OPENQASM3 = "openqasm3"
+WIRE_FORMATS = (WIRE_FORMAT_QPY, WIRE_FORMAT_TKET_JSON, WIRE_FORMAT_OPENQASM3)
+"""The wire formats that can be chosen for Qiskit and tket circuits."""
+
+
+class ProgramCodecError(TranquError):
+    """Base exception for errors related to encoding programs."""
+
+
+class UnsupportedWireFormatError(ProgramCodecError):
+    """Raised when a program cannot be encoded in the requested wire format."""
+
+
+@dataclass(frozen=True)
+class EncodedProgram:
+    """A program in a form that is cheap to send to another process.
+
+    Args:
+        encoding (str): How the payload encodes the program:
+            "qpy", "tket_json", "text" or "object".
+        payload (Any): The encoded program.
+
+    """
+
+    encoding: str
+    payload: Any
+
+
+@dataclass(frozen=True)
+class EncodedResult:
+    """A `TranspileResult` in a form that is cheap to send to another process.
+
+    Args:
+        program (EncodedProgram | None): The transpiled program, or None if
+            no program was requested.
+        stats (dict[str, dict[str, Any]]): The computed statistics.
+        virtual_physical_mapping (dict[str, dict[int, int]]): The mapping between
+            virtual and physical qubits and bits.
+        timings (dict[str, float]): The wall-clock time spent in each stage.
+        cpu_timings (dict[str, float]): The CPU time spent in each stage.
+        tier (int): The configuration that produced the result.
+            See `TranspileResult`.
+        incremental (bool): Whether the layout and routing were reused.
+            See `TranspileResult`.
+
+    """
+
+    program: EncodedProgram | None
+    stats: dict[str, dict[str, Any]]
+    virtual_physical_mapping: dict[str, dict[int, int]]
+    timings: dict[str, float]
+    cpu_timings: dict[str, float]
+    tier: int = 0
+    incremental: bool = False
+
+
+def encode_program(
+    program: Any,  # noqa: ANN401
+    wire_format: str | None = None,
+) -> EncodedProgram:
+    """Encode a program for sending to another process.
+
+    Args:
+        program (Any): The program to encode.
+        wire_format (str | None): How to encode Qiskit and tket circuits:
+            "qpy" for Qiskit circuits, "tket_json" for tket circuits, or
+            "openqasm3" for either. If None, each circuit is encoded in its
+            library's own format. Strings and other programs are encoded
+            the same way in every wire format.
+
+    Returns:
+        EncodedProgram: The encoded program.
+
+    Raises:
+        UnsupportedWireFormatError: If the wire format is unknown or cannot
+            encode the program.
+
+    """
+    if wire_format is not None and wire_format not in WIRE_FORMATS:
+        msg = (
+            f"Unknown wire format '{wire_format}'. "
+            f"Use one of {', '.join(WIRE_FORMATS)}."
+        )
+        raise UnsupportedWireFormatError(msg)
+
+    if isinstance(program, str):
+        return EncodedProgram(ENCODING_TEXT, program)
+
+    # A program cannot be a circuit of a library that has not been imported
+    quantum_circuit = loaded_attribute("qiskit", "QuantumCircuit")
+    if quantum_circuit is not None and isinstance(program, quantum_circuit):
+        if wire_format == WIRE_FORMAT_OPENQASM3:
+            from qiskit.qasm3 import (  # type: ignore[import-untyped]  # noqa: PLC0415
+                dumps,
+            )
+
+            return EncodedProgram(ENCODING_QISKIT_OPENQASM3, dumps(program))
+        if wire_format not in {None, WIRE_FORMAT_QPY}:
+            msg = f"A Qiskit circuit cannot be encoded as '{wire_format}'."
+            raise UnsupportedWireFormatError(msg)
+
+        from qiskit import qpy  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        buffer = io.BytesIO()
+        qpy.dump(program, buffer)
+        return EncodedProgram(ENCODING_QPY, buffer.getvalue())
+
+    tket_circuit = loaded_attribute("pytket", "Circuit")
+    if tket_circuit is not None and isinstance(program, tket_circuit):
+        if wire_format == WIRE_FORMAT_OPENQASM3:
+            from pytket.extensions.qiskit import (  # type: ignore[attr-defined]  # noqa: PLC0415
+                tk_to_qiskit,
+            )
+            from qiskit.qasm3 import dumps  # noqa: PLC0415
+
+            return EncodedProgram(ENCODING_TKET_OPENQASM3, dumps(tk_to_qiskit(program)))
+        if wire_format not in {None, WIRE_FORMAT_TKET_JSON}:
+            msg = f"A tket circuit cannot be encoded as '{wire_format}'."
+            raise UnsupportedWireFormatError(msg)
+        return EncodedProgram(ENCODING_TKET_JSON, program.to_dict())
+
+    return EncodedProgram(ENCODING_OBJECT, program)
+
+
+def decode_program(encoded: EncodedProgram) -> Any:  # noqa: ANN401
+    """Decode a program encoded by `encode_program()`.
+
+    Args:
+        encoded (EncodedProgram): The encoded program.
+
+    Returns:
+        Any: The program.
+
+    """
+    if encoded.encoding == ENCODING_QPY:
+        from qiskit import qpy  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return qpy.load(io.BytesIO(encoded.payload))[0]
+    if encoded.encoding == ENCODING_TKET_JSON:
+        from pytket import Circuit  # type: ignore[attr-defined]  # noqa: PLC0415
+
+        return Circuit.from_dict(encoded.payload)
+    if encoded.encoding == ENCODING_QISKIT_OPENQASM3:
+        from qiskit.qasm3 import (  # type: ignore[import-untyped]  # noqa: PLC0415
+            loads,
+        )
+
+        return loads(encoded.payload)
+    if encoded.encoding == ENCODING_TKET_OPENQASM3:
+        from pytket.extensions.qiskit import (  # type: ignore[attr-defined]  # noqa: PLC0415
+            qiskit_to_tk,
+        )
+        from qiskit.qasm3 import loads  # noqa: PLC0415
+
+        return qiskit_to_tk(loads(encoded.payload))
+
+    return encoded.payload
+
+
+def encode_result(result: TranspileResult) -> EncodedResult:
+    """Encode a transpilation result for sending to another process.
+
+    The statistics are computed if they have not been accessed yet.
+
+    Args:
+        result (TranspileResult): The result to encode.
+
+    Returns:
+        EncodedResult: The encoded result.
+
+    """
+    result_dict = result.to_dict()
+    return EncodedResult(
+        program=None
+        if result.transpiled_program is None
+        else encode_program(result.transpiled_program),
+        stats=result_dict["stats"],
+        virtual_physical_mapping=result_dict["virtual_physical_mapping"],
+        timings=dict(result.timings),
+        cpu_timings=dict(result.cpu_timings),
+        tier=result.tier,
+        incremental=result.incremental,
+    )
+
+
+def decode_result(encoded: EncodedResult) -> TranspileResult:
+    """Decode a transpilation result encoded by `encode_result()`.
+
+    Args:
+        encoded (EncodedResult): The encoded result.
+
+    Returns:
+        TranspileResult: The result.
+
+    """
+    return TranspileResult(
+        None if encoded.program is None else decode_program(encoded.program),
+        encoded.stats,
+        encoded.virtual_physical_mapping,
+        encoded.timings,
+        encoded.cpu_timings,
+        tier=encoded.tier,
+        incremental=encoded.incremental,
+    )
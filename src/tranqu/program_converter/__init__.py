@@ -1,5 +1,7 @@
-from .openqasm3_to_qiskit_program_converter import Openqasm3ToQiskitProgramConverter
-from .openqasm3_to_tket_program_converter import Openqasm3ToTketProgramConverter
+from typing import TYPE_CHECKING
+
+from tranqu.lazy_import import lazy_module_getattr
+
 from .pass_through_program_converter import PassThroughProgramConverter
 from .program_converter import ProgramConverter
 from .program_converter_manager import (
@@ -7,10 +9,39 @@ from .program_converter_manager import (
     ProgramConverterManager,
     ProgramConverterNotFoundError,
 )
-from .qiskit_to_openqasm3_program_converter import QiskitToOpenqasm3ProgramConverter
-from .qiskit_to_tket_program_converter import QiskitToTketProgramConverter
-from .tket_to_openqasm3_program_converter import TketToOpenqasm3ProgramConverter
-from .tket_to_qiskit_program_converter import TketToQiskitProgramConverter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .openqasm3_to_qiskit_program_converter import (
+        Openqasm3ToQiskitProgramConverter,
+    )
+    from .openqasm3_to_tket_program_converter import Openqasm3ToTketProgramConverter
+    from .qiskit_to_openqasm3_program_converter import (
+        QiskitToOpenqasm3ProgramConverter,
+    )
+    from .qiskit_to_qpy_program_converter import QiskitToQpyProgramConverter
+    from .qiskit_to_tket_program_converter import QiskitToTketProgramConverter
+    from .qpy_to_qiskit_program_converter import QpyToQiskitProgramConverter
+    from .tket_json_to_tket_program_converter import TketJsonToTketProgramConverter
+    from .tket_to_openqasm3_program_converter import TketToOpenqasm3ProgramConverter
+    from .tket_to_qiskit_program_converter import TketToQiskitProgramConverter
+    from .tket_to_tket_json_program_converter import TketToTketJsonProgramConverter
+
+# Converters that import their backend library are imported on first access
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "Openqasm3ToQiskitProgramConverter": ".openqasm3_to_qiskit_program_converter",
+        "Openqasm3ToTketProgramConverter": ".openqasm3_to_tket_program_converter",
+        "QiskitToOpenqasm3ProgramConverter": ".qiskit_to_openqasm3_program_converter",
+        "QiskitToQpyProgramConverter": ".qiskit_to_qpy_program_converter",
+        "QiskitToTketProgramConverter": ".qiskit_to_tket_program_converter",
+        "QpyToQiskitProgramConverter": ".qpy_to_qiskit_program_converter",
+        "TketJsonToTketProgramConverter": ".tket_json_to_tket_program_converter",
+        "TketToOpenqasm3ProgramConverter": ".tket_to_openqasm3_program_converter",
+        "TketToQiskitProgramConverter": ".tket_to_qiskit_program_converter",
+        "TketToTketJsonProgramConverter": ".tket_to_tket_json_program_converter",
+    },
+)
 
 __all__ = [
     "Openqasm3ToQiskitProgramConverter",
@@ -21,7 +52,11 @@ __all__ = [
     "ProgramConverterManager",
     "ProgramConverterNotFoundError",
     "QiskitToOpenqasm3ProgramConverter",
+    "QiskitToQpyProgramConverter",
     "QiskitToTketProgramConverter",
+    "QpyToQiskitProgramConverter",
+    "TketJsonToTketProgramConverter",
     "TketToOpenqasm3ProgramConverter",
     "TketToQiskitProgramConverter",
+    "TketToTketJsonProgramConverter",
 ]
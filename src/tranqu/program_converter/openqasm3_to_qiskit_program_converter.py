@@ -1,20 +1,23 @@
 from qiskit import QuantumCircuit  # type: ignore[import-untyped]
 from qiskit.qasm3 import loads  # type: ignore[import-untyped]
 
+from tranqu.openqasm3_io import Openqasm3Source, read_openqasm3
+
 from .program_converter import ProgramConverter
 
 
 class Openqasm3ToQiskitProgramConverter(ProgramConverter):
     """Converter that transforms programs in OpenQASM3 format to Qiskit's format."""
 
-    def convert(self, program: str) -> QuantumCircuit:  # noqa: PLR6301
+    def convert(self, program: Openqasm3Source) -> QuantumCircuit:  # noqa: PLR6301
         """Convert the specified OpenQASM3 format program to Qiskit's format.
 
         Args:
-            program (str): A string representing a quantum program in OpenQASM3 format.
+            program (Openqasm3Source): A quantum program in OpenQASM3 format, as
+                a string, a path, a file object or an iterable of lines.
 
         Returns:
             QuantumCircuit: A quantum circuit in Qiskit format.
 
         """
-        return loads(program)
+        return loads(read_openqasm3(program))
@@ -2,21 +2,24 @@ from pytket import Circuit  # type: ignore[attr-defined]
 from pytket.extensions.qiskit import qiskit_to_tk  # type: ignore[attr-defined]
 from qiskit.qasm3 import loads  # type: ignore[import-untyped]
 
+from tranqu.openqasm3_io import Openqasm3Source, read_openqasm3
+
 from .program_converter import ProgramConverter
 
 
 class Openqasm3ToTketProgramConverter(ProgramConverter):
     """Converter that transforms OpenQASM3 to tket format quantum circuits."""
 
-    def convert(self, program: str) -> Circuit:  # noqa: PLR6301
+    def convert(self, program: Openqasm3Source) -> Circuit:  # noqa: PLR6301
         """Convert a quantum program in OpenQASM3 format to tket format.
 
         Args:
-            program (str): A string representing a quantum program in OpenQASM3 format.
+            program (Openqasm3Source): A quantum program in OpenQASM3 format, as
+                a string, a path, a file object or an iterable of lines.
 
         Returns:
             Circuit: A quantum circuit in tket format.
 
         """
-        qiskit_circuit = loads(program)
+        qiskit_circuit = loads(read_openqasm3(program))
         return qiskit_to_tk(qiskit_circuit)
@@ -1,3 +1,5 @@
+from tranqu.conversion_graph import ConversionGraph
+from tranqu.lazy_import import LazyFactory
 from tranqu.tranqu_error import TranquError
 
 from .pass_through_program_converter import PassThroughProgramConverter
@@ -22,10 +24,32 @@ class ProgramConverterManager:
     Provides functionality to register, retrieve, and check converters.
     Converters are objects that perform conversions from a specific source
     program to a target program.
+
+    Args:
+        adaptive_routing (bool): Whether conversion paths are chosen by the
+            measured latencies of the converters rather than by their cost
+            hints alone. Adaptive paths can change from run to run.
+            Defaults to False.
+
     """
 
-    def __init__(self) -> None:
-        self._converters: dict[tuple[str, str], ProgramConverter] = {}
+    def __init__(self, *, adaptive_routing: bool = False) -> None:
+        self._converters: dict[tuple[str, str], ProgramConverter | LazyFactory] = {}
+        self._graph = ConversionGraph(adaptive=adaptive_routing)
+
+    @property
+    def revision(self) -> int:
+        """Returns a counter that changes whenever the conversion paths may change.
+
+        It changes when a converter is registered or removed, or, with adaptive
+        routing, when a measured latency changes enough to affect path selection.
+
+        Returns:
+            int: The current revision.
+
+        """
+        self._graph.sync_edges(self._converters.keys())
+        return self._graph.version
 
     def has_converter(self, from_lib: str, to_lib: str) -> bool:
         """Check if a converter exists between the specified devices.
@@ -71,24 +95,33 @@ class ProgramConverterManager:
             msg = f"Converter not found for conversion from {from_lib} to {to_lib}."
             raise ProgramConverterNotFoundError(msg)
 
+        if isinstance(converter, LazyFactory):
+            converter = converter.create()
+            self._converters[from_lib, to_lib] = converter
+
         return converter
 
     def register_converter(
         self,
         from_lib: str,
         to_lib: str,
-        converter: ProgramConverter,
+        converter: ProgramConverter | LazyFactory,
         *,
         allow_override: bool = False,
+        cost: float | None = None,
     ) -> None:
         """Register a converter between the specified programs.
 
         Args:
             from_lib (str): The name of the source program.
             to_lib (str): The name of the target program.
-            converter (ProgramConverter): The converter instance to register.
+            converter (ProgramConverter | LazyFactory): The converter instance to
+              register, or a `LazyFactory` that creates it on first use.
             allow_override (bool): When False, prevents overwriting existing
               registrations. Defaults to False.
+            cost (float | None): An estimate of the conversion time in seconds,
+              used to choose between conversion paths until the converter
+              has been timed. Defaults to None.
 
         Raises:
             ProgramConverterAlreadyRegisteredError:
@@ -105,3 +138,45 @@ class ProgramConverterManager:
             raise ProgramConverterAlreadyRegisteredError(msg)
 
         self._converters[key] = converter
+        self._graph.add_edge(from_lib, to_lib, cost)
+
+    def find_path(self, from_lib: str, to_lib: str) -> tuple[str, ...] | None:
+        """Find the cheapest chain of converters between two libraries.
+
+        Args:
+            from_lib (str): The library to convert from.
+            to_lib (str): The library to convert to.
+
+        Returns:
+            tuple[str, ...] | None: The libraries along the path, starting with
+                `from_lib` and ending with `to_lib`, or None if no chain of
+                registered converters connects them.
+
+        """
+        self._graph.sync_edges(self._converters.keys())
+        return self._graph.shortest_path(from_lib, to_lib)
+
+    def set_transit_penalty(self, lib: str, penalty: float) -> None:
+        """Make conversion paths that pass through a library more expensive.
+
+        Args:
+            lib (str): The library to avoid as an intermediate hop, e.g.,
+                a text format that is printed and parsed again on every hop.
+            penalty (float): The extra cost of passing through the library, as
+                a multiple of the cost assumed for an untried converter.
+
+        """
+        self._graph.set_transit_penalty(lib, penalty)
+
+    def record_latency(self, from_lib: str, to_lib: str, seconds: float) -> None:
+        """Record the measured time of a conversion for adaptive path selection.
+
+        Ignored unless the manager was created with `adaptive_routing=True`.
+
+        Args:
+            from_lib (str): The library the converter converts from.
+            to_lib (str): The library the converter converts to.
+            seconds (float): The measured time of the conversion.
+
+        """
+        self._graph.record_latency(from_lib, to_lib, seconds)
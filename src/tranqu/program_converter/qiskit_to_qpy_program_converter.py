@@ -0,0 +1,23 @@
+import io
+
+from qiskit import QuantumCircuit, qpy  # type: ignore[import-untyped]
+
+from .program_converter import ProgramConverter
+
+
+class QiskitToQpyProgramConverter(ProgramConverter):
+    """Converter that transforms Qiskit quantum circuits to QPY bytes."""
+
+    def convert(self, program: QuantumCircuit) -> bytes:  # noqa: PLR6301
+        """Convert a Qiskit quantum circuit to QPY.
+
+        Args:
+            program (QuantumCircuit): Quantum circuit in Qiskit format.
+
+        Returns:
+            bytes: The circuit serialized in Qiskit's binary QPY format.
+
+        """
+        buffer = io.BytesIO()
+        qpy.dump(program, buffer)
+        return buffer.getvalue()
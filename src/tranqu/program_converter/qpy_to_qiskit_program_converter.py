@@ -0,0 +1,22 @@
+import io
+
+from qiskit import QuantumCircuit, qpy  # type: ignore[import-untyped]
+
+from .program_converter import ProgramConverter
+
+
+class QpyToQiskitProgramConverter(ProgramConverter):
+    """Converter that transforms QPY bytes to Qiskit quantum circuits."""
+
+    def convert(self, program: bytes) -> QuantumCircuit:  # noqa: PLR6301
+        """Convert a quantum circuit in QPY format to Qiskit format.
+
+        Args:
+            program (bytes): A circuit serialized in Qiskit's binary QPY format.
+                If it contains several circuits, the first one is converted.
+
+        Returns:
+            QuantumCircuit: A quantum circuit in Qiskit format.
+
+        """
+        return qpy.load(io.BytesIO(program))[0]
@@ -0,0 +1,22 @@
+from typing import Any
+
+from pytket import Circuit  # type: ignore[attr-defined]
+
+from .program_converter import ProgramConverter
+
+
+class TketJsonToTketProgramConverter(ProgramConverter):
+    """Converter that transforms tket's JSON dictionaries to tket quantum circuits."""
+
+    def convert(self, program: dict[str, Any]) -> Circuit:  # noqa: PLR6301
+        """Convert a quantum circuit in tket's JSON format to tket format.
+
+        Args:
+            program (dict[str, Any]): The dictionary of a circuit, as returned by
+                `Circuit.to_dict()`.
+
+        Returns:
+            Circuit: A quantum circuit in tket format.
+
+        """
+        return Circuit.from_dict(program)
@@ -0,0 +1,21 @@
+from typing import Any
+
+from pytket import Circuit  # type: ignore[attr-defined]
+
+from .program_converter import ProgramConverter
+
+
+class TketToTketJsonProgramConverter(ProgramConverter):
+    """Converter that transforms tket quantum circuits to their JSON dictionary."""
+
+    def convert(self, program: Circuit) -> dict[str, Any]:  # noqa: PLR6301
+        """Convert a tket quantum circuit to tket's JSON format.
+
+        Args:
+            program (Circuit): Quantum circuit in tket format.
+
+        Returns:
+            dict[str, Any]: The JSON-serializable dictionary of the circuit.
+
+        """
+        return program.to_dict()
@@ -1,5 +1,6 @@
 from typing import Any
 
+from .lazy_import import loaded_attribute
 from .tranqu_error import TranquError
 
 
@@ -16,6 +17,9 @@ class ProgramTypeManager:
 
     def __init__(self) -> None:
         self._type_registry: dict[type[Any], str] = {}
+        self._resolved_types: dict[type[Any], str] = {}
+        # Types registered by name, keyed by (module name, type name)
+        self._lazy_types: dict[tuple[str, str], str] = {}
 
     def register_type(
         self, program_lib: str, program_type: type[Any], *, allow_override: bool = False
@@ -33,7 +37,7 @@ class ProgramTypeManager:
               registered and allow_override is False.
 
         """
-        if not allow_override and program_lib in self._type_registry.values():
+        if not allow_override and self._is_registered(program_lib):
             msg = (
                 f"Library '{program_lib}' is already registered. "
                 "Use allow_override=True to force registration."
@@ -41,6 +45,43 @@ class ProgramTypeManager:
             raise ProgramLibraryAlreadyRegisteredError(msg)
 
         self._type_registry[program_type] = program_lib
+        self._resolved_types = dict(self._type_registry)
+
+    def register_lazy_type(
+        self,
+        program_lib: str,
+        module_name: str,
+        type_name: str,
+        *,
+        allow_override: bool = False,
+    ) -> None:
+        """Register a program type by name without importing its module.
+
+        The type is looked up when a program is resolved after its module has
+        been imported, since no program can be an instance of it before that.
+
+        Args:
+            program_lib (str): Library identifier
+            module_name (str): The absolute name of the module that defines
+              the type, e.g., "qiskit".
+            type_name (str): The name of the type in the module,
+              e.g., "QuantumCircuit".
+            allow_override (bool): When False, prevents overwriting existing
+              registrations. Defaults to False.
+
+        Raises:
+            ProgramLibraryAlreadyRegisteredError: If the library is already
+              registered and allow_override is False.
+
+        """
+        if not allow_override and self._is_registered(program_lib):
+            msg = (
+                f"Library '{program_lib}' is already registered. "
+                "Use allow_override=True to force registration."
+            )
+            raise ProgramLibraryAlreadyRegisteredError(msg)
+
+        self._lazy_types[module_name, type_name] = program_lib
 
     def resolve_lib(self, program: Any) -> str | None:  # noqa: ANN401
         """Resolve the library identifier for a given program instance.
@@ -52,8 +93,38 @@ class ProgramTypeManager:
             The library identifier if the program type is registered, None otherwise.
 
         """
-        for program_type, lib in self._type_registry.items():
-            if isinstance(program, program_type):
+        program_class = type(program)
+        lib = self._resolved_types.get(program_class)
+        if lib is not None:
+            return lib
+
+        if self._lazy_types:
+            self._load_lazy_types()
+
+        # Subclasses of registered types are remembered, since the class
+        # hierarchy does not change. Virtual subclasses are checked every time.
+        for base in program_class.__mro__[1:]:
+            lib = self._type_registry.get(base)
+            if lib is not None:
+                self._resolved_types[program_class] = lib
                 return lib
 
+        for registered_type, registered_lib in self._type_registry.items():
+            if isinstance(program, registered_type):
+                return registered_lib
+
         return None
+
+    def _is_registered(self, program_lib: str) -> bool:
+        return (
+            program_lib in self._type_registry.values()
+            or program_lib in self._lazy_types.values()
+        )
+
+    def _load_lazy_types(self) -> None:
+        for (module_name, type_name), program_lib in list(self._lazy_types.items()):
+            program_type = loaded_attribute(module_name, type_name)
+            if program_type is not None:
+                self._lazy_types.pop((module_name, type_name), None)
+                self._type_registry[program_type] = program_lib
+                self._resolved_types[program_type] = program_lib
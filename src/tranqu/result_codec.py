@@ -0,0 +1,372 @@
+"""Provides a versioned serialization of `TranspileResult` including its program.
+
+`TranspileResult.to_dict()` leaves out the program, and pickling a result copies
+the whole object graph of a Qiskit or tket circuit. The formats here store the
+program in a wire format of `program_codec`, e.g., QPY, tket JSON or OpenQASM3,
+and the qubit and bit mappings as arrays of integers.
+
+There are two formats:
+
+- Bytes, written by `TranspileResult.to_bytes()`: a header with a magic number,
+  the format version and the length of a JSON section, then the JSON section
+  with the statistics and timings, then the mappings as little-endian 32-bit
+  integer arrays and the program payload.
+- JSON, one object per result, written by `TranspileResult.to_json()` or
+  as JSON lines by `write_results_jsonl()`. Binary payloads such as QPY are
+  base64 encoded.
+
+Programs that have no wire format, e.g., of a user-defined library, are pickled,
+so only read results from trusted sources.
+
+Example:
+    To store results as JSON lines and read them back one at a time:
+
+        with open("results.jsonl", "w") as stream:
+            write_results_jsonl(results, stream, wire_format="openqasm3")
+
+        with open("results.jsonl") as stream:
+            for result in read_results_jsonl(stream):
+                ...
+
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import pickle  # noqa: S403
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from .program_codec import (
+    ENCODING_OBJECT,
+    ENCODING_QPY,
+    ENCODING_TKET_JSON,
+    EncodedProgram,
+    decode_program,
+    encode_program,
+)
+from .tranqu_error import TranquError
+from .transpile_result import TranspileResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import IO
+
+FORMAT_VERSION = 1
+"""The version of the formats written by this module."""
+
+_MAGIC = b"TRQR"
+_HEADER = struct.Struct("<4sHI")
+_INT32 = (-(2**31), 2**31 - 1)
+
+
+class ResultCodecError(TranquError):
+    """Raised when a serialized result cannot be read."""
+
+
+def result_to_bytes(result: TranspileResult, wire_format: str | None = None) -> bytes:
+    """Serialize a result, including its program, to bytes.
+
+    Args:
+        result (TranspileResult): The result to serialize. Its statistics are
+            computed if they have not been accessed yet.
+        wire_format (str | None): The wire format of the program. See
+            `program_codec.encode_program()`.
+
+    Returns:
+        bytes: The serialized result.
+
+    """
+    blobs: list[bytes] = []
+    mappings: dict[str, Any] = {}
+    for name, mapping in result.to_dict()["virtual_physical_mapping"].items():
+        packed = _pack_mapping(mapping)
+        if packed is None:
+            mappings[name] = {"items": list(mapping.items())}
+            continue
+        keys, values = packed
+        mappings[name] = {"length": len(values), "dense": keys is None}
+        if keys is not None:
+            blobs.append(_int32_bytes(keys))
+        blobs.append(_int32_bytes(values))
+
+    program: dict[str, Any] | None = None
+    if result.transpiled_program is not None:
+        encoded = encode_program(result.transpiled_program, wire_format)
+        payload = _payload_bytes(encoded)
+        program = {"encoding": encoded.encoding, "length": len(payload)}
+        blobs.append(payload)
+
+    metadata = json.dumps(
+        {
+            **_common_fields(result),
+            "virtual_physical_mapping": mappings,
+            "program": program,
+        },
+        separators=(",", ":"),
+    ).encode()
+    return b"".join([
+        _HEADER.pack(_MAGIC, FORMAT_VERSION, len(metadata)),
+        metadata,
+        *blobs,
+    ])
+
+
+def result_from_bytes(data: bytes) -> TranspileResult:
+    """Deserialize a result written by `result_to_bytes()`.
+
+    Args:
+        data (bytes): The serialized result.
+
+    Returns:
+        TranspileResult: The result.
+
+    Raises:
+        ResultCodecError: If the data is not a serialized result or was written
+            in an unsupported format version.
+
+    """
+    if len(data) < _HEADER.size:
+        msg = "The data is too short to be a serialized TranspileResult."
+        raise ResultCodecError(msg)
+    magic, version, metadata_length = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        msg = "The data is not a serialized TranspileResult."
+        raise ResultCodecError(msg)
+    _check_version(version)
+
+    view = memoryview(data)
+    offset = _HEADER.size + metadata_length
+    metadata = json.loads(bytes(view[_HEADER.size : offset]))
+
+    def take(length: int) -> memoryview:
+        nonlocal offset
+        blob = view[offset : offset + length]
+        offset += length
+        return blob
+
+    mappings: dict[str, dict[int, int]] = {}
+    for name, packed in metadata["virtual_physical_mapping"].items():
+        if "items" in packed:
+            mappings[name] = dict(map(tuple, packed["items"]))
+            continue
+        length = packed["length"]
+        keys = None if packed["dense"] else _int32_array(take(4 * length))
+        mappings[name] = _unpack_mapping(keys, _int32_array(take(4 * length)))
+
+    program = None
+    if metadata["program"] is not None:
+        encoding = metadata["program"]["encoding"]
+        payload = _payload_from_bytes(
+            encoding, bytes(take(metadata["program"]["length"]))
+        )
+        program = decode_program(EncodedProgram(encoding, payload))
+
+    return TranspileResult(
+        program,
+        metadata["stats"],
+        mappings,
+        metadata["timings"],
+        metadata["cpu_timings"],
+        tier=metadata.get("tier", 0),
+        incremental=metadata.get("incremental", False),
+    )
+
+
+def result_to_json(result: TranspileResult, wire_format: str | None = None) -> str:
+    """Serialize a result, including its program, to a single line of JSON.
+
+    Args:
+        result (TranspileResult): The result to serialize. Its statistics are
+            computed if they have not been accessed yet.
+        wire_format (str | None): The wire format of the program. See
+            `program_codec.encode_program()`.
+
+    Returns:
+        str: The JSON object, without line breaks.
+
+    """
+    mappings: dict[str, Any] = {}
+    for name, mapping in result.to_dict()["virtual_physical_mapping"].items():
+        packed = _pack_mapping(mapping)
+        if packed is None:
+            mappings[name] = {"items": list(mapping.items())}
+        else:
+            keys, values = packed
+            mappings[name] = {
+                "keys": None if keys is None else list(keys),
+                "values": list(values),
+            }
+
+    program: dict[str, Any] | None = None
+    if result.transpiled_program is not None:
+        encoded = encode_program(result.transpiled_program, wire_format)
+        data: Any = encoded.payload
+        if encoded.encoding in {ENCODING_QPY, ENCODING_OBJECT}:
+            data = base64.b64encode(_payload_bytes(encoded)).decode("ascii")
+        program = {"encoding": encoded.encoding, "data": data}
+
+    return json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            **_common_fields(result),
+            "virtual_physical_mapping": mappings,
+            "program": program,
+        },
+        separators=(",", ":"),
+    )
+
+
+def result_from_json(line: str | bytes) -> TranspileResult:
+    """Deserialize a result written by `result_to_json()`.
+
+    Args:
+        line (str | bytes): The JSON object.
+
+    Returns:
+        TranspileResult: The result.
+
+    """
+    record = json.loads(line)
+    _check_version(record.get("version"))
+
+    mappings: dict[str, dict[int, int]] = {}
+    for name, packed in record["virtual_physical_mapping"].items():
+        if "items" in packed:
+            mappings[name] = dict(map(tuple, packed["items"]))
+        else:
+            mappings[name] = _unpack_mapping(packed["keys"], packed["values"])
+
+    program = None
+    if record["program"] is not None:
+        encoding = record["program"]["encoding"]
+        data = record["program"]["data"]
+        if encoding in {ENCODING_QPY, ENCODING_OBJECT}:
+            data = _payload_from_bytes(encoding, base64.b64decode(data))
+        program = decode_program(EncodedProgram(encoding, data))
+
+    return TranspileResult(
+        program,
+        record["stats"],
+        mappings,
+        record["timings"],
+        record["cpu_timings"],
+        tier=record.get("tier", 0),
+        incremental=record.get("incremental", False),
+    )
+
+
+def write_results_jsonl(
+    results: Iterable[TranspileResult],
+    stream: IO[str],
+    wire_format: str | None = None,
+) -> None:
+    """Write results to a text stream as JSON lines, one result per line.
+
+    Args:
+        results (Iterable[TranspileResult]): The results to write. They are
+            serialized one at a time, so a generator is never held in memory.
+        stream (IO[str]): The stream to write to.
+        wire_format (str | None): The wire format of the programs. See
+            `program_codec.encode_program()`.
+
+    """
+    for result in results:
+        stream.write(result_to_json(result, wire_format))
+        stream.write("\n")
+
+
+def read_results_jsonl(stream: Iterable[str]) -> Iterator[TranspileResult]:
+    """Read results written by `write_results_jsonl()` one line at a time.
+
+    Args:
+        stream (Iterable[str]): The text stream, or any iterable of lines.
+
+    Yields:
+        TranspileResult: The results, in the order they were written.
+
+    """
+    for line in stream:
+        if line.strip():
+            yield result_from_json(line)
+
+
+def _common_fields(result: TranspileResult) -> dict[str, Any]:
+    return {
+        "stats": result.to_dict()["stats"],
+        "timings": result.timings,
+        "cpu_timings": result.cpu_timings,
+        "tier": result.tier,
+        "incremental": result.incremental,
+    }
+
+
+def _check_version(version: object) -> None:
+    if version != FORMAT_VERSION:
+        msg = (
+            f"Unsupported TranspileResult format version {version}. "
+            f"This version of tranqu reads version {FORMAT_VERSION}."
+        )
+        raise ResultCodecError(msg)
+
+
+def _pack_mapping(
+    mapping: Mapping[Any, Any],
+) -> tuple[list[int] | None, list[int]] | None:
+    # Mappings with entries that are not 32-bit integers are stored as items
+    low, high = _INT32
+    if not all(
+        isinstance(value, int) and low <= value <= high
+        for item in mapping.items()
+        for value in item
+    ):
+        return None
+    keys = list(mapping)
+    values = list(mapping.values())
+    return (None if keys == list(range(len(keys))) else keys), values
+
+
+def _unpack_mapping(
+    keys: Iterable[int] | None, values: Iterable[int]
+) -> dict[int, int]:
+    if keys is None:
+        return dict(enumerate(values))
+    return dict(zip(keys, values, strict=True))
+
+
+def _int32_bytes(values: list[int]) -> bytes:
+    packed = array("i", values)
+    if sys.byteorder == "big":  # pragma: no cover
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _int32_array(data: memoryview) -> array[int]:
+    values = array("i")
+    values.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+def _payload_bytes(encoded: EncodedProgram) -> bytes:
+    if encoded.encoding == ENCODING_QPY:
+        return encoded.payload
+    if encoded.encoding == ENCODING_TKET_JSON:
+        return json.dumps(encoded.payload, separators=(",", ":")).encode()
+    if encoded.encoding == ENCODING_OBJECT:
+        return pickle.dumps(encoded.payload)
+    return encoded.payload.encode()
+
+
+def _payload_from_bytes(encoding: str, data: bytes) -> Any:  # noqa: ANN401
+    if encoding == ENCODING_QPY:
+        return data
+    if encoding == ENCODING_TKET_JSON:
+        return json.loads(data)
+    if encoding == ENCODING_OBJECT:
+        return pickle.loads(data)  # noqa: S301
+    return data.decode()
@@ -0,0 +1,42 @@
+from .device_properties import DeviceProperties, InstructionProperties
+from .duration_metric import DurationMetric
+from .gate_counts_metric import GateCountsMetric
+from .measurement_count_metric import MeasurementCountMetric
+from .qiskit_device_properties import QiskitDeviceProperties
+from .stats_metric import (
+    CircuitInfo,
+    MetricAccumulator,
+    StatsMetric,
+    StatsOperation,
+    create_accumulators,
+)
+from .stats_metric_manager import (
+    CORE_STATS,
+    StatsMetricAlreadyRegisteredError,
+    StatsMetricError,
+    StatsMetricManager,
+    StatsMetricNotFoundError,
+)
+from .success_probability_metric import SuccessProbabilityMetric
+from .two_qubit_depth_metric import TwoQubitDepthMetric
+
+__all__ = [
+    "CORE_STATS",
+    "CircuitInfo",
+    "DeviceProperties",
+    "DurationMetric",
+    "GateCountsMetric",
+    "InstructionProperties",
+    "MeasurementCountMetric",
+    "MetricAccumulator",
+    "QiskitDeviceProperties",
+    "StatsMetric",
+    "StatsMetricAlreadyRegisteredError",
+    "StatsMetricError",
+    "StatsMetricManager",
+    "StatsMetricNotFoundError",
+    "StatsOperation",
+    "SuccessProbabilityMetric",
+    "TwoQubitDepthMetric",
+    "create_accumulators",
+]
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InstructionProperties:
+    """The calibrated properties of an instruction on specific qubits.
+
+    Args:
+        duration (float | None): The duration in seconds, if known.
+        error (float | None): The error rate, if known.
+
+    """
+
+    duration: float | None = None
+    error: float | None = None
+
+
+class DeviceProperties(ABC):
+    """Abstract base class for the device information that metrics can use."""
+
+    @abstractmethod
+    def instruction_properties(
+        self, name: str, qubits: tuple[int, ...]
+    ) -> InstructionProperties | None:
+        """Look up the properties of an instruction.
+
+        Args:
+            name (str): The lowercase instruction name, e.g., "cx" or "measure".
+            qubits (tuple[int, ...]): The physical qubits it acts on.
+
+        Returns:
+            InstructionProperties | None: The properties, or None if the device
+                does not describe the instruction on these qubits.
+
+        """
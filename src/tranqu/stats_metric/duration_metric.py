@@ -0,0 +1,59 @@
+from .stats_metric import CircuitInfo, MetricAccumulator, StatsMetric, StatsOperation
+
+
+class DurationMetric(StatsMetric):
+    """Estimate the duration of a circuit in seconds from the device calibration.
+
+    Each operation starts when all of its bits are free and takes
+    the calibrated duration of the instruction on its qubits. Operations without
+    a calibrated duration, such as barriers, take no time but still wait for
+    their bits. The result is the time at which the last bit is free, or None
+    if the device properties are not known.
+    """
+
+    requires_device = True
+
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:  # noqa: PLR6301
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator of the estimated duration.
+
+        """
+        return _Duration(circuit)
+
+
+class _Duration(MetricAccumulator):
+    def __init__(self, circuit: CircuitInfo) -> None:
+        self._device_properties = circuit.device_properties
+        self._qubit_times = [0.0] * circuit.n_qubits
+        self._clbit_times = [0.0] * circuit.n_clbits
+
+    def add(self, operation: StatsOperation) -> None:
+        if self._device_properties is None:
+            return
+
+        start = max(
+            [self._qubit_times[qubit] for qubit in operation.qubits]
+            + [self._clbit_times[clbit] for clbit in operation.clbits],
+            default=0.0,
+        )
+        properties = self._device_properties.instruction_properties(
+            operation.name, operation.qubits
+        )
+        end = start
+        if properties is not None and properties.duration is not None:
+            end += properties.duration
+
+        for qubit in operation.qubits:
+            self._qubit_times[qubit] = end
+        for clbit in operation.clbits:
+            self._clbit_times[clbit] = end
+
+    def result(self) -> float | None:
+        if self._device_properties is None:
+            return None
+        return max(self._qubit_times + self._clbit_times, default=0.0)
@@ -0,0 +1,32 @@
+from .stats_metric import CircuitInfo, MetricAccumulator, StatsMetric, StatsOperation
+
+
+class GateCountsMetric(StatsMetric):
+    """Count the operations of each name, e.g., `{"cx": 2, "measure": 2}`.
+
+    Like Qiskit's `count_ops()`, measurements, resets and barriers are
+    counted as well.
+    """
+
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:  # noqa: ARG002 PLR6301
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator of the counts by name.
+
+        """
+        return _GateCounts()
+
+
+class _GateCounts(MetricAccumulator):
+    def __init__(self) -> None:
+        self._counts: dict[str, int] = {}
+
+    def add(self, operation: StatsOperation) -> None:
+        self._counts[operation.name] = self._counts.get(operation.name, 0) + 1
+
+    def result(self) -> dict[str, int]:
+        return self._counts
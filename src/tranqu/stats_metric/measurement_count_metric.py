@@ -0,0 +1,29 @@
+from .stats_metric import CircuitInfo, MetricAccumulator, StatsMetric, StatsOperation
+
+
+class MeasurementCountMetric(StatsMetric):
+    """Count the measurements of a circuit."""
+
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:  # noqa: ARG002 PLR6301
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator of the number of measurements.
+
+        """
+        return _MeasurementCount()
+
+
+class _MeasurementCount(MetricAccumulator):
+    def __init__(self) -> None:
+        self._count = 0
+
+    def add(self, operation: StatsOperation) -> None:
+        if operation.name == "measure":
+            self._count += 1
+
+    def result(self) -> int:
+        return self._count
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .device_properties import DeviceProperties, InstructionProperties
+
+if TYPE_CHECKING:  # pragma: no cover
+    from qiskit.transpiler import Target  # type: ignore[import-untyped]
+
+
+class QiskitDeviceProperties(DeviceProperties):
+    """Device properties read from a Qiskit `Target`.
+
+    Lookups are memoized, since the same instructions repeat many times
+    in a circuit.
+
+    Args:
+        target (Target): The target, e.g., `backend.target`.
+
+    """
+
+    def __init__(self, target: Target) -> None:
+        self._target = target
+        self._properties: dict[
+            tuple[str, tuple[int, ...]], InstructionProperties | None
+        ] = {}
+
+    def instruction_properties(
+        self, name: str, qubits: tuple[int, ...]
+    ) -> InstructionProperties | None:
+        """Look up the properties of an instruction in the target.
+
+        Args:
+            name (str): The instruction name, e.g., "cx" or "measure".
+            qubits (tuple[int, ...]): The physical qubits it acts on.
+
+        Returns:
+            InstructionProperties | None: The properties, or None if the target
+                does not describe the instruction on these qubits.
+
+        """
+        key = (name, qubits)
+        if key not in self._properties:
+            self._properties[key] = self._look_up(name, qubits)
+        return self._properties[key]
+
+    def _look_up(
+        self, name: str, qubits: tuple[int, ...]
+    ) -> InstructionProperties | None:
+        if name not in self._target.operation_names:
+            return None
+
+        properties_by_qubits = self._target[name]
+        properties = properties_by_qubits.get(qubits)
+        if properties is None:
+            # Instructions available on all qubits are stored under None
+            properties = properties_by_qubits.get(None)
+        if properties is None:
+            return None
+
+        return InstructionProperties(
+            duration=properties.duration, error=properties.error
+        )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+    from .device_properties import DeviceProperties
+
+
+class StatsOperation(NamedTuple):
+    """One operation of a circuit, in a form shared by all circuit libraries.
+
+    Args:
+        name (str): The lowercase operation name, e.g., "cx" or "measure".
+        qubits (tuple[int, ...]): The indices of the qubits it acts on.
+        clbits (tuple[int, ...]): The indices of the classical bits it acts on.
+        is_gate (bool): Whether the operation counts as a gate, i.e.,
+            it is not a measurement, reset, barrier or similar.
+        is_directive (bool): Whether the operation only synchronizes its bits,
+            like a barrier, without taking part in the depth.
+
+    """
+
+    name: str
+    qubits: tuple[int, ...]
+    clbits: tuple[int, ...]
+    is_gate: bool
+    is_directive: bool
+
+
+@dataclass(frozen=True)
+class CircuitInfo:
+    """Information about the circuit a metric is computed for.
+
+    Args:
+        n_qubits (int): The number of qubits.
+        n_clbits (int): The number of classical bits.
+        device_properties (DeviceProperties | None): The properties of
+            the target device, or None if they are not known, e.g., for
+            the circuit before transpilation.
+
+    """
+
+    n_qubits: int
+    n_clbits: int
+    device_properties: DeviceProperties | None = None
+
+
+class MetricAccumulator(ABC):
+    """Collects the value of a metric for one circuit, one operation at a time."""
+
+    @abstractmethod
+    def add(self, operation: StatsOperation) -> None:
+        """Take the next operation of the circuit into account.
+
+        Args:
+            operation (StatsOperation): The operation, in circuit order.
+
+        """
+
+    @abstractmethod
+    def result(self) -> Any:  # noqa: ANN401
+        """Return the value of the metric after all operations were added.
+
+        Returns:
+            Any: The value stored in the statistics, e.g., an int, a float,
+                a dictionary or None.
+
+        """
+
+
+class StatsMetric(ABC):
+    """Abstract base class for statistics computed in addition to the gate counts.
+
+    Stats extractors walk a circuit once and hand every operation to the
+    accumulators of all requested metrics, so that adding a metric does not add
+    a traversal. A metric declares what it needs besides the operations with
+    class attributes, e.g., `requires_device` for the device properties.
+    """
+
+    requires_device: ClassVar[bool] = False
+    """Whether the metric uses `CircuitInfo.device_properties`.
+
+    The dispatcher only looks up the device properties when a requested metric
+    needs them. Without them, the metric should report None.
+    """
+
+    @abstractmethod
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator that receives the operations
+                of the circuit.
+
+        """
+
+
+def create_accumulators(
+    metrics: Mapping[str, StatsMetric], circuit: CircuitInfo
+) -> dict[str, MetricAccumulator]:
+    """Create the accumulators of several metrics for one circuit.
+
+    Args:
+        metrics (Mapping[str, StatsMetric]): The metrics, keyed by name.
+        circuit (CircuitInfo): Information about the circuit.
+
+    Returns:
+        dict[str, MetricAccumulator]: The accumulators, keyed by metric name.
+
+    """
+    return {
+        name: metric.create_accumulator(circuit) for name, metric in metrics.items()
+    }
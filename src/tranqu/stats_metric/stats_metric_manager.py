@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+
+from tranqu.tranqu_error import TranquError
+
+from .stats_metric import StatsMetric
+
+CORE_STATS = frozenset({"n_qubits", "n_gates", "n_gates_1q", "n_gates_2q", "depth"})
+"""The statistics that every stats extractor computes without a metric."""
+
+
+class StatsMetricError(TranquError):
+    """Base exception for stats metric-related errors."""
+
+
+class StatsMetricAlreadyRegisteredError(StatsMetricError):
+    """Raised when attempting to register a metric that already exists."""
+
+
+class StatsMetricNotFoundError(StatsMetricError):
+    """Raised when the requested metric is not found."""
+
+
+class StatsMetricManager:
+    """Manages the registration and retrieval of stats metrics.
+
+    Metrics are registered by name, and that name is the key of their value in
+    the statistics of a `TranspileResult`. The names of the core statistics,
+    such as "depth", are reserved.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, StatsMetric] = {}
+
+    def register_metric(
+        self,
+        name: str,
+        metric: StatsMetric,
+        *,
+        allow_override: bool = False,
+    ) -> None:
+        """Register a new metric.
+
+        Args:
+            name (str): The name of the metric.
+            metric (StatsMetric): The metric to register.
+            allow_override (bool): When False, prevents overwriting existing
+              registrations. Defaults to False.
+
+        Raises:
+            StatsMetricAlreadyRegisteredError: If the name is one of the core
+                statistics, or a metric with the same name is already registered
+                and allow_override is False.
+
+        """
+        if name in CORE_STATS:
+            msg = f"'{name}' is a core statistic and cannot be registered."
+            raise StatsMetricAlreadyRegisteredError(msg)
+        if not allow_override and name in self._metrics:
+            msg = f"Stats metric '{name}' is already registered."
+            raise StatsMetricAlreadyRegisteredError(msg)
+
+        self._metrics[name] = metric
+
+    def fetch_metric(self, name: str) -> StatsMetric:
+        """Fetch a registered metric by its name.
+
+        Args:
+            name (str): The name of the metric to fetch.
+
+        Returns:
+            StatsMetric: The requested metric.
+
+        Raises:
+            StatsMetricNotFoundError: If no metric with the given name is found.
+
+        """
+        metric = self._metrics.get(name)
+        if metric is None:
+            msg = f"Unknown stats metric: {name}"
+            raise StatsMetricNotFoundError(msg)
+
+        return metric
+
+    def fetch_metrics(self, names: Iterable[str]) -> dict[str, StatsMetric]:
+        """Fetch several registered metrics.
+
+        Names of core statistics are skipped, since they are always computed.
+
+        Args:
+            names (Iterable[str]): The names of the metrics to fetch.
+
+        Returns:
+            dict[str, StatsMetric]: The metrics, keyed by name.
+
+        """
+        return {
+            name: self.fetch_metric(name) for name in names if name not in CORE_STATS
+        }
@@ -0,0 +1,45 @@
+from .stats_metric import CircuitInfo, MetricAccumulator, StatsMetric, StatsOperation
+
+
+class SuccessProbabilityMetric(StatsMetric):
+    """Estimate the probability that a circuit runs without error.
+
+    The estimate is the product of `1 - error` over all operations with
+    a calibrated error rate on their qubits, or None if the device properties are
+    not known.
+    """
+
+    requires_device = True
+
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:  # noqa: PLR6301
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator of the success probability.
+
+        """
+        return _SuccessProbability(circuit)
+
+
+class _SuccessProbability(MetricAccumulator):
+    def __init__(self, circuit: CircuitInfo) -> None:
+        self._device_properties = circuit.device_properties
+        self._probability = 1.0
+
+    def add(self, operation: StatsOperation) -> None:
+        if self._device_properties is None:
+            return
+
+        properties = self._device_properties.instruction_properties(
+            operation.name, operation.qubits
+        )
+        if properties is not None and properties.error is not None:
+            self._probability *= 1.0 - properties.error
+
+    def result(self) -> float | None:
+        if self._device_properties is None:
+            return None
+        return self._probability
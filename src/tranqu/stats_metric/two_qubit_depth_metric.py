@@ -0,0 +1,47 @@
+from .stats_metric import CircuitInfo, MetricAccumulator, StatsMetric, StatsOperation
+
+
+class TwoQubitDepthMetric(StatsMetric):
+    """Count the layers of two-qubit gates on the longest path of a circuit.
+
+    Other operations do not add to the depth but still order the gates on
+    their bits, which matches Qiskit's
+    `circuit.depth(lambda instruction: instruction.operation.num_qubits == 2)`
+    for circuits without control flow.
+    """
+
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:  # noqa: PLR6301
+        """Create an accumulator for one circuit.
+
+        Args:
+            circuit (CircuitInfo): Information about the circuit.
+
+        Returns:
+            MetricAccumulator: An accumulator of the two-qubit depth.
+
+        """
+        return _TwoQubitDepth(circuit)
+
+
+class _TwoQubitDepth(MetricAccumulator):
+    _TWO_QUBITS = 2
+
+    def __init__(self, circuit: CircuitInfo) -> None:
+        self._qubit_levels = [0] * circuit.n_qubits
+        self._clbit_levels = [0] * circuit.n_clbits
+
+    def add(self, operation: StatsOperation) -> None:
+        level = max(
+            [self._qubit_levels[qubit] for qubit in operation.qubits]
+            + [self._clbit_levels[clbit] for clbit in operation.clbits],
+            default=0,
+        )
+        if operation.is_gate and len(operation.qubits) == self._TWO_QUBITS:
+            level += 1
+        for qubit in operation.qubits:
+            self._qubit_levels[qubit] = level
+        for clbit in operation.clbits:
+            self._clbit_levels[clbit] = level
+
+    def result(self) -> int:
+        return max(self._qubit_levels + self._clbit_levels, default=0)
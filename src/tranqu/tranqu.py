@@ -4,6 +4,11 @@ Users can perform flexible transpilation using the `transpile()` method.
 For example, quantum circuit programs in Qiskit or OpenQASM3 can be transpiled
 using a transpiler different from the program's format (such as Tket's transpiler).
 
+Programs can also be given and returned in the binary formats "qpy" (Qiskit's
+QPY bytes) and "tket-json" (the dictionary of `Circuit.to_dict()`), which are
+faster to parse and print than OpenQASM3 text. Conversion paths between
+libraries pass through these formats rather than OpenQASM3 where both exist.
+
 For instance, when transpiling a Qiskit quantum circuit program with Tket's transpiler,
 Tranqu automates the following processes:
 
@@ -28,6 +33,34 @@ Example:
         result = tranqu.transpile(
             circuit, program_lib="qiskit", transpiler_lib="tket")
 
+To transpile many programs at once, use `transpile_many()`. It returns the results
+in input order and runs the programs on a thread or process pool, or hands them to
+the transpiler in a single call when the transpiler supports it. With `dedup`, equal
+programs, or Qiskit circuits that differ only in their angles, are transpiled once.
+
+To bound the time of a transpilation, pass a `timeout` to `transpile()`. When it
+runs out, the program is transpiled again with a cheaper fallback configuration,
+e.g., a lower optimization level, and `TranspileResult.tier` records which one
+produced the result.
+
+To try several transpilers, options or seeds and keep the best result, e.g.,
+the one with the fewest 2-qubit gates, use `transpile_best()`.
+
+When only the calibration data of a device changed, pass the earlier result as
+`previous` to `transpile()`. Its layout and routing are reused if they still fit
+the device's topology, and only the noise-aware steps are redone.
+
+To transpile a circuit with symbolic parameters once and bind many sets of values
+to it, e.g., in a VQE loop, use `transpile_parametric()`.
+
+From asyncio code, use `transpile_async()` and `transpile_as_completed()`, which
+run the same pipeline on a thread pool without blocking the event loop:
+
+        result = await tranqu.transpile_async(circuit, transpiler_lib="qiskit")
+
+        async for index, result in tranqu.transpile_as_completed(circuits):
+            print(index, result.stats.after.depth)
+
 Additionally, it is possible to incorporate user-defined transpilers.
 This module also provides a series of methods for this purpose.
 
@@ -39,6 +72,10 @@ This module also provides a series of methods for this purpose.
 - `register_device_converter()`: Registers a converter (`DeviceConverter`)
     for quantum machine device information.
     This is also necessary when registering a custom transpiler.
+- `register_stats_metric()`: Registers a metric (`StatsMetric`) that can be
+    requested through the `metrics` argument of `transpile()`.
+- `add_observer()`: Adds a `TranspileObserver` that receives the wall-clock and
+    CPU time of each stage, e.g., to export them to a metrics pipeline.
 
 Example:
     To transpile Qiskit code using a user-defined transpiler
@@ -76,63 +113,147 @@ using their own transpilers.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from pytket import Circuit  # type: ignore[attr-defined]
-from qiskit import QuantumCircuit  # type: ignore[import-untyped]
-from qiskit.providers import BackendV2  # type: ignore[import-untyped]
-
+from .async_executor import AsyncTranspileExecutor
+from .batch_dedup import plan_dedup, supports_templates, validate_dedup
+from .batch_executor import (
+    expand_batch_items,
+    is_per_program,
+    run_batch,
+    validate_executor,
+)
+from .deadline import default_fallbacks, transpile_with_deadline
 from .device_converter import (
+    DeviceConversionCache,
     DeviceConverter,
     DeviceConverterManager,
-    OqtopusToOuquTpDeviceConverter,
-    OqtoqusToQiskitDeviceConverter,
-    QiskitToOuquTpDeviceConverter,
-    QiskitToTketDeviceConverter,
 )
 from .device_type_manager import DeviceTypeManager
-from .program_converter import (
-    Openqasm3ToQiskitProgramConverter,
-    Openqasm3ToTketProgramConverter,
-    ProgramConverter,
-    ProgramConverterManager,
-    QiskitToOpenqasm3ProgramConverter,
-    QiskitToTketProgramConverter,
-    TketToOpenqasm3ProgramConverter,
-    TketToQiskitProgramConverter,
+from .lazy_import import LazyFactory
+from .parametric import ParametersNotSupportedError, ParametricResult, parameter_names
+from .portfolio import (
+    DEFAULT_OBJECTIVE,
+    Candidate,
+    Objective,
+    PortfolioResult,
+    as_candidate,
+    candidate_options,
+    run_portfolio,
 )
+from .program_converter import ProgramConverter, ProgramConverterManager
 from .program_type_manager import ProgramTypeManager
-from .transpiler import (
-    OuquTpTranspiler,
-    QiskitTranspiler,
-    TketTranspiler,
-    TranspilerManager,
+from .stats_metric import (
+    DurationMetric,
+    GateCountsMetric,
+    MeasurementCountMetric,
+    StatsMetric,
+    StatsMetricManager,
+    SuccessProbabilityMetric,
+    TwoQubitDepthMetric,
 )
-from .transpiler_dispatcher import TranspilerDispatcher
+from .transpiler import STATS_FULL, TranspilerManager
+from .transpiler_dispatcher import OUTPUT_LIB_INPUT, TranspilerDispatcher
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from .transpile_cache import TranspileCache
+    from .transpile_observer import TranspileObserver
     from .transpile_result import TranspileResult
 
+# Passing through OpenQASM3 costs as much as two untried converters, so a path
+# over a binary format wins unless it needs more than two extra hops
+_TEXT_TRANSIT_PENALTY = 2.0
+
 
 class Tranqu:
     """Manage the transpilation of quantum circuits.
 
     Handles converters for transforming between different quantum program formats and
     transpilers for optimizing quantum circuits.
+
+    Args:
+        cache (TranspileCache | None): A cache that stores transpilation results
+            by the content of the request. If None, every request is transpiled.
+        device_cache_size (int): The number of converted devices to keep across
+            calls, so that e.g. a Qiskit `Target` is built only once per device.
+            If 0, devices are converted on every call. Defaults to 16.
+        async_max_workers (int | None): The number of threads that run
+            the transpilations requested through the asyncio methods, which
+            limits how many run at the same time. If None, the default of
+            `ThreadPoolExecutor` is used.
+        adaptive_routing (bool): Whether conversion paths between libraries
+            are chosen by the measured latencies of the converters. If False
+            (default), they are chosen by fixed cost hints, so the same request
+            always takes the same path.
+
     """
 
-    def __init__(self) -> None:
-        self._program_converter_manager = ProgramConverterManager()
-        self._device_converter_manager = DeviceConverterManager()
+    def __init__(
+        self,
+        *,
+        cache: TranspileCache | None = None,
+        device_cache_size: int = 16,
+        async_max_workers: int | None = None,
+        adaptive_routing: bool = False,
+    ) -> None:
+        self._cache = cache
+        self._async_executor = AsyncTranspileExecutor(max_workers=async_max_workers)
+        self._device_conversion_cache = DeviceConversionCache(
+            max_size=device_cache_size
+        )
+        self._program_converter_manager = ProgramConverterManager(
+            adaptive_routing=adaptive_routing
+        )
+        self._device_converter_manager = DeviceConverterManager(
+            adaptive_routing=adaptive_routing
+        )
         self._transpiler_manager = TranspilerManager()
         self._program_type_manager = ProgramTypeManager()
         self._device_type_manager = DeviceTypeManager()
+        self._stats_metric_manager = StatsMetricManager()
+        self._observers: list[TranspileObserver] = []
 
         self._register_builtin_program_converters()
         self._register_builtin_device_converters()
         self._register_builtin_transpilers()
         self._register_builtin_program_types()
         self._register_builtin_device_types()
+        self._register_builtin_stats_metrics()
+
+        self._dispatcher = TranspilerDispatcher(
+            self._transpiler_manager,
+            self._program_converter_manager,
+            self._device_converter_manager,
+            self._program_type_manager,
+            self._device_type_manager,
+            cache=self._cache,
+            device_conversion_cache=self._device_conversion_cache,
+            stats_metric_manager=self._stats_metric_manager,
+            observers=self._observers,
+        )
+
+    @property
+    def cache(self) -> TranspileCache | None:
+        """Returns the cache used to store transpilation results.
+
+        Returns:
+            TranspileCache | None: The cache, or None if caching is disabled.
+
+        """
+        return self._cache
+
+    @property
+    def device_conversion_cache(self) -> DeviceConversionCache:
+        """Returns the cache that keeps converted devices across calls.
+
+        Returns:
+            DeviceConversionCache: The cache of converted devices.
+
+        """
+        return self._device_conversion_cache
 
     def transpile(  # noqa: PLR0913
         self,
@@ -143,11 +264,21 @@ class Tranqu:
         transpiler_options: dict[str, Any] | None = None,
         device: Any | None = None,  # noqa: ANN401
         device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+        timeout: float | None = None,
+        fallbacks: Sequence[str | Candidate] | None = None,
+        timeout_executor: str = "thread",
+        previous: TranspileResult | None = None,
     ) -> TranspileResult:
         """Transpile the program using the specified transpiler.
 
         Args:
-            program (Any): The program to be transformed.
+            program (Any): The program to be transformed. A program in
+                the "openqasm3" library may also be a path, a file object or
+                an iterable of lines, which is read before it is converted.
             program_lib (str | None): The library or format of the program. If None,
                 will attempt to detect based on program type.
             transpiler_lib (str | None): The name of the transpiler to be used.
@@ -155,28 +286,609 @@ class Tranqu:
             device (Any | None): Information about the device on which
                 the program will be executed.
             device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device, e.g., a calibration timestamp. Converted devices are
+                reused while the tag is unchanged. If None, JSON-like devices are
+                identified by their content and other devices by their identity.
+            output_lib (str | None): The library of the returned program.
+                "input" (default) returns it in the library of `program`,
+                "native" returns the transpiler's own format without converting
+                it back, and None returns no program, e.g., when only the stats
+                and the mapping are needed. Any other value names a library to
+                convert the program to.
+            stats (str): The statistics to compute. "full" (default) computes
+                all of them, "counts" skips the depth, the most expensive one,
+                and "none" computes none, leaving `stats` of the result empty.
+                Statistics are computed on first access in any case.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute in the same pass as the statistics, e.g.,
+                ["gate_counts", "duration"]. Their values are added to
+                the "before" and "after" statistics under the same names.
+                Metrics that need device properties, such as "duration", are
+                None for the program before transpilation and when the device
+                cannot be converted to a Qiskit backend.
+            timeout (float | None): The number of seconds the transpilation
+                may take. If it takes longer, it is retried with each of
+                `fallbacks` in turn, each with the same timeout, and
+                `DeadlineExceededError` is raised if all of them time out.
+                `tier` of the result tells which configuration produced it.
+                If None (default), there is no limit.
+            fallbacks (Sequence[str | Candidate] | None): The cheaper
+                configurations to try after a timeout, as transpiler names or
+                as `Candidate`s with options. If None, the requested
+                transpiler is tried again at optimization level 0.
+            timeout_executor (str): Where each configuration runs when there is
+                a timeout. "thread" (default) cannot stop a configuration that
+                times out, which finishes in the background. "process" runs it
+                in a child process with a copy of this instance and terminates
+                the process when it times out.
+            previous (TranspileResult | None): An earlier result for the same
+                program and device topology, e.g., before the device's
+                calibration data changed. The Qiskit transpiler reuses its
+                layout and routing and only redoes the noise-aware steps:
+                the layout is rescored with the new error rates and the gates
+                are translated to the device's basis again. If a 2-qubit gate
+                of the earlier program no longer acts on coupled qubits, or
+                the earlier result has no program, the program is transpiled
+                from scratch. `incremental` of the result tells which
+                happened. Other transpilers always transpile from scratch.
+                Results are not cached when this is given.
 
         Returns:
             TranspileResult: The result of the transpilation.
 
         """
-        dispatcher = TranspilerDispatcher(
-            self._transpiler_manager,
-            self._program_converter_manager,
-            self._device_converter_manager,
-            self._program_type_manager,
-            self._device_type_manager,
+        if timeout is None:
+            return self._dispatcher.dispatch(
+                program,
+                program_lib,
+                transpiler_lib,
+                transpiler_options,
+                device,
+                device_lib,
+                device_version=device_version,
+                output_lib=output_lib,
+                stats=stats,
+                metrics=metrics,
+                previous=previous,
+            )
+
+        tiers = [
+            Candidate(
+                self._dispatcher.select_transpiler_lib(transpiler_lib),
+                transpiler_options,
+            )
+        ]
+        if fallbacks is None:
+            tiers.extend(default_fallbacks(tiers[0].transpiler_lib, transpiler_options))
+        else:
+            tiers.extend(as_candidate(fallback) for fallback in fallbacks)
+
+        tier_options = []
+        for tier in tiers:
+            # Backends are imported here rather than concurrently on a worker
+            program, transpiler = self._dispatcher.prepare(
+                program,
+                program_lib,
+                tier.transpiler_lib,
+                device,
+                device_lib,
+                output_lib,
+            )
+            tier_options.append((
+                tier.transpiler_lib,
+                candidate_options(tier, getattr(transpiler, "seed_option", None)),
+            ))
+
+        return transpile_with_deadline(
+            self,
+            program,
+            tier_options,
+            {
+                "program_lib": program_lib,
+                "device": device,
+                "device_lib": device_lib,
+                "device_version": device_version,
+                "output_lib": output_lib,
+                "stats": stats,
+                "metrics": metrics,
+                "previous": previous,
+            },
+            timeout=timeout,
+            executor=timeout_executor,
+        )
+
+    def transpile_many(  # noqa: PLR0913
+        self,
+        programs: Iterable[Any],
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any]
+        | Sequence[dict[str, Any] | None]
+        | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+        executor: str = "thread",
+        max_workers: int | None = None,
+        dedup: str | None = None,
+    ) -> list[TranspileResult]:
+        """Transpile many programs and return the results in input order.
+
+        `transpiler_options` and `device` are shared by all programs. To give
+        each program its own value, pass a list with one entry per program.
+
+        When options and device are shared and the transpiler supports native
+        batch transpilation (e.g., Qiskit), all programs are handed to the
+        transpiler in a single call. Otherwise, each program is transpiled
+        on a thread pool or a process pool.
+
+        Args:
+            programs (Iterable[Any]): The programs to be transformed.
+            program_lib (str | None): The library or format of the programs.
+                If None, will attempt to detect based on each program's type.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any] | Sequence[dict[str, Any] | None]):
+                Options passed to the transpiler, shared or per program.
+            device (Any | None): Information about the device on which
+                the programs will be executed, shared or per program.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. Only use it with a shared device.
+            output_lib (str | None): The library of the returned programs.
+                See `transpile()`.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+                See `transpile()`.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute. See `transpile()`.
+            executor (str): "thread" or "process". A process pool receives a copy
+                of this Tranqu instance, including all registrations.
+                Defaults to "thread".
+            max_workers (int | None): The maximum number of pool workers.
+                If None, the executor's default is used.
+            dedup (str | None): How to transpile equal programs only once.
+                "identical" transpiles programs with the same content, options
+                and device once, and each of them gets a copy of the result.
+                "structure" also transpiles Qiskit circuits that differ only in
+                their angles once, as a template with parameters, and binds
+                the angles of each circuit into the transpiled template.
+                The template is not optimized for particular angles, e.g., zero,
+                so the bound circuits and their statistics, which are those of
+                the template, can have more gates than transpiling each circuit
+                would give. See `batch_dedup`. If None (default), every program
+                is transpiled.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        Examples:
+            To transpile a list of circuits for the same device:
+
+                results = tranqu.transpile_many(
+                    circuits, transpiler_lib="qiskit", device=FakeSantiagoV2())
+
+        """
+        validate_executor(executor)
+        validate_dedup(dedup)
+        items = expand_batch_items(programs, transpiler_options, device)
+        if not items:
+            return []
+
+        if dedup is not None:
+            transpiler = self._transpiler_manager.fetch_transpiler(
+                self._dispatcher.select_transpiler_lib(transpiler_lib)
+            )
+            plan = plan_dedup(
+                items,
+                partial(self._dispatcher.identify_program, program_lib=program_lib),
+                mode=dedup,
+                templates=supports_templates(transpiler, program_lib, output_lib),
+            )
+            if len(plan.items) < len(items):
+                results = self.transpile_many(
+                    [item.program for item in plan.items],
+                    program_lib,
+                    transpiler_lib,
+                    transpiler_options=[item.transpiler_options for item in plan.items]
+                    if is_per_program(transpiler_options)
+                    else transpiler_options,
+                    device=[item.device for item in plan.items]
+                    if is_per_program(device)
+                    else device,
+                    device_lib=device_lib,
+                    device_version=device_version,
+                    output_lib=output_lib,
+                    stats=stats,
+                    metrics=metrics,
+                    executor=executor,
+                    max_workers=max_workers,
+                )
+                return plan.fan_out(results)
+
+        is_shared = not is_per_program(transpiler_options) and not is_per_program(
+            device
+        )
+        if is_shared and self._dispatcher.supports_native_batch(transpiler_lib):
+            return self._dispatcher.dispatch_many(
+                [item.program for item in items],
+                program_lib,
+                transpiler_lib,
+                items[0].transpiler_options,
+                items[0].device,
+                device_lib,
+                device_version=device_version,
+                output_lib=output_lib,
+                stats=stats,
+                metrics=metrics,
+            )
+
+        return run_batch(
+            self,
+            items,
+            {
+                "program_lib": program_lib,
+                "transpiler_lib": transpiler_lib,
+                "device_lib": device_lib,
+                "device_version": device_version,
+                "output_lib": output_lib,
+                "stats": stats,
+                "metrics": metrics,
+            },
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def transpile_best(  # noqa: PLR0913
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None = None,
+        *,
+        candidates: Iterable[str | Candidate],
+        objective: Objective = DEFAULT_OBJECTIVE,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        metrics: Sequence[str] | None = None,
+        time_budget: float | None = None,
+        executor: str = "thread",
+        max_workers: int | None = None,
+    ) -> PortfolioResult:
+        """Transpile the program with several candidates and return the best result.
+
+        The candidates run concurrently on a thread or process pool. Each result
+        is scored by `objective` over its "after" statistics, and the result
+        with the lowest score is returned with a leaderboard of all candidates.
+        Candidates that fail are recorded in the leaderboard instead of raising,
+        unless all of them fail.
+
+        Args:
+            program (Any): The program to be transformed.
+            program_lib (str | None): The library or format of the program.
+                If None, will attempt to detect based on program type.
+            candidates (Iterable[str | Candidate]): The transpilers to try, as
+                names or as `Candidate`s with options and a seed. A seed for
+                a transpiler without a `seed_option` raises
+                `SeedNotSupportedError`.
+            objective (Objective): The name of a statistic to minimize, e.g.,
+                "n_gates_2q", a sequence of names compared in order, or
+                a function of a `TranspileResult` that returns a comparable
+                score. Defaults to ("n_gates_2q", "depth").
+            device (Any | None): Information about the device on which
+                the program will be executed.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. See `transpile()`.
+            output_lib (str | None): The library of the returned program.
+                See `transpile()`.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute, e.g., to use "duration" in the objective.
+                See `transpile()`.
+            time_budget (float | None): The number of seconds after which
+                candidates that have not finished are cut off, as soon as any
+                candidate has a score. With the "process" executor, the worker
+                processes of cut-off candidates are terminated, while threads
+                finish in the background. If None, all candidates run to
+                completion.
+            executor (str): "thread" or "process". See `transpile_many()`.
+                Defaults to "thread".
+            max_workers (int | None): The maximum number of pool workers.
+                If None, the executor's default is used.
+
+        Returns:
+            PortfolioResult: The best result, its candidate and the leaderboard.
+
+        Examples:
+            To keep the best of Qiskit with four seeds and tket:
+
+                result = tranqu.transpile_best(
+                    circuit,
+                    candidates=[
+                        "tket",
+                        *(Candidate("qiskit", seed=seed) for seed in range(4)),
+                    ],
+                    device=FakeSantiagoV2(),
+                )
+
+        """
+        validate_executor(executor)
+        candidate_list = [as_candidate(candidate) for candidate in candidates]
+        options = []
+        for candidate in candidate_list:
+            # Backends are imported here, before the candidates start on threads
+            program, transpiler = self._dispatcher.prepare(
+                program,
+                program_lib,
+                candidate.transpiler_lib,
+                device,
+                device_lib,
+                output_lib,
+            )
+            # Transpilers that do not derive from Transpiler take no seed
+            options.append(
+                candidate_options(candidate, getattr(transpiler, "seed_option", None))
+            )
+
+        return run_portfolio(
+            self,
+            program,
+            candidate_list,
+            options,
+            device,
+            {
+                "program_lib": program_lib,
+                "device_lib": device_lib,
+                "device_version": device_version,
+                "output_lib": output_lib,
+                "metrics": metrics,
+            },
+            objective=objective,
+            time_budget=time_budget,
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def transpile_parametric(  # noqa: PLR0913
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any] | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+    ) -> ParametricResult:
+        """Transpile a parametric program once, to bind values to it many times.
+
+        The parameters are kept symbolic, and the returned `ParametricResult`
+        binds values to the transpiled Qiskit circuit with `bind()` and
+        `bind_many()`, without transpiling again. See `parametric`.
+
+        Args:
+            program (Any): The program to be transformed, e.g., a Qiskit
+                circuit with `Parameter`s.
+            program_lib (str | None): The library or format of the program.
+                If None, will attempt to detect based on program type.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+                It must keep parameters symbolic, as Qiskit's does.
+            transpiler_options (dict[str, Any]): Options passed to the transpiler.
+            device (Any | None): Information about the device on which
+                the program will be executed.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. See `transpile()`.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+                See `transpile()`.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute. See `transpile()`.
+
+        Returns:
+            ParametricResult: The transpiled circuit, its statistics and mapping,
+                and the methods to bind values to it. The values are given in
+                the order of the parameters of a Qiskit circuit, or else of
+                the transpiled circuit, as listed in `parameters`.
+
+        Raises:
+            ParametersNotSupportedError: If the transpiler does not keep
+                parameters symbolic.
+
+        Examples:
+            To bind the values of every iteration of a VQE loop:
+
+                parametric = tranqu.transpile_parametric(
+                    ansatz, transpiler_lib="qiskit", device=FakeSantiagoV2()
+                )
+                for values in optimizer:
+                    circuit = parametric.bind(values)
+
+        """
+        output_lib = "qiskit"
+        program, transpiler = self._dispatcher.prepare(
+            program, program_lib, transpiler_lib, device, device_lib, output_lib
         )
+        if not getattr(transpiler, "supports_parameters", False):
+            transpiler_lib = self._dispatcher.select_transpiler_lib(transpiler_lib)
+            msg = f"The transpiler {transpiler_lib} does not keep parameters symbolic."
+            raise ParametersNotSupportedError(msg)
 
-        return dispatcher.dispatch(
+        result = self._dispatcher.dispatch(
             program,
             program_lib,
             transpiler_lib,
             transpiler_options,
             device,
             device_lib,
+            device_version=device_version,
+            output_lib=output_lib,
+            stats=stats,
+            metrics=metrics,
+        )
+        return ParametricResult(result, parameter_names(program))
+
+    async def transpile_async(  # noqa: PLR0913
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any] | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+        timeout: float | None = None,
+    ) -> TranspileResult:
+        """Transpile the program on a worker thread without blocking the event loop.
+
+        The arguments are the same as for `transpile()`. Cancelling the call
+        removes the request if it has not started yet, and otherwise discards
+        its result once it finishes. If the program does not finish within
+        `timeout`, `TranspileTimeoutError` is raised.
+
+        Args:
+            program (Any): The program to be transformed.
+            program_lib (str | None): The library or format of the program.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any]): Options passed to the transpiler.
+            device (Any | None): Information about the device on which
+                the program will be executed.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. See `transpile()`.
+            output_lib (str | None): The library of the returned program.
+                See `transpile()`.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+                See `transpile()`.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute. See `transpile()`.
+            timeout (float | None): The number of seconds to wait, including
+                the time spent waiting for a free worker thread. If None,
+                there is no limit.
+
+        Returns:
+            TranspileResult: The result of the transpilation.
+
+        """
+        return await self._async_executor.run(
+            partial(
+                self.transpile,
+                program,
+                program_lib,
+                transpiler_lib,
+                transpiler_options=transpiler_options,
+                device=device,
+                device_lib=device_lib,
+                device_version=device_version,
+                output_lib=output_lib,
+                stats=stats,
+                metrics=metrics,
+            ),
+            timeout=timeout,
         )
 
+    async def transpile_as_completed(  # noqa: PLR0913
+        self,
+        programs: Iterable[Any],
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any]
+        | Sequence[dict[str, Any] | None]
+        | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, TranspileResult]]:
+        """Transpile many programs on worker threads and yield results as they finish.
+
+        The arguments are the same as for `transpile_many()`. Each result is
+        yielded with the position of its program, so that results can be
+        matched to programs although they arrive in order of completion.
+        If a program fails or does not finish within `timeout`, the error is
+        raised from the iterator and the programs that have not finished are
+        cancelled, as they are when the iterator is closed early.
+
+        Args:
+            programs (Iterable[Any]): The programs to be transformed.
+            program_lib (str | None): The library or format of the programs.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any] | Sequence[dict[str, Any] | None]):
+                Options passed to the transpiler, shared or per program.
+            device (Any | None): Information about the device on which
+                the programs will be executed, shared or per program.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. Only use it with a shared device.
+            output_lib (str | None): The library of the returned programs.
+                See `transpile()`.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+                See `transpile()`.
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute. See `transpile()`.
+            timeout (float | None): The number of seconds to wait for each
+                program. If None, there is no limit.
+            max_concurrency (int | None): The maximum number of programs
+                in flight at the same time. If None, the number of worker
+                threads.
+
+        Yields:
+            tuple[int, TranspileResult]: The position of the program in
+                `programs` and its result.
+
+        Examples:
+            To process results while the rest are still being transpiled:
+
+                async for index, result in tranqu.transpile_as_completed(
+                    circuits, transpiler_lib="qiskit", timeout=60
+                ):
+                    print(index, result.stats.after.n_gates_2q)
+
+        """
+        items = expand_batch_items(programs, transpiler_options, device)
+        funcs = (
+            partial(
+                self.transpile,
+                item.program,
+                program_lib,
+                transpiler_lib,
+                transpiler_options=item.transpiler_options,
+                device=item.device,
+                device_lib=device_lib,
+                device_version=device_version,
+                output_lib=output_lib,
+                stats=stats,
+                metrics=metrics,
+            )
+            for item in items
+        )
+
+        async for index, result in self._async_executor.as_completed(
+            funcs, timeout=timeout, max_concurrency=max_concurrency
+        ):
+            yield index, result
+
+    def close(self) -> None:
+        """Shut down the worker threads used by the asyncio methods.
+
+        Running transpilations are waited for. The threads are created
+        again if an asyncio method is called afterwards.
+        """
+        self._async_executor.shutdown()
+
     def register_default_transpiler_lib(
         self,
         default_transpiler_lib: str,
@@ -226,6 +938,7 @@ class Tranqu:
         converter: ProgramConverter,
         *,
         allow_override: bool = False,
+        cost: float | None = None,
     ) -> None:
         """Register a program converter.
 
@@ -241,6 +954,9 @@ class Tranqu:
                 (subclass of ProgramConverter).
             allow_override (bool): When True, allows overwriting of existing converters.
                 Defaults to False.
+            cost (float | None): An estimate of the conversion time in seconds.
+                Conversions follow the cheapest chain of registered converters,
+                using measured times once available. Defaults to None.
 
         Examples:
             To register a converter that transforms from "foo" to "bar", you can call:
@@ -255,6 +971,7 @@ class Tranqu:
             to_program_lib,
             converter,
             allow_override=allow_override,
+            cost=cost,
         )
 
     def register_device_converter(
@@ -264,6 +981,7 @@ class Tranqu:
         converter: DeviceConverter,
         *,
         allow_override: bool = False,
+        cost: float | None = None,
     ) -> None:
         """Register a device converter.
 
@@ -279,6 +997,9 @@ class Tranqu:
                 (subclass of DeviceConverter).
             allow_override (bool): When True, allows overwriting of existing converters.
                 Defaults to False.
+            cost (float | None): An estimate of the conversion time in seconds.
+                Conversions follow the cheapest chain of registered converters,
+                using measured times once available. Defaults to None.
 
         Examples:
             To register a converter that transforms from "foo" to "bar", you would call:
@@ -291,7 +1012,9 @@ class Tranqu:
             to_device_lib,
             converter,
             allow_override=allow_override,
+            cost=cost,
         )
+        self._device_conversion_cache.clear()
 
     def register_program_type(
         self,
@@ -353,78 +1076,222 @@ class Tranqu:
             allow_override=allow_override,
         )
 
-    def _register_builtin_program_converters(self) -> None:
-        self.register_program_converter(
-            "openqasm3",
-            "qiskit",
-            Openqasm3ToQiskitProgramConverter(),
-        )
-        self.register_program_converter(
-            "openqasm3",
-            "qiskit-passes",
-            Openqasm3ToQiskitProgramConverter(),
-        )
-        self.register_program_converter(
-            "openqasm3",
-            "tket",
-            Openqasm3ToTketProgramConverter(),
-        )
-        self.register_program_converter(
-            "qiskit",
-            "openqasm3",
-            QiskitToOpenqasm3ProgramConverter(),
-        )
-        self.register_program_converter(
-            "qiskit-passes",
-            "openqasm3",
-            QiskitToOpenqasm3ProgramConverter(),
-        )
-        self.register_program_converter(
-            "qiskit",
-            "tket",
-            QiskitToTketProgramConverter(),
-        )
-        self.register_program_converter(
-            "tket",
-            "openqasm3",
-            TketToOpenqasm3ProgramConverter(),
+    def register_stats_metric(
+        self,
+        name: str,
+        metric: StatsMetric,
+        *,
+        allow_override: bool = False,
+    ) -> None:
+        """Register a metric that can be requested by name when transpiling.
+
+        The metric is computed in the same pass over the circuit as
+        the built-in statistics.
+
+        Args:
+            name (str): The name of the metric, also its key in the statistics.
+            metric (StatsMetric): The metric to register.
+            allow_override (bool): When True, allows overwriting of existing
+                metrics. Defaults to False.
+
+        Examples:
+            To count the measurements of the transpiled circuit:
+
+                tranqu.register_stats_metric("n_measure", MeasurementCountMetric())
+                result = tranqu.transpile(circuit, metrics=["n_measure"])
+                print(result.stats.after.n_measure)
+
+        """
+        self._stats_metric_manager.register_metric(
+            name, metric, allow_override=allow_override
         )
-        self.register_program_converter(
-            "tket",
-            "qiskit",
-            TketToQiskitProgramConverter(),
+
+    def add_observer(self, observer: TranspileObserver) -> None:
+        """Add an observer that receives the timing of each transpilation stage.
+
+        Observers are called in the thread that ran the stage, including
+        the worker threads of `transpile_many()` and the asyncio methods.
+
+        Args:
+            observer (TranspileObserver): The observer to add.
+
+        Examples:
+            To print the time spent in each stage:
+
+                class PrintingObserver(TranspileObserver):
+                    def on_stage(self, timing, context):
+                        print(timing.stage, timing.wall_time, timing.cpu_time)
+
+                tranqu.add_observer(PrintingObserver())
+
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: TranspileObserver) -> None:
+        """Remove an observer added with `add_observer()`.
+
+        Removing an observer that was not added raises `ValueError`.
+
+        Args:
+            observer (TranspileObserver): The observer to remove.
+
+        """
+        self._observers.remove(observer)
+
+    def _register_builtin_program_converters(self) -> None:
+        for from_lib, to_lib, module_name, class_name in (
+            (
+                "openqasm3",
+                "qiskit",
+                "openqasm3_to_qiskit_program_converter",
+                "Openqasm3ToQiskitProgramConverter",
+            ),
+            (
+                "openqasm3",
+                "qiskit-passes",
+                "openqasm3_to_qiskit_program_converter",
+                "Openqasm3ToQiskitProgramConverter",
+            ),
+            (
+                "openqasm3",
+                "tket",
+                "openqasm3_to_tket_program_converter",
+                "Openqasm3ToTketProgramConverter",
+            ),
+            (
+                "qiskit",
+                "openqasm3",
+                "qiskit_to_openqasm3_program_converter",
+                "QiskitToOpenqasm3ProgramConverter",
+            ),
+            (
+                "qiskit-passes",
+                "openqasm3",
+                "qiskit_to_openqasm3_program_converter",
+                "QiskitToOpenqasm3ProgramConverter",
+            ),
+            (
+                "qiskit",
+                "tket",
+                "qiskit_to_tket_program_converter",
+                "QiskitToTketProgramConverter",
+            ),
+            (
+                "tket",
+                "openqasm3",
+                "tket_to_openqasm3_program_converter",
+                "TketToOpenqasm3ProgramConverter",
+            ),
+            (
+                "tket",
+                "qiskit",
+                "tket_to_qiskit_program_converter",
+                "TketToQiskitProgramConverter",
+            ),
+            (
+                "qiskit",
+                "qpy",
+                "qiskit_to_qpy_program_converter",
+                "QiskitToQpyProgramConverter",
+            ),
+            (
+                "qpy",
+                "qiskit",
+                "qpy_to_qiskit_program_converter",
+                "QpyToQiskitProgramConverter",
+            ),
+            (
+                "tket",
+                "tket-json",
+                "tket_to_tket_json_program_converter",
+                "TketToTketJsonProgramConverter",
+            ),
+            (
+                "tket-json",
+                "tket",
+                "tket_json_to_tket_program_converter",
+                "TketJsonToTketProgramConverter",
+            ),
+        ):
+            self._program_converter_manager.register_converter(
+                from_lib,
+                to_lib,
+                LazyFactory(
+                    f"tranqu.program_converter.{module_name}", class_name, shared=True
+                ),
+            )
+
+        # Text is printed and parsed again on every hop, so conversions between
+        # other libraries go through the binary "qpy" and "tket-json" instead
+        self._program_converter_manager.set_transit_penalty(
+            "openqasm3", _TEXT_TRANSIT_PENALTY
         )
 
     def _register_builtin_device_converters(self) -> None:
-        self.register_device_converter(
-            "oqtopus",
-            "qiskit",
-            OqtoqusToQiskitDeviceConverter(),
-        )
-        self.register_device_converter(
-            "oqtopus",
-            "ouqu-tp",
-            OqtopusToOuquTpDeviceConverter(),
-        )
-        self.register_device_converter(
-            "qiskit",
-            "ouqu-tp",
-            QiskitToOuquTpDeviceConverter(),
-        )
-        self.register_device_converter(
-            "qiskit",
-            "tket",
-            QiskitToTketDeviceConverter(),
-        )
+        for from_lib, to_lib, module_name, class_name in (
+            (
+                "oqtopus",
+                "qiskit",
+                "oqtopus_to_qiskit_device_converter",
+                "OqtoqusToQiskitDeviceConverter",
+            ),
+            (
+                "oqtopus",
+                "ouqu-tp",
+                "oqtopus_to_ouqu_tp_device_converter",
+                "OqtopusToOuquTpDeviceConverter",
+            ),
+            (
+                "qiskit",
+                "ouqu-tp",
+                "qiskit_to_ouqu_tp_device_converter",
+                "QiskitToOuquTpDeviceConverter",
+            ),
+            (
+                "qiskit",
+                "tket",
+                "qiskit_to_tket_device_converter",
+                "QiskitToTketDeviceConverter",
+            ),
+        ):
+            self._device_converter_manager.register_converter(
+                from_lib,
+                to_lib,
+                LazyFactory(
+                    f"tranqu.device_converter.{module_name}", class_name, shared=True
+                ),
+            )
 
     def _register_builtin_transpilers(self) -> None:
-        self.register_transpiler("qiskit", QiskitTranspiler(program_lib="qiskit"))
-        self.register_transpiler("ouqu-tp", OuquTpTranspiler(program_lib="openqasm3"))
-        self.register_transpiler("tket", TketTranspiler(program_lib="tket"))
+        for transpiler_lib, module_name, class_name, program_lib in (
+            ("qiskit", "qiskit_transpiler", "QiskitTranspiler", "qiskit"),
+            ("ouqu-tp", "ouqu_tp_transpiler", "OuquTpTranspiler", "openqasm3"),
+            ("tket", "tket_transpiler", "TketTranspiler", "tket"),
+        ):
+            self._transpiler_manager.register_transpiler(
+                transpiler_lib,
+                LazyFactory(
+                    f"tranqu.transpiler.{module_name}",
+                    class_name,
+                    {"program_lib": program_lib},
+                    shared=True,
+                ),
+            )
 
     def _register_builtin_program_types(self) -> None:
-        self.register_program_type("qiskit", QuantumCircuit)
-        self.register_program_type("tket", Circuit)
+        self._program_type_manager.register_lazy_type(
+            "qiskit", "qiskit", "QuantumCircuit"
+        )
+        self._program_type_manager.register_lazy_type("tket", "pytket", "Circuit")
 
     def _register_builtin_device_types(self) -> None:
-        self.register_device_type("qiskit", BackendV2)
+        self._device_type_manager.register_lazy_type(
+            "qiskit", "qiskit.providers", "BackendV2"
+        )
+
+    def _register_builtin_stats_metrics(self) -> None:
+        self.register_stats_metric("gate_counts", GateCountsMetric())
+        self.register_stats_metric("depth_2q", TwoQubitDepthMetric())
+        self.register_stats_metric("n_measurements", MeasurementCountMetric())
+        self.register_stats_metric("duration", DurationMetric())
+        self.register_stats_metric("success_probability", SuccessProbabilityMetric())
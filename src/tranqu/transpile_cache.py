@@ -0,0 +1,316 @@
+"""Provides caches that store transpilation results by content.
+
+A cache is passed to `Tranqu` and consulted by the dispatcher before any
+conversion or transpilation runs. Entries are keyed on a fingerprint of
+the program, the program library, the transpiler library, the normalized
+transpiler options and the device, so repeated requests for the same circuit
+on the same device return the stored `TranspileResult` without calling
+the backend transpiler. Every hit returns a shallow copy of the stored result
+with its own program reference, so that releasing or spilling the program of
+one hit does not affect later ones. Its timings only contain the time of the
+lookup, as "cache_lookup". The statistics and the mapping are shared and
+should be treated as read-only.
+
+Example:
+    To keep up to 1000 results in memory:
+
+        cache = InMemoryTranspileCache(max_size=1000)
+        tranqu = Tranqu(cache=cache)
+        tranqu.transpile(circuit, transpiler_lib="qiskit")
+        tranqu.transpile(circuit, transpiler_lib="qiskit")
+        print(cache.stats.hits)  # 1
+
+"""
+
+from __future__ import annotations
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .tranqu_error import TranquError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .transpile_result import TranspileResult
+
+
+class TranspileCacheError(TranquError):
+    """Base exception for errors related to transpile caches."""
+
+
+class InvalidCacheSizeError(TranspileCacheError):
+    """Raised when a cache is configured with an invalid size limit."""
+
+
+@dataclass
+class CacheStats:
+    """Counters that describe how effective a cache is.
+
+    Args:
+        hits (int): The number of lookups that returned a stored result.
+        misses (int): The number of lookups that found no stored result.
+        evictions (int): The number of entries removed to respect the size limit.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio of hits to lookups.
+
+        Returns:
+            float: The hit rate, or 0.0 if no lookup has been made.
+
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TranspileCache(ABC):
+    """Abstract base class for caches of transpilation results.
+
+    Subclasses implement `_load()`, `_store()` and `_clear()`.
+    Counting hits and misses, serializing access and copying the results of
+    hits are done by this class.
+    """
+
+    def __init__(self) -> None:
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the lock.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a cache from a pickled state.
+
+        Args:
+            state (dict[str, Any]): The pickled state.
+
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters of this cache.
+
+        Returns:
+            CacheStats: The counters.
+
+        """
+        return self._stats
+
+    def get(self, key: str) -> TranspileResult | None:
+        """Look up a stored result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            TranspileResult | None: A copy of the stored result with the time of
+                the lookup as its timings, or None if there is none.
+
+        """
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        with self._lock:
+            result = self._load(key)
+            if result is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+
+        return result.copy(
+            timings={"cache_lookup": time.perf_counter() - start},
+            cpu_timings={"cache_lookup": time.thread_time() - cpu_start},
+        )
+
+    def put(self, key: str, result: TranspileResult) -> None:
+        """Store a result.
+
+        Args:
+            key (str): The cache key.
+            result (TranspileResult): The result to store. A copy is stored, so
+                that releasing the program of the result does not affect
+                the cache.
+
+        """
+        result = result.copy()
+        with self._lock:
+            self._stats.evictions += self._store(key, result)
+
+    def clear(self) -> None:
+        """Remove all stored results. The counters are kept."""
+        with self._lock:
+            self._clear()
+
+    @abstractmethod
+    def _load(self, key: str) -> TranspileResult | None:
+        """Return the stored result for the key, or None."""
+
+    @abstractmethod
+    def _store(self, key: str, result: TranspileResult) -> int:
+        """Store the result and return the number of evicted entries."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove all stored results."""
+
+
+class InMemoryTranspileCache(TranspileCache):
+    """A least-recently-used cache that keeps results in memory.
+
+    Args:
+        max_size (int): The maximum number of results to keep. When it is
+            exceeded, the least recently used result is evicted.
+
+    Raises:
+        InvalidCacheSizeError: If max_size is less than 1.
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+        if max_size < 1:
+            msg = f"max_size must be at least 1, got {max_size}."
+            raise InvalidCacheSizeError(msg)
+
+        self._max_size = max_size
+        self._entries: OrderedDict[str, TranspileResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of stored results.
+
+        Returns:
+            int: The number of stored results.
+
+        """
+        return len(self._entries)
+
+    def _load(self, key: str) -> TranspileResult | None:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def _store(self, key: str, result: TranspileResult) -> int:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+
+        evicted = 0
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskTranspileCache(TranspileCache):
+    """A cache that keeps pickled results as files in a directory.
+
+    Entries survive process restarts and can be shared by processes that use
+    the same directory. When `max_size` is given, the least recently used
+    files are removed once the limit is exceeded.
+
+    Only use a directory that is not writable by untrusted parties, since
+    the stored files are unpickled when read.
+
+    Args:
+        directory (str | os.PathLike[str]): The directory that holds the files.
+            It is created if it does not exist.
+        max_size (int | None): The maximum number of files to keep.
+            If None, the number of files is not limited.
+
+    Raises:
+        InvalidCacheSizeError: If max_size is less than 1.
+
+    """
+
+    _SUFFIX = ".pickle"
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_size: int | None = None
+    ) -> None:
+        super().__init__()
+        if max_size is not None and max_size < 1:
+            msg = f"max_size must be at least 1, got {max_size}."
+            raise InvalidCacheSizeError(msg)
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        """Return the number of stored results.
+
+        Returns:
+            int: The number of stored results.
+
+        """
+        return len(self._entry_paths())
+
+    def _load(self, key: str) -> TranspileResult | None:
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as file:
+                result = pickle.load(file)  # noqa: S301
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Touch the file so that eviction removes the least recently used entries
+        path.touch()
+        return result
+
+    def _store(self, key: str, result: TranspileResult) -> int:
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            dir=self._directory, suffix=".tmp"
+        )
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(temporary_name).replace(self._path_for(key))
+
+        return self._evict()
+
+    def _clear(self) -> None:
+        for path in self._entry_paths():
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> int:
+        if self._max_size is None:
+            return 0
+
+        paths = self._entry_paths()
+        excess = len(paths) - self._max_size
+        if excess <= 0:
+            return 0
+
+        paths.sort(key=lambda path: path.stat().st_mtime_ns)
+        for path in paths[:excess]:
+            path.unlink(missing_ok=True)
+        return excess
+
+    def _entry_paths(self) -> list[Path]:
+        return list(self._directory.glob(f"*{self._SUFFIX}"))
+
+    def _path_for(self, key: str) -> Path:
+        return self._directory / f"{key}{self._SUFFIX}"
@@ -0,0 +1,159 @@
+"""Provides hooks for exporting the timings of transpilation stages.
+
+Every call to `Tranqu.transpile()` runs a fixed sequence of stages:
+"convert_program", "convert_device", "transpile" and "convert_output".
+Statistics are computed later, when they are first accessed, as the "stats" stage.
+The wall-clock and CPU time of each stage are recorded in
+`TranspileResult.timings` and `TranspileResult.cpu_timings`.
+
+To send these timings to a metrics pipeline, implement `TranspileObserver` and
+add it with `Tranqu.add_observer()`. Observers are called synchronously in
+the thread that ran the stage, so they should only record or enqueue the timing.
+When no observer is added, the only cost is reading the clocks.
+
+Example:
+    To export each stage as an OpenTelemetry span:
+
+        class SpanObserver(TranspileObserver):
+            def on_stage(self, timing, context):
+                start_ns = int(timing.start_time * 1e9)
+                span = tracer.start_span(
+                    f"tranqu.{timing.stage}",
+                    start_time=start_ns,
+                    attributes={
+                        "tranqu.transpiler_lib": context.transpiler_lib,
+                        "tranqu.cpu_time": timing.cpu_time,
+                    },
+                )
+                span.end(end_time=start_ns + int(timing.wall_time * 1e9))
+
+        tranqu.add_observer(SpanObserver())
+
+"""
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class TranspileContext:
+    """Describes the request that a stage belongs to.
+
+    Args:
+        program_lib (str | None): The library of the input program, or None for
+            stages shared by a batch of programs in different libraries.
+        transpiler_lib (str): The library of the transpiler.
+        device_lib (str | None): The library of the device, if any.
+        batch_size (int): The number of programs transpiled together. Stages
+            shared by a batch are reported once for the whole batch.
+
+    """
+
+    program_lib: str | None
+    transpiler_lib: str
+    device_lib: str | None
+    batch_size: int = 1
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """The time spent in one stage of a transpilation.
+
+    Args:
+        stage (str): The name of the stage, e.g., "transpile".
+        start_time (float): When the stage started, in seconds since the epoch.
+        wall_time (float): The wall-clock seconds spent in the stage.
+        cpu_time (float): The CPU seconds spent in the stage by the thread
+            that ran it. Work that a backend does in other threads or processes
+            is not included.
+
+    """
+
+    stage: str
+    start_time: float
+    wall_time: float
+    cpu_time: float
+
+
+class TranspileObserver(ABC):
+    """Receives the timing of each transpilation stage as it finishes."""
+
+    @abstractmethod
+    def on_stage(self, timing: StageTiming, context: TranspileContext) -> None:
+        """Handle the timing of a finished stage.
+
+        It is also called for stages that raised an error.
+
+        Args:
+            timing (StageTiming): The time spent in the stage.
+            context (TranspileContext): The request that the stage belongs to.
+
+        """
+
+
+class StageTimer:
+    """Runs the stages of one request and records their timings.
+
+    Args:
+        context (TranspileContext): The request that the stages belong to.
+        observers (Sequence[TranspileObserver]): The observers to notify.
+        wall_times (dict[str, float] | None): Where to add the wall-clock
+            seconds of each stage. If None, a new dictionary is used.
+        cpu_times (dict[str, float] | None): Where to add the CPU seconds of
+            each stage. If None, a new dictionary is used.
+
+    """
+
+    def __init__(
+        self,
+        context: TranspileContext,
+        observers: Sequence[TranspileObserver],
+        wall_times: dict[str, float] | None = None,
+        cpu_times: dict[str, float] | None = None,
+    ) -> None:
+        self._context = context
+        self._observers = observers
+        self.wall_times: dict[str, float] = {} if wall_times is None else wall_times
+        self.cpu_times: dict[str, float] = {} if cpu_times is None else cpu_times
+
+    def run(
+        self,
+        stage: str,
+        func: Callable[..., _T],
+        *args: Any,  # noqa: ANN401
+    ) -> _T:
+        """Run a stage and record its timing.
+
+        Args:
+            stage (str): The name of the stage. The times of stages that run
+                several times are added up.
+            func (Callable[..., _T]): The function that performs the stage.
+            *args (Any): Arguments passed to the function.
+
+        Returns:
+            _T: The return value of the function.
+
+        """
+        start_time = time.time() if self._observers else 0.0
+        start_cpu = time.thread_time()
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            wall_time = time.perf_counter() - start
+            cpu_time = time.thread_time() - start_cpu
+            self.wall_times[stage] = self.wall_times.get(stage, 0.0) + wall_time
+            self.cpu_times[stage] = self.cpu_times.get(stage, 0.0) + cpu_time
+            if self._observers:
+                timing = StageTiming(stage, start_time, wall_time, cpu_time)
+                for observer in self._observers:
+                    observer.on_stage(timing, self._context)
@@ -49,11 +49,50 @@ qubits and classical bits:
 - `transpile_result.virtual_physical_mapping.bit_mapping`:
     Mapping between virtual and physical classical bits
 
+The time spent in each stage is available in `transpile_result.timings`,
+a dictionary of wall-clock seconds keyed by stage name, and the CPU time in
+`transpile_result.cpu_timings`. The "stats" stage is added when the statistics
+are computed.
+
+Statistics are computed on first access, not during transpilation, so that callers
+that only need the transpiled program and the mapping do not pay for them.
+They reflect the programs as they are at that time, so do not modify the input
+program before reading the "before" statistics.
+
+To hold many results with little memory, write each transpiled program to disk
+with `transpile_result.spill_program()`, or drop it with
+`transpile_result.release_program()` once it has been saved elsewhere.
+
 """
 
-from collections.abc import ItemsView, Iterator, KeysView, ValuesView
+from __future__ import annotations
+
+import copy
+import os
+import pickle  # noqa: S403
+import tempfile
+import threading
+import weakref
+from array import array
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    ValuesView,
+)
+from functools import partial
+from pathlib import Path
 from typing import Any
 
+_ABSENT = -1
+"""The value of the table entries of an `IntMapping` that hold no key."""
+
+_MAPPING_STOP_KEYS = {"qubit_mapping", "bit_mapping"}
+"""Keys of the virtual-physical mapping whose values are returned as mappings."""
+
 
 class NestedDictAccessor:
     """A utility class for accessing nested dictionary attributes.
@@ -64,7 +103,9 @@ class NestedDictAccessor:
     NestedDictAccessor instance for further nested access.
 
     Args:
-        d (dict): The dictionary to be accessed.
+        d (dict | Callable[[], dict]): The dictionary to be accessed, or
+            a function that builds it. The function is called once, on first
+            access from any thread, and its result is kept.
         stop_keys (set[str] | None, optional): A set of keys where nested
             access should stop. If None, all keys are accessible.
 
@@ -73,8 +114,16 @@ class NestedDictAccessor:
 
     """
 
-    def __init__(self, d: dict, stop_keys: set[str] | None = None) -> None:
-        self._d = d
+    __slots__ = ("_build_d", "_build_lock", "_d", "_stop_keys")
+
+    def __init__(
+        self, d: dict | Callable[[], dict], stop_keys: set[str] | None = None
+    ) -> None:
+        if callable(d):
+            self._build_d = d
+            self._build_lock = threading.Lock()
+        else:
+            self._d = d
         self._stop_keys = stop_keys
 
     def __delitem__(self, key: str) -> None:
@@ -108,6 +157,13 @@ class NestedDictAccessor:
             AttributeError: If the attribute name is not found in the dictionary.
 
         """
+        # The dictionary is built when it is first needed. Unset internal
+        # attributes are also looked up before __init__ runs when unpickling.
+        if item == "_d":
+            return self._build()
+        if item in self.__slots__:
+            raise AttributeError(item)
+
         if item in self._d:
             value = self._d[item]
             if isinstance(value, dict) and (
@@ -119,6 +175,14 @@ class NestedDictAccessor:
         msg = f"No such attribute: {item}"
         raise AttributeError(msg)
 
+    def _build(self) -> dict:
+        with self._build_lock:
+            # Another thread may have built the dictionary while this one waited
+            if hasattr(self, "_build_d"):
+                self._d = self._build_d()
+                del self._build_d
+            return self._d
+
     def __getitem__(self, key: str) -> Any:  # noqa: ANN401
         """Retrieve an item via subscript (e.g., obj[key]).
 
@@ -145,6 +209,25 @@ class NestedDictAccessor:
         msg = f"Key not found: {key}"
         raise KeyError(msg)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, with the dictionary built.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        return {"_d": self._d, "_stop_keys": self._stop_keys}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of an unpickled object.
+
+        Args:
+            state (dict[str, Any]): The state returned by `__getstate__()`.
+
+        """
+        self._d = state["_d"]
+        self._stop_keys = state["_stop_keys"]
+
     def __iter__(self) -> Iterator:
         """Return an iterator over the keys of the internal dictionary.
 
@@ -200,6 +283,15 @@ class NestedDictAccessor:
         """
         return self._d.keys()
 
+    def to_dict(self) -> dict:
+        """Return the internal dictionary.
+
+        Returns:
+            dict: The internal dictionary, not a copy.
+
+        """
+        return self._d
+
     def values(self) -> ValuesView[Any]:
         """Return an iterator over the values of the dictionary.
 
@@ -210,31 +302,435 @@ class NestedDictAccessor:
         return self._d.values()
 
 
-class TranspileResult:
+class IntMapping(MutableMapping[int, int]):
+    """A mapping between non-negative integers stored as an integer array.
+
+    A `dict` of n qubits takes over a hundred bytes per entry, while this
+    mapping takes four. It behaves like the `dict` it was created from: it
+    keeps the order of the keys, compares equal to it and has the same
+    `repr()`.
+
+    Args:
+        mapping (Mapping[int, int]): The mapping to store. Its keys must be
+            non-negative and at most twice the number of entries, and its values
+            must be non-negative integers below 2**31. Use `compact()` for
+            mappings that may not satisfy this.
+
+    """
+
+    __slots__ = ("_order", "_table")
+
+    def __init__(self, mapping: Mapping[int, int]) -> None:
+        keys = list(mapping)
+        self._table = array("i", [_ABSENT]) * (max(keys, default=-1) + 1)
+        for key, value in mapping.items():
+            self._table[key] = value
+        # The keys in order, or None when they are 0, 1, ..., n - 1
+        self._order: array[int] | None = (
+            None if keys == list(range(len(keys))) else array("i", keys)
+        )
+
+    @classmethod
+    def compact(cls, mapping: dict[int, int]) -> Mapping[int, int]:
+        """Store a mapping as an `IntMapping` if its keys and values allow it.
+
+        Args:
+            mapping (dict[int, int]): The mapping to store.
+
+        Returns:
+            Mapping[int, int]: The new `IntMapping`, or `mapping` itself if it
+                has keys or values that an `IntMapping` cannot hold.
+
+        """
+        if not all(
+            _is_index(key) and _is_index(value) for key, value in mapping.items()
+        ) or max(mapping, default=0) >= 2 * len(mapping):
+            return mapping
+        try:
+            return cls(mapping)
+        except OverflowError:
+            return mapping
+
+    def __getitem__(self, key: int) -> int:
+        """Retrieve the value of a key.
+
+        Args:
+            key (int): The key to retrieve.
+
+        Returns:
+            int: The value of the key.
+
+        Raises:
+            KeyError: If the key is not in the mapping.
+
+        """
+        if _is_index(key) and key < len(self._table):
+            value = self._table[key]
+            if value != _ABSENT:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the value of a key, adding the key if it is not in the mapping.
+
+        Args:
+            key (int): The key to set.
+            value (int): The value to set.
+
+        Raises:
+            TypeError: If the key or the value is not a non-negative integer.
+
+        """
+        if not (_is_index(key) and _is_index(value)):
+            msg = f"IntMapping only holds non-negative integers, got {key}: {value}."
+            raise TypeError(msg)
+
+        if key in self:
+            self._table[key] = value
+            return
+
+        # Keys added in index order keep the mapping without an order array
+        if not (self._order is None and key == len(self._table)):
+            self._ordered_keys().append(key)
+        if key >= len(self._table):
+            self._table.extend([_ABSENT] * (key + 1 - len(self._table)))
+        self._table[key] = value
+
+    def __delitem__(self, key: int) -> None:
+        """Remove a key.
+
+        Args:
+            key (int): The key to remove.
+
+        Raises:
+            KeyError: If the key is not in the mapping.
+
+        """
+        if key not in self:
+            raise KeyError(key)
+        self._ordered_keys().remove(key)
+        self._table[key] = _ABSENT
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the keys in insertion order.
+
+        Returns:
+            Iterator[int]: An iterator over the keys.
+
+        """
+        if self._order is None:
+            return iter(range(len(self._table)))
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        """Return the number of entries.
+
+        Returns:
+            int: The number of entries.
+
+        """
+        if self._order is None:
+            return len(self._table)
+        return len(self._order)
+
+    def __repr__(self) -> str:
+        """Return the representation of the equivalent `dict`.
+
+        Returns:
+            str: The representation, e.g., "{0: 1, 1: 0}".
+
+        """
+        return repr(dict(self))
+
+    def _ordered_keys(self) -> array[int]:
+        if self._order is None:
+            self._order = array("i", range(len(self._table)))
+        return self._order
+
+
+class TranspileResult:  # noqa: PLR0904
     """Hold transpilation results.
 
+    The qubit and bit mappings are stored as `IntMapping` objects until they
+    are first accessed, when they become `dict`s again, and the accessors for
+    the statistics and the mapping are created on first access, so that
+    holding many results takes little memory. The transpiled program
+    can be written to disk with `spill_program()` or dropped with
+    `release_program()` once it is no longer needed in memory.
+
     Args:
         transpiled_program: The quantum program after transpilation.
-        stats: Statistical information before and after transpilation.
+        stats: Statistical information before and after transpilation, or
+            a function that computes it on first access.
         virtual_physical_mapping: Mapping between virtual quantum bits and
             physical quantum bits.
+        timings: Wall-clock seconds spent in each stage of the transpilation,
+            e.g., "convert_program", "convert_device", "transpile",
+            "convert_output" and "stats".
+        cpu_timings: CPU seconds spent in each stage by the thread that ran it.
+        tier: The configuration that produced the result: 0 for the requested
+            transpiler and options, or the position of the fallback that was
+            used after the configurations before it timed out.
+        incremental: True if the layout and routing were reused from an earlier
+            result and only the device-dependent steps were redone.
 
     """
 
-    def __init__(
+    __slots__ = (
+        "__weakref__",
+        "_mapping_accessor",
+        "_program",
+        "_program_file",
+        "_remove_program_file",
+        "_stats_value",
+        "_virtual_physical_mapping",
+        "cpu_timings",
+        "incremental",
+        "tier",
+        "timings",
+    )
+
+    def __init__(  # noqa: PLR0913
         self,
         transpiled_program: Any,  # noqa: ANN401
-        stats: dict[str, dict[str, int]],
+        stats: dict[str, dict[str, int]] | Callable[[], dict[str, dict[str, int]]],
         virtual_physical_mapping: dict[str, dict[int, int]],
+        timings: dict[str, float] | None = None,
+        cpu_timings: dict[str, float] | None = None,
+        *,
+        tier: int = 0,
+        incremental: bool = False,
     ) -> None:
+        self._program_file: Path | None = None
+        self._remove_program_file: weakref.finalize | None = None
         self.transpiled_program = transpiled_program
-        self._stats = stats
-        self.stats = self._nested_dict_accessor(stats)
-        self._virtual_physical_mapping = virtual_physical_mapping
-        self.virtual_physical_mapping = self._nested_dict_accessor(
-            virtual_physical_mapping,
-            stop_keys={"qubit_mapping", "bit_mapping"},
+        self.timings = {} if timings is None else timings
+        self.cpu_timings = {} if cpu_timings is None else cpu_timings
+        self.tier = tier
+        self.incremental = incremental
+        # The statistics, or what builds them until the accessor is created
+        self._stats_value: (
+            NestedDictAccessor
+            | dict[str, dict[str, int]]
+            | Callable[[], dict[str, dict[str, int]]]
+        ) = stats
+        self._virtual_physical_mapping = _compact_mapping(virtual_physical_mapping)
+        self._mapping_accessor: NestedDictAccessor | None = None
+
+    @property
+    def transpiled_program(self) -> Any:  # noqa: ANN401
+        """Returns the quantum program after transpilation.
+
+        A program written to disk by `spill_program()` is read from the file
+        on every access and is not kept in memory.
+
+        Returns:
+            Any: The transpiled program, or None if it was not requested or
+                has been released.
+
+        """
+        if self._program_file is None:
+            return self._program
+
+        from .program_codec import decode_program  # noqa: PLC0415
+
+        with self._program_file.open("rb") as file:
+            return decode_program(pickle.load(file))  # noqa: S301
+
+    @transpiled_program.setter
+    def transpiled_program(self, transpiled_program: Any) -> None:  # noqa: ANN401
+        self._forget_program_file()
+        self._program = transpiled_program
+
+    @property
+    def stats(self) -> NestedDictAccessor:
+        """Returns statistical information before and after transpilation.
+
+        It is computed on first access.
+
+        Returns:
+            NestedDictAccessor: The statistics, e.g., `stats.after.depth`.
+
+        """
+        if not isinstance(self._stats_value, NestedDictAccessor):
+            self._stats_value = NestedDictAccessor(self._stats_value)
+        return self._stats_value
+
+    @stats.setter
+    def stats(
+        self,
+        stats: dict[str, dict[str, int]] | Callable[[], dict[str, dict[str, int]]],
+    ) -> None:
+        self._stats_value = stats
+
+    @property
+    def virtual_physical_mapping(self) -> NestedDictAccessor:
+        """Returns the mapping between virtual and physical qubits and bits.
+
+        Returns:
+            NestedDictAccessor: The mapping, e.g.,
+                `virtual_physical_mapping.qubit_mapping`, a `dict`.
+
+        """
+        if self._mapping_accessor is None:
+            self._virtual_physical_mapping = _expand_mapping(
+                self._virtual_physical_mapping
+            )
+            self._mapping_accessor = NestedDictAccessor(
+                self._virtual_physical_mapping, _MAPPING_STOP_KEYS
+            )
+        return self._mapping_accessor
+
+    @property
+    def _stats(self) -> dict[str, dict[str, int]]:
+        if isinstance(self._stats_value, dict):
+            return self._stats_value
+        return self.stats.to_dict()
+
+    def spill_program(self, path: str | os.PathLike[str] | None = None) -> Path:
+        """Write the transpiled program to a file and release it from memory.
+
+        The program is written in the format of `program_codec`, e.g., QPY for
+        Qiskit circuits, and is read back on each access of
+        `transpiled_program`.
+
+        The statistics are computed first if they have not been accessed yet,
+        so that the programs they are computed from can be freed.
+
+        Args:
+            path (str | os.PathLike[str] | None): The file to write. If None,
+                a temporary file is used, which is removed when this result is
+                garbage collected or its program is replaced or released.
+
+        Returns:
+            Path: The file that holds the program.
+
+        """
+        from .program_codec import encode_program  # noqa: PLC0415
+
+        encoded = encode_program(self._program)
+        self._compute_stats()
+        if path is None:
+            descriptor, name = tempfile.mkstemp(prefix="tranqu-", suffix=".program")
+            os.close(descriptor)
+            program_file = Path(name)
+            remove_program_file = weakref.finalize(
+                self, program_file.unlink, missing_ok=True
+            )
+        else:
+            program_file = Path(path)
+            remove_program_file = None
+
+        try:
+            with program_file.open("wb") as file:
+                pickle.dump(encoded, file)
+        except BaseException:
+            if remove_program_file is not None:
+                remove_program_file()
+            raise
+
+        self.transpiled_program = None
+        self._program_file = program_file
+        self._remove_program_file = remove_program_file
+        return program_file
+
+    def release_program(self) -> None:
+        """Drop the transpiled program, e.g., after it has been written elsewhere.
+
+        `transpiled_program` is None afterwards. A temporary file created by
+        `spill_program()` is removed. The statistics are computed first if they
+        have not been accessed yet, so that the programs they are computed from
+        can be freed.
+        """
+        self._compute_stats()
+        self.transpiled_program = None
+
+    def copy(
+        self,
+        *,
+        timings: dict[str, float] | None = None,
+        cpu_timings: dict[str, float] | None = None,
+    ) -> TranspileResult:
+        """Return a shallow copy with its own program reference and timings.
+
+        The copy shares the mapping, which is read-only, and has its own
+        statistics, copied from those of this result when first accessed.
+        Lazy statistics are computed only once for a result and all its
+        copies. Releasing or spilling the program of one of them does not
+        affect the other. A spilled program is read back into the copy.
+
+        Args:
+            timings (dict[str, float] | None): The wall-clock timings of
+                the copy. If None, those of this result are copied.
+            cpu_timings (dict[str, float] | None): The CPU timings of the copy.
+                If None, those of this result are copied.
+
+        Returns:
+            TranspileResult: The copy.
+
+        """
+        result = TranspileResult(
+            self.transpiled_program,
+            {},
+            {},
+            dict(self.timings) if timings is None else timings,
+            dict(self.cpu_timings) if cpu_timings is None else cpu_timings,
+            tier=self.tier,
+            incremental=self.incremental,
         )
+        # The shared accessor builds lazy statistics once, even across threads
+        result._stats_value = partial(_copy_stats, self.stats)
+        result._virtual_physical_mapping = self._virtual_physical_mapping
+        result._mapping_accessor = self._mapping_accessor
+        return result
+
+    def _compute_stats(self) -> None:
+        # The function that computes the statistics on first access holds the
+        # programs, which could not be freed while it is kept
+        if not isinstance(self._stats_value, dict):
+            self.stats.to_dict()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, with the statistics and program loaded.
+
+        Returns:
+            dict[str, Any]: The state to pickle.
+
+        """
+        return {
+            "transpiled_program": self.transpiled_program,
+            "stats": self._stats,
+            "virtual_physical_mapping": self._virtual_physical_mapping,
+            "timings": self.timings,
+            "cpu_timings": self.cpu_timings,
+            "tier": self.tier,
+            "incremental": self.incremental,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of an unpickled object.
+
+        Args:
+            state (dict[str, Any]): The state returned by `__getstate__()`.
+
+        """
+        self._program_file = None
+        self._remove_program_file = None
+        self._program = state["transpiled_program"]
+        self.stats = state["stats"]
+        self._virtual_physical_mapping = state["virtual_physical_mapping"]
+        self._mapping_accessor = None
+        self.timings = state["timings"]
+        self.cpu_timings = state["cpu_timings"]
+        self.tier = state.get("tier", 0)
+        self.incremental = state.get("incremental", False)
+
+    def _forget_program_file(self) -> None:
+        remove_program_file = self._remove_program_file
+        self._program_file = None
+        self._remove_program_file = None
+        if remove_program_file is not None:
+            remove_program_file()
 
     def __repr__(self) -> str:
         """Return a string representation of the TranspileResult.
@@ -315,11 +811,8 @@ class TranspileResult:
         """
         return hash((
             self.transpiled_program,
-            frozenset((k, frozenset(v.items())) for k, v in self._stats.items()),
-            frozenset(
-                (k, frozenset(v.items()))
-                for k, v in self._virtual_physical_mapping.items()
-            ),
+            _freeze(self._stats),
+            _freeze(self._virtual_physical_mapping),
         ))
 
     def to_dict(self) -> dict[str, Any]:
@@ -333,11 +826,105 @@ class TranspileResult:
         """
         return {
             "stats": self._stats,
-            "virtual_physical_mapping": self._virtual_physical_mapping,
+            "virtual_physical_mapping": _expand_mapping(self._virtual_physical_mapping),
         }
 
-    @staticmethod
-    def _nested_dict_accessor(
-        d: dict, stop_keys: set[str] | None = None
-    ) -> NestedDictAccessor:
-        return NestedDictAccessor(d, stop_keys)
+    def to_bytes(self, wire_format: str | None = None) -> bytes:
+        """Serialize the result, including the transpiled program, to bytes.
+
+        The format is versioned and described in `result_codec`.
+
+        Args:
+            wire_format (str | None): How to encode the program: "qpy",
+                "tket_json" or "openqasm3". If None, Qiskit circuits are
+                encoded as QPY and tket circuits as tket JSON.
+
+        Returns:
+            bytes: The serialized result.
+
+        """
+        from .result_codec import result_to_bytes  # noqa: PLC0415
+
+        return result_to_bytes(self, wire_format)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> TranspileResult:
+        """Deserialize a result written by `to_bytes()`.
+
+        Args:
+            data (bytes): The serialized result.
+
+        Returns:
+            TranspileResult: The result.
+
+        """
+        from .result_codec import result_from_bytes  # noqa: PLC0415
+
+        return result_from_bytes(data)
+
+    def to_json(self, wire_format: str | None = None) -> str:
+        """Serialize the result, including the transpiled program, to JSON.
+
+        The JSON has no line breaks, so results can be written as JSON lines.
+
+        Args:
+            wire_format (str | None): How to encode the program: "qpy",
+                "tket_json" or "openqasm3". If None, Qiskit circuits are
+                encoded as QPY and tket circuits as tket JSON.
+
+        Returns:
+            str: The serialized result.
+
+        """
+        from .result_codec import result_to_json  # noqa: PLC0415
+
+        return result_to_json(self, wire_format)
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> TranspileResult:
+        """Deserialize a result written by `to_json()`.
+
+        Args:
+            line (str | bytes): The serialized result.
+
+        Returns:
+            TranspileResult: The result.
+
+        """
+        from .result_codec import result_from_json  # noqa: PLC0415
+
+        return result_from_json(line)
+
+
+def _copy_stats(stats: NestedDictAccessor) -> dict:
+    return copy.deepcopy(stats.to_dict())
+
+
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    # Metrics such as "gate_counts" nest dictionaries inside the statistics
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+def _is_index(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _compact_mapping(
+    virtual_physical_mapping: dict[str, dict[int, int]],
+) -> dict[str, Mapping[int, int]]:
+    return {
+        name: IntMapping.compact(mapping) if isinstance(mapping, dict) else mapping
+        for name, mapping in virtual_physical_mapping.items()
+    }
+
+
+def _expand_mapping(
+    virtual_physical_mapping: dict[str, Mapping[int, int]],
+) -> dict[str, Any]:
+    # Callers of the public API expect dicts, e.g., to serialize them as JSON
+    return {
+        name: dict(mapping) if isinstance(mapping, IntMapping) else mapping
+        for name, mapping in virtual_physical_mapping.items()
+    }
@@ -1,6 +1,14 @@
-from .ouqu_tp_transpiler import OuquTpTranspiler
-from .qiskit_transpiler import QiskitTranspiler
-from .tket_transpiler import TketTranspiler
+from typing import TYPE_CHECKING
+
+from tranqu.lazy_import import lazy_module_getattr
+
+from .transpile_hints import (
+    STATS_COUNTS,
+    STATS_FULL,
+    STATS_MODES,
+    STATS_NONE,
+    TranspileHints,
+)
 from .transpiler import Transpiler
 from .transpiler_manager import (
     DefaultTranspilerLibAlreadyRegisteredError,
@@ -9,11 +17,31 @@ from .transpiler_manager import (
     TranspilerNotFoundError,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .ouqu_tp_transpiler import OuquTpTranspiler
+    from .qiskit_transpiler import QiskitTranspiler
+    from .tket_transpiler import TketTranspiler
+
+# Transpilers that import their backend library are imported on first access
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "OuquTpTranspiler": ".ouqu_tp_transpiler",
+        "QiskitTranspiler": ".qiskit_transpiler",
+        "TketTranspiler": ".tket_transpiler",
+    },
+)
+
 __all__ = [
+    "STATS_COUNTS",
+    "STATS_FULL",
+    "STATS_MODES",
+    "STATS_NONE",
     "DefaultTranspilerLibAlreadyRegisteredError",
     "OuquTpTranspiler",
     "QiskitTranspiler",
     "TketTranspiler",
+    "TranspileHints",
     "Transpiler",
     "TranspilerAlreadyRegisteredError",
     "TranspilerManager",
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import NoReturn
+
+from tranqu.tranqu_error import TranquError
+
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_PHYSICAL_QUBIT = re.compile(r"^\$(\d+)$")
+_OPERAND = re.compile(r"^([A-Za-z_]\w*)(?:\s*\[\s*(\d+)\s*\])?$")
+_GATE_CALL = re.compile(r"^([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.+)$", re.DOTALL)
+_MEASURE_ASSIGN = re.compile(r"^(.+?)\s*=\s*measure\s+(.+)$", re.DOTALL)
+_MEASURE_ARROW = re.compile(r"^measure\s+(.+?)\s*->\s*(.+)$", re.DOTALL)
+_LEGACY_REGISTER = re.compile(r"^(qreg|creg)\s+([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]$")
+_REGISTER = re.compile(r"^(qubit|bit)\s*(?:\[\s*(\d+)\s*\])?\s+([A-Za-z_]\w*)$")
+
+# Statements that the scanner cannot interpret without a full parser
+_UNSUPPORTED_KEYWORDS = frozenset({
+    "array",
+    "bool",
+    "box",
+    "cal",
+    "complex",
+    "const",
+    "ctrl",
+    "def",
+    "defcal",
+    "delay",
+    "duration",
+    "extern",
+    "float",
+    "for",
+    "gate",
+    "if",
+    "input",
+    "int",
+    "inv",
+    "let",
+    "negctrl",
+    "opaque",
+    "output",
+    "pow",
+    "return",
+    "stretch",
+    "switch",
+    "uint",
+    "while",
+})
+
+
+class Openqasm3ScanError(TranquError):
+    """Raised when a program uses syntax that the scanner does not support."""
+
+
+@dataclass(frozen=True)
+class Openqasm3ScanResult:
+    """Statistical information collected by `Openqasm3StatsScanner`.
+
+    Args:
+        stats (dict[str, int]): The same keys and values as
+            `QiskitStatsExtractor` produces for the parsed circuit.
+        n_clbits (int): The number of classical bits.
+
+    """
+
+    stats: dict[str, int]
+    n_clbits: int
+
+
+class Openqasm3StatsScanner:
+    """Extract statistical information from OpenQASM3 text without parsing it.
+
+    It handles the flat programs that transpilers emit: register declarations,
+    gate calls on indexed or whole registers or on physical qubits such as `$0`,
+    measurements, resets and barriers.
+    The results match `QiskitStatsExtractor` applied to `qiskit.qasm3.loads()`.
+    For anything else, e.g., gate definitions or control flow,
+    `Openqasm3ScanError` is raised so that callers can fall back to a full parse.
+    """
+
+    def extract_stats_from(self, program: str) -> dict[str, int]:
+        """Extract statistical information from an OpenQASM3 program.
+
+        Args:
+            program (str): The OpenQASM3 program to analyze.
+
+        Returns:
+            dict[str, int]: Statistical information about the circuit.
+
+        """
+        return self.scan(program).stats
+
+    def scan(self, program: str) -> Openqasm3ScanResult:  # noqa: PLR6301
+        """Scan an OpenQASM3 program.
+
+        Args:
+            program (str): The OpenQASM3 program to analyze.
+
+        Returns:
+            Openqasm3ScanResult: Statistical information and the number of
+                classical bits.
+
+        """
+        return _Scan(program).run()
+
+
+class _Scan:
+    def __init__(self, program: str) -> None:
+        self._program = program
+        self._qregs: dict[str, tuple[int, int]] = {}
+        self._cregs: dict[str, tuple[int, int]] = {}
+        self._n_qubits = 0
+        self._n_clbits = 0
+        self._qubit_levels: list[int] = []
+        self._clbit_levels: list[int] = []
+        self._n_gates_by_width: dict[int, int] = {}
+        self._depth = 0
+        self._uses_physical_qubits = False
+
+    def run(self) -> Openqasm3ScanResult:
+        text = _COMMENT.sub("", self._program)
+        if "{" in text or "}" in text or "@" in text:
+            _unsupported("blocks or gate modifiers")
+
+        for raw_statement in text.split(";"):
+            statement = " ".join(raw_statement.split())
+            if statement:
+                self._statement(statement)
+
+        stats = {
+            "n_qubits": self._n_qubits,
+            "n_gates": sum(self._n_gates_by_width.values()),
+            "n_gates_1q": self._n_gates_by_width.get(1, 0),
+            "n_gates_2q": self._n_gates_by_width.get(2, 0),
+            "depth": self._depth,
+        }
+        return Openqasm3ScanResult(stats, self._n_clbits)
+
+    def _statement(self, statement: str) -> None:
+        keyword = statement.split(" ", 1)[0].split("(", 1)[0].split("[", 1)[0]
+        if keyword in {"OPENQASM", "include"}:
+            return
+        if keyword in _UNSUPPORTED_KEYWORDS:
+            _unsupported(statement)
+
+        if self._declaration(statement) or self._measurement(statement):
+            return
+
+        if keyword == "measure":
+            # A measurement whose result is discarded
+            _unsupported(statement)
+        if keyword == "barrier":
+            # Barriers are not gates and synchronize qubits without adding depth
+            operands = statement[len("barrier") :].strip()
+            qubits = self._qubits(operands) if operands else range(self._n_qubits)
+            self._apply(tuple(qubits), (), depth=0)
+            return
+        if keyword == "reset":
+            for qubit in self._qubits(statement[len("reset") :]):
+                self._apply((qubit,), ())
+            return
+
+        self._gate_call(statement)
+
+    def _declaration(self, statement: str) -> bool:
+        if match := _LEGACY_REGISTER.match(statement):
+            kind, name, size = match.groups()
+            self._declare(name, int(size), is_quantum=kind == "qreg")
+            return True
+        if match := _REGISTER.match(statement):
+            kind, size, name = match.groups()
+            self._declare(
+                name, 1 if size is None else int(size), is_quantum=kind == "qubit"
+            )
+            return True
+        return False
+
+    def _measurement(self, statement: str) -> bool:
+        if match := _MEASURE_ASSIGN.match(statement):
+            self._measure(match.group(2), match.group(1))
+            return True
+        if match := _MEASURE_ARROW.match(statement):
+            self._measure(match.group(1), match.group(2))
+            return True
+        return False
+
+    def _declare(self, name: str, size: int, *, is_quantum: bool) -> None:
+        if name in self._qregs or name in self._cregs:
+            _unsupported(f"redeclaration of {name}")
+
+        if is_quantum:
+            if self._uses_physical_qubits:
+                _unsupported("virtual qubits mixed with physical qubits")
+            self._qregs[name] = (self._n_qubits, size)
+            self._n_qubits += size
+            self._qubit_levels.extend([0] * size)
+        else:
+            self._cregs[name] = (self._n_clbits, size)
+            self._n_clbits += size
+            self._clbit_levels.extend([0] * size)
+
+    def _gate_call(self, statement: str) -> None:
+        match = _GATE_CALL.match(statement)
+        if match is None:
+            _unsupported(statement)
+        operands = [
+            self._resolve_qubits(operand) for operand in match.group(3).split(",")
+        ]
+
+        # Whole registers are broadcast, as in `h q;` or `cx a, b;`
+        sizes = {len(bits) for bits in operands if len(bits) != 1}
+        if len(sizes) > 1:
+            _unsupported(statement)
+        width = sizes.pop() if sizes else 1
+        for position in range(width):
+            qubits = tuple(
+                bits[0] if len(bits) == 1 else bits[position] for bits in operands
+            )
+            self._apply(qubits, ())
+            self._n_gates_by_width[len(qubits)] = (
+                self._n_gates_by_width.get(len(qubits), 0) + 1
+            )
+
+    def _measure(self, qubit_operand: str, clbit_operand: str) -> None:
+        qubits = self._resolve_qubits(qubit_operand)
+        clbits = self._resolve(clbit_operand, self._cregs)
+        if len(qubits) != len(clbits):
+            _unsupported(f"measure {qubit_operand} -> {clbit_operand}")
+
+        for qubit, clbit in zip(qubits, clbits, strict=True):
+            self._apply((qubit,), (clbit,))
+
+    def _qubits(self, operands: str) -> list[int]:
+        return [
+            qubit
+            for operand in operands.split(",")
+            for qubit in self._resolve_qubits(operand)
+        ]
+
+    def _apply(
+        self, qubits: tuple[int, ...], clbits: tuple[int, ...], depth: int = 1
+    ) -> None:
+        level = depth + max(
+            [self._qubit_levels[qubit] for qubit in qubits]
+            + [self._clbit_levels[clbit] for clbit in clbits],
+            default=0,
+        )
+        for qubit in qubits:
+            self._qubit_levels[qubit] = level
+        for clbit in clbits:
+            self._clbit_levels[clbit] = level
+        self._depth = max(self._depth, level)
+
+    def _resolve_qubits(self, operand: str) -> list[int]:
+        match = _PHYSICAL_QUBIT.match(operand.strip())
+        if match is None:
+            return self._resolve(operand, self._qregs)
+
+        if self._qregs:
+            _unsupported("physical qubits mixed with virtual qubits")
+        self._uses_physical_qubits = True
+
+        # Qiskit creates every qubit up to the highest index that is used
+        index = int(match.group(1))
+        if index >= self._n_qubits:
+            self._qubit_levels.extend([0] * (index + 1 - self._n_qubits))
+            self._n_qubits = index + 1
+        return [index]
+
+    @staticmethod
+    def _resolve(operand: str, registers: dict[str, tuple[int, int]]) -> list[int]:
+        match = _OPERAND.match(operand.strip())
+        if match is None or match.group(1) not in registers:
+            _unsupported(operand)
+        offset, size = registers[match.group(1)]
+        if match.group(2) is None:
+            return list(range(offset, offset + size))
+
+        index = int(match.group(2))
+        if index >= size:
+            _unsupported(operand)
+        return [offset + index]
+
+
+def _unsupported(statement: str) -> NoReturn:
+    msg = f"Unsupported OpenQASM3 statement: {statement}"
+    raise Openqasm3ScanError(msg)
@@ -1,30 +1,51 @@
+from functools import partial
+from typing import Any
+
 from ouqu_tp.servicers.ouqu_tp import (  # type: ignore[import-untyped]
     TranspilerService as OuquTp,  # type: ignore[import-untyped]
 )
 from qiskit import QuantumCircuit  # type: ignore[import-untyped]
 from qiskit.qasm3 import loads  # type: ignore[import-untyped]
 
+from tranqu.tranqu_error import TranquError
 from tranqu.transpile_result import TranspileResult
 
+from .openqasm3_stats_scanner import (
+    Openqasm3ScanError,
+    Openqasm3ScanResult,
+    Openqasm3StatsScanner,
+)
 from .qiskit_stats_extractor import QiskitStatsExtractor
+from .transpile_hints import TranspileHints
 from .transpiler import Transpiler
 
 
+class OuquTpTranspilerError(TranquError):
+    """Raised when ouqu-tp fails to transpile a program."""
+
+
 class OuquTpTranspiler(Transpiler):
     """Transpile quantum circuits using ouqu-tp.
 
     It optimizes quantum circuits using ouqu-tp's transpilation function.
+    Statistics are taken from the source Qiskit circuit when the dispatcher
+    provides one, and from a lightweight scan of the OpenQASM3 text otherwise,
+    so that programs are not parsed into a `QuantumCircuit` just for counting.
+    Additional metrics need the operations themselves, so requesting any
+    parses the programs.
+    The "before" statistics are computed on first access.
     """
 
     def __init__(self, program_lib: str) -> None:
         super().__init__(program_lib)
         self._ouqu_tp = OuquTp()
         self._qiskit_stats_extractor = QiskitStatsExtractor()
+        self._openqasm3_stats_scanner = Openqasm3StatsScanner()
 
     def transpile(
         self,
         program: str,
-        options: dict | None = None,  # noqa: ARG002
+        options: dict | None = None,
         device: str | None = None,
     ) -> TranspileResult:
         """Transpile the specified quantum circuit and return a TranspileResult.
@@ -42,27 +63,131 @@ class OuquTpTranspiler(Transpiler):
                 and the mapping of virtual qubits to physical qubits.
 
         """
-        transpile_response = self._ouqu_tp.transpile(program, device)
+        return self.transpile_with_hints(
+            program, options, device, hints=TranspileHints()
+        )
 
-        original_circuit = loads(program)
-        transpiled_circuit = loads(transpile_response.qasm)
+    def transpile_with_hints(
+        self,
+        program: str,
+        options: dict | None = None,  # noqa: ARG002
+        device: str | None = None,
+        *,
+        hints: TranspileHints,
+    ) -> TranspileResult:
+        """Transpile the specified quantum circuit using hints from the dispatcher.
 
-        stats = {
-            "before": self._qiskit_stats_extractor.extract_stats_from(original_circuit),
-            "after": self._qiskit_stats_extractor.extract_stats_from(
-                transpiled_circuit
-            ),
-        }
+        Args:
+            program (str): The quantum circuit to transpile.
+            options (dict, optional): Transpilation options.
+                Defaults to an empty dictionary.
+            device (Any, optional): The target device for transpilation.
+                Defaults to None.
+            hints (TranspileHints): Information collected by the dispatcher.
+                A Qiskit source program or precomputed "before" statistics
+                are used instead of parsing `program`, and only the requested
+                statistics are returned.
+
+        Returns:
+            TranspileResult: An object containing the transpilation result,
+                including the transpiled quantum circuit, statistics,
+                and the mapping of virtual qubits to physical qubits.
+
+        Raises:
+            OuquTpTranspilerError: If ouqu-tp reports a failure.
+
+        """
+        transpile_response = self._ouqu_tp.transpile(program, device)
+        # The scanner would accept the empty program of a failed response
+        if transpile_response.status != "SUCCESS":
+            msg = (
+                f"ouqu-tp failed to transpile the program: {transpile_response.message}"
+            )
+            raise OuquTpTranspilerError(msg)
+
+        # The transpiled program is scanned anyway for its number of clbits
+        transpiled_scan = self._scan(transpile_response.qasm)
 
         qubit_mapping = _calc_qubit_mapping(transpile_response.qubit_mapping)
-        bit_mapping = _calc_bit_mapping(transpiled_circuit)
+        bit_mapping = _calc_bit_mapping(transpiled_scan.n_clbits)
         mapping = {
             "qubit_mapping": qubit_mapping,
             "bit_mapping": bit_mapping,
         }
 
+        if not hints.include_stats:
+            return TranspileResult(transpile_response.qasm, {}, mapping)
+
+        stats = partial(
+            self._stats,
+            program,
+            transpile_response.qasm,
+            transpiled_scan.stats,
+            hints,
+        )
         return TranspileResult(transpile_response.qasm, stats, mapping)
 
+    def _stats(
+        self,
+        program: str,
+        transpiled_program: str,
+        after_stats: dict[str, int],
+        hints: TranspileHints,
+    ) -> dict[str, dict[str, Any]]:
+        if hints.metrics:
+            return self._stats_with_metrics(program, transpiled_program, hints)
+
+        stats = {
+            "before": self._before_stats(program, hints),
+            "after": dict(after_stats),
+        }
+        if not hints.include_depth:
+            for section in stats.values():
+                section.pop("depth", None)
+        return stats
+
+    def _stats_with_metrics(
+        self,
+        program: str,
+        transpiled_program: str,
+        hints: TranspileHints,
+    ) -> dict[str, dict[str, Any]]:
+        # The scanner does not produce operations, so both programs are parsed
+        source_program = hints.source_programs.get("qiskit")
+        if not isinstance(source_program, QuantumCircuit):
+            source_program = loads(program)
+
+        return {
+            "before": self._qiskit_stats_extractor.extract_stats_from(
+                source_program, depth=hints.include_depth, metrics=hints.metrics
+            ),
+            "after": self._qiskit_stats_extractor.extract_stats_from(
+                loads(transpiled_program),
+                depth=hints.include_depth,
+                metrics=hints.metrics,
+                device_properties=hints.device_properties,
+            ),
+        }
+
+    def _before_stats(self, program: str, hints: TranspileHints) -> dict[str, int]:
+        source_program = hints.source_programs.get("qiskit")
+        if isinstance(source_program, QuantumCircuit):
+            return self._qiskit_stats_extractor.extract_stats_from(
+                source_program, depth=hints.include_depth
+            )
+
+        return self._scan(program).stats
+
+    def _scan(self, program: str) -> Openqasm3ScanResult:
+        try:
+            return self._openqasm3_stats_scanner.scan(program)
+        except Openqasm3ScanError:
+            circuit = loads(program)
+            return Openqasm3ScanResult(
+                self._qiskit_stats_extractor.extract_stats_from(circuit),
+                circuit.num_clbits,
+            )
+
 
 def _calc_qubit_mapping(qubit_mapping: dict[int, int]) -> dict[int, int]:
     # qubit_mapping in ouqu-tp is physical -> virtual
@@ -70,7 +195,6 @@ def _calc_qubit_mapping(qubit_mapping: dict[int, int]) -> dict[int, int]:
     return {v: k for k, v in qubit_mapping.items()}
 
 
-def _calc_bit_mapping(transpiled_circuit: QuantumCircuit) -> dict[int, int]:
+def _calc_bit_mapping(num_clbits: int) -> dict[int, int]:
     # bit_mapping remains unchanged before and after transpilation
-    num_clbits = transpiled_circuit.num_clbits
     return {i: i for i in range(num_clbits)}
@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.circuit import Qubit  # type: ignore[import-untyped]
+from qiskit.circuit.equivalence_library import (  # type: ignore[import-untyped]
+    SessionEquivalenceLibrary,
+)
+from qiskit.transpiler import PassManager, Target  # type: ignore[import-untyped]
+from qiskit.transpiler.passes import (  # type: ignore[import-untyped]
+    ApplyLayout,
+    BasisTranslator,
+    GateDirection,
+    Optimize1qGatesDecomposition,
+    SetLayout,
+    VF2PostLayout,
+)
+
+
+class QiskitRetranspiler:
+    """Adapts a transpiled circuit to new calibration data of the same device.
+
+    The circuit of an earlier transpilation is already laid out and routed.
+    If every 2-qubit gate still acts on a coupled pair of qubits, only
+    the noise-aware steps are redone: `VF2PostLayout` moves the circuit to
+    the subgraph with the lowest error rates under the new calibration, and
+    the gates are translated to the device's current basis and directions
+    and resynthesized with the new 1-qubit gate errors.
+    """
+
+    def retranspile(
+        self,
+        previous_program: QuantumCircuit,
+        previous_qubit_mapping: Mapping[int, int] | None,
+        target: Target,
+        seed: int | None = None,
+    ) -> tuple[QuantumCircuit, dict[int, int]] | None:
+        """Adapt a transpiled circuit to the target.
+
+        Args:
+            previous_program (QuantumCircuit): The circuit of the earlier
+                transpilation, on physical qubits.
+            previous_qubit_mapping (Mapping[int, int] | None): The virtual to
+                physical qubit mapping of the earlier transpilation. If None,
+                virtual qubit i is physical qubit i.
+            target (Target): The target with the new calibration data.
+            seed (int | None): The seed of `VF2PostLayout`.
+
+        Returns:
+            tuple[QuantumCircuit, dict[int, int]] | None: The adapted circuit and
+                its virtual to physical qubit mapping, or None if the circuit
+                does not fit the topology of the target and has to be
+                transpiled from scratch.
+
+        """
+        if not self.fits(previous_program, target):
+            return None
+
+        # Programs read from OpenQASM3 only have the qubits they use
+        program = previous_program
+        if program.num_qubits < target.num_qubits:
+            program = QuantumCircuit(
+                [
+                    *previous_program.qubits,
+                    *(Qubit() for _ in range(target.num_qubits - program.num_qubits)),
+                ],
+                previous_program.clbits,
+                *previous_program.cregs,
+            )
+            program.compose(previous_program, inplace=True)
+
+        pass_manager = PassManager([
+            SetLayout(list(range(program.num_qubits))),
+            VF2PostLayout(target=target, seed=seed, strict_direction=False),
+            ApplyLayout(),
+            BasisTranslator(SessionEquivalenceLibrary, None, target=target),
+            # Flipping a gate adds 1-qubit gates that are translated again
+            GateDirection(None, target=target),
+            BasisTranslator(SessionEquivalenceLibrary, None, target=target),
+            Optimize1qGatesDecomposition(target=target),
+        ])
+        program = pass_manager.run(program)
+
+        # The layout of the result maps the earlier physical qubits to new ones
+        moves = program.layout.final_index_layout()
+        if previous_qubit_mapping is None:
+            previous_qubit_mapping = {
+                qubit: qubit for qubit in range(previous_program.num_qubits)
+            }
+        return program, {
+            virtual: moves[physical]
+            for virtual, physical in previous_qubit_mapping.items()
+        }
+
+    @staticmethod
+    def fits(program: QuantumCircuit, target: Target) -> bool:
+        """Return whether a transpiled circuit fits the topology of the target.
+
+        Args:
+            program (QuantumCircuit): The transpiled circuit.
+            target (Target): The target.
+
+        Returns:
+            bool: True if the target has enough qubits and every 2-qubit gate
+                acts on a coupled pair of qubits, in either direction.
+
+        """
+        if program.num_qubits > target.num_qubits:
+            return False
+
+        coupling_map = target.build_coupling_map()
+        if coupling_map is None:
+            return True
+        edges = set(coupling_map.get_edges())
+
+        for instruction in program.data:
+            if getattr(instruction.operation, "_directive", False):
+                continue
+            qubits = tuple(
+                program.find_bit(qubit).index for qubit in instruction.qubits
+            )
+            if len(qubits) > 2:  # noqa: PLR2004
+                return False
+            if (
+                len(qubits) == 2  # noqa: PLR2004
+                and qubits not in edges
+                and qubits[::-1] not in edges
+            ):
+                return False
+        return True
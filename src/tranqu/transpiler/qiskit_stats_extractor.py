@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from tranqu.stats_metric import (
+    CircuitInfo,
+    DeviceProperties,
+    MetricAccumulator,
+    StatsMetric,
+    StatsOperation,
+    create_accumulators,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+    from qiskit.circuit import CircuitInstruction  # type: ignore[import-untyped]
 from qiskit.circuit.controlflow import (  # type: ignore[import-untyped]
     CONTROL_FLOW_OP_NAMES,
 )
@@ -21,58 +33,113 @@ class QiskitStatsExtractor:
         *CONTROL_FLOW_OP_NAMES,  # 'if_else','for_loop','while_loop','switch_case'
     }
 
-    def extract_stats_from(self, program: QuantumCircuit) -> dict[str, int]:
+    def extract_stats_from(
+        self,
+        program: QuantumCircuit,
+        *,
+        depth: bool = True,
+        metrics: Mapping[str, StatsMetric] | None = None,
+        device_properties: DeviceProperties | None = None,
+    ) -> dict[str, Any]:
         """Extract statistical information from a Qiskit quantum circuit.
 
+        Gate counts, depth and the requested metrics are collected in a single
+        pass over the circuit. The depth is the same as `QuantumCircuit.depth()`,
+        which is called instead for circuits with control flow or
+        classical variables.
+
         Args:
             program (QuantumCircuit): The quantum circuit to analyze.
+            depth (bool): Whether to compute the depth, the most expensive
+                statistic. If False, "depth" is omitted. Defaults to True.
+            metrics (Mapping[str, StatsMetric] | None): Additional metrics to
+                compute, keyed by the name under which they are returned.
+            device_properties (DeviceProperties | None): The properties of
+                the device the circuit is mapped to, for metrics that need them.
 
         Returns:
-            dict[str, int]: Statistical information about the circuit.
+            dict[str, Any]: Statistical information about the circuit.
 
         """
-        stats = {}
+        accumulators = create_accumulators(
+            metrics or {},
+            CircuitInfo(program.num_qubits, program.num_clbits, device_properties),
+        )
+        n_gates_by_width, circuit_depth = self._scan(
+            program, depth=depth, accumulators=list(accumulators.values())
+        )
+
+        stats: dict[str, Any] = {}
         stats["n_qubits"] = program.num_qubits
-        stats["n_gates"] = self._count_gates(program)
-        stats["n_gates_1q"] = self._count_single_qubit_gates(program)
-        stats["n_gates_2q"] = self._count_two_qubit_gates(program)
-        stats["depth"] = program.depth()
+        stats["n_gates"] = sum(n_gates_by_width.values())
+        stats["n_gates_1q"] = n_gates_by_width.get(1, 0)
+        stats["n_gates_2q"] = n_gates_by_width.get(2, 0)
+        if depth:
+            stats["depth"] = program.depth() if circuit_depth is None else circuit_depth
+        for name, accumulator in accumulators.items():
+            stats[name] = accumulator.result()
         return stats
 
     @staticmethod
-    def _count_gates(program: QuantumCircuit) -> int:
-        # sum non_gate operation
-        return sum(
-            1
-            for instruction in program.data
-            if instruction.operation.name
-            not in QiskitStatsExtractor._NON_GATE_OPERATION
-        )
+    def _scan(
+        program: QuantumCircuit,
+        *,
+        depth: bool,
+        accumulators: list[MetricAccumulator],
+    ) -> tuple[dict[int, int], int | None]:
+        non_gate_operation = QiskitStatsExtractor._NON_GATE_OPERATION
+        n_gates_by_width: dict[int, int] = {}
+        to_operation = _OperationBuilder(program) if accumulators else None
 
-    @staticmethod
-    def _count_single_qubit_gates(program: QuantumCircuit) -> int:
-        data = program.data
-        count = 0
-        for instruction in data:
-            # is 1 qubit?
-            if len(instruction.qubits) != 1:
-                continue
-            # is non gate opration?
-            if instruction.operation.name in QiskitStatsExtractor._NON_GATE_OPERATION:
-                continue
-            count += 1
-        return count
+        # The depth reached on each qubit and clbit, as in QuantumCircuit.depth()
+        levels = dict.fromkeys(program.qubits, 0)
+        levels.update(dict.fromkeys(program.clbits, 0))
+        tracks_depth = depth and program.num_vars == 0
 
-    @staticmethod
-    def _count_two_qubit_gates(program: QuantumCircuit) -> int:
-        data = program.data
-        count = 0
-        for instruction in data:
-            # is 2 qubit?
-            if len(instruction.qubits) != 2:  # noqa: PLR2004
+        for instruction in program.data:
+            qubits = instruction.qubits
+            is_gate = instruction.name not in non_gate_operation
+            if is_gate:
+                width = len(qubits)
+                n_gates_by_width[width] = n_gates_by_width.get(width, 0) + 1
+
+            if to_operation is not None:
+                operation = to_operation(instruction, is_gate=is_gate)
+                for accumulator in accumulators:
+                    accumulator.add(operation)
+
+            if not tracks_depth:
                 continue
-            # is non gate opration?
-            if instruction.operation.name in QiskitStatsExtractor._NON_GATE_OPERATION:
+            if instruction.is_control_flow():
+                # Conditions also involve bits that are not operands
+                tracks_depth = False
                 continue
-            count += 1
-        return count
+
+            bits = qubits + instruction.clbits if instruction.clbits else qubits
+            level = max((levels[bit] for bit in bits), default=0)
+            # Directives such as barriers synchronize bits without adding depth
+            if not instruction.is_directive():
+                level += 1
+            for bit in bits:
+                levels[bit] = level
+
+        if not tracks_depth:
+            return n_gates_by_width, None
+        return n_gates_by_width, max(levels.values(), default=0)
+
+
+class _OperationBuilder:
+    def __init__(self, program: QuantumCircuit) -> None:
+        self._qubit_indices = {bit: index for index, bit in enumerate(program.qubits)}
+        self._clbit_indices = {bit: index for index, bit in enumerate(program.clbits)}
+
+    def __call__(
+        self, instruction: CircuitInstruction, *, is_gate: bool
+    ) -> StatsOperation:
+        return StatsOperation(
+            instruction.name,
+            tuple(self._qubit_indices[bit] for bit in instruction.qubits),
+            tuple(self._clbit_indices[bit] for bit in instruction.clbits),
+            is_gate=is_gate,
+            is_directive=instruction.is_directive(),
+        )
@@ -1,3 +1,7 @@
+from collections.abc import Sequence
+from functools import partial
+from typing import Any, ClassVar
+
 from qiskit import QuantumCircuit  # type: ignore[import-untyped]
 from qiskit import transpile as qiskit_transpile  # type: ignore[import-untyped]
 from qiskit.providers.backend import BackendV2  # type: ignore[import-untyped]
@@ -5,7 +9,9 @@ from qiskit.providers.backend import BackendV2  # type: ignore[import-untyped]
 from tranqu.transpile_result import TranspileResult
 
 from .qiskit_layout_mapper import QiskitLayoutMapper
+from .qiskit_retranspiler import QiskitRetranspiler
 from .qiskit_stats_extractor import QiskitStatsExtractor
+from .transpile_hints import TranspileHints
 from .transpiler import Transpiler
 
 
@@ -13,12 +19,23 @@ class QiskitTranspiler(Transpiler):
     """Transpile quantum circuits using Qiskit.
 
     It optimizes quantum circuits using Qiskit's `transpile()` function.
+    A batch of circuits is passed to `transpile()` as a single list so that
+    Qiskit can parallelize it natively.
+    Statistics are computed on first access, and only those requested
+    through the hints. Given the program of an earlier result for the same
+    device topology, only its layout is rescored and its gates rebased
+    (see `QiskitRetranspiler`).
     """
 
+    supports_native_batch: ClassVar[bool] = True
+    seed_option: ClassVar[str | None] = "seed_transpiler"
+    supports_parameters: ClassVar[bool] = True
+
     def __init__(self, program_lib: str) -> None:
         super().__init__(program_lib)
         self._stats_extractor = QiskitStatsExtractor()
         self._layout_mapper = QiskitLayoutMapper()
+        self._retranspiler = QiskitRetranspiler()
 
     def transpile(
         self,
@@ -41,16 +58,162 @@ class QiskitTranspiler(Transpiler):
                 and the mapping of virtual qubits to physical qubits.
 
         """
-        options_dict = options or {}
+        return self.transpile_with_hints(
+            program, options, device, hints=TranspileHints()
+        )
+
+    def transpile_with_hints(
+        self,
+        program: QuantumCircuit,
+        options: dict | None = None,
+        device: BackendV2 | None = None,
+        *,
+        hints: TranspileHints,
+    ) -> TranspileResult:
+        """Transpile the specified quantum circuit using hints from the dispatcher.
+
+        Args:
+            program (QuantumCircuit): The quantum circuit to transpile.
+            options (dict, optional): Transpilation options.
+                Defaults to an empty dictionary.
+            device (BackendV2, optional): The target device for transpilation.
+                Defaults to None.
+            hints (TranspileHints): Information collected by the dispatcher.
+                Only the requested statistics are computed. If it has
+                a previous program that fits the topology of the device,
+                the previous program is adapted to the device instead of
+                transpiling `program` from scratch.
+
+        Returns:
+            TranspileResult: An object containing the transpilation result,
+                including the transpiled quantum circuit, statistics,
+                and the mapping of virtual qubits to physical qubits.
+
+        """
+        if hints.previous_program is not None and device is not None:
+            retranspiled = self._retranspiler.retranspile(
+                hints.previous_program,
+                hints.previous_qubit_mapping,
+                device.target,
+                (options or {}).get("seed_transpiler"),
+            )
+            if retranspiled is not None:
+                transpiled_program, qubit_mapping = retranspiled
+                return self._create_result(
+                    program, transpiled_program, hints, qubit_mapping
+                )
+
+        transpiled_program = qiskit_transpile(
+            program, **self._build_options(options, device)
+        )
+
+        return self._create_result(program, transpiled_program, hints)
+
+    def transpile_many(
+        self,
+        programs: Sequence[QuantumCircuit],
+        options: dict | None = None,
+        device: BackendV2 | None = None,
+    ) -> list[TranspileResult]:
+        """Transpile several quantum circuits with a single `transpile()` call.
+
+        Args:
+            programs (Sequence[QuantumCircuit]): The quantum circuits to transpile.
+            options (dict, optional): Transpilation options shared by all circuits.
+                Use "num_processes" to control Qiskit's parallelism.
+                Defaults to an empty dictionary.
+            device (BackendV2, optional): The target device for transpilation.
+                Defaults to None.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        """
+        return self.transpile_many_with_hints(
+            programs, options, device, hints=TranspileHints()
+        )
+
+    def transpile_many_with_hints(
+        self,
+        programs: Sequence[QuantumCircuit],
+        options: dict | None = None,
+        device: BackendV2 | None = None,
+        *,
+        hints: TranspileHints,
+    ) -> list[TranspileResult]:
+        """Transpile several quantum circuits using hints from the dispatcher.
+
+        Args:
+            programs (Sequence[QuantumCircuit]): The quantum circuits to transpile.
+            options (dict, optional): Transpilation options shared by all circuits.
+                Defaults to an empty dictionary.
+            device (BackendV2, optional): The target device for transpilation.
+                Defaults to None.
+            hints (TranspileHints): Information collected by the dispatcher.
+                Only the requested statistics are computed.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        """
+        if not programs:
+            return []
+
+        transpiled_programs = qiskit_transpile(
+            list(programs), **self._build_options(options, device)
+        )
+
+        return [
+            self._create_result(program, transpiled_program, hints)
+            for program, transpiled_program in zip(
+                programs, transpiled_programs, strict=True
+            )
+        ]
+
+    @staticmethod
+    def _build_options(options: dict | None, device: BackendV2 | None) -> dict:
+        options_dict = dict(options or {})
         if device is not None:
             options_dict["backend"] = device
+        return options_dict
 
-        transpiled_program = qiskit_transpile(program, **options_dict)
-
-        stats = {
-            "before": self._stats_extractor.extract_stats_from(program),
-            "after": self._stats_extractor.extract_stats_from(transpiled_program),
-        }
+    def _create_result(
+        self,
+        program: QuantumCircuit,
+        transpiled_program: QuantumCircuit,
+        hints: TranspileHints,
+        qubit_mapping: dict[int, int] | None = None,
+    ) -> TranspileResult:
+        # A qubit mapping is given for circuits adapted from a previous result
         mapping = self._layout_mapper.create_mapping_from_layout(transpiled_program)
+        if qubit_mapping is not None:
+            mapping["qubit_mapping"] = qubit_mapping
+        incremental = qubit_mapping is not None
+        if not hints.include_stats:
+            return TranspileResult(
+                transpiled_program, {}, mapping, incremental=incremental
+            )
+
+        stats = partial(self._extract_stats, program, transpiled_program, hints)
+        return TranspileResult(
+            transpiled_program, stats, mapping, incremental=incremental
+        )
 
-        return TranspileResult(transpiled_program, stats, mapping)
+    def _extract_stats(
+        self,
+        program: QuantumCircuit,
+        transpiled_program: QuantumCircuit,
+        hints: TranspileHints,
+    ) -> dict[str, dict[str, Any]]:
+        # Only the transpiled program runs on the device
+        return {
+            "before": self._stats_extractor.extract_stats_from(
+                program, depth=hints.include_depth, metrics=hints.metrics
+            ),
+            "after": self._stats_extractor.extract_stats_from(
+                transpiled_program,
+                depth=hints.include_depth,
+                metrics=hints.metrics,
+                device_properties=hints.device_properties,
+            ),
+        }
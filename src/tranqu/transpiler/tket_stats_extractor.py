@@ -1,4 +1,17 @@
-from pytket import Circuit  # type: ignore[attr-defined]
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+from pytket import Circuit, OpType  # type: ignore[attr-defined]
+from pytket.circuit import Command, Qubit  # type: ignore[attr-defined]
+
+from tranqu.stats_metric import (
+    CircuitInfo,
+    DeviceProperties,
+    StatsMetric,
+    StatsOperation,
+    create_accumulators,
+)
 
 
 class TketStatsExtractor:
@@ -8,28 +21,98 @@ class TketStatsExtractor:
     TWO_QUBIT = 2
 
     @staticmethod
-    def extract_stats_from(program: Circuit) -> dict[str, int]:
+    def extract_stats_from(
+        program: Circuit,
+        *,
+        depth: bool = True,
+        metrics: Mapping[str, StatsMetric] | None = None,
+        device_properties: DeviceProperties | None = None,
+    ) -> dict[str, Any]:
         """Extract stats from a tket circuit.
 
+        The command list is materialized only once, for both gate counts and
+        the requested metrics. Operation names are passed to the metrics in
+        lowercase, e.g., "cx" for `OpType.CX`, and qubits by their index.
+
         Args:
             program (Circuit): The circuit to analyze.
+            depth (bool): Whether to compute the depth, the most expensive
+                statistic. If False, "depth" is omitted. Defaults to True.
+            metrics (Mapping[str, StatsMetric] | None): Additional metrics to
+                compute, keyed by the name under which they are returned.
+            device_properties (DeviceProperties | None): The properties of
+                the device the circuit is mapped to, for metrics that need them.
 
         Returns:
-            dict[str, int]: Statistical information about the circuit.
+            dict[str, Any]: Statistical information about the circuit.
 
         """
-        return {
+        commands = program.get_commands()
+        n_commands_by_width = Counter(len(cmd.qubits) for cmd in commands)
+        stats: dict[str, Any] = {
             "n_qubits": program.n_qubits,
             "n_gates": program.n_gates,
-            "n_gates_1q": sum(
-                1
-                for cmd in program.get_commands()
-                if len(cmd.qubits) == TketStatsExtractor.SINGLE_QUBIT
-            ),
-            "n_gates_2q": sum(
-                1
-                for cmd in program.get_commands()
-                if len(cmd.qubits) == TketStatsExtractor.TWO_QUBIT
+            "n_gates_1q": n_commands_by_width[TketStatsExtractor.SINGLE_QUBIT],
+            "n_gates_2q": n_commands_by_width[TketStatsExtractor.TWO_QUBIT],
+        }
+        if depth:
+            stats["depth"] = program.depth()
+
+        if metrics:
+            stats.update(
+                TketStatsExtractor._compute_metrics(
+                    program, commands, metrics, device_properties
+                )
+            )
+        return stats
+
+    @staticmethod
+    def _compute_metrics(
+        program: Circuit,
+        commands: list[Command],
+        metrics: Mapping[str, StatsMetric],
+        device_properties: DeviceProperties | None,
+    ) -> dict[str, Any]:
+        qubit_indices = _qubit_indices(program.qubits)
+        clbit_indices = {bit: index for index, bit in enumerate(program.bits)}
+        accumulators = create_accumulators(
+            metrics,
+            CircuitInfo(
+                max(qubit_indices.values(), default=-1) + 1,
+                len(clbit_indices),
+                device_properties,
             ),
-            "depth": program.depth(),
+        )
+        for cmd in commands:
+            op_type = cmd.op.type
+            operation = StatsOperation(
+                op_type.name.lower(),
+                tuple(qubit_indices[qubit] for qubit in cmd.qubits),
+                tuple(clbit_indices[bit] for bit in cmd.bits),
+                is_gate=op_type not in _NON_GATE_TYPES,
+                is_directive=op_type == OpType.Barrier,
+            )
+            for accumulator in accumulators.values():
+                accumulator.add(operation)
+
+        return {
+            name: accumulator.result() for name, accumulator in accumulators.items()
         }
+
+
+_NON_GATE_TYPES = frozenset({
+    OpType.Measure,
+    OpType.Reset,
+    OpType.Barrier,
+    OpType.Conditional,
+    OpType.SetBits,
+    OpType.CopyBits,
+})
+
+
+def _qubit_indices(qubits: list[Qubit]) -> dict[Qubit, int]:
+    # Qubits of placed circuits, e.g., node[3], keep their index on the device
+    indices = [qubit.index[0] if len(qubit.index) == 1 else -1 for qubit in qubits]
+    if min(indices, default=0) < 0 or len(set(indices)) != len(indices):
+        indices = list(range(len(qubits)))
+    return dict(zip(qubits, indices, strict=True))
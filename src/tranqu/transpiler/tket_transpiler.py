@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 
 from pytket import Circuit  # type: ignore[attr-defined]
@@ -14,11 +15,16 @@ from tranqu.transpile_result import TranspileResult
 
 from .tket_layout_mapper import TketLayoutMapper
 from .tket_stats_extractor import TketStatsExtractor
+from .transpile_hints import TranspileHints
 from .transpiler import Transpiler
 
 
 class TketTranspiler(Transpiler):
-    """Transpile quantum circuits using t|ket>."""
+    """Transpile quantum circuits using t|ket>.
+
+    Statistics are computed on first access, and only those requested
+    through the hints.
+    """
 
     INVALID_OPT_LEVEL = "Invalid optimization level"
 
@@ -43,6 +49,33 @@ class TketTranspiler(Transpiler):
         Returns:
             TranspileResult: Result of transpilation.
 
+        Optimization levels other than 0, 1 and 2 raise a `ValueError`.
+
+        """
+        return self.transpile_with_hints(
+            program, options, device, hints=TranspileHints()
+        )
+
+    def transpile_with_hints(
+        self,
+        program: Circuit,
+        options: dict[str, Any] | None = None,
+        device: Backend | None = None,
+        *,
+        hints: TranspileHints,
+    ) -> TranspileResult:
+        """Transpile the program using tket and hints from the dispatcher.
+
+        Args:
+            program (Circuit): Program to transpile.
+            options (dict[str, Any] | None): Options for transpilation.
+            device (Backend | None): Device information.
+            hints (TranspileHints): Information collected by the dispatcher.
+                Only the requested statistics are computed.
+
+        Returns:
+            TranspileResult: Result of transpilation.
+
         Raises:
             ValueError: If optimization_level is not 0, 1, or 2.
 
@@ -75,13 +108,31 @@ class TketTranspiler(Transpiler):
             )
             mapping = self._layout_mapper.create_identity_mapping(transpiled_program)
 
-        stats = {
-            "before": self._stats_extractor.extract_stats_from(program),
-            "after": self._stats_extractor.extract_stats_from(transpiled_program),
-        }
+        if not hints.include_stats:
+            return TranspileResult(transpiled_program, {}, mapping)
 
+        stats = partial(self._extract_stats, program, transpiled_program, hints)
         return TranspileResult(transpiled_program, stats, mapping)
 
+    def _extract_stats(
+        self,
+        program: Circuit,
+        transpiled_program: Circuit,
+        hints: TranspileHints,
+    ) -> dict[str, dict[str, Any]]:
+        # Only the transpiled program runs on the device
+        return {
+            "before": self._stats_extractor.extract_stats_from(
+                program, depth=hints.include_depth, metrics=hints.metrics
+            ),
+            "after": self._stats_extractor.extract_stats_from(
+                transpiled_program,
+                depth=hints.include_depth,
+                metrics=hints.metrics,
+                device_properties=hints.device_properties,
+            ),
+        }
+
     @staticmethod
     def _apply_minimal_pass(circuit: Circuit, optimization_level: int) -> Circuit:
         if optimization_level == 0:
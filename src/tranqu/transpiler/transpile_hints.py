@@ -0,0 +1,72 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from tranqu.stats_metric import DeviceProperties, StatsMetric
+
+STATS_FULL = "full"
+"""`stats` value that computes all statistics, including the depth."""
+
+STATS_COUNTS = "counts"
+"""`stats` value that computes the qubit and gate counts but not the depth."""
+
+STATS_NONE = "none"
+"""`stats` value that computes no statistics."""
+
+STATS_MODES = frozenset({STATS_FULL, STATS_COUNTS, STATS_NONE})
+"""All accepted `stats` values."""
+
+
+@dataclass(frozen=True)
+class TranspileHints:
+    """Information that lets a transpiler skip work the dispatcher already did.
+
+    Transpilers are free to ignore hints. Apart from `stats`, which the
+    dispatcher also enforces on the result, and `previous_program`, they never
+    change the result, only how it is computed.
+
+    Args:
+        source_programs (Mapping[str, Any]): The input program in every library
+            it passed through on its way to the transpiler, keyed by library,
+            e.g., the original Qiskit circuit of an OpenQASM3 program.
+        stats (str): Which statistics the caller needs: "full", "counts"
+            (everything but the depth) or "none".
+        metrics (Mapping[str, StatsMetric]): Additional metrics to compute,
+            keyed by the name under which they are returned in the statistics.
+        device_properties (DeviceProperties | None): The properties of the target
+            device, for metrics of the transpiled program that need them.
+        previous_program (Any): The transpiled program of an earlier result for
+            the same program, converted to the transpiler's library. Transpilers
+            that support incremental transpilation reuse its layout and routing
+            if it still fits the device, and set `incremental` of the result.
+        previous_qubit_mapping (Mapping[int, int] | None): The virtual to
+            physical qubit mapping of the earlier result.
+
+    """
+
+    source_programs: Mapping[str, Any] = field(default_factory=dict)
+    stats: str = STATS_FULL
+    metrics: Mapping[str, StatsMetric] = field(default_factory=dict)
+    device_properties: DeviceProperties | None = None
+    previous_program: Any = None
+    previous_qubit_mapping: Mapping[int, int] | None = None
+
+    @property
+    def include_stats(self) -> bool:
+        """Returns whether any statistics are needed.
+
+        Returns:
+            bool: False if `stats` is "none".
+
+        """
+        return self.stats != STATS_NONE
+
+    @property
+    def include_depth(self) -> bool:
+        """Returns whether the depth is needed.
+
+        Returns:
+            bool: True if `stats` is "full".
+
+        """
+        return self.stats == STATS_FULL
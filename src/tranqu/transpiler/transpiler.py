@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
 from tranqu.transpile_result import TranspileResult
 
+from .transpile_hints import TranspileHints
+
 
 class Transpiler(ABC):
     """Abstract base class for transpiling specified quantum circuits.
@@ -16,6 +19,15 @@ class Transpiler(ABC):
 
     """
 
+    supports_native_batch: ClassVar[bool] = False
+    """Whether `transpile_many()` handles a whole batch in a single call."""
+
+    seed_option: ClassVar[str | None] = None
+    """The name of the option that seeds the transpiler's randomness, if any."""
+
+    supports_parameters: ClassVar[bool] = False
+    """Whether programs with unbound parameters can be transpiled and bound later."""
+
     def __init__(self, program_lib: str) -> None:
         self._program_lib = program_lib
 
@@ -56,3 +68,86 @@ class Transpiler(ABC):
                 and mapping between virtual and physical quantum bits.
 
         """
+
+    def transpile_with_hints(
+        self,
+        program: Any,  # noqa: ANN401
+        options: dict | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        *,
+        hints: TranspileHints,  # noqa: ARG002
+    ) -> TranspileResult:
+        """Transpile the specified quantum circuit using hints from the dispatcher.
+
+        The default implementation ignores the hints and calls `transpile()`.
+        Subclasses can override this method to reuse, e.g., an already parsed
+        source program instead of parsing `program` again.
+
+        Args:
+            program (Any): The circuit object or code converted to
+                the transpiler's target.
+            options (dict | None, optional): Transpilation options. Defaults to
+                an empty dictionary.
+            device (Any | None, optional): The target device for transpilation.
+                Defaults to None.
+            hints (TranspileHints): Information collected by the dispatcher.
+
+        Returns:
+            TranspileResult: The result of the transpilation.
+
+        """
+        return self.transpile(program, options, device)
+
+    def transpile_many(
+        self,
+        programs: Sequence[Any],
+        options: dict | None = None,
+        device: Any | None = None,  # noqa: ANN401
+    ) -> list[TranspileResult]:
+        """Transpile several quantum circuits that share options and device.
+
+        The default implementation calls `transpile()` for each program.
+        Subclasses whose backend accepts a list of circuits can override this
+        method and set `supports_native_batch` to True.
+
+        Args:
+            programs (Sequence[Any]): The circuit objects or code converted to
+                the transpiler's target.
+            options (dict | None, optional): Transpilation options shared by
+                all programs. Defaults to None.
+            device (Any | None, optional): The target device shared by
+                all programs. Defaults to None.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        """
+        return [self.transpile(program, options, device) for program in programs]
+
+    def transpile_many_with_hints(
+        self,
+        programs: Sequence[Any],
+        options: dict | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        *,
+        hints: TranspileHints,  # noqa: ARG002
+    ) -> list[TranspileResult]:
+        """Transpile several quantum circuits using hints from the dispatcher.
+
+        The default implementation ignores the hints and calls `transpile_many()`.
+        The hints apply to all programs, so `source_programs` is empty.
+
+        Args:
+            programs (Sequence[Any]): The circuit objects or code converted to
+                the transpiler's target.
+            options (dict | None, optional): Transpilation options shared by
+                all programs. Defaults to None.
+            device (Any | None, optional): The target device shared by
+                all programs. Defaults to None.
+            hints (TranspileHints): Information collected by the dispatcher.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        """
+        return self.transpile_many(programs, options, device)
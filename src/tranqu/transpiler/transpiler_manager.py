@@ -1,5 +1,6 @@
 from typing import Any
 
+from tranqu.lazy_import import LazyFactory
 from tranqu.tranqu_error import TranquError
 
 
@@ -24,11 +25,24 @@ class TranspilerManager:
 
     This class allows for the registration of different transpiler instances
     and provides methods to fetch them by their library names.
+    A transpiler can also be registered as a `LazyFactory`, which creates it
+    when it is first fetched.
     """
 
     def __init__(self) -> None:
         self._transpilers: dict[str, Any] = {}
         self._default_transpiler_lib: str | None = None
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Returns a counter that changes whenever a transpiler is registered.
+
+        Returns:
+            int: The current revision.
+
+        """
+        return self._revision
 
     def register_default_transpiler_lib(
         self,
@@ -57,6 +71,7 @@ class TranspilerManager:
             raise DefaultTranspilerLibAlreadyRegisteredError(msg)
 
         self._default_transpiler_lib = default_transpiler_lib
+        self._revision += 1
 
     def get_default_transpiler_lib(self) -> str | None:
         """Get the default transpiler library.
@@ -78,7 +93,8 @@ class TranspilerManager:
 
         Args:
             transpiler_lib (str): The name of the transpiler library to register.
-            transpiler (Any): An instance of the Transpiler to register.
+            transpiler (Any): An instance of the Transpiler to register, or
+              a `LazyFactory` that creates it on first use.
             allow_override (bool): When False, prevents overwriting existing
               registrations. Defaults to False.
 
@@ -92,6 +108,7 @@ class TranspilerManager:
             raise TranspilerAlreadyRegisteredError(msg)
 
         self._transpilers[transpiler_lib] = transpiler
+        self._revision += 1
 
     def fetch_transpiler(
         self,
@@ -114,4 +131,8 @@ class TranspilerManager:
             msg = f"Unknown transpiler: {transpiler_lib}"
             raise TranspilerNotFoundError(msg)
 
+        if isinstance(transpiler, LazyFactory):
+            transpiler = transpiler.create()
+            self._transpilers[transpiler_lib] = transpiler
+
         return transpiler
@@ -1,12 +1,47 @@
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from itertools import pairwise, starmap
 from typing import Any
 
-from .device_converter import DeviceConverterManager
+from .device_converter import DeviceConversionCache, DeviceConverterManager
 from .device_type_manager import DeviceTypeManager
+from .fingerprint import FingerprintError, fingerprint
+from .openqasm3_io import read_openqasm3
 from .program_converter import ProgramConverterManager
 from .program_type_manager import ProgramTypeManager
+from .stats_metric import (
+    DeviceProperties,
+    QiskitDeviceProperties,
+    StatsMetric,
+    StatsMetricManager,
+)
 from .tranqu_error import TranquError
-from .transpile_result import TranspileResult
-from .transpiler import TranspilerManager
+from .transpile_cache import TranspileCache
+from .transpile_observer import StageTimer, TranspileContext, TranspileObserver
+from .transpile_result import NestedDictAccessor, TranspileResult
+from .transpiler import (
+    STATS_COUNTS,
+    STATS_FULL,
+    STATS_MODES,
+    STATS_NONE,
+    TranspileHints,
+    Transpiler,
+    TranspilerManager,
+)
+
+OUTPUT_LIB_INPUT = "input"
+"""`output_lib` value that returns the program in the library of the input."""
+
+OUTPUT_LIB_NATIVE = "native"
+"""`output_lib` value that returns the program as produced by the transpiler."""
+
+_OPENQASM3_LIB = "openqasm3"
+"""The program library whose programs may also be given as files and streams."""
+
+_DEVICE_PROPERTIES_LIB = "qiskit"
+"""The device library from which metrics read instruction durations and errors."""
 
 
 class TranspilerDispatcherError(TranquError):
@@ -37,14 +72,117 @@ class DeviceConversionPathNotFoundError(TranspilerDispatcherError):
     """Error raised when no conversion path is found for the device."""
 
 
+class InvalidStatsModeError(TranspilerDispatcherError):
+    """Error raised when an unknown statistics mode is specified."""
+
+
+@dataclass(frozen=True)
+class ConversionPath:
+    """A chain of converters from one library to another.
+
+    Args:
+        from_lib (str): The library to convert from.
+        to_lib (str): The library to convert to.
+        converters (tuple[Any, ...] | None): The converters to apply in order.
+            An empty tuple means no conversion is needed, and None means
+            that no path exists.
+        error_type (type[TranspilerDispatcherError]): The error raised when
+            a conversion is attempted and no path exists.
+        converter_name (str): The kind of converter, used in the error message.
+        libs (tuple[str, ...]): The libraries along the path, one more than
+            the number of converters.
+        record_latency (Callable[[str, str, float], None] | None): Receives
+            the source library, the target library and the time in seconds of
+            each conversion step.
+
+    """
+
+    from_lib: str
+    to_lib: str
+    converters: tuple[Any, ...] | None
+    error_type: type[TranspilerDispatcherError]
+    converter_name: str
+    libs: tuple[str, ...] = ()
+    record_latency: Callable[[str, str, float], None] | None = None
+
+    def convert(
+        self,
+        value: Any,  # noqa: ANN401
+        intermediates: dict[str, Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Convert a value along the path.
+
+        If no path exists, `error_type` is raised.
+
+        Args:
+            value (Any): The program or device to convert.
+            intermediates (dict[str, Any] | None): If given, receives the value
+                in every library along the path, including the first and last.
+
+        Returns:
+            Any: The converted value.
+
+        """
+        if self.converters is None:
+            msg = (
+                f"No {self.converter_name} path found to convert "
+                f"from {self.from_lib} to {self.to_lib}"
+            )
+            raise self.error_type(msg)
+
+        if intermediates is not None:
+            intermediates[self.from_lib] = value
+        for (source, target), converter in zip(
+            pairwise(self.libs), self.converters, strict=True
+        ):
+            start = time.perf_counter()
+            value = converter.convert(value)
+            if self.record_latency is not None:
+                self.record_latency(source, target, time.perf_counter() - start)
+            if intermediates is not None:
+                intermediates[target] = value
+        return value
+
+
+@dataclass(frozen=True)
+class DispatchRoute:
+    """The precomputed steps for one combination of libraries.
+
+    Args:
+        transpiler (Any): The transpiler to use.
+        to_transpiler (ConversionPath): Converts the program to the
+            transpiler's program library.
+        from_transpiler (ConversionPath | None): Converts the transpiled program
+            to the requested output library. None if no program is returned.
+        device (ConversionPath | None): Converts the device to the transpiler's
+            device library. None if the device library is not known.
+        device_properties (ConversionPath | None): Converts the device to
+            the library that metrics read device properties from.
+            None if the device library is not known.
+
+    """
+
+    transpiler: Any
+    to_transpiler: ConversionPath
+    from_transpiler: ConversionPath | None
+    device: ConversionPath | None
+    device_properties: ConversionPath | None = None
+
+
 class TranspilerDispatcher:
     """A dispatcher class that executes quantum circuit transpilation.
 
     Manages the integrated handling of circuit conversion between different
     quantum computing libraries and the utilization of various transpiler libraries.
 
-    Supports conversion through Qiskit as an intermediate format when direct conversion
-    between programs is not available.
+    When no direct converter is registered, programs and devices are converted
+    along the cheapest chain of registered converters, e.g., through Qiskit
+    as an intermediate format.
+
+    The dispatcher is meant to be created once and reused. The transpiler and the
+    converter chains for each combination of program, transpiler and device
+    libraries are looked up once and kept in a routing table, which is rebuilt
+    when a transpiler or a converter is registered with one of the managers.
 
     Args:
         transpiler_manager (TranspilerManager): Manages the selection and
@@ -57,24 +195,44 @@ class TranspilerDispatcher:
             and their corresponding libraries.
         device_type_manager (DeviceTypeManager): Manages detection of device types
             and their corresponding libraries.
+        cache (TranspileCache | None): Stores results by the content of
+            the request. If None, every request is transpiled.
+        device_conversion_cache (DeviceConversionCache | None): Keeps converted
+            devices across calls. If None, devices are converted on every call.
+        stats_metric_manager (StatsMetricManager | None): Resolves the names of
+            additional metrics to compute. If None, no metrics are available.
+        observers (Sequence[TranspileObserver] | None): Receive the timing of
+            each stage. The sequence is read on every call, so observers added
+            to it later are notified as well.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         transpiler_manager: TranspilerManager,
         program_converter_manager: ProgramConverterManager,
         device_converter_manager: DeviceConverterManager,
         program_type_manager: ProgramTypeManager,
         device_type_manager: DeviceTypeManager,
+        *,
+        cache: TranspileCache | None = None,
+        device_conversion_cache: DeviceConversionCache | None = None,
+        stats_metric_manager: StatsMetricManager | None = None,
+        observers: Sequence[TranspileObserver] | None = None,
     ) -> None:
         self._transpiler_manager = transpiler_manager
         self._program_converter_manager = program_converter_manager
         self._device_converter_manager = device_converter_manager
         self._program_type_manager = program_type_manager
         self._device_type_manager = device_type_manager
+        self._cache = cache
+        self._device_conversion_cache = device_conversion_cache
+        self._stats_metric_manager = stats_metric_manager or StatsMetricManager()
+        self._observers = () if observers is None else observers
+        self._routes: dict[tuple[str, str, str | None, str | None], DispatchRoute] = {}
+        self._routes_revision = self._manager_revision()
 
-    def dispatch(  # noqa: PLR0913 PLR0917
+    def dispatch(  # noqa: PLR0913 PLR0914 PLR0917
         self,
         program: Any,  # noqa: ANN401
         program_lib: str | None,
@@ -82,9 +240,18 @@ class TranspilerDispatcher:
         transpiler_options: dict[str, Any] | None,
         device: Any | None,  # noqa: ANN401
         device_lib: str | None,
+        *,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+        previous: TranspileResult | None = None,
     ) -> TranspileResult:
         """Execute transpilation of a quantum circuit.
 
+        An unknown `stats` value raises `InvalidStatsModeError`, and an unknown
+        metric name raises `StatsMetricNotFoundError`.
+
         Args:
             program (Any): The quantum circuit to be transpiled
             program_lib (str): Name of the library for the input circuit
@@ -93,6 +260,19 @@ class TranspilerDispatcher:
             transpiler_options (dict | None): Options to be passed to the transpiler
             device (Any | None): Target device (optional)
             device_lib (str | None): Name of the device library (optional)
+            device_version (str | None): Tag that identifies the content of
+                the device, used to reuse converted devices (optional)
+            output_lib (str | None): Library of the returned program. "input"
+                for the library of the input circuit, "native" for the
+                transpiler's own format, or None to return no program
+            stats (str): Statistics to compute: "full", "counts" (without
+                the depth) or "none"
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute in addition to the statistics, ignored when `stats`
+                is "none"
+            previous (TranspileResult | None): An earlier result for the same
+                program, whose program is passed to the transpiler as a hint.
+                Results with a previous result are not cached
 
         Returns:
             TranspileResult: Object containing the transpilation results
@@ -104,39 +284,464 @@ class TranspilerDispatcher:
         if program is None:
             msg = "No program specified. Please specify a valid quantum circuit."
             raise ProgramNotSpecifiedError(msg)
+        self._validate_stats_mode(stats)
+        resolved_metrics = self._resolve_metrics(metrics, stats)
 
-        selected_transpiler_lib = self._select_transpiler_lib(transpiler_lib)
+        selected_transpiler_lib = self.select_transpiler_lib(transpiler_lib)
         resolved_program_lib = self._resolve_program_lib(program, program_lib)
+        program = self._read_program(program, resolved_program_lib)
         resolved_device_lib = self._resolve_device_lib(device, device_lib)
-        transpiler = self._transpiler_manager.fetch_transpiler(selected_transpiler_lib)
+        route = self._route(
+            resolved_program_lib,
+            selected_transpiler_lib,
+            resolved_device_lib,
+            output_lib,
+        )
 
-        if resolved_program_lib != transpiler.program_lib:
-            converted_program = self._convert_program(
-                program, from_lib=resolved_program_lib, to_lib=transpiler.program_lib
+        # The result depends on the previous result, which is not in the key
+        cache_key = None
+        if previous is None:
+            cache_key = self._cache_key(
+                program,
+                resolved_program_lib,
+                selected_transpiler_lib,
+                transpiler_options,
+                device,
+                resolved_device_lib,
+                device_version,
+                output_lib,
+                stats,
+                resolved_metrics,
             )
-        else:
-            converted_program = program
+        cached_result = self._load_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
 
-        converted_device = self._convert_device(
-            device, from_lib=resolved_device_lib, to_lib=selected_transpiler_lib
+        context = TranspileContext(
+            resolved_program_lib, selected_transpiler_lib, resolved_device_lib
+        )
+        timer = StageTimer(context, self._observers)
+        source_programs: dict[str, Any] = {}
+        converted_program = timer.run(
+            "convert_program",
+            route.to_transpiler.convert,
+            program,
+            source_programs,
+        )
+        previous_program = None
+        if previous is not None and previous.transpiled_program is not None:
+            previous_program = timer.run(
+                "convert_program",
+                self._convert_previous_program,
+                previous.transpiled_program,
+                resolved_program_lib,
+                route.to_transpiler.to_lib,
+            )
+        converted_device = timer.run(
+            "convert_device",
+            lambda: self._convert_device(device, route.device, version=device_version),
+        )
+        device_properties = timer.run(
+            "convert_device",
+            self._device_properties,
+            device,
+            route.device_properties,
+            device_version,
+            resolved_metrics,
         )
 
-        result = transpiler.transpile(
+        result = timer.run(
+            "transpile",
+            self._transpile,
+            route.transpiler,
             converted_program,
             transpiler_options,
             converted_device,
+            TranspileHints(
+                source_programs=source_programs,
+                stats=stats,
+                metrics=resolved_metrics,
+                device_properties=device_properties,
+                previous_program=previous_program,
+                previous_qubit_mapping=None
+                if previous is None
+                else previous.virtual_physical_mapping.qubit_mapping,
+            ),
+        )
+        self._restrict_stats(result, stats)
+
+        result.transpiled_program = timer.run(
+            "convert_output",
+            self._convert_output,
+            result.transpiled_program,
+            route.from_transpiler,
         )
+        result.timings.update(timer.wall_times)
+        result.cpu_timings.update(timer.cpu_times)
+        self._time_stats(result, stats, context)
+        self._store_cached_result(cache_key, result)
+
+        return result
+
+    def dispatch_many(  # noqa: PLR0913 PLR0914 PLR0917
+        self,
+        programs: Sequence[Any],
+        program_lib: str | None,
+        transpiler_lib: str | None,
+        transpiler_options: dict[str, Any] | None,
+        device: Any | None,  # noqa: ANN401
+        device_lib: str | None,
+        *,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+    ) -> list[TranspileResult]:
+        """Execute transpilation of several quantum circuits in one backend call.
 
-        if transpiler.program_lib != resolved_program_lib:
-            result.transpiled_program = self._convert_program(
+        The device is converted once and all programs are handed to the
+        transpiler's `transpile_many()`. Each transpiled program is converted
+        to the requested output library, by default the library of its own
+        input program. The "transpile" timing of each result is its share of
+        the single backend call. An unknown `stats` value raises
+        `InvalidStatsModeError`, and an unknown metric name raises
+        `StatsMetricNotFoundError`.
+
+        Args:
+            programs (Sequence[Any]): The quantum circuits to be transpiled
+            program_lib (str | None): Name of the library for the input circuits.
+                If None, it is resolved for each circuit.
+            transpiler_lib (str | None): Name of the transpiler library to use
+            transpiler_options (dict | None): Options shared by all circuits
+            device (Any | None): Target device shared by all circuits (optional)
+            device_lib (str | None): Name of the device library (optional)
+            device_version (str | None): Tag that identifies the content of
+                the device, used to reuse converted devices (optional)
+            output_lib (str | None): Library of the returned program. "input"
+                for the library of the input circuit, "native" for the
+                transpiler's own format, or None to return no program
+            stats (str): Statistics to compute: "full", "counts" (without
+                the depth) or "none"
+            metrics (Sequence[str] | None): Names of registered metrics to
+                compute in addition to the statistics, ignored when `stats`
+                is "none"
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`
+
+        Raises:
+            ProgramNotSpecifiedError: Raised when any program is None.
+
+        """
+        if any(program is None for program in programs):
+            msg = "No program specified. Please specify a valid quantum circuit."
+            raise ProgramNotSpecifiedError(msg)
+        self._validate_stats_mode(stats)
+        resolved_metrics = self._resolve_metrics(metrics, stats)
+
+        selected_transpiler_lib = self.select_transpiler_lib(transpiler_lib)
+        resolved_program_libs = [
+            self._resolve_program_lib(program, program_lib) for program in programs
+        ]
+        programs = list(
+            starmap(
+                self._read_program,
+                zip(programs, resolved_program_libs, strict=True),
+            )
+        )
+        resolved_device_lib = self._resolve_device_lib(device, device_lib)
+        routes = [
+            self._route(
+                resolved_lib, selected_transpiler_lib, resolved_device_lib, output_lib
+            )
+            for resolved_lib in resolved_program_libs
+        ]
+
+        cache_keys = [
+            self._cache_key(
+                program,
+                resolved_lib,
+                selected_transpiler_lib,
+                transpiler_options,
+                device,
+                resolved_device_lib,
+                device_version,
+                output_lib,
+                stats,
+                resolved_metrics,
+            )
+            for program, resolved_lib in zip(
+                programs, resolved_program_libs, strict=True
+            )
+        ]
+        results: list[TranspileResult | None] = [
+            self._load_cached_result(key) for key in cache_keys
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            return [result for result in results if result is not None]
+
+        timers = [
+            StageTimer(
+                TranspileContext(
+                    resolved_program_libs[index],
+                    selected_transpiler_lib,
+                    resolved_device_lib,
+                    len(pending),
+                ),
+                self._observers,
+            )
+            for index in pending
+        ]
+        converted_programs = [
+            timers[position].run(
+                "convert_program",
+                routes[index].to_transpiler.convert,
+                programs[index],
+            )
+            for position, index in enumerate(pending)
+        ]
+        # Shared stages name the program library only if the batch has one
+        pending_program_libs = {resolved_program_libs[index] for index in pending}
+        shared_program_lib = (
+            pending_program_libs.pop() if len(pending_program_libs) == 1 else None
+        )
+        shared_timer = StageTimer(
+            TranspileContext(
+                shared_program_lib,
+                selected_transpiler_lib,
+                resolved_device_lib,
+                len(pending),
+            ),
+            self._observers,
+        )
+        converted_device = shared_timer.run(
+            "convert_device",
+            lambda: self._convert_device(
+                device, routes[pending[0]].device, version=device_version
+            ),
+        )
+        device_properties = shared_timer.run(
+            "convert_device",
+            self._device_properties,
+            device,
+            routes[pending[0]].device_properties,
+            device_version,
+            resolved_metrics,
+        )
+
+        transpiled_results = shared_timer.run(
+            "transpile",
+            self._transpile_many,
+            routes[pending[0]].transpiler,
+            converted_programs,
+            transpiler_options,
+            converted_device,
+            TranspileHints(
+                stats=stats,
+                metrics=resolved_metrics,
+                device_properties=device_properties,
+            ),
+        )
+
+        for position, (index, result) in enumerate(
+            zip(pending, transpiled_results, strict=True)
+        ):
+            self._restrict_stats(result, stats)
+            result.transpiled_program = timers[position].run(
+                "convert_output",
+                self._convert_output,
                 result.transpiled_program,
-                from_lib=transpiler.program_lib,
-                to_lib=resolved_program_lib,
+                routes[index].from_transpiler,
+            )
+            result.timings.update(_shares(shared_timer.wall_times, len(pending)))
+            result.timings.update(timers[position].wall_times)
+            result.cpu_timings.update(_shares(shared_timer.cpu_times, len(pending)))
+            result.cpu_timings.update(timers[position].cpu_times)
+            self._time_stats(
+                result,
+                stats,
+                TranspileContext(
+                    resolved_program_libs[index],
+                    selected_transpiler_lib,
+                    resolved_device_lib,
+                ),
             )
+            self._store_cached_result(cache_keys[index], result)
+            results[index] = result
 
-        return result
+        return [result for result in results if result is not None]
+
+    def supports_native_batch(self, transpiler_lib: str | None) -> bool:
+        """Check whether the transpiler handles a whole batch in one call.
+
+        Args:
+            transpiler_lib (str | None): Name of the transpiler library to use.
+                If None, the default transpiler library is used.
+
+        Returns:
+            bool: True if the transpiler supports native batch transpilation.
+
+        """
+        selected_transpiler_lib = self.select_transpiler_lib(transpiler_lib)
+        transpiler = self._transpiler_manager.fetch_transpiler(selected_transpiler_lib)
+        return bool(getattr(transpiler, "supports_native_batch", False))
+
+    def prepare(  # noqa: PLR0913 PLR0917
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None,
+        transpiler_lib: str | None,
+        device: Any | None,  # noqa: ANN401
+        device_lib: str | None,
+        output_lib: str | None,
+    ) -> tuple[Any, Any]:
+        """Read the program and build the route of a request without transpiling.
+
+        The converters and the transpiler of the route are created, and their
+        backend libraries imported, in the calling thread. Importing libraries
+        such as Qiskit and pytket for the first time from several threads at
+        once can fail with circular import errors, so callers that dispatch on
+        a thread pool prepare each route first.
+
+        Args:
+            program (Any): The program to be transpiled.
+            program_lib (str | None): The library or format of the program.
+            transpiler_lib (str | None): Name of the transpiler library to use.
+            device (Any | None): The device to transpile for.
+            device_lib (str | None): The library or format of the device.
+            output_lib (str | None): The library of the returned program.
+
+        Returns:
+            tuple[Any, Any]: The program, read if it is an OpenQASM3 source
+                such as a file, and the transpiler.
 
-    def _select_transpiler_lib(self, transpiler_lib: str | None) -> str:
+        """
+        resolved_program_lib = self._resolve_program_lib(program, program_lib)
+        route = self._route(
+            resolved_program_lib,
+            self.select_transpiler_lib(transpiler_lib),
+            self._resolve_device_lib(device, device_lib),
+            output_lib,
+        )
+        return self._read_program(program, resolved_program_lib), route.transpiler
+
+    def identify_program(
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None,
+    ) -> tuple[Any, str | None]:
+        """Read a program and compute the fingerprint of its content.
+
+        The fingerprint is the one that identifies the program in cache keys,
+        so programs with equal fingerprints have the same transpilation result.
+
+        Args:
+            program (Any): The program.
+            program_lib (str | None): The library or format of the program.
+                If None, it is resolved from the type of the program.
+
+        Returns:
+            tuple[Any, str | None]: The program, read if it is an OpenQASM3
+                source such as a file, and its fingerprint, or None if it
+                cannot be fingerprinted.
+
+        """
+        resolved_program_lib = self._resolve_program_lib(program, program_lib)
+        program = self._read_program(program, resolved_program_lib)
+        try:
+            return program, self._fingerprint_program(program, resolved_program_lib)
+        except FingerprintError:
+            return program, None
+
+    def _cache_key(  # noqa: PLR0913 PLR0917
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str,
+        transpiler_lib: str,
+        transpiler_options: dict[str, Any] | None,
+        device: Any | None,  # noqa: ANN401
+        device_lib: str | None,
+        device_version: str | None,
+        output_lib: str | None,
+        stats: str,
+        metrics: dict[str, StatsMetric],
+    ) -> str | None:
+        if self._cache is None:
+            return None
+
+        try:
+            return fingerprint({
+                "program": self._fingerprint_program(program, program_lib),
+                "program_lib": program_lib,
+                "transpiler_lib": transpiler_lib,
+                "transpiler_options": transpiler_options or {},
+                "device": self._fingerprint_device(device, device_version),
+                "device_lib": device_lib,
+                "output_lib": output_lib,
+                "stats": stats,
+                "metrics": sorted(metrics),
+            })
+        except FingerprintError:
+            # Requests that cannot be fingerprinted are transpiled without caching
+            return None
+
+    @staticmethod
+    def _fingerprint_device(device: Any | None, device_version: str | None) -> Any:  # noqa: ANN401
+        if device is None:
+            return None
+        if device_version is not None:
+            return {"version": device_version}
+        return fingerprint(device)
+
+    def _fingerprint_program(self, program: Any, program_lib: str) -> str:  # noqa: ANN401
+        if isinstance(program, str):
+            return fingerprint(program)
+
+        # OpenQASM3 text is a canonical form that does not depend on object identity
+        if self._program_converter_manager.has_converter(program_lib, "openqasm3"):
+            converter = self._program_converter_manager.fetch_converter(
+                program_lib, "openqasm3"
+            )
+            try:
+                openqasm3_program = converter.convert(program)
+            except Exception:  # noqa: BLE001
+                # Fall back to the pickled form when the program cannot be exported
+                return fingerprint(program)
+            # OpenQASM3 has no global phase, which transpilers keep
+            return fingerprint({
+                "openqasm3": openqasm3_program,
+                "global_phase": _global_phase(program),
+            })
+
+        return fingerprint(program)
+
+    def _load_cached_result(self, cache_key: str | None) -> TranspileResult | None:
+        if self._cache is None or cache_key is None:
+            return None
+        return self._cache.get(cache_key)
+
+    def _store_cached_result(
+        self, cache_key: str | None, result: TranspileResult
+    ) -> None:
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, result)
+
+    def select_transpiler_lib(self, transpiler_lib: str | None) -> str:
+        """Return the transpiler library to use for a request.
+
+        Args:
+            transpiler_lib (str | None): Name of the transpiler library to use.
+                If None, the default transpiler library is used.
+
+        Returns:
+            str: The transpiler library.
+
+        Raises:
+            TranspilerLibNotSpecifiedError: If no library is given and no default
+                is registered.
+
+        """
         selected_lib = transpiler_lib
 
         if selected_lib is None:
@@ -164,6 +769,13 @@ class TranspilerDispatcher:
 
         return resolved_lib
 
+    @staticmethod
+    def _read_program(program: Any, program_lib: str) -> Any:  # noqa: ANN401
+        # OpenQASM3 sources are read before they are fingerprinted or converted
+        if program_lib == _OPENQASM3_LIB and not isinstance(program, str):
+            return read_openqasm3(program)
+        return program
+
     def _resolve_device_lib(
         self,
         device: Any | None,  # noqa: ANN401
@@ -180,92 +792,244 @@ class TranspilerDispatcher:
 
         return resolved_lib
 
-    def _convert_program(self, program: Any, *, from_lib: str, to_lib: str) -> Any:  # noqa: ANN401
-        if self._can_convert_program_directly(from_lib=from_lib, to_lib=to_lib):
-            direct_converter = self._program_converter_manager.fetch_converter(
-                from_lib=from_lib,
-                to_lib=to_lib,
-            )
-            return direct_converter.convert(program)
+    def _route(
+        self,
+        program_lib: str,
+        transpiler_lib: str,
+        device_lib: str | None,
+        output_lib: str | None,
+    ) -> DispatchRoute:
+        revision = self._manager_revision()
+        if revision != self._routes_revision:
+            self._routes = {}
+            self._routes_revision = revision
 
-        if not self._can_convert_program_via_qiskit(from_lib=from_lib, to_lib=to_lib):
-            msg = (
-                f"No ProgramConverter path found to convert from {from_lib} to {to_lib}"
-            )
-            raise ProgramConversionPathNotFoundError(msg)
+        key = (program_lib, transpiler_lib, device_lib, output_lib)
+        route = self._routes.get(key)
+        if route is None:
+            route = self._build_route(*key)
+            self._routes[key] = route
 
-        to_qiskit_converter = self._program_converter_manager.fetch_converter(
-            from_lib, "qiskit"
-        )
-        from_qiskit_converter = self._program_converter_manager.fetch_converter(
-            "qiskit", to_lib
+        return route
+
+    def _manager_revision(self) -> tuple[int, int, int]:
+        return (
+            self._transpiler_manager.revision,
+            self._program_converter_manager.revision,
+            self._device_converter_manager.revision,
         )
 
-        qiskit_program = to_qiskit_converter.convert(program)
-        return from_qiskit_converter.convert(qiskit_program)
+    def _build_route(
+        self,
+        program_lib: str,
+        transpiler_lib: str,
+        device_lib: str | None,
+        output_lib: str | None,
+    ) -> DispatchRoute:
+        transpiler = self._transpiler_manager.fetch_transpiler(transpiler_lib)
+        transpiler_program_lib = transpiler.program_lib
 
-    def _can_convert_program_directly(self, *, from_lib: str, to_lib: str) -> bool:
-        return self._program_converter_manager.has_converter(
-            from_lib=from_lib, to_lib=to_lib
+        if output_lib == OUTPUT_LIB_INPUT:
+            output_lib = program_lib
+        elif output_lib == OUTPUT_LIB_NATIVE:
+            output_lib = transpiler_program_lib
+
+        return DispatchRoute(
+            transpiler=transpiler,
+            to_transpiler=self._find_program_path(program_lib, transpiler_program_lib),
+            from_transpiler=None
+            if output_lib is None
+            else self._find_program_path(transpiler_program_lib, output_lib),
+            device=None
+            if device_lib is None
+            else self._find_device_path(device_lib, transpiler_lib),
+            device_properties=None
+            if device_lib is None
+            else self._find_device_path(device_lib, _DEVICE_PROPERTIES_LIB),
         )
 
-    def _can_convert_program_via_qiskit(self, *, from_lib: str, to_lib: str) -> bool:
-        can_convert_to_qiskit = self._program_converter_manager.has_converter(
-            from_lib=from_lib,
-            to_lib="qiskit",
+    def _find_program_path(self, from_lib: str, to_lib: str) -> ConversionPath:
+        return self._find_path(
+            self._program_converter_manager,
+            from_lib,
+            to_lib,
+            ProgramConversionPathNotFoundError,
+            "ProgramConverter",
         )
-        can_convert_to_target = self._program_converter_manager.has_converter(
-            from_lib="qiskit",
-            to_lib=to_lib,
+
+    def _find_device_path(self, from_lib: str, to_lib: str) -> ConversionPath:
+        return self._find_path(
+            self._device_converter_manager,
+            from_lib,
+            to_lib,
+            DeviceConversionPathNotFoundError,
+            "DeviceConverter",
         )
-        return can_convert_to_qiskit and can_convert_to_target
 
-    def _convert_device(
-        self,
-        device: Any | None,  # noqa: ANN401
-        *,
-        from_lib: str | None,
+    @staticmethod
+    def _find_path(
+        manager: ProgramConverterManager | DeviceConverterManager,
+        from_lib: str,
         to_lib: str,
-    ) -> Any | None:  # noqa: ANN401
-        if device is None:
-            return None
+        error_type: type[TranspilerDispatcherError],
+        converter_name: str,
+    ) -> ConversionPath:
+        libs = manager.find_path(from_lib, to_lib)
+        if libs is None:
+            return ConversionPath(from_lib, to_lib, None, error_type, converter_name)
 
-        if from_lib is None:
-            return device
+        return ConversionPath(
+            from_lib,
+            to_lib,
+            tuple(starmap(manager.fetch_converter, pairwise(libs))),
+            error_type,
+            converter_name,
+            libs,
+            manager.record_latency,
+        )
 
-        if self._can_convert_device_directly(from_lib=from_lib, to_lib=to_lib):
-            direct_converter = self._device_converter_manager.fetch_converter(
-                from_lib,
-                to_lib,
+    @staticmethod
+    def _transpile(
+        transpiler: Any,  # noqa: ANN401
+        program: Any,  # noqa: ANN401
+        options: dict[str, Any] | None,
+        device: Any | None,  # noqa: ANN401
+        hints: TranspileHints,
+    ) -> TranspileResult:
+        # Transpilers that do not derive from Transpiler only provide transpile()
+        if isinstance(transpiler, Transpiler):
+            return transpiler.transpile_with_hints(
+                program, options, device, hints=hints
             )
-            return direct_converter.convert(device)
+        return transpiler.transpile(program, options, device)
 
-        if not self._can_convert_device_via_qiskit(from_lib=from_lib, to_lib=to_lib):
+    @staticmethod
+    def _transpile_many(
+        transpiler: Any,  # noqa: ANN401
+        programs: list[Any],
+        options: dict[str, Any] | None,
+        device: Any | None,  # noqa: ANN401
+        hints: TranspileHints,
+    ) -> list[TranspileResult]:
+        if isinstance(transpiler, Transpiler):
+            return transpiler.transpile_many_with_hints(
+                programs, options, device, hints=hints
+            )
+        return transpiler.transpile_many(programs, options, device)
+
+    @staticmethod
+    def _validate_stats_mode(stats: str) -> None:
+        if stats not in STATS_MODES:
             msg = (
-                f"No DeviceConverter path found to convert from {from_lib} to {to_lib}"
+                f"Unknown stats mode: {stats}. "
+                f"Please specify one of {', '.join(sorted(STATS_MODES))}."
             )
-            raise DeviceConversionPathNotFoundError(msg)
+            raise InvalidStatsModeError(msg)
+
+    def _resolve_metrics(
+        self, metrics: Sequence[str] | None, stats: str
+    ) -> dict[str, StatsMetric]:
+        # Unknown names are reported even when no statistics are computed
+        resolved_metrics = self._stats_metric_manager.fetch_metrics(metrics or ())
+        if stats == STATS_NONE:
+            return {}
+        return resolved_metrics
+
+    def _device_properties(
+        self,
+        device: Any | None,  # noqa: ANN401
+        path: ConversionPath | None,
+        version: str | None,
+        metrics: dict[str, StatsMetric],
+    ) -> DeviceProperties | None:
+        if not any(metric.requires_device for metric in metrics.values()):
+            return None
+        if device is None or path is None or path.converters is None:
+            return None
+
+        converted_device = self._convert_device(device, path, version=version)
+        target = getattr(converted_device, "target", None)
+        if target is None:
+            return None
+        return QiskitDeviceProperties(target)
+
+    @staticmethod
+    def _restrict_stats(result: TranspileResult, stats: str) -> None:
+        # Transpilers that ignore the hints still return only what was requested
+        if stats == STATS_NONE:
+            result.stats = {}
+        elif stats == STATS_COUNTS:
+            result.stats = partial(_without_depth, result.stats)
+
+    def _time_stats(
+        self, result: TranspileResult, stats: str, context: TranspileContext
+    ) -> None:
+        # Statistics are computed on first access, possibly in another thread
+        if stats == STATS_NONE:
+            return
+        timer = StageTimer(context, self._observers, result.timings, result.cpu_timings)
+        result.stats = partial(timer.run, "stats", result.stats.to_dict)
 
-        to_qiskit_converter = self._device_converter_manager.fetch_converter(
-            from_lib, "qiskit"
+    def _convert_previous_program(
+        self,
+        previous_program: Any,  # noqa: ANN401
+        program_lib: str,
+        transpiler_program_lib: str,
+    ) -> Any:  # noqa: ANN401
+        # Programs returned with output_lib="native" are of another library
+        previous_lib = (
+            self._program_type_manager.resolve_lib(previous_program) or program_lib
         )
-        from_qiskit_converter = self._device_converter_manager.fetch_converter(
-            "qiskit", to_lib
+        return self._find_program_path(previous_lib, transpiler_program_lib).convert(
+            previous_program
         )
-        qiskit_device = to_qiskit_converter.convert(device)
-        return from_qiskit_converter.convert(qiskit_device)
 
-    def _can_convert_device_directly(self, *, from_lib: str, to_lib: str) -> bool:
-        return self._device_converter_manager.has_converter(from_lib, to_lib)
+    @staticmethod
+    def _convert_output(
+        program: Any,  # noqa: ANN401
+        path: ConversionPath | None,
+    ) -> Any | None:  # noqa: ANN401
+        if path is None:
+            return None
+        return path.convert(program)
 
-    def _can_convert_device_via_qiskit(self, *, from_lib: str, to_lib: str) -> bool:
-        can_convert_to_qiskit = self._device_converter_manager.has_converter(
-            from_lib,
-            "qiskit",
-        )
-        can_convert_to_target = self._device_converter_manager.has_converter(
-            "qiskit",
-            to_lib,
+    def _convert_device(
+        self,
+        device: Any | None,  # noqa: ANN401
+        path: ConversionPath | None,
+        *,
+        version: str | None,
+    ) -> Any | None:  # noqa: ANN401
+        if device is None or path is None:
+            return device
+
+        if not path.converters or self._device_conversion_cache is None:
+            return path.convert(device)
+
+        return self._device_conversion_cache.get_or_convert(
+            device,
+            from_lib=path.from_lib,
+            to_lib=path.to_lib,
+            convert=path.convert,
+            version=version,
         )
 
-        return can_convert_to_qiskit and can_convert_to_target
+
+def _global_phase(program: Any) -> str | None:  # noqa: ANN401
+    # Qiskit circuits call it global_phase and tket circuits phase
+    for name in ("global_phase", "phase"):
+        phase = getattr(program, name, None)
+        if phase is not None and not callable(phase):
+            return str(phase)
+    return None
+
+
+def _shares(times: dict[str, float], n_programs: int) -> dict[str, float]:
+    return {stage: elapsed / n_programs for stage, elapsed in times.items()}
+
+
+def _without_depth(stats: NestedDictAccessor) -> dict[str, dict[str, int]]:
+    return {
+        section: {key: value for key, value in values.items() if key != "depth"}
+        for section, values in stats.items()
+    }
@@ -0,0 +1,383 @@
+"""Provides a pool of long-lived worker processes for transpilation.
+
+Qiskit and tket transpilation hold the GIL for most of their run time, so
+threads do not scale, and a process started for a single batch spends seconds
+importing Qiskit and pytket before it does any work. `TranquWorkerPool` keeps
+its processes alive between calls. Each process holds its own `Tranqu` instance
+with the transpilers and converters already imported and registered.
+
+Programs and results cross the process boundary in the compact formats of
+`program_codec`, e.g., QPY bytes for Qiskit circuits and JSON for tket circuits.
+
+Example:
+    To transpile on four warm worker processes:
+
+        with TranquWorkerPool(max_workers=4, warm_up_transpilers=["qiskit"]) as pool:
+            pool.start()
+            results = pool.transpile_many(circuits, transpiler_lib="qiskit")
+
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .batch_executor import expand_batch_items
+from .program_codec import (
+    EncodedProgram,
+    EncodedResult,
+    decode_program,
+    decode_result,
+    encode_program,
+    encode_result,
+)
+from .tranqu import Tranqu
+from .tranqu_error import TranquError
+from .transpiler import STATS_FULL
+from .transpiler_dispatcher import OUTPUT_LIB_INPUT
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
+
+    from .transpile_result import TranspileResult
+
+_WARM_UP_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+
+
+class WorkerPoolError(TranquError):
+    """Base exception for errors related to the worker pool."""
+
+
+class WorkerPoolClosedError(WorkerPoolError):
+    """Raised when a request is submitted to a closed worker pool."""
+
+
+class TranquWorkerPool:
+    """A pool of long-lived processes that each hold a `Tranqu` instance.
+
+    Workers are started on the first request, or all at once by `start()`.
+    Results are returned with their statistics computed by the worker.
+    The pool should be closed with `close()` or used as a context manager.
+
+    Args:
+        tranqu (Tranqu | None): The instance whose registrations the workers use.
+            It is pickled once for each worker when the worker starts.
+            If None, each worker creates a default `Tranqu`.
+        max_workers (int | None): The number of worker processes.
+            If None, the number of CPUs.
+        mp_context (str | None): The multiprocessing start method, e.g., "spawn"
+            or "forkserver". If None, the platform default is used.
+        warm_up_transpilers (Sequence[str]): Transpiler libraries that each
+            worker runs once on a small program when it starts, so that
+            the modules they import lazily are loaded before the first request.
+
+    """
+
+    def __init__(
+        self,
+        tranqu: Tranqu | None = None,
+        *,
+        max_workers: int | None = None,
+        mp_context: str | None = None,
+        warm_up_transpilers: Sequence[str] = (),
+    ) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=None
+            if mp_context is None
+            else multiprocessing.get_context(mp_context),
+            initializer=_initialize_worker,
+            initargs=(tranqu, tuple(warm_up_transpilers)),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Returns the number of worker processes.
+
+        Returns:
+            int: The number of worker processes.
+
+        """
+        return self._max_workers
+
+    def start(self) -> None:
+        """Start the worker processes and wait until they are initialized."""
+        futures = [
+            self._get_executor().submit(os.getpid) for _ in range(self._max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def submit(  # noqa: PLR0913
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any] | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+    ) -> Future[TranspileResult]:
+        """Send a program to a worker and return a future of its result.
+
+        The arguments are the same as for `Tranqu.transpile()`.
+        A closed pool raises `WorkerPoolClosedError`.
+
+        Args:
+            program (Any): The program to be transformed.
+            program_lib (str | None): The library or format of the program.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any]): Options passed to the transpiler.
+            device (Any | None): Information about the device on which
+                the program will be executed. It is pickled for each request.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. See `Tranqu.transpile()`.
+            output_lib (str | None): The library of the returned program.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+            metrics (Sequence[str] | None): Names of registered metrics to compute.
+
+        Returns:
+            Future[TranspileResult]: The future result.
+
+        """
+        transpile_kwargs = {
+            "program_lib": program_lib,
+            "transpiler_lib": transpiler_lib,
+            "transpiler_options": transpiler_options,
+            "device": device,
+            "device_lib": device_lib,
+            "device_version": device_version,
+            "output_lib": output_lib,
+            "stats": stats,
+            "metrics": None if metrics is None else list(metrics),
+        }
+        future = self._get_executor().submit(
+            _transpile_in_worker, encode_program(program), transpile_kwargs
+        )
+        return _decoded(future)
+
+    def transpile(  # noqa: PLR0913
+        self,
+        program: Any,  # noqa: ANN401
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any] | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+    ) -> TranspileResult:
+        """Transpile a program on a worker and wait for the result.
+
+        The arguments are the same as for `Tranqu.transpile()`.
+
+        Args:
+            program (Any): The program to be transformed.
+            program_lib (str | None): The library or format of the program.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any]): Options passed to the transpiler.
+            device (Any | None): Information about the device on which
+                the program will be executed.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device.
+            output_lib (str | None): The library of the returned program.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+            metrics (Sequence[str] | None): Names of registered metrics to compute.
+
+        Returns:
+            TranspileResult: The result of the transpilation.
+
+        """
+        return self.submit(
+            program,
+            program_lib,
+            transpiler_lib,
+            transpiler_options=transpiler_options,
+            device=device,
+            device_lib=device_lib,
+            device_version=device_version,
+            output_lib=output_lib,
+            stats=stats,
+            metrics=metrics,
+        ).result()
+
+    def transpile_many(  # noqa: PLR0913
+        self,
+        programs: Iterable[Any],
+        program_lib: str | None = None,
+        transpiler_lib: str | None = None,
+        *,
+        transpiler_options: dict[str, Any]
+        | Sequence[dict[str, Any] | None]
+        | None = None,
+        device: Any | None = None,  # noqa: ANN401
+        device_lib: str | None = None,
+        device_version: str | None = None,
+        output_lib: str | None = OUTPUT_LIB_INPUT,
+        stats: str = STATS_FULL,
+        metrics: Sequence[str] | None = None,
+    ) -> list[TranspileResult]:
+        """Transpile many programs on the workers and return the results in order.
+
+        `transpiler_options` and `device` are shared by all programs, or
+        given per program as a list, as for `Tranqu.transpile_many()`.
+        If a program fails, the programs that have not started are cancelled
+        and the error is raised.
+
+        Args:
+            programs (Iterable[Any]): The programs to be transformed.
+            program_lib (str | None): The library or format of the programs.
+            transpiler_lib (str | None): The name of the transpiler to be used.
+            transpiler_options (dict[str, Any] | Sequence[dict[str, Any] | None]):
+                Options passed to the transpiler, shared or per program.
+            device (Any | None): Information about the device on which
+                the programs will be executed, shared or per program.
+            device_lib (str | None): Specifies the type of the device.
+            device_version (str | None): A tag that identifies the content of
+                the device. Only use it with a shared device.
+            output_lib (str | None): The library of the returned programs.
+            stats (str): The statistics to compute: "full", "counts" or "none".
+            metrics (Sequence[str] | None): Names of registered metrics to compute.
+
+        Returns:
+            list[TranspileResult]: The results, in the same order as `programs`.
+
+        """
+        futures = [
+            self.submit(
+                item.program,
+                program_lib,
+                transpiler_lib,
+                transpiler_options=item.transpiler_options,
+                device=item.device,
+                device_lib=device_lib,
+                device_version=device_version,
+                output_lib=output_lib,
+                stats=stats,
+                metrics=metrics,
+            )
+            for item in expand_batch_items(programs, transpiler_options, device)
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait (bool): Whether to wait for running requests to finish.
+                Requests that have not started are cancelled. Defaults to True.
+
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> TranquWorkerPool:  # noqa: PYI034
+        """Return the pool for use in a `with` statement.
+
+        Returns:
+            TranquWorkerPool: This pool.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pool at the end of a `with` statement.
+
+        Args:
+            exc_type (type[BaseException] | None): The type of the exception
+                raised in the block, if any.
+            exc_value (BaseException | None): The exception, if any.
+            traceback (TracebackType | None): The traceback, if any.
+
+        """
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            msg = "The worker pool has been closed."
+            raise WorkerPoolClosedError(msg)
+        return self._executor
+
+
+def _decoded(future: Future[EncodedResult]) -> Future[TranspileResult]:
+    decoded: Future[TranspileResult] = Future()
+
+    def copy_result(source: Future[EncodedResult]) -> None:
+        if source.cancelled():
+            decoded.cancel()
+            return
+        if not decoded.set_running_or_notify_cancel():
+            return
+        try:
+            decoded.set_result(decode_result(source.result()))
+        except Exception as error:  # noqa: BLE001
+            decoded.set_exception(error)
+
+    def cancel_source(target: Future[TranspileResult]) -> None:
+        if target.cancelled():
+            future.cancel()
+
+    decoded.add_done_callback(cancel_source)
+    future.add_done_callback(copy_result)
+    return decoded
+
+
+_worker_tranqu: Tranqu | None = None
+
+
+def _initialize_worker(
+    tranqu: Tranqu | None, warm_up_transpilers: tuple[str, ...]
+) -> None:
+    global _worker_tranqu  # noqa: PLW0603
+    if tranqu is None:
+        tranqu = Tranqu()
+    _worker_tranqu = tranqu
+
+    for transpiler_lib in warm_up_transpilers:
+        tranqu.transpile(
+            _WARM_UP_PROGRAM,
+            program_lib="openqasm3",
+            transpiler_lib=transpiler_lib,
+            output_lib=None,
+        ).to_dict()
+
+
+def _transpile_in_worker(
+    program: EncodedProgram,
+    transpile_kwargs: dict[str, Any],
+) -> EncodedResult:
+    if _worker_tranqu is None:  # pragma: no cover
+        msg = "The worker process has not been initialized."
+        raise WorkerPoolError(msg)
+    result = _worker_tranqu.transpile(decode_program(program), **transpile_kwargs)
+    return encode_result(result)
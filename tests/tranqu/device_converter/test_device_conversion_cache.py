@@ -0,0 +1,112 @@
+import pickle  # noqa: S403
+from typing import Any
+
+from tranqu.device_converter import DeviceConversionCache
+
+
+class CountingConvert:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, device: Any) -> Any:
+        self.calls += 1
+        return {"converted": device}
+
+
+class Backend:
+    """Device object that is not JSON-like"""
+
+
+class TestDeviceConversionCache:
+    def setup_method(self):
+        self.cache = DeviceConversionCache(max_size=2)
+        self.convert = CountingConvert()
+
+    def get(self, device: Any, version: str | None = None) -> Any:
+        return self.cache.get_or_convert(
+            device,
+            from_lib="lib1",
+            to_lib="lib2",
+            convert=self.convert,
+            version=version,
+        )
+
+    def test_json_device_is_keyed_on_content(self):
+        first = self.get({"name": "device", "qubits": [0, 1]})
+        second = self.get({"qubits": [0, 1], "name": "device"})
+
+        assert first is second
+        assert self.convert.calls == 1
+        assert self.cache.stats.hits == 1
+        assert self.cache.stats.misses == 1
+
+    def test_changed_json_device_is_converted_again(self):
+        self.get({"name": "device", "fidelity": 0.99})
+        self.get({"name": "device", "fidelity": 0.98})
+
+        assert self.convert.calls == 2
+
+    def test_device_object_is_keyed_on_identity(self):
+        backend = Backend()
+
+        first = self.get(backend)
+        second = self.get(backend)
+        self.get(Backend())
+
+        assert first is second
+        assert self.convert.calls == 2
+
+    def test_version_tag_takes_precedence_over_content(self):
+        self.get({"fidelity": 0.99}, version="2024-01-01")
+        self.get({"fidelity": 0.98}, version="2024-01-01")
+        self.get({"fidelity": 0.98}, version="2024-01-02")
+
+        assert self.convert.calls == 2
+
+    def test_libraries_are_part_of_the_key(self):
+        device = {"name": "device"}
+        self.get(device)
+        self.cache.get_or_convert(
+            device, from_lib="lib1", to_lib="lib3", convert=self.convert
+        )
+
+        assert self.convert.calls == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.get("a")
+        self.get("b")
+        self.get("a")
+        self.get("c")
+        self.get("a")
+        self.get("b")
+
+        assert self.convert.calls == 4
+        assert self.cache.stats.evictions == 2
+
+    def test_zero_size_disables_caching(self):
+        cache = DeviceConversionCache(max_size=0)
+        for _ in range(2):
+            cache.get_or_convert(
+                "device", from_lib="lib1", to_lib="lib2", convert=self.convert
+            )
+
+        assert self.convert.calls == 2
+        assert cache.stats.misses == 0
+
+    def test_clear(self):
+        self.get("a")
+        self.cache.clear()
+        self.get("a")
+
+        assert self.convert.calls == 2
+
+    def test_pickled_cache_starts_empty(self):
+        self.get("a")
+
+        restored = pickle.loads(pickle.dumps(self.cache))  # noqa: S301
+        restored.get_or_convert(
+            "a", from_lib="lib1", to_lib="lib2", convert=self.convert
+        )
+
+        assert self.convert.calls == 2
+        assert restored.stats.hits == 0
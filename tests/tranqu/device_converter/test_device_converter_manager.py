@@ -10,6 +10,7 @@ from tranqu.device_converter import (
     DeviceConverterNotFoundError,
     PassThroughDeviceConverter,
 )
+from tranqu.lazy_import import LazyFactory
 
 
 class DummyDeviceConverter(DeviceConverter):
@@ -27,6 +28,16 @@ class TestDeviceConverterManager:
 
         assert self.manager.has_converter("lib1", "lib2")
 
+    def test_fetch_converter_created_by_lazy_factory(self):
+        self.manager.register_converter(
+            "lib1", "lib2", LazyFactory(__name__, "DummyDeviceConverter")
+        )
+
+        converter = self.manager.fetch_converter("lib1", "lib2")
+
+        assert isinstance(converter, DummyDeviceConverter)
+        assert self.manager.fetch_converter("lib1", "lib2") is converter
+
     def test_register_converter_raises_error_when_already_registered(self):
         converter = DummyDeviceConverter()
         self.manager.register_converter("lib1", "lib2", converter)
@@ -72,3 +83,24 @@ class TestDeviceConverterManager:
         error = DeviceConverterError.invalid_backend_type(dict)
 
         assert str(error) == "Invalid backend type: <class 'dict'>"
+
+    def test_find_path(self):
+        self.manager.register_converter("lib1", "qiskit", DummyDeviceConverter())
+        self.manager.register_converter("qiskit", "lib2", DummyDeviceConverter())
+        revision = self.manager.revision
+
+        self.manager.register_converter("lib1", "lib2", DummyDeviceConverter())
+
+        assert self.manager.revision != revision
+        assert self.manager.find_path("lib1", "lib2") == ("lib1", "lib2")
+
+    def test_find_path_only_uses_registered_converters(self):
+        self.manager.register_converter("lib1", "qiskit", DummyDeviceConverter())
+        self.manager.register_converter("qiskit", "lib2", DummyDeviceConverter())
+        assert self.manager.find_path("lib1", "lib2") == ("lib1", "qiskit", "lib2")
+        revision = self.manager.revision
+
+        del self.manager._converters["qiskit", "lib2"]  # noqa: SLF001
+
+        assert self.manager.revision != revision
+        assert self.manager.find_path("lib1", "lib2") is None
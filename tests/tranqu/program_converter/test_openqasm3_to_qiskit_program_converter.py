@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 from openqasm3.parser import QASM3ParsingError
 from qiskit import QuantumCircuit  # type: ignore[import-untyped]
@@ -19,6 +21,18 @@ h q[0];
 
         assert isinstance(result, QuantumCircuit)
 
+    def test_convert_openqasm3_file(self, tmp_path: Path):
+        path = tmp_path / "program.qasm"
+        path.write_text(
+            'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[1] q;\nh q[0];\n',
+            encoding="utf-8",
+        )
+
+        result = self.converter.convert(path)
+
+        assert isinstance(result, QuantumCircuit)
+        assert result.count_ops() == {"h": 1}
+
     def test_convert_invalid_openqasm3(self):
         with pytest.raises(QASM3ParsingError):
             self.converter.convert("INVALID OPENQASM3 CODE")
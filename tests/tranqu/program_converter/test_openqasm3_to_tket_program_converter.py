@@ -1,3 +1,5 @@
+import io
+
 import pytest
 from openqasm3.parser import QASM3ParsingError
 from pytket import Circuit  # type: ignore[attr-defined]
@@ -19,6 +21,16 @@ h q[0];
 
         assert isinstance(result, Circuit)
 
+    def test_convert_qasm3_stream(self):
+        result = self.converter.convert(
+            io.StringIO(
+                'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[1] q;\nh q[0];\n'
+            )
+        )
+
+        assert isinstance(result, Circuit)
+        assert result.n_gates == 1
+
     def test_convert_invalid_qasm3(self):
         with pytest.raises(QASM3ParsingError):
             self.converter.convert("INVALID QASM CODE")
@@ -2,6 +2,7 @@ from typing import Any
 
 import pytest
 
+from tranqu.lazy_import import LazyFactory
 from tranqu.program_converter import (
     PassThroughProgramConverter,
     ProgramConverter,
@@ -32,6 +33,16 @@ class TestProgramConverterManager:
 
         assert isinstance(converter, TestFooBarConverter)
 
+    def test_fetch_converter_created_by_lazy_factory(self):
+        self.manager.register_converter(
+            "baz", "qux", LazyFactory(__name__, "BazToQuxConverter")
+        )
+
+        assert self.manager.has_converter("baz", "qux")
+        converter = self.manager.fetch_converter("baz", "qux")
+        assert isinstance(converter, BazToQuxConverter)
+        assert self.manager.fetch_converter("baz", "qux") is converter
+
     def test_fetch_converter_not_found(self):
         with pytest.raises(ProgramConverterNotFoundError):
             self.manager.fetch_converter("baz", "qux")
@@ -67,3 +78,39 @@ class TestProgramConverterManager:
         self.manager.register_converter("foo", "bar", converter2, allow_override=True)
 
         assert self.manager.fetch_converter("foo", "bar") == converter2
+
+    def test_find_path(self):
+        self.manager.register_converter("foo", "qiskit", TestFooBarConverter())
+        self.manager.register_converter("qiskit", "bar", BazToQuxConverter())
+
+        assert self.manager.find_path("foo", "bar") == ("foo", "qiskit", "bar")
+        assert self.manager.find_path("bar", "foo") is None
+
+    def test_find_path_only_uses_registered_converters(self):
+        self.manager.register_converter("foo", "qiskit", TestFooBarConverter())
+        self.manager.register_converter("qiskit", "bar", BazToQuxConverter())
+        assert self.manager.find_path("foo", "bar") == ("foo", "qiskit", "bar")
+
+        self.manager._converters.clear()  # noqa: SLF001
+        self.manager._converters["foo", "bar"] = TestFooBarConverter()  # noqa: SLF001
+
+        assert self.manager.find_path("foo", "bar") == ("foo", "bar")
+        assert self.manager.find_path("foo", "qiskit") is None
+
+    def test_find_path_with_cost(self):
+        self.manager.register_converter("foo", "bar", TestFooBarConverter(), cost=1.0)
+        self.manager.register_converter("foo", "baz", BazToQuxConverter(), cost=0.1)
+        self.manager.register_converter("baz", "bar", BazToQuxConverter(), cost=0.1)
+
+        assert self.manager.find_path("foo", "bar") == ("foo", "baz", "bar")
+
+    def test_set_transit_penalty(self):
+        self.manager.register_converter("foo", "openqasm3", TestFooBarConverter())
+        self.manager.register_converter("openqasm3", "bar", TestFooBarConverter())
+        self.manager.register_converter("foo", "qpy", TestFooBarConverter())
+        self.manager.register_converter("qpy", "qiskit", TestFooBarConverter())
+        self.manager.register_converter("qiskit", "bar", TestFooBarConverter())
+
+        self.manager.set_transit_penalty("openqasm3", 2.0)
+
+        assert self.manager.find_path("foo", "bar") == ("foo", "qpy", "qiskit", "bar")
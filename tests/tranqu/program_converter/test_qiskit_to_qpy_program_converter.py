@@ -0,0 +1,33 @@
+# mypy: disable-error-code="import-untyped"
+
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.circuit import Parameter
+
+from tranqu.program_converter import (
+    QiskitToQpyProgramConverter,
+    QpyToQiskitProgramConverter,
+)
+
+
+class TestQiskitToQpyProgramConverter:
+    def setup_method(self):
+        self.converter = QiskitToQpyProgramConverter()
+
+    def test_convert(self):
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        result = self.converter.convert(circuit)
+
+        assert isinstance(result, bytes)
+        assert QpyToQiskitProgramConverter().convert(result) == circuit
+
+    def test_parameters_are_kept(self):
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(1)
+        circuit.rz(theta, 0)
+
+        result = QpyToQiskitProgramConverter().convert(self.converter.convert(circuit))
+
+        assert [parameter.name for parameter in result.parameters] == ["theta"]
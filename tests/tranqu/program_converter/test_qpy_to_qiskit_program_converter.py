@@ -0,0 +1,25 @@
+# mypy: disable-error-code="import-untyped"
+
+import io
+
+from qiskit import QuantumCircuit, qpy  # type: ignore[import-untyped]
+
+from tranqu.program_converter import QpyToQiskitProgramConverter
+
+
+class TestQpyToQiskitProgramConverter:
+    def setup_method(self):
+        self.converter = QpyToQiskitProgramConverter()
+
+    def test_convert(self):
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+        buffer = io.BytesIO()
+        qpy.dump(circuit, buffer)
+
+        result = self.converter.convert(buffer.getvalue())
+
+        assert isinstance(result, QuantumCircuit)
+        assert result == circuit
@@ -0,0 +1,16 @@
+from pytket import Circuit  # type: ignore[attr-defined]
+
+from tranqu.program_converter import TketJsonToTketProgramConverter
+
+
+class TestTketJsonToTketProgramConverter:
+    def setup_method(self):
+        self.converter = TketJsonToTketProgramConverter()
+
+    def test_convert(self):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        result = self.converter.convert(circuit.to_dict())
+
+        assert isinstance(result, Circuit)
+        assert result == circuit
@@ -0,0 +1,16 @@
+from pytket import Circuit  # type: ignore[attr-defined]
+
+from tranqu.program_converter import TketToTketJsonProgramConverter
+
+
+class TestTketToTketJsonProgramConverter:
+    def setup_method(self):
+        self.converter = TketToTketJsonProgramConverter()
+
+    def test_convert(self):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        result = self.converter.convert(circuit)
+
+        assert isinstance(result, dict)
+        assert Circuit.from_dict(result) == circuit
@@ -0,0 +1,71 @@
+# mypy: disable-error-code="import-untyped"
+
+import pytest
+from qiskit import QuantumCircuit
+
+from tranqu.stats_metric import (
+    DeviceProperties,
+    DurationMetric,
+    InstructionProperties,
+)
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+
+class FixedDeviceProperties(DeviceProperties):
+    def __init__(self, properties: dict[str, InstructionProperties]) -> None:
+        self._properties = properties
+
+    def instruction_properties(
+        self,
+        name: str,
+        qubits: tuple[int, ...],  # noqa: ARG002
+    ) -> InstructionProperties | None:
+        return self._properties.get(name)
+
+
+DEVICE_PROPERTIES = FixedDeviceProperties({
+    "x": InstructionProperties(duration=1.0, error=0.1),
+    "cx": InstructionProperties(duration=3.0, error=0.2),
+    "measure": InstructionProperties(duration=5.0),
+})
+
+
+def duration(
+    circuit: QuantumCircuit, device_properties: DeviceProperties | None
+) -> float | None:
+    return QiskitStatsExtractor().extract_stats_from(
+        circuit,
+        metrics={"duration": DurationMetric()},
+        device_properties=device_properties,
+    )["duration"]
+
+
+class TestDurationMetric:
+    def test_sums_durations_along_critical_path(self):
+        circuit = QuantumCircuit(3, 1)
+        circuit.x(0)
+        circuit.x(0)
+        circuit.x(1)
+        circuit.cx(0, 1)
+        circuit.x(2)
+        circuit.measure(1, 0)
+
+        assert duration(circuit, DEVICE_PROPERTIES) == pytest.approx(10.0)
+
+    def test_uncalibrated_operations_synchronize_without_taking_time(self):
+        circuit = QuantumCircuit(2)
+        circuit.x(0)
+        circuit.barrier()
+        circuit.h(1)
+        circuit.x(1)
+
+        assert duration(circuit, DEVICE_PROPERTIES) == pytest.approx(2.0)
+
+    def test_requires_device(self):
+        assert DurationMetric.requires_device
+
+    def test_returns_none_without_device_properties(self):
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+
+        assert duration(circuit, None) is None
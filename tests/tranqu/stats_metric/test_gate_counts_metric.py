@@ -0,0 +1,33 @@
+# mypy: disable-error-code="import-untyped"
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.random import random_circuit
+
+from tranqu.stats_metric import GateCountsMetric
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+
+def gate_counts(circuit: QuantumCircuit) -> dict[str, int]:
+    return QiskitStatsExtractor().extract_stats_from(
+        circuit, metrics={"gate_counts": GateCountsMetric()}
+    )["gate_counts"]
+
+
+class TestGateCountsMetric:
+    def test_counts_operations_by_name(self):
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.barrier()
+        circuit.measure([0, 1], [0, 1])
+
+        assert gate_counts(circuit) == {"h": 1, "cx": 1, "barrier": 1, "measure": 2}
+
+    def test_matches_count_ops(self):
+        for seed in range(10):
+            circuit = random_circuit(4, 6, measure=True, reset=True, seed=seed)
+
+            assert gate_counts(circuit) == dict(circuit.count_ops())
+
+    def test_returns_empty_dict_for_empty_circuit(self):
+        assert gate_counts(QuantumCircuit(1)) == {}
@@ -0,0 +1,31 @@
+# mypy: disable-error-code="import-untyped"
+
+from qiskit import QuantumCircuit
+
+from tranqu.stats_metric import MeasurementCountMetric
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+
+class TestMeasurementCountMetric:
+    def test_counts_measurements(self):
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.measure([0, 1, 2], [0, 1, 2])
+        circuit.reset(0)
+        circuit.measure(0, 0)
+
+        stats = QiskitStatsExtractor().extract_stats_from(
+            circuit, metrics={"n_measurements": MeasurementCountMetric()}
+        )
+
+        assert stats["n_measurements"] == 4
+
+    def test_returns_zero_without_measurements(self):
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+
+        stats = QiskitStatsExtractor().extract_stats_from(
+            circuit, metrics={"n_measurements": MeasurementCountMetric()}
+        )
+
+        assert stats["n_measurements"] == 0
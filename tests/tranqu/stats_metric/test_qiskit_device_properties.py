@@ -0,0 +1,55 @@
+# mypy: disable-error-code="import-untyped"
+
+import pytest
+from qiskit.circuit.library import XGate
+from qiskit.transpiler import InstructionProperties as QiskitInstructionProperties
+from qiskit.transpiler import Target
+from qiskit_ibm_runtime.fake_provider import FakeSantiagoV2
+
+from tranqu.stats_metric import InstructionProperties, QiskitDeviceProperties
+
+
+class TestQiskitDeviceProperties:
+    def setup_method(self):
+        self.target = FakeSantiagoV2().target
+        self.properties = QiskitDeviceProperties(self.target)
+
+    def test_returns_properties_of_calibrated_instruction(self):
+        expected = self.target["cx"][0, 1]
+
+        assert self.properties.instruction_properties(
+            "cx", (0, 1)
+        ) == InstructionProperties(duration=expected.duration, error=expected.error)
+
+    def test_returns_none_for_unknown_instruction(self):
+        assert self.properties.instruction_properties("ccx", (0, 1, 2)) is None
+
+    def test_returns_none_for_uncoupled_qubits(self):
+        assert self.properties.instruction_properties("cx", (0, 4)) is None
+
+    def test_falls_back_to_global_instructions(self):
+        target = Target(num_qubits=2)
+        target.add_instruction(
+            XGate(), {None: QiskitInstructionProperties(duration=1e-8, error=0.01)}
+        )
+        properties = QiskitDeviceProperties(target)
+
+        assert properties.instruction_properties("x", (1,)) == InstructionProperties(
+            duration=1e-8, error=0.01
+        )
+
+    def test_memoizes_lookups(self, monkeypatch: pytest.MonkeyPatch):
+        calls = []
+        look_up = self.properties._look_up  # noqa: SLF001
+
+        def counting_look_up(
+            name: str, qubits: tuple[int, ...]
+        ) -> InstructionProperties | None:
+            calls.append((name, qubits))
+            return look_up(name, qubits)
+
+        monkeypatch.setattr(self.properties, "_look_up", counting_look_up)
+        self.properties.instruction_properties("sx", (2,))
+        self.properties.instruction_properties("sx", (2,))
+
+        assert calls == [("sx", (2,))]
@@ -0,0 +1,47 @@
+from tranqu.stats_metric import (
+    CircuitInfo,
+    GateCountsMetric,
+    MetricAccumulator,
+    StatsMetric,
+    StatsOperation,
+    create_accumulators,
+)
+
+
+class CircuitSizeMetric(StatsMetric):
+    def create_accumulator(self, circuit: CircuitInfo) -> MetricAccumulator:
+        return CircuitSizeAccumulator(circuit)
+
+
+class CircuitSizeAccumulator(MetricAccumulator):
+    def __init__(self, circuit: CircuitInfo) -> None:
+        self.circuit = circuit
+        self.operations: list[StatsOperation] = []
+
+    def add(self, operation: StatsOperation) -> None:
+        self.operations.append(operation)
+
+    def result(self) -> tuple[int, int, int]:
+        return (self.circuit.n_qubits, self.circuit.n_clbits, len(self.operations))
+
+
+class TestCreateAccumulators:
+    def test_creates_one_accumulator_per_metric(self):
+        accumulators = create_accumulators(
+            {"size": CircuitSizeMetric(), "gate_counts": GateCountsMetric()},
+            CircuitInfo(n_qubits=3, n_clbits=1),
+        )
+        for accumulator in accumulators.values():
+            accumulator.add(
+                StatsOperation("h", (0,), (), is_gate=True, is_directive=False)
+            )
+
+        assert list(accumulators) == ["size", "gate_counts"]
+        assert accumulators["size"].result() == (3, 1, 1)
+        assert accumulators["gate_counts"].result() == {"h": 1}
+
+    def test_metrics_do_not_require_a_device_by_default(self):
+        assert not CircuitSizeMetric.requires_device
+
+    def test_returns_empty_dict_without_metrics(self):
+        assert create_accumulators({}, CircuitInfo(n_qubits=1, n_clbits=0)) == {}
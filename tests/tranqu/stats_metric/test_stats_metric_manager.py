@@ -0,0 +1,64 @@
+import pytest
+
+from tranqu.stats_metric import (
+    GateCountsMetric,
+    MeasurementCountMetric,
+    StatsMetricAlreadyRegisteredError,
+    StatsMetricError,
+    StatsMetricManager,
+    StatsMetricNotFoundError,
+)
+
+
+class TestStatsMetricManager:
+    def setup_method(self):
+        self.manager = StatsMetricManager()
+
+    def test_register_metric(self):
+        metric = GateCountsMetric()
+        self.manager.register_metric("gate_counts", metric)
+
+        assert self.manager.fetch_metric("gate_counts") is metric
+
+    def test_register_metric_raises_error_when_already_registered(self):
+        self.manager.register_metric("gate_counts", GateCountsMetric())
+
+        with pytest.raises(
+            StatsMetricAlreadyRegisteredError,
+            match=r"Stats metric 'gate_counts' is already registered\.",
+        ):
+            self.manager.register_metric("gate_counts", GateCountsMetric())
+
+    def test_register_metric_with_allow_override(self):
+        metric = MeasurementCountMetric()
+        self.manager.register_metric("custom", GateCountsMetric())
+        self.manager.register_metric("custom", metric, allow_override=True)
+
+        assert self.manager.fetch_metric("custom") is metric
+
+    def test_register_metric_rejects_core_statistics(self):
+        with pytest.raises(
+            StatsMetricAlreadyRegisteredError,
+            match=r"'depth' is a core statistic",
+        ):
+            self.manager.register_metric(
+                "depth", GateCountsMetric(), allow_override=True
+            )
+
+    def test_fetch_metric_raises_error_when_not_found(self):
+        with pytest.raises(
+            StatsMetricNotFoundError, match=r"Unknown stats metric: missing"
+        ):
+            self.manager.fetch_metric("missing")
+
+    def test_fetch_metrics_skips_core_statistics(self):
+        metric = GateCountsMetric()
+        self.manager.register_metric("gate_counts", metric)
+
+        assert self.manager.fetch_metrics(["depth", "gate_counts"]) == {
+            "gate_counts": metric
+        }
+
+    def test_errors_share_a_base_class(self):
+        assert issubclass(StatsMetricNotFoundError, StatsMetricError)
+        assert issubclass(StatsMetricAlreadyRegisteredError, StatsMetricError)
@@ -0,0 +1,58 @@
+# mypy: disable-error-code="import-untyped"
+
+import pytest
+from qiskit import QuantumCircuit
+
+from tranqu.stats_metric import (
+    DeviceProperties,
+    InstructionProperties,
+    SuccessProbabilityMetric,
+)
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+
+class FixedDeviceProperties(DeviceProperties):
+    def __init__(self, properties: dict[str, InstructionProperties]) -> None:
+        self._properties = properties
+
+    def instruction_properties(
+        self,
+        name: str,
+        qubits: tuple[int, ...],  # noqa: ARG002
+    ) -> InstructionProperties | None:
+        return self._properties.get(name)
+
+
+def success_probability(
+    circuit: QuantumCircuit, device_properties: DeviceProperties | None
+) -> float | None:
+    return QiskitStatsExtractor().extract_stats_from(
+        circuit,
+        metrics={"success_probability": SuccessProbabilityMetric()},
+        device_properties=device_properties,
+    )["success_probability"]
+
+
+class TestSuccessProbabilityMetric:
+    def test_multiplies_success_rates(self):
+        device_properties = FixedDeviceProperties({
+            "x": InstructionProperties(error=0.1),
+            "cx": InstructionProperties(error=0.2),
+            "measure": InstructionProperties(duration=1.0),
+        })
+        circuit = QuantumCircuit(2, 2)
+        circuit.x(0)
+        circuit.x(1)
+        circuit.cx(0, 1)
+        circuit.h(0)
+        circuit.measure([0, 1], [0, 1])
+
+        assert success_probability(circuit, device_properties) == pytest.approx(
+            0.9 * 0.9 * 0.8
+        )
+
+    def test_returns_none_without_device_properties(self):
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+
+        assert success_probability(circuit, None) is None
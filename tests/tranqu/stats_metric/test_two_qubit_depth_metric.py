@@ -0,0 +1,43 @@
+# mypy: disable-error-code="import-untyped"
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.random import random_circuit
+
+from tranqu.stats_metric import TwoQubitDepthMetric
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+
+def two_qubit_depth(circuit: QuantumCircuit) -> int:
+    return QiskitStatsExtractor().extract_stats_from(
+        circuit, metrics={"depth_2q": TwoQubitDepthMetric()}
+    )["depth_2q"]
+
+
+class TestTwoQubitDepthMetric:
+    def test_counts_layers_of_two_qubit_gates(self):
+        circuit = QuantumCircuit(4)
+        circuit.h(range(4))
+        circuit.cx(0, 1)
+        circuit.cx(2, 3)
+        circuit.cx(1, 2)
+        circuit.x(3)
+
+        assert two_qubit_depth(circuit) == 2
+
+    def test_single_qubit_gates_do_not_add_depth(self):
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.x(0)
+        circuit.x(1)
+
+        assert two_qubit_depth(circuit) == 0
+
+    def test_matches_qiskit_filtered_depth(self):
+        for seed in range(20):
+            circuit = random_circuit(
+                5, 8, max_operands=3, measure=seed % 2 == 0, seed=seed
+            )
+
+            assert two_qubit_depth(circuit) == circuit.depth(
+                lambda instruction: instruction.operation.num_qubits == 2
+            )
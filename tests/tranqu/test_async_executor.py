@@ -0,0 +1,168 @@
+import asyncio
+import pickle  # noqa: S403
+import threading
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
+
+import pytest
+
+from tranqu.async_executor import (
+    AsyncTranspileExecutor,
+    InvalidConcurrencyError,
+    TranspileTimeoutError,
+)
+
+
+def sleep_and_return(delay: float) -> float:
+    time.sleep(delay)
+    return delay
+
+
+class TestAsyncTranspileExecutor:
+    def setup_method(self):
+        self.executor = AsyncTranspileExecutor(max_workers=2)
+
+    def teardown_method(self):
+        self.executor.shutdown()
+
+    def test_run_returns_result_from_worker_thread(self):
+        result = asyncio.run(self.executor.run(threading.current_thread))
+
+        assert result.name.startswith("tranqu-async")
+
+    def test_run_does_not_block_the_event_loop(self):
+        async def main() -> bool:
+            transpilation = asyncio.ensure_future(
+                self.executor.run(lambda: time.sleep(0.2))
+            )
+            await asyncio.sleep(0.01)
+            is_running = not transpilation.done()
+            await transpilation
+            return is_running
+
+        assert asyncio.run(main())
+
+    def test_run_raises_timeout(self):
+        with pytest.raises(TranspileTimeoutError, match=r"within 0\.01 seconds"):
+            asyncio.run(self.executor.run(lambda: time.sleep(0.2), timeout=0.01))
+
+    def test_timeout_error_is_a_timeout_error(self):
+        assert issubclass(TranspileTimeoutError, TimeoutError)
+
+    def test_run_propagates_errors(self):
+        def fail() -> None:
+            msg = "failure"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="failure"):
+            asyncio.run(self.executor.run(fail))
+
+    def test_cancelled_requests_that_have_not_started_do_not_run(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def block() -> None:
+            started.set()
+            release.wait(1)
+
+        async def main() -> None:
+            executor = AsyncTranspileExecutor(max_workers=1)
+            blocking = asyncio.ensure_future(executor.run(block))
+            queued = asyncio.ensure_future(executor.run(lambda: calls.append("ran")))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            release.set()
+            await blocking
+            executor.shutdown()
+
+        asyncio.run(main())
+
+        assert calls == []
+
+    def test_as_completed_yields_results_in_completion_order(self):
+        delays = [0.2, 0.0, 0.1]
+
+        async def main() -> list[tuple[int, float]]:
+            funcs = [partial(sleep_and_return, delay) for delay in delays]
+            executor = AsyncTranspileExecutor(max_workers=3)
+            results = [result async for result in executor.as_completed(funcs)]
+            executor.shutdown()
+            return results
+
+        assert asyncio.run(main()) == [(1, 0.0), (2, 0.1), (0, 0.2)]
+
+    def test_as_completed_limits_concurrency(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work() -> None:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        async def main() -> list[int]:
+            executor = AsyncTranspileExecutor(max_workers=8)
+            indices = [
+                index
+                async for index, _ in executor.as_completed(
+                    [work] * 10, max_concurrency=2
+                )
+            ]
+            executor.shutdown()
+            return indices
+
+        assert sorted(asyncio.run(main())) == list(range(10))
+        assert peak[0] <= 2
+
+    def test_as_completed_takes_functions_lazily(self):
+        taken: list[int] = []
+
+        def funcs() -> Iterator[Callable[[], None]]:
+            for index in range(5):
+                taken.append(index)
+                yield lambda: None
+
+        async def main() -> None:
+            async for _ in self.executor.as_completed(funcs(), max_concurrency=1):
+                break
+
+        asyncio.run(main())
+
+        assert taken == [0]
+
+    def test_as_completed_raises_timeout(self):
+        async def main() -> None:
+            async for _ in self.executor.as_completed(
+                [lambda: time.sleep(0.2)], timeout=0.01
+            ):
+                pass
+
+        with pytest.raises(TranspileTimeoutError):
+            asyncio.run(main())
+
+    def test_invalid_concurrency(self):
+        async def main() -> None:
+            async for _ in self.executor.as_completed([], max_concurrency=0):
+                pass
+
+        with pytest.raises(InvalidConcurrencyError, match="max_concurrency"):
+            asyncio.run(main())
+        with pytest.raises(InvalidConcurrencyError, match="max_workers"):
+            AsyncTranspileExecutor(max_workers=0)
+
+    def test_pickle_drops_the_pool(self):
+        asyncio.run(self.executor.run(lambda: None))
+
+        restored = pickle.loads(pickle.dumps(self.executor))  # noqa: S301
+
+        assert restored.max_workers == 2
+        assert asyncio.run(restored.run(lambda: 1)) == 1
+        restored.shutdown()
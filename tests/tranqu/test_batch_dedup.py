@@ -0,0 +1,255 @@
+import math
+from typing import Any
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.qasm3 import dumps  # type: ignore[import-untyped]
+from qiskit.quantum_info import Operator  # type: ignore[import-untyped]
+from qiskit_ibm_runtime.fake_provider import (  # type: ignore[import-untyped]
+    FakeSantiagoV2,
+)
+
+from tranqu import Tranqu, TranspileResult
+from tranqu.batch_dedup import UnknownDedupModeError, parametrize_circuit
+from tranqu.transpiler import Transpiler
+
+
+class CountingTranspiler(Transpiler):
+    def __init__(self) -> None:
+        super().__init__("qiskit")
+        self.programs: list[Any] = []
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        self.programs.append(program)
+        return TranspileResult(program, {"before": {}, "after": {}}, {})
+
+
+@pytest.fixture
+def tranqu() -> Tranqu:
+    return Tranqu()
+
+
+@pytest.fixture
+def counting(tranqu: Tranqu) -> CountingTranspiler:
+    transpiler = CountingTranspiler()
+    tranqu.register_transpiler("counting", transpiler)
+    return transpiler
+
+
+def ansatz(theta: float) -> QuantumCircuit:
+    circuit = QuantumCircuit(3, 3)
+    circuit.ry(theta, 0)
+    circuit.cx(0, 1)
+    circuit.rz(2 * theta, 1)
+    circuit.cx(1, 2)
+    circuit.rx(theta / 3, 2)
+    circuit.measure(range(3), range(3))
+    return circuit
+
+
+def unitary(circuit: QuantumCircuit) -> Operator:
+    return Operator(circuit.remove_final_measurements(inplace=False))
+
+
+class TestParametrizeCircuit:
+    def test_angles_become_parameters(self):
+        circuit = QuantumCircuit(1, global_phase=0.5)
+        circuit.rx(0.1, 0)
+        circuit.u(0.2, 0.3, 0.4, 0)
+
+        template, values = parametrize_circuit(circuit)
+
+        assert len(template.parameters) == 5
+        assert sorted(values.values()) == [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert (
+            template.assign_parameters({
+                parameter: values[parameter.name] for parameter in template.parameters
+            })
+            == circuit
+        )
+
+    def test_circuits_with_different_angles_have_equal_templates(self):
+        first, _ = parametrize_circuit(ansatz(0.1))
+        second, _ = parametrize_circuit(ansatz(0.2))
+
+        assert dumps(first) == dumps(second)
+
+    def test_gates_without_angles_are_kept(self):
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        template, values = parametrize_circuit(circuit)
+
+        assert template.count_ops() == {"h": 1, "cx": 1}
+        assert list(values) == ["tranqu_value_global_phase"]
+
+
+class TestTranspileManyDedup:
+    def test_identical_programs_are_transpiled_once(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        circuits = [ansatz(0.1), ansatz(0.2), ansatz(0.1)]
+
+        results = tranqu.transpile_many(
+            circuits, transpiler_lib="counting", dedup="identical"
+        )
+
+        assert len(counting.programs) == 2
+        assert results[0] is not results[2]
+        assert results[0].transpiled_program is results[2].transpiled_program
+        assert results[1].transpiled_program is not results[0].transpiled_program
+
+    def test_releasing_a_shared_result_keeps_the_others(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        results = tranqu.transpile_many(
+            [ansatz(0.1), ansatz(0.1)], transpiler_lib="counting", dedup="identical"
+        )
+
+        results[0].release_program()
+
+        assert len(counting.programs) == 1
+        assert results[0].transpiled_program is None
+        assert results[1].transpiled_program == ansatz(0.1)
+
+    def test_programs_with_different_global_phases_are_not_merged(self, tranqu: Tranqu):
+        shifted = ansatz(0.1)
+        shifted.global_phase = 0.5
+
+        results = tranqu.transpile_many(
+            [ansatz(0.1), shifted], transpiler_lib="qiskit", dedup="identical"
+        )
+
+        assert [
+            result.transpiled_program.global_phase for result in results
+        ] == pytest.approx([0.0, 0.5])
+
+    def test_programs_with_different_options_are_not_merged(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        tranqu.transpile_many(
+            [ansatz(0.1), ansatz(0.1)],
+            transpiler_lib="counting",
+            transpiler_options=[{"level": 1}, {"level": 2}],
+            dedup="identical",
+        )
+
+        assert len(counting.programs) == 2
+
+    def test_structurally_equal_circuits_share_a_template(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        counting.supports_parameters = True  # type: ignore[misc]
+        circuits = [ansatz(theta) for theta in (0.1, 0.2, 0.3)]
+
+        results = tranqu.transpile_many(
+            circuits, transpiler_lib="counting", dedup="structure"
+        )
+
+        assert len(counting.programs) == 1
+        assert counting.programs[0].parameters
+        assert [result.transpiled_program for result in results] == circuits
+        assert all("bind" in result.timings for result in results)
+
+    def test_single_circuits_are_not_templated(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        counting.supports_parameters = True  # type: ignore[misc]
+        circuit = QuantumCircuit(1)
+        circuit.rx(0.1, 0)
+
+        tranqu.transpile_many(
+            [ansatz(0.1), circuit], transpiler_lib="counting", dedup="structure"
+        )
+
+        assert not any(program.parameters for program in counting.programs)
+
+    def test_structure_falls_back_to_identical_without_parameter_support(
+        self, tranqu: Tranqu, counting: CountingTranspiler
+    ):
+        tranqu.transpile_many(
+            [ansatz(0.1), ansatz(0.2), ansatz(0.2)],
+            transpiler_lib="counting",
+            dedup="structure",
+        )
+
+        assert len(counting.programs) == 2
+        assert not any(program.parameters for program in counting.programs)
+
+    def test_qiskit_results_match_individual_transpilation(self, tranqu: Tranqu):
+        device = FakeSantiagoV2()
+        circuits = [ansatz(theta) for theta in (0.1, 1.0, math.pi / 3)]
+
+        results = tranqu.transpile_many(
+            circuits,
+            transpiler_lib="qiskit",
+            transpiler_options={"seed_transpiler": 1},
+            device=device,
+            dedup="structure",
+        )
+
+        for circuit, result in zip(circuits, results, strict=True):
+            expected = tranqu.transpile(
+                circuit,
+                transpiler_lib="qiskit",
+                transpiler_options={"seed_transpiler": 1},
+                device=device,
+            )
+            assert not result.transpiled_program.parameters
+            assert unitary(result.transpiled_program).equiv(
+                unitary(expected.transpiled_program)
+            )
+            assert (
+                result.virtual_physical_mapping.qubit_mapping
+                == expected.virtual_physical_mapping.qubit_mapping
+            )
+            assert result.stats.before.n_gates == expected.stats.before.n_gates
+
+    def test_bound_results_report_the_stats_of_the_template(self, tranqu: Tranqu):
+        circuits = [ansatz(theta) for theta in (0.0, 1.0)]
+
+        results = tranqu.transpile_many(
+            circuits,
+            transpiler_lib="qiskit",
+            transpiler_options={"optimization_level": 3},
+            dedup="structure",
+        )
+
+        for result in results:
+            assert result.stats.after.n_gates == sum(
+                count
+                for name, count in result.transpiled_program.count_ops().items()
+                if name != "measure"
+            )
+
+    def test_openqasm3_output_is_only_deduplicated_when_identical(self, tranqu: Tranqu):
+        results = tranqu.transpile_many(
+            [ansatz(0.1), ansatz(0.2), ansatz(0.1)],
+            transpiler_lib="qiskit",
+            output_lib="openqasm3",
+            dedup="structure",
+        )
+
+        assert results[0].transpiled_program is results[2].transpiled_program
+        assert "0.2" in results[1].transpiled_program
+
+    def test_tket_programs(self, tranqu: Tranqu):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        results = tranqu.transpile_many(
+            [circuit, circuit.copy()], transpiler_lib="tket", dedup="structure"
+        )
+
+        assert results[0].transpiled_program is results[1].transpiled_program
+        assert isinstance(results[0].transpiled_program, Circuit)
+
+    def test_unknown_mode(self, tranqu: Tranqu):
+        with pytest.raises(UnknownDedupModeError):
+            tranqu.transpile_many([ansatz(0.1)], dedup="angles")
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu import Tranqu
+from tranqu.batch_executor import (
+    BatchItem,
+    BatchSizeMismatchError,
+    UnknownExecutorError,
+    create_executor,
+    expand_batch_items,
+    terminate_workers,
+)
+
+
+@pytest.fixture
+def tranqu() -> Tranqu:
+    return Tranqu()
+
+
+def h_h_circuit(n_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(n_qubits)
+    circuit.h(0)
+    circuit.h(0)
+    return circuit
+
+
+class TestExpandBatchItems:
+    def test_shared_values(self):
+        device = {"device_id": "dev", "qubits": [], "couplings": []}
+
+        items = expand_batch_items(iter(["a", "b"]), {"opt": 1}, device)
+
+        assert items == [
+            BatchItem("a", {"opt": 1}, device),
+            BatchItem("b", {"opt": 1}, device),
+        ]
+
+    def test_per_program_values(self):
+        items = expand_batch_items(["a", "b"], [{"opt": 1}, None], ["d1", "d2"])
+
+        assert items == [BatchItem("a", {"opt": 1}, "d1"), BatchItem("b", None, "d2")]
+
+    def test_size_mismatch(self):
+        with pytest.raises(
+            BatchSizeMismatchError,
+            match=r"The number of device \(1\) does not match the number of programs",
+        ):
+            expand_batch_items(["a", "b"], None, ["d1"])
+
+
+class TestTerminateWorkers:
+    def test_process_pool(self, tranqu: Tranqu):
+        pool = create_executor("process", 1, tranqu)
+        assert isinstance(pool, ProcessPoolExecutor)
+        pool.submit(sum, [1, 2]).result()
+        processes = list(pool._processes.values())  # noqa: SLF001
+
+        assert terminate_workers(pool)
+        assert not any(process.is_alive() for process in processes)
+        pool.shutdown()
+
+    def test_thread_pool_is_left_running(self, tranqu: Tranqu):
+        pool = create_executor("thread", 1, tranqu)
+
+        assert not terminate_workers(pool)
+        assert pool.submit(sum, [1, 2]).result() == 3
+        pool.shutdown()
+
+
+class TestTranspileMany:
+    def test_results_are_in_input_order(self, tranqu: Tranqu):
+        circuits = [h_h_circuit(n) for n in range(1, 5)]
+
+        results = tranqu.transpile_many(circuits, transpiler_lib="tket")
+
+        assert [r.stats.before.n_qubits for r in results] == [1, 2, 3, 4]
+        assert all(isinstance(r.transpiled_program, QuantumCircuit) for r in results)
+
+    def test_per_program_options(self, tranqu: Tranqu):
+        circuits = [h_h_circuit(1), h_h_circuit(1)]
+
+        results = tranqu.transpile_many(
+            circuits,
+            transpiler_lib="qiskit",
+            transpiler_options=[{"optimization_level": 0}, {"optimization_level": 1}],
+            max_workers=2,
+        )
+
+        assert results[0].stats.after.n_gates == 2
+        assert results[1].stats.after.n_gates == 0
+
+    def test_mixed_program_libs(self, tranqu: Tranqu):
+        results = tranqu.transpile_many(
+            [h_h_circuit(1), Circuit(1)], transpiler_lib="qiskit"
+        )
+
+        assert isinstance(results[0].transpiled_program, QuantumCircuit)
+        assert isinstance(results[1].transpiled_program, Circuit)
+
+    def test_process_executor(self, tranqu: Tranqu):
+        results = tranqu.transpile_many(
+            [h_h_circuit(1), h_h_circuit(2)],
+            transpiler_lib="tket",
+            executor="process",
+            max_workers=2,
+        )
+
+        assert [r.stats.before.n_qubits for r in results] == [1, 2]
+
+    def test_empty_programs(self, tranqu: Tranqu):
+        assert tranqu.transpile_many([], transpiler_lib="qiskit") == []
+
+    def test_unknown_executor(self, tranqu: Tranqu):
+        with pytest.raises(UnknownExecutorError, match="Unknown executor: fiber"):
+            tranqu.transpile_many(
+                [h_h_circuit(1)], transpiler_lib="qiskit", executor="fiber"
+            )
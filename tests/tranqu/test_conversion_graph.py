@@ -0,0 +1,163 @@
+import pickle  # noqa: S403
+
+from tranqu.conversion_graph import ConversionGraph
+
+
+class TestConversionGraph:
+    def setup_method(self):
+        self.graph = ConversionGraph()
+
+    def test_path_to_same_library(self):
+        assert self.graph.shortest_path("a", "a") == ("a",)
+
+    def test_no_path(self):
+        self.graph.add_edge("a", "b")
+
+        assert self.graph.shortest_path("b", "a") is None
+
+    def test_direct_edge_is_preferred_without_costs(self):
+        self.graph.add_edge("a", "qiskit")
+        self.graph.add_edge("qiskit", "b")
+        self.graph.add_edge("a", "b")
+
+        assert self.graph.shortest_path("a", "b") == ("a", "b")
+
+    def test_multi_hop_path(self):
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "c")
+        self.graph.add_edge("c", "d")
+
+        assert self.graph.shortest_path("a", "d") == ("a", "b", "c", "d")
+
+    def test_cost_hints_select_the_cheapest_path(self):
+        self.graph.add_edge("a", "qiskit", cost=1.0)
+        self.graph.add_edge("qiskit", "d", cost=1.0)
+        self.graph.add_edge("a", "b", cost=0.1)
+        self.graph.add_edge("b", "d", cost=0.1)
+
+        assert self.graph.shortest_path("a", "d") == ("a", "b", "d")
+
+    def test_measured_latency_overrides_cost_hint(self):
+        self.graph = ConversionGraph(adaptive=True)
+        self.graph.add_edge("a", "b", cost=0.1)
+        self.graph.add_edge("b", "d", cost=0.1)
+        self.graph.add_edge("a", "d", cost=1.0)
+        assert self.graph.shortest_path("a", "d") == ("a", "b", "d")
+        version = self.graph.version
+
+        self.graph.record_latency("a", "d", 0.01)
+
+        assert self.graph.version != version
+        assert self.graph.shortest_path("a", "d") == ("a", "d")
+
+    def test_untried_edge_costs_the_average_latency(self):
+        self.graph = ConversionGraph(adaptive=True)
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "c")
+        self.graph.add_edge("a", "c")
+        self.graph.record_latency("a", "b", 0.001)
+        self.graph.record_latency("b", "c", 0.001)
+
+        assert self.graph.shortest_path("a", "c") == ("a", "c")
+
+    def test_small_latency_changes_keep_memoized_paths(self):
+        self.graph = ConversionGraph(adaptive=True)
+        self.graph.add_edge("a", "b")
+        self.graph.record_latency("a", "b", 0.0100)
+        version = self.graph.version
+
+        self.graph.record_latency("a", "b", 0.0101)
+
+        assert self.graph.version == version
+
+    def test_latency_of_unknown_edge_is_ignored(self):
+        self.graph = ConversionGraph(adaptive=True)
+        version = self.graph.version
+
+        self.graph.record_latency("a", "b", 1.0)
+
+        assert self.graph.version == version
+        assert self.graph.shortest_path("a", "b") is None
+
+    def test_latency_is_ignored_unless_adaptive(self):
+        self.graph.add_edge("a", "b", cost=0.1)
+        self.graph.add_edge("b", "d", cost=0.1)
+        self.graph.add_edge("a", "d", cost=1.0)
+        version = self.graph.version
+
+        self.graph.record_latency("a", "d", 0.01)
+
+        assert self.graph.version == version
+        assert self.graph.shortest_path("a", "d") == ("a", "b", "d")
+
+    def test_sync_edges_removes_and_adds_edges(self):
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "c")
+        assert self.graph.shortest_path("a", "c") == ("a", "b", "c")
+
+        self.graph.sync_edges({("a", "b"), ("a", "c")})
+
+        assert self.graph.shortest_path("b", "c") is None
+        assert self.graph.shortest_path("a", "c") == ("a", "c")
+
+    def test_sync_edges_keeps_memoized_paths_when_unchanged(self):
+        self.graph.add_edge("a", "b")
+        version = self.graph.version
+
+        self.graph.sync_edges({("a", "b")})
+
+        assert self.graph.version == version
+
+    def test_add_edge_invalidates_memoized_paths(self):
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "c")
+        assert self.graph.shortest_path("a", "c") == ("a", "b", "c")
+
+        self.graph.add_edge("a", "c")
+
+        assert self.graph.shortest_path("a", "c") == ("a", "c")
+
+    def test_transit_penalty_avoids_library_in_the_middle(self):
+        self.graph.add_edge("a", "openqasm3")
+        self.graph.add_edge("openqasm3", "d")
+        self.graph.add_edge("a", "qpy")
+        self.graph.add_edge("qpy", "qiskit")
+        self.graph.add_edge("qiskit", "d")
+        assert self.graph.shortest_path("a", "d") == ("a", "openqasm3", "d")
+        version = self.graph.version
+
+        self.graph.set_transit_penalty("openqasm3", 2.0)
+
+        assert self.graph.version != version
+        assert self.graph.shortest_path("a", "d") == ("a", "qpy", "qiskit", "d")
+
+    def test_transit_penalty_does_not_apply_to_endpoints(self):
+        self.graph.add_edge("a", "openqasm3")
+        self.graph.add_edge("a", "qiskit")
+        self.graph.add_edge("qiskit", "openqasm3")
+        self.graph.set_transit_penalty("openqasm3", 2.0)
+
+        assert self.graph.shortest_path("a", "openqasm3") == ("a", "openqasm3")
+
+    def test_zero_transit_penalty_removes_it(self):
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "d")
+        self.graph.add_edge("a", "c")
+        self.graph.add_edge("c", "e")
+        self.graph.add_edge("e", "d")
+        self.graph.set_transit_penalty("b", 2.0)
+        assert self.graph.shortest_path("a", "d") == ("a", "c", "e", "d")
+
+        self.graph.set_transit_penalty("b", 0)
+
+        assert self.graph.shortest_path("a", "d") == ("a", "b", "d")
+
+    def test_pickle(self):
+        self.graph.add_edge("a", "b")
+        self.graph.add_edge("b", "c")
+        self.graph.set_transit_penalty("b", 1.0)
+
+        restored = pickle.loads(pickle.dumps(self.graph))  # noqa: S301
+
+        assert restored.shortest_path("a", "c") == ("a", "b", "c")
+        assert restored.__getstate__()["transit_penalties"] == {"b": 1.0}
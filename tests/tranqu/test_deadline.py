@@ -0,0 +1,187 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu import Candidate, Tranqu, TranspileResult
+from tranqu.deadline import (
+    DeadlineExceededError,
+    UnknownTimeoutExecutorError,
+    default_fallbacks,
+)
+from tranqu.transpiler import Transpiler
+
+
+class SlowAboveLevelZeroTranspiler(Transpiler):
+    """Takes `seconds` unless optimization level 0 is requested."""
+
+    def __init__(self, program_lib: str, seconds: float = 10) -> None:
+        super().__init__(program_lib)
+        self._seconds = seconds
+        self.released = threading.Event()
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        level = (options or {}).get("optimization_level", 1)
+        if level != 0:
+            self.released.wait(timeout=self._seconds)
+        stats: dict[str, dict[str, int]] = {
+            "before": {},
+            "after": {"optimization_level": level},
+        }
+        return TranspileResult(program, stats, {})
+
+
+class FailingTranspiler(Transpiler):
+    def transpile(
+        self,
+        program: Any,  # noqa: ARG002
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+
+@pytest.fixture
+def slow() -> Any:
+    transpiler = SlowAboveLevelZeroTranspiler("qiskit")
+    yield transpiler
+    transpiler.released.set()
+
+
+@pytest.fixture
+def tranqu(slow: SlowAboveLevelZeroTranspiler) -> Tranqu:
+    tranqu = Tranqu()
+    tranqu.register_transpiler("slow", slow)
+    tranqu.register_transpiler("failing", FailingTranspiler("qiskit"))
+    return tranqu
+
+
+@pytest.fixture
+def circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    return circuit
+
+
+class TestDefaultFallbacks:
+    def test_optimization_level_zero(self):
+        assert default_fallbacks("qiskit", {"optimization_level": 3, "x": 1}) == [
+            Candidate("qiskit", {"optimization_level": 0, "x": 1})
+        ]
+
+    def test_without_options(self):
+        assert default_fallbacks("tket", None) == [
+            Candidate("tket", {"optimization_level": 0})
+        ]
+
+    def test_no_fallback_below_level_zero(self):
+        assert default_fallbacks("qiskit", {"optimization_level": 0}) == []
+
+
+class TestTranspileWithTimeout:
+    def test_requested_configuration_in_time(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        result = tranqu.transpile(circuit, "qiskit", "qiskit", timeout=60)
+
+        assert result.tier == 0
+        assert isinstance(result.transpiled_program, QuantumCircuit)
+
+    def test_default_fallback_lowers_optimization_level(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        result = tranqu.transpile(
+            circuit,
+            "qiskit",
+            "slow",
+            transpiler_options={"optimization_level": 3},
+            timeout=0.1,
+        )
+
+        assert result.tier == 1
+        assert result.stats.after.optimization_level == 0
+
+    def test_fallback_to_another_transpiler(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        result = tranqu.transpile(
+            circuit,
+            "qiskit",
+            "slow",
+            timeout=0.1,
+            fallbacks=[Candidate("slow", {"optimization_level": 1}), "qiskit"],
+        )
+
+        assert result.tier == 2
+        assert isinstance(result.transpiled_program, QuantumCircuit)
+
+    def test_every_tier_timed_out(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        with pytest.raises(DeadlineExceededError, match="slow, slow"):
+            tranqu.transpile(
+                circuit,
+                "qiskit",
+                "slow",
+                timeout=0.05,
+                fallbacks=[Candidate("slow", {"optimization_level": 1})],
+            )
+
+    def test_errors_are_raised_without_fallback(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        with pytest.raises(RuntimeError, match="boom"):
+            tranqu.transpile(
+                circuit, "qiskit", "failing", timeout=60, fallbacks=["qiskit"]
+            )
+
+    def test_unknown_executor(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        with pytest.raises(UnknownTimeoutExecutorError):
+            tranqu.transpile(
+                circuit, "qiskit", "qiskit", timeout=60, timeout_executor="fiber"
+            )
+
+
+class TestProcessExecutor:
+    def test_requested_configuration_in_time(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        result = tranqu.transpile(
+            circuit, "qiskit", "qiskit", timeout=60, timeout_executor="process"
+        )
+
+        assert result.tier == 0
+        assert result.stats.after.n_qubits == 2
+
+    def test_timed_out_process_is_terminated(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        start = time.perf_counter()
+
+        result = tranqu.transpile(
+            circuit,
+            "qiskit",
+            "slow",
+            transpiler_options={"optimization_level": 2},
+            timeout=0.5,
+            timeout_executor="process",
+        )
+
+        assert result.tier == 1
+        assert time.perf_counter() - start < 5
+        assert not any(
+            thread.name == "tranqu-deadline" for thread in threading.enumerate()
+        )
+
+    def test_errors_are_raised(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        with pytest.raises(RuntimeError, match="boom"):
+            tranqu.transpile(
+                circuit, "qiskit", "failing", timeout=60, timeout_executor="process"
+            )
@@ -1,3 +1,6 @@
+import sys
+import types
+
 import pytest
 
 from tranqu.device_type_manager import (
@@ -81,3 +84,32 @@ class TestDeviceTypeManager:
 
         device = DummyDevice()
         assert device_manager.resolve_lib(device) == "dummy"
+
+    def test_resolve_lib_for_subclass(self, device_manager: DeviceTypeManager) -> None:
+        class DerivedDevice(DummyDevice):
+            pass
+
+        device_manager.register_type("dummy", DummyDevice)
+
+        assert device_manager.resolve_lib(DerivedDevice()) == "dummy"
+        assert device_manager.resolve_lib(DerivedDevice()) == "dummy"
+
+    def test_register_lazy_type_before_module_is_imported(
+        self, device_manager: DeviceTypeManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        device_manager.register_lazy_type("lazy", "lazy_device_module", "LazyDevice")
+        assert device_manager.resolve_lib(DummyDevice()) is None
+
+        module = types.ModuleType("lazy_device_module")
+        module.LazyDevice = type("LazyDevice", (), {})  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "lazy_device_module", module)
+
+        assert device_manager.resolve_lib(module.LazyDevice()) == "lazy"  # type: ignore[attr-defined]
+
+    def test_register_lazy_type_raises_error_when_lib_already_registered(
+        self, device_manager: DeviceTypeManager
+    ) -> None:
+        device_manager.register_type("dummy", DummyDevice)
+
+        with pytest.raises(DeviceLibraryAlreadyRegisteredError):
+            device_manager.register_lazy_type("dummy", __name__, "DummyDevice")
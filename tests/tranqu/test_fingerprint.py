@@ -0,0 +1,30 @@
+import threading
+
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu.fingerprint import FingerprintError, canonical_json, fingerprint
+
+
+class TestFingerprint:
+    def test_dict_key_order_does_not_matter(self):
+        assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+
+    def test_different_values_have_different_fingerprints(self):
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+    def test_tuple_and_list_are_equivalent(self):
+        assert canonical_json((1, 2)) == canonical_json([1, 2])
+
+    def test_string_is_hashed_as_text(self):
+        assert fingerprint("OPENQASM 3;") == fingerprint(b"OPENQASM 3;")
+
+    def test_non_json_values_are_pickled(self):
+        circuit = QuantumCircuit(2)
+        circuit.cx(0, 1)
+
+        assert fingerprint({"circuit": circuit}) == fingerprint({"circuit": circuit})
+
+    def test_unpicklable_value(self):
+        with pytest.raises(FingerprintError, match="Cannot fingerprint"):
+            fingerprint({"lock": threading.Lock()})
@@ -0,0 +1,86 @@
+import pickle  # noqa: S403
+import subprocess  # noqa: S404
+import sys
+import types
+from dataclasses import dataclass
+
+import pytest
+
+from tranqu.lazy_import import LazyFactory, lazy_module_getattr, loaded_attribute
+
+
+@dataclass
+class Greeter:
+    name: str = "world"
+
+
+class TestLazyFactory:
+    def test_create(self):
+        factory = LazyFactory(__name__, "Greeter", {"name": "tranqu"})
+
+        greeter = factory.create()
+
+        assert isinstance(greeter, Greeter)
+        assert greeter.name == "tranqu"
+
+    def test_create_returns_new_instances(self):
+        factory = LazyFactory(__name__, "Greeter")
+
+        assert factory.create() is not factory.create()
+
+    def test_shared_factories_return_one_instance(self):
+        first = LazyFactory(__name__, "Greeter", {"name": "shared"}, shared=True)
+        second = LazyFactory(__name__, "Greeter", {"name": "shared"}, shared=True)
+        other = LazyFactory(__name__, "Greeter", {"name": "other"}, shared=True)
+
+        assert first.create() is second.create()
+        assert first.create() is not other.create()
+
+    def test_pickle(self):
+        factory = LazyFactory(__name__, "Greeter")
+
+        restored = pickle.loads(pickle.dumps(factory))  # noqa: S301
+
+        assert restored == factory
+        assert restored.create().name == "world"
+
+
+class TestLoadedAttribute:
+    def test_returns_attribute_of_imported_module(self):
+        assert loaded_attribute(__name__, "Greeter") is Greeter
+
+    def test_returns_none_before_module_is_imported(self):
+        assert loaded_attribute("tranqu_module_that_is_never_imported", "X") is None
+
+    def test_returns_none_for_missing_attribute(self):
+        assert loaded_attribute(__name__, "Missing") is None
+
+
+class TestLazyModuleGetattr:
+    def test_imports_attribute_on_first_access(self, monkeypatch: pytest.MonkeyPatch):
+        package = types.ModuleType("lazy_package")
+        monkeypatch.setitem(sys.modules, "lazy_package", package)
+        getattr_ = lazy_module_getattr("lazy_package", {"Greeter": __name__})
+
+        assert getattr_("Greeter") is Greeter
+        assert package.Greeter is Greeter  # type: ignore[attr-defined]
+
+    def test_raises_attribute_error_for_unknown_name(self):
+        getattr_ = lazy_module_getattr(__name__, {})
+
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            getattr_("Missing")
+
+
+def test_import_tranqu_does_not_import_backends():
+    code = (
+        "import sys, tranqu\n"
+        "tranqu.Tranqu()\n"
+        "print(sorted({'qiskit', 'pytket', 'ouqu_tp'} & set(sys.modules)))\n"
+    )
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
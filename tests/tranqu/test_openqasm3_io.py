@@ -0,0 +1,92 @@
+# mypy: disable-error-code="import-untyped"
+
+import io
+from pathlib import Path
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit
+from qiskit.qasm3 import dumps, loads
+
+from tranqu.openqasm3_io import Openqasm3IOError, read_openqasm3, write_openqasm3
+
+PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+
+
+class TestReadOpenqasm3:
+    def test_string_is_returned_as_is(self):
+        assert read_openqasm3(PROGRAM) is PROGRAM
+
+    def test_path(self, tmp_path: Path):
+        path = tmp_path / "program.qasm"
+        path.write_text(PROGRAM, encoding="utf-8")
+
+        assert read_openqasm3(path) == PROGRAM
+
+    def test_text_file_object(self):
+        assert read_openqasm3(io.StringIO(PROGRAM)) == PROGRAM
+
+    def test_binary_file_object(self):
+        assert read_openqasm3(io.BytesIO(PROGRAM.encode())) == PROGRAM
+
+    def test_bytes(self):
+        assert read_openqasm3(PROGRAM.encode()) == PROGRAM
+
+    def test_iterable_of_lines(self):
+        lines = iter(PROGRAM.splitlines(keepends=True))
+
+        assert read_openqasm3(lines) == PROGRAM
+
+    def test_open_file_is_read_to_the_end(self, tmp_path: Path):
+        path = tmp_path / "program.qasm"
+        path.write_text(PROGRAM, encoding="utf-8")
+
+        with path.open(encoding="utf-8") as file:
+            assert read_openqasm3(file) == PROGRAM
+
+    def test_unsupported_source(self):
+        with pytest.raises(Openqasm3IOError, match="int"):
+            read_openqasm3(42)  # type: ignore[arg-type]
+
+
+class TestWriteOpenqasm3:
+    def test_qiskit_circuit_to_stream(self):
+        circuit = loads(PROGRAM)
+        stream = io.StringIO()
+
+        write_openqasm3(circuit, stream)
+
+        assert stream.getvalue() == dumps(circuit)
+
+    def test_qiskit_circuit_to_path(self, tmp_path: Path):
+        circuit = loads(PROGRAM)
+        path = tmp_path / "program.qasm"
+
+        write_openqasm3(circuit, path)
+
+        assert path.read_text(encoding="utf-8") == dumps(circuit)
+
+    def test_tket_circuit(self):
+        stream = io.StringIO()
+
+        write_openqasm3(Circuit(2).H(0).CX(0, 1), stream)
+
+        circuit = loads(stream.getvalue())
+        assert isinstance(circuit, QuantumCircuit)
+        assert circuit.count_ops() == {"h": 1, "cx": 1}
+
+    def test_text(self):
+        stream = io.StringIO()
+
+        write_openqasm3(PROGRAM, stream)
+
+        assert stream.getvalue() == PROGRAM
+
+    def test_unsupported_program(self):
+        with pytest.raises(Openqasm3IOError, match="dict"):
+            write_openqasm3({}, io.StringIO())
@@ -0,0 +1,183 @@
+import math
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.circuit import (  # type: ignore[import-untyped]
+    Parameter,
+    ParameterVector,
+)
+from qiskit.quantum_info import Operator  # type: ignore[import-untyped]
+from qiskit_ibm_runtime.fake_provider import (  # type: ignore[import-untyped]
+    FakeSantiagoV2,
+)
+
+from tranqu import ParametricResult, Tranqu, TranspileResult
+from tranqu.parametric import ParametersNotSupportedError, ParameterValuesError
+
+
+@pytest.fixture
+def tranqu() -> Tranqu:
+    return Tranqu()
+
+
+def ansatz() -> QuantumCircuit:
+    theta = ParameterVector("theta", 4)
+    circuit = QuantumCircuit(3, 3)
+    circuit.ry(theta[0], 0)
+    circuit.cx(0, 1)
+    circuit.rz(2 * theta[1] + theta[2], 1)
+    circuit.cx(1, 2)
+    circuit.rx(theta[3] / 3, 2)
+    circuit.cp(theta[1], 0, 2)
+    circuit.measure(range(3), range(3))
+    return circuit
+
+
+def unitary(circuit: QuantumCircuit) -> Operator:
+    return Operator(circuit.remove_final_measurements(inplace=False))
+
+
+class TestTranspileParametric:
+    def test_bound_circuits_match_transpiled_bound_circuits(self, tranqu: Tranqu):
+        device = FakeSantiagoV2()
+        circuit = ansatz()
+        values = np.random.default_rng(0).uniform(-math.pi, math.pi, (3, 4))
+
+        parametric = tranqu.transpile_parametric(
+            circuit,
+            transpiler_lib="qiskit",
+            transpiler_options={"seed_transpiler": 1},
+            device=device,
+        )
+        bound = parametric.bind_many(values)
+
+        assert parametric.transpiled_program.parameters
+        assert len(bound) == len(values)
+        for row, program in zip(values, bound, strict=True):
+            assert not program.parameters
+            expected = tranqu.transpile(
+                circuit.assign_parameters(row),
+                transpiler_lib="qiskit",
+                transpiler_options={"seed_transpiler": 1},
+                device=device,
+            )
+            assert unitary(program).equiv(unitary(expected.transpiled_program))
+
+    def test_stats_and_mapping_are_those_of_the_template(self, tranqu: Tranqu):
+        parametric = tranqu.transpile_parametric(
+            ansatz(), transpiler_lib="qiskit", device=FakeSantiagoV2()
+        )
+
+        assert parametric.stats.before.n_gates_2q == 3
+        assert parametric.stats.after.n_gates_2q == (
+            parametric.transpiled_program.num_nonlocal_gates()
+        )
+        assert parametric.virtual_physical_mapping is (
+            parametric.result.virtual_physical_mapping
+        )
+
+    def test_parameters_are_in_circuit_order(self, tranqu: Tranqu):
+        parametric = tranqu.transpile_parametric(ansatz(), transpiler_lib="qiskit")
+
+        assert parametric.parameters == tuple(f"theta[{i}]" for i in range(4))
+
+    def test_tket_does_not_support_parameters(self, tranqu: Tranqu):
+        with pytest.raises(ParametersNotSupportedError):
+            tranqu.transpile_parametric(ansatz(), transpiler_lib="tket")
+
+
+class TestParametricResult:
+    @staticmethod
+    def create(
+        program: QuantumCircuit, parameters: list[str] | None = None
+    ) -> ParametricResult:
+        return ParametricResult(
+            TranspileResult(program, {"before": {}, "after": {}}, {}), parameters
+        )
+
+    def test_affine_expressions_and_global_phase(self):
+        a, b = Parameter("a"), Parameter("b")
+        circuit = QuantumCircuit(1, global_phase=a / 2)
+        circuit.rz(2 * a - b + 1, 0)
+        circuit.u(b, 0.5, -a, 0)
+
+        bound = self.create(circuit).bind([0.3, 0.7])
+
+        assert bound == circuit.assign_parameters({a: 0.3, b: 0.7})
+
+    def test_expressions_that_are_not_affine(self):
+        a, b = Parameter("a"), Parameter("b")
+        circuit = QuantumCircuit(1)
+        circuit.rz(a.sin() * b, 0)
+        circuit.rx(b, 0)
+
+        bound = self.create(circuit).bind_many([[0.3, 0.7], [1.0, 2.0]])
+
+        assert bound == [
+            circuit.assign_parameters({a: 0.3, b: 0.7}),
+            circuit.assign_parameters({a: 1.0, b: 2.0}),
+        ]
+
+    def test_bind_by_name_or_parameter(self):
+        a, b = Parameter("a"), Parameter("b")
+        circuit = QuantumCircuit(1)
+        circuit.rx(a, 0)
+        circuit.ry(b, 0)
+        parametric = self.create(circuit)
+
+        assert parametric.bind({"b": 0.2, a: 0.1}) == parametric.bind([0.1, 0.2])
+
+    def test_removed_parameters_are_ignored(self):
+        a = Parameter("a")
+        circuit = QuantumCircuit(1)
+        circuit.rx(a, 0)
+
+        bound = self.create(circuit, ["a", "unused"]).bind([0.1, 0.2])
+
+        assert bound == circuit.assign_parameters([0.1])
+
+    def test_circuits_without_parameters(self):
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+
+        bound = self.create(circuit).bind_many(np.empty((2, 0)))
+
+        assert bound == [circuit, circuit]
+        assert bound[0] is not circuit
+
+    def test_parameters_outside_standard_gates(self):
+        a = Parameter("a")
+        inner = QuantumCircuit(1)
+        inner.rx(a, 0)
+        circuit = QuantumCircuit(1)
+        circuit.append(inner.to_gate(label="inner"), [0])
+
+        bound = self.create(circuit).bind([0.4])
+
+        assert Operator(bound).equiv(Operator(inner.assign_parameters([0.4])))
+
+    @pytest.mark.parametrize("values", [[[0.1]], [0.1, 0.2], [[[0.1, 0.2]]]])
+    def test_values_of_wrong_shape(self, values: list):
+        a, b = Parameter("a"), Parameter("b")
+        circuit = QuantumCircuit(1)
+        circuit.rx(a + b, 0)
+
+        with pytest.raises(ParameterValuesError):
+            self.create(circuit).bind_many(values)
+
+    @pytest.mark.parametrize("values", [{"a": 0.1}, {"a": 0.1, "b": 0.2, "c": 0.3}])
+    def test_values_with_wrong_names(self, values: dict[str, float]):
+        a, b = Parameter("a"), Parameter("b")
+        circuit = QuantumCircuit(1)
+        circuit.rx(a + b, 0)
+
+        with pytest.raises(ParameterValuesError):
+            self.create(circuit).bind(values)
+
+    def test_unknown_parameters_in_transpiled_circuit(self):
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter("a"), 0)
+
+        with pytest.raises(ParameterValuesError):
+            self.create(circuit, ["b"])
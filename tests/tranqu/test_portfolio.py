@@ -0,0 +1,297 @@
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu import Candidate, Tranqu, TranspileResult
+from tranqu.portfolio import (
+    STATUS_CUT_OFF,
+    STATUS_FAILED,
+    STATUS_OK,
+    NoCandidateError,
+    NoCandidateSucceededError,
+    SeedNotSupportedError,
+    UnknownObjectiveError,
+    candidate_options,
+    create_scorer,
+)
+from tranqu.transpiler import Transpiler
+
+
+class FixedStatsTranspiler(Transpiler):
+    seed_option: ClassVar[str | None] = "seed"
+
+    def __init__(
+        self,
+        n_gates_2q: int,
+        depth: int = 1,
+        *,
+        release: threading.Event | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        super().__init__("qiskit")
+        self._stats = {"n_gates_2q": n_gates_2q, "depth": depth}
+        self._release = release
+        self._error = error
+        self.options: list[dict | None] = []
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        self.options.append(options)
+        if self._release is not None:
+            self._release.wait(timeout=10)
+        if self._error is not None:
+            raise self._error
+        return TranspileResult(program, {"before": {}, "after": self._stats}, {})
+
+
+class PidFileTranspiler(Transpiler):
+    """Writes its process ID and sleeps, or waits for the ID if it is fast."""
+
+    def __init__(self, pid_file: Path, *, slow: bool) -> None:
+        super().__init__("qiskit")
+        self._pid_file = pid_file
+        self._slow = slow
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        if self._slow:
+            self._pid_file.write_text(str(os.getpid()))
+            time.sleep(60)
+        deadline = time.monotonic() + 10
+        while not self._pid_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return TranspileResult(program, {"before": {}, "after": {"depth": 1}}, {})
+
+
+@pytest.fixture
+def tranqu() -> Tranqu:
+    return Tranqu()
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture
+def circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    return circuit
+
+
+class TestCandidate:
+    def test_str(self):
+        assert str(Candidate("tket")) == "tket"
+        assert (
+            str(Candidate("qiskit", {"optimization_level": 3}, seed=1))
+            == "qiskit(optimization_level=3, seed=1)"
+        )
+
+    def test_options_include_seed(self):
+        candidate = Candidate("qiskit", {"optimization_level": 3}, seed=7)
+
+        assert candidate_options(candidate, "seed_transpiler") == {
+            "optimization_level": 3,
+            "seed_transpiler": 7,
+        }
+
+    def test_options_without_seed(self):
+        options = {"optimization_level": 3}
+
+        assert candidate_options(Candidate("tket", options), None) is options
+
+    def test_seed_without_seed_option(self):
+        with pytest.raises(SeedNotSupportedError, match="tket"):
+            candidate_options(Candidate("tket", seed=1), None)
+
+
+class TestCreateScorer:
+    def setup_method(self):
+        self.result = TranspileResult(
+            None, {"before": {}, "after": {"n_gates_2q": 3, "depth": 5}}, {}
+        )
+
+    def test_single_statistic(self):
+        assert create_scorer("depth")(self.result) == 5
+
+    def test_statistics_in_order(self):
+        assert create_scorer(["n_gates_2q", "depth"])(self.result) == (3, 5)
+
+    def test_function(self):
+        assert (
+            create_scorer(lambda result: -result.stats.after.depth)(self.result) == -5
+        )
+
+    def test_unknown_statistic(self):
+        with pytest.raises(UnknownObjectiveError, match="duration"):
+            create_scorer("duration")(self.result)
+
+
+class TestTranspileBest:
+    def test_lowest_score_wins(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        tranqu.register_transpiler("a", FixedStatsTranspiler(3))
+        tranqu.register_transpiler("b", FixedStatsTranspiler(1, depth=9))
+        tranqu.register_transpiler("c", FixedStatsTranspiler(1, depth=4))
+
+        result = tranqu.transpile_best(circuit, candidates=["a", "b", "c"])
+
+        assert result.candidate == Candidate("c")
+        assert result.best.stats.after.depth == 4
+        assert [entry.candidate.transpiler_lib for entry in result.leaderboard] == [
+            "c",
+            "b",
+            "a",
+        ]
+        assert [entry.score for entry in result.leaderboard] == [(1, 4), (1, 9), (3, 1)]
+        assert all(entry.status == STATUS_OK for entry in result.leaderboard)
+
+    def test_ties_go_to_the_first_candidate(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        tranqu.register_transpiler("a", FixedStatsTranspiler(1))
+        tranqu.register_transpiler("b", FixedStatsTranspiler(1))
+
+        result = tranqu.transpile_best(circuit, candidates=["b", "a"])
+
+        assert result.candidate == Candidate("b")
+
+    def test_seeds_are_passed_as_options(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        transpiler = FixedStatsTranspiler(1)
+        tranqu.register_transpiler("a", transpiler)
+
+        tranqu.transpile_best(
+            circuit,
+            candidates=[Candidate("a", {"level": 1}, seed=seed) for seed in range(2)],
+            max_workers=1,
+        )
+
+        assert transpiler.options == [
+            {"level": 1, "seed": 0},
+            {"level": 1, "seed": 1},
+        ]
+
+    def test_failed_candidates_are_listed_last(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        tranqu.register_transpiler(
+            "broken", FixedStatsTranspiler(0, error=RuntimeError("boom"))
+        )
+        tranqu.register_transpiler("a", FixedStatsTranspiler(2))
+
+        result = tranqu.transpile_best(circuit, candidates=["broken", "a"])
+
+        assert result.candidate == Candidate("a")
+        assert result.leaderboard[-1].status == STATUS_FAILED
+        assert result.leaderboard[-1].error == "RuntimeError: boom"
+
+    def test_every_candidate_failed(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        tranqu.register_transpiler(
+            "broken", FixedStatsTranspiler(0, error=RuntimeError("boom"))
+        )
+
+        with pytest.raises(NoCandidateSucceededError, match="boom"):
+            tranqu.transpile_best(circuit, candidates=["broken"])
+
+    def test_no_candidates(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        with pytest.raises(NoCandidateError):
+            tranqu.transpile_best(circuit, candidates=[])
+
+    def test_slow_candidates_are_cut_off_after_the_time_budget(
+        self, tranqu: Tranqu, circuit: QuantumCircuit, release: threading.Event
+    ):
+        tranqu.register_transpiler("slow", FixedStatsTranspiler(0, release=release))
+        tranqu.register_transpiler("fast", FixedStatsTranspiler(5))
+
+        result = tranqu.transpile_best(
+            circuit, candidates=["slow", "fast"], time_budget=0.1
+        )
+
+        assert result.candidate == Candidate("fast")
+        assert [entry.status for entry in result.leaderboard] == [
+            STATUS_OK,
+            STATUS_CUT_OFF,
+        ]
+
+    def test_budget_waits_for_a_first_result(
+        self, tranqu: Tranqu, circuit: QuantumCircuit
+    ):
+        release = threading.Event()
+        threading.Timer(0.2, release.set).start()
+        tranqu.register_transpiler("slow", FixedStatsTranspiler(0, release=release))
+
+        result = tranqu.transpile_best(circuit, candidates=["slow"], time_budget=0)
+
+        assert result.candidate == Candidate("slow")
+
+    def test_qiskit_and_tket(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        result = tranqu.transpile_best(
+            circuit,
+            candidates=["tket", *(Candidate("qiskit", seed=seed) for seed in range(2))],
+            objective="n_gates",
+        )
+
+        assert isinstance(result.best.transpiled_program, QuantumCircuit)
+        assert len(result.leaderboard) == 3
+        assert all(entry.seconds is not None for entry in result.leaderboard)
+
+    def test_openqasm3_stream_is_read_once(self, tranqu: Tranqu):
+        program = io.StringIO(
+            'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\n'
+        )
+
+        result = tranqu.transpile_best(
+            program, "openqasm3", candidates=["qiskit", "tket"]
+        )
+
+        assert all(entry.status == STATUS_OK for entry in result.leaderboard)
+        assert isinstance(result.best.transpiled_program, str)
+
+    def test_process_executor(self, tranqu: Tranqu, circuit: QuantumCircuit):
+        result = tranqu.transpile_best(
+            circuit,
+            candidates=["tket", "qiskit"],
+            objective="depth",
+            executor="process",
+            max_workers=2,
+        )
+
+        assert result.best.stats.after.n_qubits == 2
+
+    def test_process_candidates_are_terminated_when_cut_off(
+        self, tranqu: Tranqu, circuit: QuantumCircuit, tmp_path: Path
+    ):
+        pid_file = tmp_path / "pid"
+        tranqu.register_transpiler("slow", PidFileTranspiler(pid_file, slow=True))
+        tranqu.register_transpiler("fast", PidFileTranspiler(pid_file, slow=False))
+
+        result = tranqu.transpile_best(
+            circuit,
+            candidates=["slow", "fast"],
+            objective="depth",
+            time_budget=0.1,
+            executor="process",
+            max_workers=2,
+        )
+
+        assert result.candidate == Candidate("fast")
+        assert result.leaderboard[1].status == STATUS_CUT_OFF
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
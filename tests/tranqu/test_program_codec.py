@@ -0,0 +1,131 @@
+# mypy: disable-error-code="import-untyped"
+
+import pickle  # noqa: S403
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit_ibm_runtime.fake_provider import FakeSantiagoV2
+
+from tranqu import TranspileResult
+from tranqu.program_codec import (
+    ENCODING_OBJECT,
+    ENCODING_QISKIT_OPENQASM3,
+    ENCODING_QPY,
+    ENCODING_TEXT,
+    ENCODING_TKET_JSON,
+    ENCODING_TKET_OPENQASM3,
+    UnsupportedWireFormatError,
+    decode_program,
+    decode_result,
+    encode_program,
+    encode_result,
+)
+
+
+class TestEncodeProgram:
+    def test_qiskit_circuit_round_trip_is_lossless(self):
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(2, 2, global_phase=0.3)
+        circuit.rx(theta, 0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        encoded = encode_program(circuit)
+        decoded = decode_program(pickle.loads(pickle.dumps(encoded)))  # noqa: S301
+
+        assert encoded.encoding == ENCODING_QPY
+        assert decoded == circuit
+        assert [parameter.name for parameter in decoded.parameters] == ["theta"]
+
+    def test_qiskit_layout_is_kept(self):
+        circuit = QuantumCircuit(2)
+        circuit.cx(0, 1)
+        transpiled = transpile(circuit, FakeSantiagoV2(), seed_transpiler=0)
+
+        decoded = decode_program(encode_program(transpiled))
+
+        assert decoded.layout is not None
+        assert decoded.layout.final_index_layout() == (
+            transpiled.layout.final_index_layout()
+        )
+
+    def test_tket_circuit_is_sent_as_json(self):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        encoded = encode_program(circuit)
+
+        assert encoded.encoding == ENCODING_TKET_JSON
+        assert isinstance(encoded.payload, dict)
+        assert decode_program(encoded) == circuit
+
+    def test_text_is_sent_as_is(self):
+        encoded = encode_program("OPENQASM 3.0;")
+
+        assert encoded.encoding == ENCODING_TEXT
+        assert decode_program(encoded) == "OPENQASM 3.0;"
+
+    def test_other_programs_are_sent_as_objects(self):
+        encoded = encode_program({"gates": ["h"]})
+
+        assert encoded.encoding == ENCODING_OBJECT
+        assert decode_program(encoded) == {"gates": ["h"]}
+
+
+class TestWireFormat:
+    def test_qiskit_circuit_as_openqasm3(self):
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        encoded = encode_program(circuit, "openqasm3")
+
+        assert encoded.encoding == ENCODING_QISKIT_OPENQASM3
+        assert encoded.payload.startswith("OPENQASM 3.0;")
+        assert decode_program(encoded) == circuit
+
+    def test_tket_circuit_as_openqasm3(self):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        encoded = encode_program(circuit, "openqasm3")
+        decoded = decode_program(encoded)
+
+        assert encoded.encoding == ENCODING_TKET_OPENQASM3
+        assert isinstance(decoded, Circuit)
+        assert decoded.n_gates == 2
+
+    def test_text_ignores_the_wire_format(self):
+        assert encode_program("OPENQASM 3.0;", "qpy").encoding == ENCODING_TEXT
+
+    @pytest.mark.parametrize(
+        ("program", "wire_format"),
+        [(QuantumCircuit(1), "tket_json"), (Circuit(1), "qpy"), ("", "unknown")],
+    )
+    def test_unsupported_wire_format(self, program: object, wire_format: str):
+        with pytest.raises(UnsupportedWireFormatError):
+            encode_program(program, wire_format)
+
+
+class TestEncodeResult:
+    def test_round_trip_computes_lazy_stats(self):
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        result = TranspileResult(
+            circuit,
+            lambda: {"after": {"n_gates": 1}},
+            {"qubit_mapping": {0: 0}, "bit_mapping": {}},
+            {"transpile": 0.5},
+        )
+
+        encoded = pickle.loads(pickle.dumps(encode_result(result)))  # noqa: S301
+        decoded = decode_result(encoded)
+
+        assert decoded == result
+        assert decoded.transpiled_program == circuit
+        assert decoded.timings == {"transpile": 0.5}
+
+    def test_result_without_program(self):
+        result = TranspileResult(None, {}, {"qubit_mapping": {}, "bit_mapping": {}})
+
+        assert decode_result(encode_result(result)).transpiled_program is None
@@ -1,3 +1,7 @@
+import sys
+import types
+from abc import ABC
+
 import pytest
 
 from tranqu.program_type_manager import (
@@ -70,3 +74,63 @@ class TestProgramTypeManager:
             ),
         ):
             manager.register_type("dummy", AnotherProgram)
+
+    def test_resolve_lib_for_subclass(self, manager: ProgramTypeManager):
+        class DerivedProgram(DummyProgram):
+            pass
+
+        manager.register_type("dummy", DummyProgram)
+
+        assert manager.resolve_lib(DerivedProgram()) == "dummy"
+        assert manager.resolve_lib(DerivedProgram()) == "dummy"
+
+    def test_resolve_lib_for_virtual_subclass(self, manager: ProgramTypeManager):
+        class AbstractProgram(ABC):  # noqa: B024
+            pass
+
+        manager.register_type("abstract", AbstractProgram)
+        AbstractProgram.register(DummyProgram)
+
+        assert manager.resolve_lib(DummyProgram()) == "abstract"
+
+    def test_register_type_after_resolving_subclass(self, manager: ProgramTypeManager):
+        class DerivedProgram(DummyProgram):
+            pass
+
+        manager.register_type("dummy", DummyProgram)
+        assert manager.resolve_lib(DerivedProgram()) == "dummy"
+
+        manager.register_type("derived", DerivedProgram)
+
+        assert manager.resolve_lib(DerivedProgram()) == "derived"
+        assert manager.resolve_lib(DummyProgram()) == "dummy"
+
+    def test_register_lazy_type_before_module_is_imported(
+        self, manager: ProgramTypeManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        manager.register_lazy_type("lazy", "lazy_program_module", "LazyProgram")
+        assert manager.resolve_lib(DummyProgram()) is None
+
+        module = types.ModuleType("lazy_program_module")
+        module.LazyProgram = type("LazyProgram", (), {})  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "lazy_program_module", module)
+
+        assert manager.resolve_lib(module.LazyProgram()) == "lazy"  # type: ignore[attr-defined]
+
+    def test_register_lazy_type_resolves_subclasses(self, manager: ProgramTypeManager):
+        class DerivedProgram(DummyProgram):
+            pass
+
+        manager.register_lazy_type("dummy", __name__, "DummyProgram")
+
+        assert manager.resolve_lib(DerivedProgram()) == "dummy"
+
+    def test_register_lazy_type_raises_error_when_lib_already_registered(
+        self, manager: ProgramTypeManager
+    ):
+        manager.register_lazy_type("dummy", __name__, "DummyProgram")
+
+        with pytest.raises(ProgramLibraryAlreadyRegisteredError):
+            manager.register_type("dummy", DummyProgram)
+        with pytest.raises(ProgramLibraryAlreadyRegisteredError):
+            manager.register_lazy_type("dummy", __name__, "DummyProgram")
@@ -0,0 +1,174 @@
+# mypy: disable-error-code="import-untyped"
+
+import io
+import struct
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit, transpile
+from qiskit_ibm_runtime.fake_provider import FakeSantiagoV2
+
+from tranqu import TranspileResult, read_results_jsonl, write_results_jsonl
+from tranqu.program_codec import UnsupportedWireFormatError
+from tranqu.result_codec import FORMAT_VERSION, ResultCodecError
+
+STATS: dict[str, Any] = {
+    "before": {"n_qubits": 2, "n_gates": 2, "gate_counts": {"h": 1, "cx": 1}},
+    "after": {"n_qubits": 5, "n_gates": 4, "gate_counts": {"sx": 3, "cx": 1}},
+}
+MAPPING = {"qubit_mapping": {0: 3, 1: 4}, "bit_mapping": {0: 0, 1: 1}}
+
+RoundTrip = Callable[..., TranspileResult]
+
+
+def _qiskit_result() -> TranspileResult:
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    transpiled = transpile(circuit, FakeSantiagoV2(), seed_transpiler=0)
+    return TranspileResult(
+        transpiled, STATS, MAPPING, {"transpile": 0.5}, {"transpile": 0.25}
+    )
+
+
+@pytest.fixture(params=["bytes", "json"])
+def round_trip(request: pytest.FixtureRequest) -> RoundTrip:
+    def bytes_round_trip(
+        result: TranspileResult, wire_format: str | None = None
+    ) -> TranspileResult:
+        return TranspileResult.from_bytes(result.to_bytes(wire_format))
+
+    def json_round_trip(
+        result: TranspileResult, wire_format: str | None = None
+    ) -> TranspileResult:
+        return TranspileResult.from_json(result.to_json(wire_format))
+
+    return bytes_round_trip if request.param == "bytes" else json_round_trip
+
+
+class TestRoundTrip:
+    def test_qiskit_program_as_qpy(self, round_trip: RoundTrip):
+        result = _qiskit_result()
+
+        restored = round_trip(result)
+
+        assert restored == result
+        assert restored.transpiled_program.layout is not None
+        assert restored.timings == {"transpile": 0.5}
+        assert restored.cpu_timings == {"transpile": 0.25}
+        assert restored.virtual_physical_mapping.qubit_mapping == {0: 3, 1: 4}
+
+    def test_qiskit_program_as_openqasm3(self, round_trip: RoundTrip):
+        result = _qiskit_result()
+
+        restored = round_trip(result, "openqasm3")
+
+        assert isinstance(restored.transpiled_program, QuantumCircuit)
+        assert restored.transpiled_program.count_ops() == (
+            result.transpiled_program.count_ops()
+        )
+        assert restored.to_dict() == result.to_dict()
+
+    @pytest.mark.parametrize("wire_format", [None, "tket_json", "openqasm3"])
+    def test_tket_program(self, round_trip: RoundTrip, wire_format: str | None):
+        result = TranspileResult(Circuit(2).H(0).CX(0, 1), STATS, MAPPING)
+
+        restored = round_trip(result, wire_format)
+
+        assert isinstance(restored.transpiled_program, Circuit)
+        assert restored.transpiled_program.n_gates == 2
+
+    def test_text_program_and_unordered_mapping(self, round_trip: RoundTrip):
+        mapping = {"qubit_mapping": {2: 0, 0: 1, 1: 2}, "bit_mapping": {}}
+        result = TranspileResult("OPENQASM 3.0;", STATS, mapping)
+
+        restored = round_trip(result)
+
+        assert restored == result
+        assert list(restored.virtual_physical_mapping.qubit_mapping) == [2, 0, 1]
+
+    def test_mapping_that_is_not_int32(self, round_trip: RoundTrip):
+        mapping = {"qubit_mapping": {0: 2**40}, "bit_mapping": {0: -1}}
+        result = TranspileResult(None, STATS, mapping)
+
+        restored = round_trip(result)
+
+        assert restored.to_dict() == result.to_dict()
+        assert restored.transpiled_program is None
+
+    def test_lazy_stats_are_computed(self, round_trip: RoundTrip):
+        result = TranspileResult({"gates": ["h"]}, lambda: STATS, MAPPING)
+
+        restored = round_trip(result)
+
+        assert restored.to_dict()["stats"] == STATS
+        assert restored.transpiled_program == {"gates": ["h"]}
+
+    def test_tier(self, round_trip: RoundTrip):
+        result = TranspileResult(None, STATS, MAPPING, tier=2)
+
+        assert round_trip(result).tier == 2
+
+    def test_incremental(self, round_trip: RoundTrip):
+        result = TranspileResult(None, STATS, MAPPING, incremental=True)
+
+        assert round_trip(result).incremental
+
+    def test_unsupported_wire_format(self, round_trip: RoundTrip):
+        result = TranspileResult(Circuit(1), STATS, MAPPING)
+
+        with pytest.raises(UnsupportedWireFormatError):
+            round_trip(result, "qpy")
+
+
+class TestVersioning:
+    def test_bytes_start_with_the_version(self):
+        data = TranspileResult(None, STATS, MAPPING).to_bytes()
+
+        assert data[:4] == b"TRQR"
+        assert struct.unpack_from("<H", data, 4)[0] == FORMAT_VERSION
+
+    def test_unknown_bytes_version(self):
+        data = bytearray(TranspileResult(None, STATS, MAPPING).to_bytes())
+        struct.pack_into("<H", data, 4, FORMAT_VERSION + 1)
+
+        with pytest.raises(ResultCodecError, match="version"):
+            TranspileResult.from_bytes(bytes(data))
+
+    def test_not_a_result(self):
+        with pytest.raises(ResultCodecError):
+            TranspileResult.from_bytes(b"not a result")
+        with pytest.raises(ResultCodecError):
+            TranspileResult.from_bytes(b"TR")
+
+    def test_unknown_json_version(self):
+        line = TranspileResult(None, STATS, MAPPING).to_json()
+        line = line.replace(
+            f'"version":{FORMAT_VERSION}', f'"version":{FORMAT_VERSION + 1}'
+        )
+
+        with pytest.raises(ResultCodecError, match="version"):
+            TranspileResult.from_json(line)
+
+
+class TestJsonLines:
+    def test_write_and_read(self):
+        results = [
+            TranspileResult(f"OPENQASM 3.0; // {index}", STATS, MAPPING)
+            for index in range(3)
+        ]
+        stream = io.StringIO()
+
+        write_results_jsonl(iter(results), stream)
+        stream.seek(0)
+
+        assert stream.getvalue().count("\n") == 3
+        assert list(read_results_jsonl(stream)) == results
+
+    def test_blank_lines_are_skipped(self):
+        line = TranspileResult(None, STATS, MAPPING).to_json()
+
+        assert len(list(read_results_jsonl(["", line + "\n", "\n"]))) == 1
@@ -1,6 +1,11 @@
 # mypy: disable-error-code="import-untyped"
 
+import asyncio
+import io
 import re
+import time
+from pathlib import Path
+from typing import Any
 
 import pytest
 from pytket import Circuit  # type: ignore[attr-defined]
@@ -9,8 +14,19 @@ from qiskit.qasm3 import loads
 from qiskit.quantum_info import Statevector
 from qiskit_ibm_runtime.fake_provider import FakeSantiagoV2
 
-from tranqu import Tranqu, __version__
+from tranqu import (
+    InMemoryTranspileCache,
+    StageTiming,
+    Tranqu,
+    TranspileContext,
+    TranspileObserver,
+    TranspileResult,
+    __version__,
+    write_openqasm3,
+)
+from tranqu.async_executor import TranspileTimeoutError
 from tranqu.device_converter import (
+    DeviceConverter,
     OqtoqusToQiskitDeviceConverter,
     QiskitToOuquTpDeviceConverter,
 )
@@ -18,12 +34,21 @@ from tranqu.program_converter import (
     Openqasm3ToTketProgramConverter,
     ProgramConverter,
     QiskitToOpenqasm3ProgramConverter,
+    QiskitToQpyProgramConverter,
+    QpyToQiskitProgramConverter,
     TketToQiskitProgramConverter,
 )
+from tranqu.stats_metric import (
+    MeasurementCountMetric,
+    StatsMetricAlreadyRegisteredError,
+    StatsMetricNotFoundError,
+)
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
 from tranqu.transpiler.transpiler_manager import TranspilerNotFoundError
 from tranqu.transpiler_dispatcher import (
     DeviceConversionPathNotFoundError,
     DeviceNotSpecifiedError,
+    InvalidStatsModeError,
     ProgramConversionPathNotFoundError,
     ProgramLibResolutionError,
     ProgramNotSpecifiedError,
@@ -31,6 +56,14 @@ from tranqu.transpiler_dispatcher import (
 )
 
 
+class StageRecorder(TranspileObserver):
+    def __init__(self) -> None:
+        self.stages: list[tuple[str, str]] = []
+
+    def on_stage(self, timing: StageTiming, context: TranspileContext) -> None:
+        self.stages.append((timing.stage, context.transpiler_lib))
+
+
 class EnigmaCircuit:
     """Custom circuit class"""
 
@@ -45,6 +78,36 @@ class QiskitToEnigmaConverter(ProgramConverter):
         return EnigmaCircuit()
 
 
+class EnigmaToOpenqasm3Converter(ProgramConverter):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def convert(self, _program: EnigmaCircuit) -> str:
+        self.calls += 1
+        return 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[1] q;\nh q[0];\n'
+
+
+class EnigmaToQpyConverter(ProgramConverter):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def convert(self, _program: EnigmaCircuit) -> bytes:
+        self.calls += 1
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        return QiskitToQpyProgramConverter().convert(circuit)
+
+
+class CountingOqtopusToQiskitDeviceConverter(DeviceConverter):
+    def __init__(self) -> None:
+        self.calls = 0
+        self._converter = OqtoqusToQiskitDeviceConverter()
+
+    def convert(self, device: dict) -> object:
+        self.calls += 1
+        return self._converter.convert(device)
+
+
 @pytest.fixture
 def tranqu() -> Tranqu:
     return Tranqu()
@@ -95,6 +158,12 @@ class TestTranqu:
         # Check if the version string follows semantic versioning format
         assert re.match(r"^\d+\.\d+\.\d+(-\w+(\.\d+)?)?$", __version__)
 
+    def test_builtin_transpilers_are_shared_between_instances(self):
+        first = Tranqu()._transpiler_manager  # noqa: SLF001
+        second = Tranqu()._transpiler_manager  # noqa: SLF001
+
+        assert first.fetch_transpiler("qiskit") is second.fetch_transpiler("qiskit")
+
     class TestCustomProgramsAndConverters:
         def test_transpile_custom_circuit_with_qiskit_transpiler(self, tranqu: Tranqu):
             tranqu.register_program_converter(
@@ -380,3 +449,630 @@ c[1] = measure q[1];
                 device=None,
                 device_lib="qiskit",
             )
+
+    def test_converted_device_is_reused_across_calls(self, tranqu: Tranqu):
+        converter = CountingOqtopusToQiskitDeviceConverter()
+        tranqu.register_device_converter(
+            "oqtopus", "qiskit", converter, allow_override=True
+        )
+        device = {
+            "device_id": "local_device",
+            "qubits": [
+                {"id": 0, "fidelity": 0.99, "meas_error": {}},
+                {"id": 1, "fidelity": 0.98, "meas_error": {}},
+            ],
+            "couplings": [
+                {"control": 0, "target": 1, "fidelity": 0.95},
+                {"control": 1, "target": 0, "fidelity": 0.95},
+            ],
+        }
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        for _ in range(3):
+            tranqu.transpile(
+                circuit,
+                transpiler_lib="qiskit",
+                device=dict(device),
+                device_lib="oqtopus",
+            )
+
+        assert converter.calls == 1
+        assert tranqu.device_conversion_cache.stats.hits == 2
+
+    def test_device_cache_can_be_disabled(self):
+        tranqu = Tranqu(device_cache_size=0)
+        converter = CountingOqtopusToQiskitDeviceConverter()
+        tranqu.register_device_converter(
+            "oqtopus", "qiskit", converter, allow_override=True
+        )
+        device = {
+            "device_id": "local_device",
+            "qubits": [{"id": 0, "fidelity": 0.99, "meas_error": {}}],
+            "couplings": [],
+        }
+
+        for _ in range(2):
+            tranqu.transpile(
+                QuantumCircuit(1),
+                transpiler_lib="qiskit",
+                device=device,
+                device_lib="oqtopus",
+            )
+
+        assert converter.calls == 2
+
+    class TestOutputLib:
+        program = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+
+        def test_default_returns_input_lib(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                self.program, program_lib="openqasm3", transpiler_lib="tket"
+            )
+
+            assert isinstance(result.transpiled_program, str)
+            assert set(result.timings) == {
+                "convert_program",
+                "convert_device",
+                "transpile",
+                "convert_output",
+            }
+            assert set(result.cpu_timings) == set(result.timings)
+
+        def test_native_returns_transpiler_format(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                self.program,
+                program_lib="openqasm3",
+                transpiler_lib="tket",
+                output_lib="native",
+            )
+
+            assert isinstance(result.transpiled_program, Circuit)
+
+        def test_none_returns_no_program(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                self.program,
+                program_lib="openqasm3",
+                transpiler_lib="tket",
+                output_lib=None,
+            )
+
+            assert result.transpiled_program is None
+            assert result.stats.after.n_qubits == 2
+
+        def test_specific_lib(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                self.program,
+                program_lib="openqasm3",
+                transpiler_lib="tket",
+                output_lib="qiskit",
+            )
+
+            assert isinstance(result.transpiled_program, QuantumCircuit)
+
+        def test_transpile_many(self, tranqu: Tranqu):
+            results = tranqu.transpile_many(
+                [self.program, self.program],
+                program_lib="openqasm3",
+                transpiler_lib="qiskit",
+                output_lib="native",
+            )
+
+            assert all(
+                isinstance(result.transpiled_program, QuantumCircuit)
+                for result in results
+            )
+
+    class TestOpenqasm3Sources:
+        program = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+
+        def test_path(self, tranqu: Tranqu, tmp_path: Path):
+            path = tmp_path / "program.qasm"
+            path.write_text(self.program, encoding="utf-8")
+
+            result = tranqu.transpile(
+                path, program_lib="openqasm3", transpiler_lib="qiskit"
+            )
+
+            assert isinstance(result.transpiled_program, str)
+            assert result.stats.before.n_gates == 2
+
+        def test_file_objects_in_transpile_many(self, tranqu: Tranqu):
+            results = tranqu.transpile_many(
+                [io.StringIO(self.program), io.StringIO(self.program)],
+                program_lib="openqasm3",
+                transpiler_lib="qiskit",
+                output_lib="native",
+            )
+
+            assert all(
+                isinstance(result.transpiled_program, QuantumCircuit)
+                for result in results
+            )
+
+        def test_output_can_be_written_to_a_stream(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                io.StringIO(self.program),
+                program_lib="openqasm3",
+                transpiler_lib="qiskit",
+                output_lib="qiskit",
+            )
+            stream = io.StringIO()
+
+            write_openqasm3(result.transpiled_program, stream)
+
+            assert loads(stream.getvalue()) == result.transpiled_program
+
+        def test_cache_key_depends_on_file_content(self, tmp_path: Path):
+            tranqu = Tranqu(cache=InMemoryTranspileCache())
+            path = tmp_path / "program.qasm"
+            path.write_text(self.program, encoding="utf-8")
+            first = tranqu.transpile(
+                path, program_lib="openqasm3", transpiler_lib="qiskit"
+            )
+
+            path.write_text(self.program + "x q[1];\n", encoding="utf-8")
+            second = tranqu.transpile(
+                path, program_lib="openqasm3", transpiler_lib="qiskit"
+            )
+
+            assert first.stats.before.n_gates == 2
+            assert second.stats.before.n_gates == 3
+
+    class TestBinaryPrograms:
+        @pytest.fixture
+        def circuit(self) -> QuantumCircuit:
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+            return circuit
+
+        def test_qpy_program(self, tranqu: Tranqu, circuit: QuantumCircuit):
+            program = QiskitToQpyProgramConverter().convert(circuit)
+
+            result = tranqu.transpile(
+                program, program_lib="qpy", transpiler_lib="qiskit"
+            )
+
+            assert isinstance(result.transpiled_program, bytes)
+            transpiled = QpyToQiskitProgramConverter().convert(
+                result.transpiled_program
+            )
+            assert Statevector(transpiled).equiv(Statevector(circuit))
+
+        def test_tket_json_program(self, tranqu: Tranqu):
+            program = Circuit(2).H(0).CX(0, 1).to_dict()
+
+            result = tranqu.transpile(
+                program, program_lib="tket-json", transpiler_lib="qiskit"
+            )
+
+            assert isinstance(result.transpiled_program, dict)
+            assert Circuit.from_dict(result.transpiled_program).n_qubits == 2
+
+        def test_tket_json_output(self, tranqu: Tranqu, circuit: QuantumCircuit):
+            result = tranqu.transpile(
+                circuit,
+                program_lib="qiskit",
+                transpiler_lib="tket",
+                output_lib="tket-json",
+            )
+
+            assert isinstance(result.transpiled_program, dict)
+
+        def test_binary_format_is_preferred_over_text_for_intermediate_hops(
+            self, tranqu: Tranqu
+        ):
+            to_openqasm3 = EnigmaToOpenqasm3Converter()
+            to_qpy = EnigmaToQpyConverter()
+            tranqu.register_program_converter("enigma", "openqasm3", to_openqasm3)
+            tranqu.register_program_converter("enigma", "qpy", to_qpy)
+
+            result = tranqu.transpile(
+                EnigmaCircuit(),
+                program_lib="enigma",
+                transpiler_lib="tket",
+                output_lib="native",
+            )
+
+            assert isinstance(result.transpiled_program, Circuit)
+            assert to_qpy.calls == 1
+            assert to_openqasm3.calls == 0
+
+    class TestPreviousResult:
+        program = """OPENQASM 3;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+
+h q[0];
+cx q[0],q[1];
+c[0] = measure q[0];
+c[1] = measure q[1];
+"""
+
+        @staticmethod
+        def line_device(best_pair: set[int]) -> dict[str, Any]:
+            return {
+                "device_id": "line",
+                "qubits": [
+                    {
+                        "id": qubit,
+                        "fidelity": 0.99,
+                        "meas_error": {
+                            "prob_meas1_prep0": 0.01,
+                            "prob_meas0_prep1": 0.02,
+                        },
+                    }
+                    for qubit in range(4)
+                ],
+                "couplings": [
+                    {
+                        "control": control,
+                        "target": target,
+                        "fidelity": 0.99 if {control, target} == best_pair else 0.8,
+                    }
+                    for control, target in [
+                        (0, 1), (1, 0), (1, 2), (2, 1), (2, 3), (3, 2)
+                    ]
+                ],
+            }  # fmt: skip
+
+        def transpile(
+            self,
+            tranqu: Tranqu,
+            device: dict[str, Any],
+            previous: TranspileResult | None = None,
+        ) -> TranspileResult:
+            return tranqu.transpile(
+                self.program,
+                "openqasm3",
+                "qiskit",
+                device=device,
+                device_lib="oqtopus",
+                previous=previous,
+            )
+
+        def test_calibration_change_reuses_the_routing(self, tranqu: Tranqu):
+            previous = self.transpile(tranqu, self.line_device({0, 1}))
+
+            result = self.transpile(tranqu, self.line_device({2, 3}), previous)
+
+            assert not previous.incremental
+            assert result.incremental
+            assert set(result.virtual_physical_mapping.qubit_mapping.values()) == {
+                2,
+                3,
+            }
+            assert loads(result.transpiled_program).count_ops()["cx"] == 1
+
+        def test_topology_change_transpiles_from_scratch(self, tranqu: Tranqu):
+            previous = self.transpile(tranqu, self.line_device({0, 1}))
+            device = self.line_device({1, 2})
+            device["couplings"] = [
+                coupling
+                for coupling in device["couplings"]
+                if {coupling["control"], coupling["target"]} != {0, 1}
+            ]
+
+            result = self.transpile(tranqu, device, previous)
+
+            assert not result.incremental
+            assert set(result.virtual_physical_mapping.qubit_mapping.values()) == {
+                1,
+                2,
+            }
+
+        def test_previous_result_without_program(self, tranqu: Tranqu):
+            previous = self.transpile(tranqu, self.line_device({0, 1}))
+            previous.release_program()
+
+            result = self.transpile(tranqu, self.line_device({2, 3}), previous)
+
+            assert not result.incremental
+
+        def test_native_previous_program(self, tranqu: Tranqu):
+            previous = tranqu.transpile(
+                self.program,
+                "openqasm3",
+                "qiskit",
+                device=self.line_device({0, 1}),
+                device_lib="oqtopus",
+                output_lib="native",
+            )
+
+            result = self.transpile(tranqu, self.line_device({2, 3}), previous)
+
+            assert result.incremental
+            assert isinstance(result.transpiled_program, str)
+
+        def test_results_are_not_cached(self):
+            tranqu = Tranqu(cache=InMemoryTranspileCache())
+            device = self.line_device({2, 3})
+            previous = self.transpile(tranqu, self.line_device({0, 1}))
+
+            result = self.transpile(tranqu, device, previous)
+
+            assert self.transpile(tranqu, device) is not result
+            assert not self.transpile(tranqu, device).incremental
+
+    class TestStatsMode:
+        @pytest.mark.parametrize("transpiler_lib", ["qiskit", "tket"])
+        def test_full(self, tranqu: Tranqu, transpiler_lib: str):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+
+            result = tranqu.transpile(circuit, "qiskit", transpiler_lib)
+
+            assert result.stats.before.depth == 2
+
+        @pytest.mark.parametrize("transpiler_lib", ["qiskit", "tket"])
+        def test_counts_skips_depth(self, tranqu: Tranqu, transpiler_lib: str):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+
+            result = tranqu.transpile(circuit, "qiskit", transpiler_lib, stats="counts")
+
+            assert result.stats.before.n_gates == 2
+            assert "depth" not in result.stats.before
+            assert "depth" not in result.stats.after
+
+        @pytest.mark.parametrize("transpiler_lib", ["qiskit", "tket"])
+        def test_none_skips_stats(self, tranqu: Tranqu, transpiler_lib: str):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+
+            result = tranqu.transpile(circuit, "qiskit", transpiler_lib, stats="none")
+
+            assert dict(result.stats.items()) == {}
+            assert result.virtual_physical_mapping.qubit_mapping == {0: 0, 1: 1}
+
+        def test_stats_are_computed_on_first_access(
+            self, tranqu: Tranqu, monkeypatch: pytest.MonkeyPatch
+        ):
+            calls = []
+            original = QiskitStatsExtractor.extract_stats_from
+
+            def counting_extract_stats_from(
+                self: QiskitStatsExtractor, program: QuantumCircuit, **kwargs: Any
+            ) -> dict[str, Any]:
+                calls.append(program)
+                return original(self, program, **kwargs)
+
+            monkeypatch.setattr(
+                QiskitStatsExtractor, "extract_stats_from", counting_extract_stats_from
+            )
+            circuit = QuantumCircuit(1)
+            circuit.x(0)
+
+            result = tranqu.transpile(circuit, "qiskit", "qiskit")
+
+            assert calls == []
+            assert result.stats.before.n_gates == 1
+            assert len(calls) == 2
+
+        def test_transpile_many(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(2)
+            circuit.cx(0, 1)
+
+            results = tranqu.transpile_many(
+                [circuit, circuit], "qiskit", "qiskit", stats="counts"
+            )
+
+            assert all(result.stats.after.n_gates_2q == 1 for result in results)
+            assert all("depth" not in result.stats.after for result in results)
+
+        def test_unknown_mode(self, tranqu: Tranqu):
+            with pytest.raises(InvalidStatsModeError, match="Unknown stats mode"):
+                tranqu.transpile(QuantumCircuit(1), "qiskit", "qiskit", stats="some")
+
+    class TestStatsMetrics:
+        def test_builtin_metrics(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(2, 2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+            circuit.measure([0, 1], [0, 1])
+
+            result = tranqu.transpile(
+                circuit,
+                "qiskit",
+                "qiskit",
+                metrics=["gate_counts", "depth_2q", "n_measurements"],
+            )
+
+            assert result.stats.before.gate_counts.to_dict() == {
+                "h": 1,
+                "cx": 1,
+                "measure": 2,
+            }
+            assert result.stats.before.depth_2q == 1
+            assert result.stats.before.n_measurements == 2
+            assert result.stats.after.n_measurements == 2
+
+        def test_device_metrics_use_the_target(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+            device = FakeSantiagoV2()
+
+            result = tranqu.transpile(
+                circuit,
+                "qiskit",
+                "qiskit",
+                device=device,
+                metrics=["duration", "success_probability"],
+            )
+
+            assert result.stats.before.duration is None
+            assert result.stats.before.success_probability is None
+            assert result.stats.after.duration > 0
+            assert 0 < result.stats.after.success_probability < 1
+
+        def test_device_metrics_are_none_without_device(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(1)
+            circuit.x(0)
+
+            result = tranqu.transpile(circuit, "qiskit", "qiskit", metrics=["duration"])
+
+            assert result.stats.after.duration is None
+
+        def test_custom_metric(self, tranqu: Tranqu):
+            tranqu.register_stats_metric("n_measure", MeasurementCountMetric())
+            circuit = QuantumCircuit(1, 1)
+            circuit.measure(0, 0)
+
+            result = tranqu.transpile(circuit, "qiskit", "tket", metrics=["n_measure"])
+
+            assert result.stats.after.n_measure == 1
+
+        def test_transpile_many(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(2)
+            circuit.cx(0, 1)
+
+            results = tranqu.transpile_many(
+                [circuit, circuit], "qiskit", "qiskit", metrics=["gate_counts"]
+            )
+
+            assert all(
+                result.stats.after.gate_counts.to_dict() == {"cx": 1}
+                for result in results
+            )
+
+        def test_metrics_are_skipped_without_stats(self, tranqu: Tranqu):
+            result = tranqu.transpile(
+                QuantumCircuit(1),
+                "qiskit",
+                "qiskit",
+                stats="none",
+                metrics=["gate_counts"],
+            )
+
+            assert dict(result.stats.items()) == {}
+
+        def test_unknown_metric(self, tranqu: Tranqu):
+            with pytest.raises(StatsMetricNotFoundError, match="Unknown stats metric"):
+                tranqu.transpile(
+                    QuantumCircuit(1), "qiskit", "qiskit", metrics=["missing"]
+                )
+
+        def test_core_statistic_names_cannot_be_registered(self, tranqu: Tranqu):
+            with pytest.raises(StatsMetricAlreadyRegisteredError):
+                tranqu.register_stats_metric("depth", MeasurementCountMetric())
+
+    class TestAsync:
+        def test_transpile_async(self, tranqu: Tranqu):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+
+            result = asyncio.run(
+                tranqu.transpile_async(circuit, "qiskit", "tket", stats="counts")
+            )
+
+            assert result.stats.after.n_gates_2q == 1
+            assert "depth" not in result.stats.after
+
+        def test_transpile_async_timeout(
+            self, tranqu: Tranqu, monkeypatch: pytest.MonkeyPatch
+        ):
+            original = tranqu.transpile
+
+            def slow_transpile(*args: Any, **kwargs: Any) -> Any:
+                time.sleep(0.2)
+                return original(*args, **kwargs)
+
+            monkeypatch.setattr(tranqu, "transpile", slow_transpile)
+
+            with pytest.raises(TranspileTimeoutError):
+                asyncio.run(
+                    tranqu.transpile_async(
+                        QuantumCircuit(1), "qiskit", "qiskit", timeout=0.01
+                    )
+                )
+
+        def test_transpile_as_completed(self, tranqu: Tranqu):
+            circuits = []
+            for n_qubits in range(1, 4):
+                circuit = QuantumCircuit(n_qubits)
+                circuit.h(range(n_qubits))
+                circuits.append(circuit)
+
+            async def main() -> dict[int, Any]:
+                return {
+                    index: result
+                    async for index, result in tranqu.transpile_as_completed(
+                        circuits,
+                        "qiskit",
+                        "qiskit",
+                        transpiler_options=[{"optimization_level": 0}] * 3,
+                        max_concurrency=2,
+                    )
+                }
+
+            results = asyncio.run(main())
+
+            assert sorted(results) == [0, 1, 2]
+            assert all(
+                results[index].stats.before.n_qubits == index + 1 for index in results
+            )
+
+        def test_transpile_as_completed_raises_errors(self, tranqu: Tranqu):
+            async def main() -> None:
+                async for _ in tranqu.transpile_as_completed(
+                    [QuantumCircuit(1)], "qiskit", "qiskit", stats="some"
+                ):
+                    pass
+
+            with pytest.raises(InvalidStatsModeError):
+                asyncio.run(main())
+
+        def test_close_allows_reuse(self, tranqu: Tranqu):
+            asyncio.run(tranqu.transpile_async(QuantumCircuit(1), "qiskit", "qiskit"))
+            tranqu.close()
+
+            result = asyncio.run(
+                tranqu.transpile_async(QuantumCircuit(1), "qiskit", "qiskit")
+            )
+
+            assert result.stats.after.n_qubits == 1
+
+    class TestObservers:
+        def test_observer_receives_stages(self, tranqu: Tranqu):
+            recorder = StageRecorder()
+            tranqu.add_observer(recorder)
+
+            result = tranqu.transpile(QuantumCircuit(1), "qiskit", "qiskit")
+            _ = result.stats.after.depth
+
+            assert [stage for stage, _ in recorder.stages] == [
+                "convert_program",
+                "convert_device",
+                "convert_device",
+                "transpile",
+                "convert_output",
+                "stats",
+            ]
+            assert {lib for _, lib in recorder.stages} == {"qiskit"}
+            assert set(result.cpu_timings) == set(result.timings)
+
+        def test_removed_observer_is_not_notified(self, tranqu: Tranqu):
+            recorder = StageRecorder()
+            tranqu.add_observer(recorder)
+            tranqu.remove_observer(recorder)
+
+            tranqu.transpile(QuantumCircuit(1), "qiskit", "qiskit")
+
+            assert recorder.stages == []
@@ -0,0 +1,265 @@
+import pickle  # noqa: S403
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu import DiskTranspileCache, InMemoryTranspileCache, Tranqu, TranspileResult
+from tranqu.device_converter import PassThroughDeviceConverter
+from tranqu.transpile_cache import InvalidCacheSizeError
+from tranqu.transpiler import Transpiler
+
+
+class CountingTranspiler(Transpiler):
+    def __init__(self, program_lib: str) -> None:
+        super().__init__(program_lib)
+        self.calls = 0
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        self.calls += 1
+        return TranspileResult(program, {}, {})
+
+
+def make_result(name: str) -> TranspileResult:
+    return TranspileResult(name, {"before": {"n_qubits": 1}}, {})
+
+
+def bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    return circuit
+
+
+class TestInMemoryTranspileCache:
+    def test_hit_and_miss(self):
+        cache = InMemoryTranspileCache()
+
+        assert cache.get("key") is None
+        cache.put("key", make_result("a"))
+
+        assert cache.get("key") == make_result("a")
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == pytest.approx(0.5)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryTranspileCache(max_size=2)
+        cache.put("a", make_result("a"))
+        cache.put("b", make_result("b"))
+        cache.get("a")
+
+        cache.put("c", make_result("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_invalid_max_size(self):
+        with pytest.raises(InvalidCacheSizeError):
+            InMemoryTranspileCache(max_size=0)
+
+    def test_hits_are_copies_with_their_own_program(self):
+        cache = InMemoryTranspileCache()
+        stored = TranspileResult("a", {"before": {"n_qubits": 1}}, {}, {"stats": 1.0})
+        cache.put("key", stored)
+        first = cache.get("key")
+        assert first is not None
+
+        first.release_program()
+        stored.release_program()
+        second = cache.get("key")
+
+        assert second is not None
+        assert second is not first
+        assert second.transpiled_program == "a"
+        assert second.stats.to_dict() == first.stats.to_dict()
+        assert list(second.timings) == ["cache_lookup"]
+        assert list(second.cpu_timings) == ["cache_lookup"]
+
+    def test_hits_have_their_own_stats(self):
+        cache = InMemoryTranspileCache()
+        cache.put("key", make_result("a"))
+        first = cache.get("key")
+        assert first is not None
+
+        first.stats.before["n_qubits"] = 5
+        second = cache.get("key")
+
+        assert second is not None
+        assert second.stats.before.n_qubits == 1
+
+    def test_lazy_stats_of_hits_are_computed_once_across_threads(self):
+        calls = []
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+
+        def build() -> dict:
+            calls.append(None)
+            time.sleep(0.01)
+            return {"after": {"depth": 3}}
+
+        cache = InMemoryTranspileCache()
+        cache.put("key", TranspileResult("a", build, {}))
+
+        def read(_: int) -> int:
+            result = cache.get("key")
+            assert result is not None
+            barrier.wait()
+            return result.stats.after.depth
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            depths = list(pool.map(read, range(n_threads)))
+
+        assert depths == [3] * n_threads
+        assert len(calls) == 1
+
+    def test_pickle(self):
+        cache = InMemoryTranspileCache(max_size=2)
+        cache.put("key", make_result("a"))
+
+        restored = pickle.loads(pickle.dumps(cache))  # noqa: S301
+
+        assert restored.get("key") == make_result("a")
+        restored.put("other", make_result("b"))
+        assert len(restored) == 2
+
+
+class TestDiskTranspileCache:
+    def test_entries_survive_new_instances(self, tmp_path: Path):
+        DiskTranspileCache(tmp_path).put("key", make_result("a"))
+
+        cache = DiskTranspileCache(tmp_path)
+
+        assert cache.get("key") == make_result("a")
+        assert cache.stats.hits == 1
+
+    def test_eviction(self, tmp_path: Path):
+        cache = DiskTranspileCache(tmp_path, max_size=1)
+        cache.put("a", make_result("a"))
+        cache.put("b", make_result("b"))
+
+        assert len(cache) == 1
+        assert cache.get("b") is not None
+        assert cache.stats.evictions == 1
+
+    def test_clear(self, tmp_path: Path):
+        cache = DiskTranspileCache(tmp_path)
+        cache.put("a", make_result("a"))
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestTranquWithCache:
+    def test_repeated_request_skips_transpiler(self):
+        cache = InMemoryTranspileCache()
+        tranqu = Tranqu(cache=cache)
+        transpiler = CountingTranspiler(program_lib="qiskit")
+        tranqu.register_transpiler("counting", transpiler)
+
+        first = tranqu.transpile(bell_circuit(), transpiler_lib="counting")
+        second = tranqu.transpile(bell_circuit(), transpiler_lib="counting")
+
+        assert transpiler.calls == 1
+        assert second is not first
+        assert second.transpiled_program is first.transpiled_program
+        assert tranqu.cache is cache
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.parametrize("cache_type", ["memory", "disk"])
+    def test_tranqu_with_cache_can_be_pickled(self, cache_type: str, tmp_path: Path):
+        cache = (
+            InMemoryTranspileCache()
+            if cache_type == "memory"
+            else DiskTranspileCache(tmp_path)
+        )
+        tranqu = Tranqu(cache=cache)
+        tranqu.transpile(bell_circuit(), transpiler_lib="qiskit")
+
+        restored = pickle.loads(pickle.dumps(tranqu))  # noqa: S301
+        restored.transpile(bell_circuit(), transpiler_lib="qiskit")
+
+        assert restored.cache is not None
+        assert restored.cache.stats.hits == 1
+
+    @pytest.mark.parametrize("transpiler_lib", ["qiskit", "tket"])
+    def test_global_phase_is_part_of_the_key(self, transpiler_lib: str):
+        cache = InMemoryTranspileCache()
+        tranqu = Tranqu(cache=cache)
+        circuit = QuantumCircuit(1)
+        circuit.rx(0.1, 0)
+        shifted = circuit.copy()
+        shifted.global_phase = 0.5
+
+        tranqu.transpile(circuit, transpiler_lib=transpiler_lib)
+        result = tranqu.transpile(shifted, transpiler_lib=transpiler_lib)
+
+        assert cache.stats.hits == 0
+        assert result.transpiled_program.global_phase == pytest.approx(0.5)
+
+    def test_tket_phase_is_part_of_the_key(self):
+        cache = InMemoryTranspileCache()
+        tranqu = Tranqu(cache=cache)
+
+        tranqu.transpile(Circuit(1).Rx(0.1, 0), transpiler_lib="tket")
+        result = tranqu.transpile(
+            Circuit(1).Rx(0.1, 0).add_phase(0.5), transpiler_lib="tket"
+        )
+
+        assert cache.stats.hits == 0
+        assert result.transpiled_program.phase == pytest.approx(0.5)
+
+    def test_options_and_device_are_part_of_the_key(self):
+        tranqu = Tranqu(cache=InMemoryTranspileCache())
+        transpiler = CountingTranspiler(program_lib="qiskit")
+        tranqu.register_transpiler("counting", transpiler)
+        device = {"device_id": "dev", "qubits": [], "couplings": []}
+
+        tranqu.transpile(bell_circuit(), transpiler_lib="counting")
+        tranqu.transpile(
+            bell_circuit(),
+            transpiler_lib="counting",
+            transpiler_options={"optimization_level": 1},
+        )
+        tranqu.transpile(
+            bell_circuit(),
+            transpiler_lib="counting",
+            transpiler_options={"optimization_level": 1},
+        )
+        tranqu.register_device_converter(
+            "oqtopus", "counting", PassThroughDeviceConverter()
+        )
+        tranqu.transpile(
+            bell_circuit(),
+            transpiler_lib="counting",
+            device=device,
+            device_lib="oqtopus",
+        )
+
+        assert transpiler.calls == 3
+
+    def test_transpile_many_uses_cache(self):
+        cache = InMemoryTranspileCache()
+        tranqu = Tranqu(cache=cache)
+        tranqu.transpile(bell_circuit(), transpiler_lib="qiskit")
+
+        results = tranqu.transpile_many(
+            [bell_circuit(), QuantumCircuit(1)], transpiler_lib="qiskit"
+        )
+
+        assert cache.stats.hits == 1
+        assert results[1].stats.before.n_qubits == 1
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from tranqu import StageTiming, TranspileContext, TranspileObserver
+from tranqu.transpile_observer import StageTimer
+
+CONTEXT = TranspileContext("qiskit", "tket", None)
+
+
+class RecordingObserver(TranspileObserver):
+    def __init__(self) -> None:
+        self.calls: list[tuple[StageTiming, TranspileContext]] = []
+
+    def on_stage(self, timing: StageTiming, context: TranspileContext) -> None:
+        self.calls.append((timing, context))
+
+
+def busy_wait(seconds: float) -> str:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return "done"
+
+
+class TestStageTimer:
+    def test_records_wall_and_cpu_time(self):
+        timer = StageTimer(CONTEXT, [])
+
+        assert timer.run("transpile", busy_wait, 0.02) == "done"
+
+        assert timer.wall_times["transpile"] >= 0.02
+        assert timer.cpu_times["transpile"] > 0.01
+
+    def test_sleeping_uses_no_cpu_time(self):
+        timer = StageTimer(CONTEXT, [])
+
+        timer.run("transpile", time.sleep, 0.02)
+
+        assert timer.wall_times["transpile"] >= 0.02
+        assert timer.cpu_times["transpile"] < 0.01
+
+    def test_adds_up_repeated_stages(self):
+        timer = StageTimer(CONTEXT, [])
+
+        timer.run("convert_device", busy_wait, 0.01)
+        timer.run("convert_device", busy_wait, 0.01)
+
+        assert timer.wall_times["convert_device"] >= 0.02
+
+    def test_writes_to_given_dictionaries(self):
+        wall_times = {"transpile": 1.0}
+        cpu_times: dict[str, float] = {}
+        timer = StageTimer(CONTEXT, [], wall_times, cpu_times)
+
+        timer.run("stats", dict)
+
+        assert set(wall_times) == {"transpile", "stats"}
+        assert set(cpu_times) == {"stats"}
+
+    def test_notifies_observers(self):
+        observer = RecordingObserver()
+        timer = StageTimer(CONTEXT, [observer])
+        before = time.time()
+
+        timer.run("transpile", busy_wait, 0.01)
+
+        [(timing, context)] = observer.calls
+        assert timing.stage == "transpile"
+        assert timing.wall_time == timer.wall_times["transpile"]
+        assert timing.cpu_time == timer.cpu_times["transpile"]
+        assert before <= timing.start_time <= time.time()
+        assert context == CONTEXT
+
+    def test_records_stages_that_raise(self):
+        observer = RecordingObserver()
+        timer = StageTimer(CONTEXT, [observer])
+
+        def fail() -> None:
+            msg = "failure"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="failure"):
+            timer.run("transpile", fail)
+
+        assert "transpile" in timer.wall_times
+        assert [timing.stage for timing, _ in observer.calls] == ["transpile"]
@@ -1,8 +1,18 @@
+import gc
+import json
+import pickle  # noqa: S403
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
 import pytest
 from qiskit import QuantumCircuit  # type: ignore[import-untyped]
 
 from tranqu import Tranqu
-from tranqu.transpile_result import NestedDictAccessor, TranspileResult
+from tranqu.transpile_result import IntMapping, NestedDictAccessor, TranspileResult
 
 
 @pytest.fixture
@@ -79,6 +89,110 @@ class TestNestedDictAccessor:
         values = accessor.values()
         assert {"value1", "value2"} == set(values)
 
+    def test_callable_is_evaluated_once_on_first_access(self):
+        calls = []
+
+        def build() -> dict:
+            calls.append(None)
+            return {"before": {"depth": 2}}
+
+        accessor = NestedDictAccessor(build)
+
+        assert calls == []
+        assert accessor.before.depth == 2
+        assert accessor["before"]["depth"] == 2
+        assert len(calls) == 1
+
+    def test_callable_is_evaluated_once_across_threads(self):
+        calls = []
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+
+        def build() -> dict:
+            calls.append(None)
+            time.sleep(0.01)
+            return {"after": {"depth": 3}}
+
+        accessor = NestedDictAccessor(build)
+
+        def read(_: int) -> int:
+            barrier.wait()
+            return accessor.after.depth
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            depths = list(pool.map(read, range(n_threads)))
+
+        assert depths == [3] * n_threads
+        assert len(calls) == 1
+
+    def test_pickle_evaluates_callable(self):
+        accessor = NestedDictAccessor(lambda: {"key1": "value1"})
+
+        restored = pickle.loads(pickle.dumps(accessor))  # noqa: S301
+
+        assert restored.key1 == "value1"
+
+
+class TestIntMapping:
+    def test_behaves_like_the_dict(self):
+        source = {0: 2, 1: 0, 2: 1}
+        mapping = IntMapping(source)
+
+        assert mapping == source
+        assert source == mapping
+        assert repr(mapping) == repr(source)
+        assert list(mapping.items()) == list(source.items())
+        assert mapping[1] == 0
+        assert len(mapping) == 3
+
+    def test_keeps_the_order_of_unordered_keys(self):
+        source = {2: 0, 0: 1, 1: 2}
+
+        assert list(IntMapping(source)) == [2, 0, 1]
+
+    def test_missing_key(self):
+        mapping = IntMapping({0: 0, 2: 1})
+
+        assert 1 not in mapping
+        assert mapping.get(5) is None
+        with pytest.raises(KeyError):
+            mapping[1]
+        with pytest.raises(KeyError):
+            mapping[-1]
+
+    def test_set_and_delete(self):
+        mapping = IntMapping({0: 0, 1: 1})
+
+        mapping[1] = 5
+        mapping[2] = 2
+        mapping[4] = 3
+        del mapping[0]
+
+        assert mapping == {1: 5, 2: 2, 4: 3}
+        assert list(mapping) == [1, 2, 4]
+        with pytest.raises(KeyError):
+            del mapping[0]
+        with pytest.raises(TypeError):
+            mapping[0] = -1
+
+    def test_compact(self):
+        assert isinstance(IntMapping.compact({0: 1, 1: 0}), IntMapping)
+        assert isinstance(IntMapping.compact({0: 1, 1000: 0}), dict)
+        assert isinstance(IntMapping.compact({0: -1}), dict)
+        assert isinstance(IntMapping.compact({0: 2**40}), dict)
+
+    def test_pickle(self):
+        mapping = IntMapping({1: 0, 0: 1})
+
+        restored = pickle.loads(pickle.dumps(mapping))  # noqa: S301
+
+        assert restored == mapping
+        assert list(restored) == [1, 0]
+
+
+def circuit_stats(circuit: QuantumCircuit) -> dict:
+    return {"before": {}, "after": {"depth": circuit.depth()}}
+
 
 @pytest.fixture
 def tranqu() -> Tranqu:
@@ -240,9 +354,161 @@ class TestTraspileResult:
         assert hash(result_1) == hash(result_2)
         assert hash(result_1) != hash(result_3)
 
+    def test_transpile_result_hash_with_nested_stats(self):
+        stats = {"after": {"n_gates": 2, "gate_counts": {"h": 1, "cx": 1}}}
+        mapping = {"qubit_mapping": {0: 0}, "bit_mapping": {}}
+
+        result_1 = TranspileResult("dummy_program", stats, mapping)
+        result_2 = TranspileResult("dummy_program", stats, mapping)
+
+        assert hash(result_1) == hash(result_2)
+
     def test_nested_dict_accessor_attribute_error(self, transpile_data: tuple):
         stats, virtual_physical_mapping = transpile_data
         result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
 
         with pytest.raises(AttributeError, match="No such attribute: non_existent"):
             _ = result.stats.non_existent
+
+    def test_transpile_result_pickle(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        restored = pickle.loads(pickle.dumps(result))  # noqa: S301
+
+        assert restored == result
+        assert restored.stats.before.n_gates_1q == 2
+
+    def test_lazy_stats(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        calls: list[None] = []
+
+        def compute_stats() -> dict:
+            calls.append(None)
+            return stats
+
+        result = TranspileResult(
+            "dummy_program", compute_stats, virtual_physical_mapping
+        )
+
+        assert calls == []
+        assert result.stats.before.depth == 2
+        assert result == TranspileResult(
+            "dummy_program", stats, virtual_physical_mapping
+        )
+        assert len(calls) == 1
+
+    def test_lazy_stats_pickle(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult(
+            "dummy_program", lambda: stats, virtual_physical_mapping
+        )
+
+        restored = pickle.loads(pickle.dumps(result))  # noqa: S301
+
+        assert restored.stats.after.n_gates_1q == 0
+        assert restored.to_dict() == result.to_dict()
+
+
+class TestTranspileResultMemory:
+    def test_no_instance_dict(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.stats, "__dict__")
+
+    def test_mappings_are_compact(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        compact = result._virtual_physical_mapping  # noqa: SLF001
+        assert isinstance(compact["qubit_mapping"], IntMapping)
+        mapping_dict = result.to_dict()["virtual_physical_mapping"]
+        assert type(mapping_dict["qubit_mapping"]) is dict
+
+    def test_public_mappings_are_dicts(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        qubit_mapping = result.virtual_physical_mapping.qubit_mapping
+        qubit_mapping[3] = 3
+
+        assert type(qubit_mapping) is dict
+        assert json.dumps(result.virtual_physical_mapping.bit_mapping)
+        assert result.virtual_physical_mapping.qubit_mapping[3] == 3
+        assert result.to_dict()["virtual_physical_mapping"]["qubit_mapping"][3] == 3
+
+    def test_accessors_are_created_on_first_access(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        assert result.to_dict()["stats"] is stats
+        assert result.virtual_physical_mapping is result.virtual_physical_mapping
+        assert result.stats is result.stats
+
+    def test_spill_program_to_path(self, transpile_data: tuple, tmp_path: Path):
+        stats, virtual_physical_mapping = transpile_data
+        circuit = QuantumCircuit(2)
+        circuit.cx(0, 1)
+        result = TranspileResult(circuit, stats, virtual_physical_mapping)
+        path = tmp_path / "program.qpy"
+
+        assert result.spill_program(path) == path
+
+        assert path.exists()
+        assert result.transpiled_program == circuit
+        assert result.transpiled_program is not result.transpiled_program
+
+    def test_spill_program_to_temporary_file(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+
+        path = result.spill_program()
+
+        assert result.transpiled_program == "dummy_program"
+        assert pickle.loads(pickle.dumps(result)) == result  # noqa: S301
+        del result
+        gc.collect()
+        assert not path.exists()
+
+    def test_release_program(self, transpile_data: tuple):
+        stats, virtual_physical_mapping = transpile_data
+        result = TranspileResult("dummy_program", stats, virtual_physical_mapping)
+        path = result.spill_program()
+
+        result.release_program()
+
+        assert result.transpiled_program is None
+        assert not path.exists()
+        assert result.stats.before.depth == 2
+
+    def test_release_program_frees_programs_held_by_lazy_stats(self):
+        circuit = QuantumCircuit(2)
+        circuit.cx(0, 1)
+        result = TranspileResult(circuit, partial(circuit_stats, circuit), {})
+        program = weakref.ref(circuit)
+        del circuit
+
+        result.release_program()
+        gc.collect()
+
+        assert program() is None
+        assert result.stats.after.depth == 1
+
+    @pytest.mark.parametrize("release", ["release_program", "spill_program"])
+    def test_transpiled_programs_are_collected(self, tranqu: Tranqu, release: str):
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        result = tranqu.transpile(circuit, transpiler_lib="qiskit")
+        program = weakref.ref(result.transpiled_program)
+        source = weakref.ref(circuit)
+        del circuit
+
+        getattr(result, release)()
+        gc.collect()
+
+        assert program() is None
+        assert source() is None
+        assert result.stats.before.n_gates_2q == 1
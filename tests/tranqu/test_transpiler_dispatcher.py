@@ -0,0 +1,521 @@
+import io
+from typing import Any
+
+import pytest
+
+from tranqu import StageTiming, TranspileContext, TranspileObserver, TranspileResult
+from tranqu.device_converter import DeviceConverter, DeviceConverterManager
+from tranqu.device_type_manager import DeviceTypeManager
+from tranqu.lazy_import import LazyFactory
+from tranqu.program_converter import ProgramConverter, ProgramConverterManager
+from tranqu.program_type_manager import ProgramTypeManager
+from tranqu.stats_metric import (
+    DurationMetric,
+    GateCountsMetric,
+    QiskitDeviceProperties,
+    StatsMetricManager,
+)
+from tranqu.transpiler import TranspileHints, Transpiler, TranspilerManager
+from tranqu.transpiler_dispatcher import (
+    DeviceConversionPathNotFoundError,
+    ProgramConversionPathNotFoundError,
+    TranspilerDispatcher,
+)
+
+
+class RecordingTranspiler(Transpiler):
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,
+    ) -> TranspileResult:
+        return TranspileResult((program, device), {}, {})
+
+
+class EagerStatsTranspiler(Transpiler):
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        stats = {
+            "before": {"n_gates": 1, "depth": 1},
+            "after": {"n_gates": 1, "depth": 1},
+        }
+        return TranspileResult(program, stats, {})
+
+
+class HintsRecordingTranspiler(Transpiler):
+    def __init__(self, program_lib: str) -> None:
+        super().__init__(program_lib)
+        self.hints: list[TranspileHints] = []
+
+    def transpile(
+        self,
+        program: Any,
+        options: dict | None = None,  # noqa: ARG002
+        device: Any | None = None,  # noqa: ARG002
+    ) -> TranspileResult:
+        return TranspileResult(program, {}, {})
+
+    def transpile_with_hints(
+        self,
+        program: Any,
+        options: dict | None = None,
+        device: Any | None = None,
+        *,
+        hints: TranspileHints,
+    ) -> TranspileResult:
+        self.hints.append(hints)
+        return self.transpile(program, options, device)
+
+
+class RecordingObserver(TranspileObserver):
+    def __init__(self) -> None:
+        self.calls: list[tuple[StageTiming, TranspileContext]] = []
+
+    def on_stage(self, timing: StageTiming, context: TranspileContext) -> None:
+        self.calls.append((timing, context))
+
+
+class FakeBackend:
+    target = "target"
+
+
+class BackendConverter(DeviceConverter):
+    def convert(self, device: Any) -> Any:  # noqa: ARG002
+        return FakeBackend()
+
+
+class TaggingConverter(ProgramConverter, DeviceConverter):
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+    def convert(self, value: Any) -> Any:
+        return f"{value}>{self.tag}"
+
+
+class CountingProgramConverterManager(ProgramConverterManager):
+    def __init__(self, *, adaptive_routing: bool = False) -> None:
+        super().__init__(adaptive_routing=adaptive_routing)
+        self.lookups = 0
+
+    def has_converter(self, from_lib: str, to_lib: str) -> bool:
+        self.lookups += 1
+        return super().has_converter(from_lib, to_lib)
+
+
+class TestTranspilerDispatcher:
+    def setup_method(self):
+        self.transpiler_manager = TranspilerManager()
+        self.program_converter_manager = CountingProgramConverterManager()
+        self.device_converter_manager = DeviceConverterManager()
+        self.dispatcher = TranspilerDispatcher(
+            self.transpiler_manager,
+            self.program_converter_manager,
+            self.device_converter_manager,
+            ProgramTypeManager(),
+            DeviceTypeManager(),
+        )
+        self.transpiler_manager.register_transpiler(
+            "enigma", RecordingTranspiler(program_lib="enigma")
+        )
+
+    def dispatch(
+        self,
+        program_lib: str = "foo",
+        device: Any | None = None,
+        output_lib: str | None = "input",
+    ) -> Any:
+        return self.dispatcher.dispatch(
+            "program",
+            program_lib,
+            "enigma",
+            None,
+            device,
+            None if device is None else "bar",
+            output_lib=output_lib,
+        )
+
+    def test_direct_conversion(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+        self.device_converter_manager.register_converter(
+            "bar", "enigma", TaggingConverter("enigma")
+        )
+
+        result = self.dispatch(device="device")
+
+        assert result.transpiled_program == ("('program>enigma', 'device>enigma')>foo")
+
+    def test_conversion_via_qiskit(self):
+        self.program_converter_manager.register_converter(
+            "foo", "qiskit", TaggingConverter("qiskit")
+        )
+        self.program_converter_manager.register_converter(
+            "qiskit", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+
+        result = self.dispatch()
+
+        assert result.transpiled_program == "('program>qiskit>enigma', None)>foo"
+
+    def test_route_is_reused_across_calls(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+
+        self.dispatch()
+        lookups = self.program_converter_manager.lookups
+        self.dispatch()
+        self.dispatch()
+
+        assert self.program_converter_manager.lookups == lookups
+
+    def test_route_is_rebuilt_after_registration(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+        self.dispatch()
+
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("other"), allow_override=True
+        )
+        result = self.dispatch()
+
+        assert result.transpiled_program == "('program>other', None)>foo"
+
+    def test_program_path_not_found(self):
+        with pytest.raises(
+            ProgramConversionPathNotFoundError,
+            match=r"No ProgramConverter path found to convert from foo to enigma",
+        ):
+            self.dispatch()
+
+    def test_device_path_not_found(self):
+        with pytest.raises(
+            DeviceConversionPathNotFoundError,
+            match=r"No DeviceConverter path found to convert from bar to enigma",
+        ):
+            self.dispatch(program_lib="enigma", device="device")
+
+    def test_missing_path_is_found_after_registration(self):
+        with pytest.raises(ProgramConversionPathNotFoundError):
+            self.dispatch(program_lib="foo")
+
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+
+        assert self.dispatch().transpiled_program == "('program>enigma', None)>foo"
+
+    def test_conversion_along_custom_chain(self):
+        self.program_converter_manager.register_converter(
+            "foo", "bar", TaggingConverter("bar")
+        )
+        self.program_converter_manager.register_converter(
+            "bar", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+
+        result = self.dispatch()
+
+        assert result.transpiled_program == "('program>bar>enigma', None)>foo"
+
+    def test_conversion_along_cheapest_chain(self):
+        for from_lib, to_lib, cost in [
+            ("foo", "qiskit", 1.0),
+            ("qiskit", "enigma", 1.0),
+            ("foo", "bar", 0.1),
+            ("bar", "enigma", 0.1),
+            ("enigma", "foo", None),
+        ]:
+            self.program_converter_manager.register_converter(
+                from_lib, to_lib, TaggingConverter(to_lib), cost=cost
+            )
+
+        result = self.dispatch()
+
+        assert result.transpiled_program == "('program>bar>enigma', None)>foo"
+
+    def test_conversion_latency_is_recorded_with_adaptive_routing(self):
+        self.program_converter_manager = CountingProgramConverterManager(
+            adaptive_routing=True
+        )
+        self.dispatcher = TranspilerDispatcher(
+            self.transpiler_manager,
+            self.program_converter_manager,
+            self.device_converter_manager,
+            ProgramTypeManager(),
+            DeviceTypeManager(),
+        )
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+        revision = self.program_converter_manager.revision
+
+        self.dispatch()
+
+        assert self.program_converter_manager.revision != revision
+
+    def test_conversion_latency_does_not_change_routes_by_default(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "foo", TaggingConverter("foo")
+        )
+        revision = self.program_converter_manager.revision
+
+        self.dispatch()
+
+        assert self.program_converter_manager.revision == revision
+
+    def test_native_output_skips_back_conversion(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+
+        result = self.dispatch(output_lib="native")
+
+        assert result.transpiled_program == ("program>enigma", None)
+
+    def test_output_lib_none_skips_back_conversion(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+
+        result = self.dispatch(output_lib=None)
+
+        assert result.transpiled_program is None
+        assert "convert_output" in result.timings
+
+    def test_output_to_other_lib(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", TaggingConverter("enigma")
+        )
+        self.program_converter_manager.register_converter(
+            "enigma", "bar", TaggingConverter("bar")
+        )
+
+        result = self.dispatch(output_lib="bar")
+
+        assert result.transpiled_program == "('program>enigma', None)>bar"
+
+    @pytest.mark.parametrize(
+        ("stats", "expected"),
+        [
+            ("full", {"n_gates": 1, "depth": 1}),
+            ("counts", {"n_gates": 1}),
+            ("none", None),
+        ],
+    )
+    def test_stats_mode_applies_to_transpilers_without_hints(
+        self, stats: str, expected: dict[str, int] | None
+    ):
+        self.transpiler_manager.register_transpiler(
+            "eager", EagerStatsTranspiler(program_lib="foo")
+        )
+
+        result = self.dispatcher.dispatch(
+            "program", "foo", "eager", None, None, None, stats=stats
+        )
+
+        assert result.to_dict()["stats"].get("before") == expected
+
+
+class TestPrepare:
+    def setup_method(self):
+        self.transpiler_manager = TranspilerManager()
+        self.program_converter_manager = ProgramConverterManager()
+        self.dispatcher = TranspilerDispatcher(
+            self.transpiler_manager,
+            self.program_converter_manager,
+            DeviceConverterManager(),
+            ProgramTypeManager(),
+            DeviceTypeManager(),
+        )
+        self.transpiler = RecordingTranspiler(program_lib="enigma")
+        self.transpiler_manager.register_transpiler("enigma", self.transpiler)
+
+    def test_converters_are_created(self):
+        self.program_converter_manager.register_converter(
+            "foo", "enigma", LazyFactory(__name__, "TaggingConverter", {"tag": "e"})
+        )
+
+        program, transpiler = self.dispatcher.prepare(
+            "program", "foo", "enigma", None, None, "native"
+        )
+
+        assert program == "program"
+        assert transpiler is self.transpiler
+        assert isinstance(
+            self.program_converter_manager._converters["foo", "enigma"],  # noqa: SLF001
+            TaggingConverter,
+        )
+
+    def test_openqasm3_source_is_read(self):
+        self.program_converter_manager.register_converter(
+            "openqasm3", "enigma", TaggingConverter("e")
+        )
+
+        program, _ = self.dispatcher.prepare(
+            io.StringIO("OPENQASM 3.0;\n"), "openqasm3", "enigma", None, None, None
+        )
+
+        assert program == "OPENQASM 3.0;\n"
+
+
+class TestObservers:
+    def setup_method(self):
+        self.transpiler_manager = TranspilerManager()
+        self.transpiler_manager.register_transpiler(
+            "eager", EagerStatsTranspiler(program_lib="foo")
+        )
+        self.observer = RecordingObserver()
+        self.observers: list[TranspileObserver] = [self.observer]
+        program_type_manager = ProgramTypeManager()
+        program_type_manager.register_type("foo", str)
+        self.dispatcher = TranspilerDispatcher(
+            self.transpiler_manager,
+            ProgramConverterManager(),
+            DeviceConverterManager(),
+            program_type_manager,
+            DeviceTypeManager(),
+            observers=self.observers,
+        )
+
+    def stages(self) -> list[str]:
+        return [timing.stage for timing, _ in self.observer.calls]
+
+    def test_stages_are_reported_in_order(self):
+        result = self.dispatcher.dispatch("program", "foo", "eager", None, None, None)
+
+        assert self.stages() == [
+            "convert_program",
+            "convert_device",
+            "convert_device",
+            "transpile",
+            "convert_output",
+        ]
+        assert {context for _, context in self.observer.calls} == {
+            TranspileContext("foo", "eager", None)
+        }
+        assert set(result.cpu_timings) == set(result.timings)
+
+    def test_stats_stage_is_reported_when_stats_are_computed(self):
+        result = self.dispatcher.dispatch("program", "foo", "eager", None, None, None)
+        assert "stats" not in result.timings
+
+        assert result.stats.after.n_gates == 1
+
+        assert self.stages()[-1] == "stats"
+        assert "stats" in result.timings
+        assert "stats" in result.cpu_timings
+
+    def test_no_stats_stage_without_stats(self):
+        result = self.dispatcher.dispatch(
+            "program", "foo", "eager", None, None, None, stats="none"
+        )
+
+        assert result.stats.to_dict() == {}
+        assert "stats" not in self.stages()
+
+    def test_observers_added_later_are_notified(self):
+        late_observer = RecordingObserver()
+        self.observers.append(late_observer)
+
+        self.dispatcher.dispatch("program", "foo", "eager", None, None, None)
+
+        assert len(late_observer.calls) == len(self.observer.calls)
+
+    def test_shared_stages_of_a_batch_are_reported_once(self):
+        results = self.dispatcher.dispatch_many(
+            ["a", "b", "c"], "foo", "eager", None, None, None
+        )
+
+        assert self.stages().count("transpile") == 1
+        assert self.stages().count("convert_program") == 3
+        assert {context.batch_size for _, context in self.observer.calls} == {3}
+        shared_transpile = next(
+            timing.wall_time
+            for timing, _ in self.observer.calls
+            if timing.stage == "transpile"
+        )
+        assert results[0].timings["transpile"] == pytest.approx(shared_transpile / 3)
+
+    def test_batch_stages_report_the_resolved_program_lib(self):
+        self.dispatcher.dispatch_many(["a", "b"], None, "eager", None, None, None)
+
+        assert {context.program_lib for _, context in self.observer.calls} == {"foo"}
+
+
+class TestStatsMetrics:
+    def setup_method(self):
+        self.transpiler = HintsRecordingTranspiler(program_lib="foo")
+        self.transpiler_manager = TranspilerManager()
+        self.transpiler_manager.register_transpiler("recording", self.transpiler)
+        self.device_converter_manager = DeviceConverterManager()
+        self.device_converter_manager.register_converter(
+            "bar", "recording", TaggingConverter("recording")
+        )
+        stats_metric_manager = StatsMetricManager()
+        stats_metric_manager.register_metric("gate_counts", GateCountsMetric())
+        stats_metric_manager.register_metric("duration", DurationMetric())
+        self.dispatcher = TranspilerDispatcher(
+            self.transpiler_manager,
+            ProgramConverterManager(),
+            self.device_converter_manager,
+            ProgramTypeManager(),
+            DeviceTypeManager(),
+            stats_metric_manager=stats_metric_manager,
+        )
+
+    def dispatch(self, metrics: list[str]) -> TranspileHints:
+        self.dispatcher.dispatch(
+            "program", "foo", "recording", None, "device", "bar", metrics=metrics
+        )
+        return self.transpiler.hints[-1]
+
+    def test_metrics_are_passed_in_hints(self):
+        hints = self.dispatch(["gate_counts"])
+
+        assert list(hints.metrics) == ["gate_counts"]
+        assert hints.device_properties is None
+
+    def test_device_metrics_receive_qiskit_device_properties(self):
+        self.device_converter_manager.register_converter(
+            "bar", "qiskit", BackendConverter()
+        )
+
+        hints = self.dispatch(["duration"])
+
+        assert isinstance(hints.device_properties, QiskitDeviceProperties)
+
+    def test_device_properties_are_none_without_qiskit_device(self):
+        hints = self.dispatch(["duration"])
+
+        assert hints.device_properties is None
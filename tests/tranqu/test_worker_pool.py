@@ -0,0 +1,93 @@
+# mypy: disable-error-code="import-untyped"
+
+from collections.abc import Iterator
+
+import pytest
+from pytket import Circuit  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit
+
+from tranqu import Tranqu, TranquWorkerPool
+from tranqu.program_converter import ProgramConverter
+from tranqu.transpiler_dispatcher import InvalidStatsModeError
+from tranqu.worker_pool import WorkerPoolClosedError
+
+
+class ReversingConverter(ProgramConverter):
+    def convert(self, program: str) -> str:
+        return program[::-1]
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[TranquWorkerPool]:
+    with TranquWorkerPool(max_workers=2, warm_up_transpilers=["qiskit"]) as pool:
+        pool.start()
+        yield pool
+
+
+def bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    return circuit
+
+
+class TestTranquWorkerPool:
+    def test_transpile(self, pool: TranquWorkerPool):
+        result = pool.transpile(bell_circuit(), "qiskit", "qiskit")
+
+        assert isinstance(result.transpiled_program, QuantumCircuit)
+        assert result.stats.before.n_gates == 2
+        assert result.virtual_physical_mapping.qubit_mapping == {0: 0, 1: 1}
+        assert "transpile" in result.timings
+
+    def test_tket_programs(self, pool: TranquWorkerPool):
+        result = pool.transpile(Circuit(2).H(0).CX(0, 1), "tket", "tket")
+
+        assert isinstance(result.transpiled_program, Circuit)
+        assert result.stats.after.n_gates_2q == 1
+
+    def test_transpile_many_returns_results_in_order(self, pool: TranquWorkerPool):
+        circuits = [QuantumCircuit(n_qubits) for n_qubits in range(1, 6)]
+
+        results = pool.transpile_many(
+            circuits,
+            "qiskit",
+            "tket",
+            transpiler_options=[{"optimization_level": 0}] * 5,
+            stats="counts",
+        )
+
+        assert [result.stats.before.n_qubits for result in results] == [1, 2, 3, 4, 5]
+        assert all("depth" not in result.stats.after for result in results)
+
+    def test_submit_returns_future(self, pool: TranquWorkerPool):
+        future = pool.submit(bell_circuit(), "qiskit", "qiskit", output_lib=None)
+
+        assert future.result().transpiled_program is None
+
+    def test_errors_are_raised_in_the_caller(self, pool: TranquWorkerPool):
+        with pytest.raises(InvalidStatsModeError):
+            pool.transpile(bell_circuit(), "qiskit", "qiskit", stats="some")
+
+    def test_workers_use_registrations_of_the_given_tranqu(self):
+        tranqu = Tranqu()
+        tranqu.register_program_converter("reversed", "openqasm3", ReversingConverter())
+        tranqu.register_program_converter("openqasm3", "reversed", ReversingConverter())
+        program = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[1] q;
+x q[0];
+"""
+
+        with TranquWorkerPool(tranqu, max_workers=1) as pool:
+            result = pool.transpile(program[::-1], "reversed", "qiskit")
+
+        assert result.transpiled_program.endswith(";0.3 MSAQNEPO")
+        assert result.stats.before.n_gates == 1
+
+    def test_closed_pool_rejects_requests(self):
+        pool = TranquWorkerPool(max_workers=1)
+        pool.close()
+
+        with pytest.raises(WorkerPoolClosedError):
+            pool.transpile(bell_circuit(), "qiskit", "qiskit")
@@ -0,0 +1,120 @@
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit import transpile as qiskit_transpile  # type: ignore[import-untyped]
+from qiskit.circuit.random import random_circuit  # type: ignore[import-untyped]
+from qiskit.qasm3 import dumps, loads  # type: ignore[import-untyped]
+
+from tranqu.transpiler.openqasm3_stats_scanner import (
+    Openqasm3ScanError,
+    Openqasm3StatsScanner,
+)
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+
+OUQU_TP_STYLE_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+
+// q[0] --> q[1]
+// q[1] --> q[0]
+qreg q[3];
+creg c[2];
+sx q[0];
+rz(pi/2) q[1];
+cx q[0],q[1];
+barrier q[0], q[2];
+reset q[2];
+c[0] = measure q[0];
+measure q[1] -> c[1];
+"""
+
+BROADCAST_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+qubit r;
+bit[2] c;
+h q;
+cx q, r;
+/* measure everything */
+c = measure q;
+"""
+
+BARRIER_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+x q[0];
+barrier q[0], q[1];
+x q[1];
+barrier;
+x q[2];
+"""
+
+
+def transpiled_random_programs() -> list[str]:
+    programs: list[str] = []
+    for seed in range(20):
+        circuit = random_circuit(4, 5, max_operands=2, measure=True, seed=seed)
+        transpiled = qiskit_transpile(
+            circuit, basis_gates=["rz", "sx", "x", "cx"], seed_transpiler=seed
+        )
+        programs.extend((
+            dumps(transpiled),
+            dumps(transpiled.remove_final_measurements(inplace=False)),
+        ))
+    return programs
+
+
+class TestOpenqasm3StatsScanner:
+    @pytest.mark.parametrize(
+        "program",
+        [
+            OUQU_TP_STYLE_PROGRAM,
+            BROADCAST_PROGRAM,
+            BARRIER_PROGRAM,
+            *transpiled_random_programs(),
+        ],
+    )
+    def test_matches_qiskit_stats_extractor(self, program: str):
+        circuit = loads(program)
+
+        result = Openqasm3StatsScanner().scan(program)
+
+        assert result.stats == QiskitStatsExtractor().extract_stats_from(circuit)
+        assert result.n_clbits == circuit.num_clbits
+
+    def test_extract_stats_from(self):
+        stats = Openqasm3StatsScanner().extract_stats_from(OUQU_TP_STYLE_PROGRAM)
+
+        assert stats == {
+            "n_qubits": 3,
+            "n_gates": 3,
+            "n_gates_1q": 2,
+            "n_gates_2q": 1,
+            "depth": 3,
+        }
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "gate g a { h a; }",
+            "if (c[0]) x q[0];",
+            "ctrl @ x q[0], q[1];",
+            "float[64] theta = 0.5;",
+            "measure q[0];",
+            "delay[100ns] q[0];",
+            "x $0;",
+            "x q;\nx $3;",
+            "x r[0];",
+            "x q[5];",
+        ],
+    )
+    def test_unsupported_statement(self, statement: str):
+        program = f"OPENQASM 3.0;\nqubit[2] q;\nbit[2] c;\n{statement}\n"
+
+        with pytest.raises(Openqasm3ScanError):
+            Openqasm3StatsScanner().scan(program)
+
+    def test_empty_circuit(self):
+        circuit = QuantumCircuit(2)
+
+        result = Openqasm3StatsScanner().scan(dumps(circuit))
+
+        assert result.stats == QiskitStatsExtractor().extract_stats_from(circuit)
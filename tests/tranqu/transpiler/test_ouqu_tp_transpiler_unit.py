@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field
+
+import pytest
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+
+from tranqu.stats_metric import (
+    DeviceProperties,
+    GateCountsMetric,
+    InstructionProperties,
+    SuccessProbabilityMetric,
+)
+from tranqu.transpiler import TranspileHints
+from tranqu.transpiler import ouqu_tp_transpiler as ouqu_tp_module
+from tranqu.transpiler.ouqu_tp_transpiler import (
+    OuquTpTranspiler,
+    OuquTpTranspilerError,
+)
+
+SOURCE_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+h q[0];
+cx q[0], q[1];
+c = measure q;
+"""
+
+TRANSPILED_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+// q[0] --> q[1]
+// q[1] --> q[0]
+qreg q[2];
+creg c[2];
+rz(pi/2) q[1];
+sx q[1];
+rz(pi/2) q[1];
+cx q[1],q[0];
+c[0] = measure q[1];
+c[1] = measure q[0];
+"""
+
+
+@dataclass
+class FakeResponse:
+    status: str
+    message: str
+    qasm: str
+    qubit_mapping: dict[int, int] = field(default_factory=dict)
+
+
+class FakeOuquTp:
+    def __init__(self, response: FakeResponse) -> None:
+        self.response = response
+
+    def transpile(self, qasm: str, device: str | None = None) -> FakeResponse:  # noqa: ARG002
+        return self.response
+
+
+class UniformDeviceProperties(DeviceProperties):
+    def instruction_properties(
+        self,
+        name: str,  # noqa: ARG002
+        qubits: tuple[int, ...],  # noqa: ARG002
+    ) -> InstructionProperties | None:
+        return InstructionProperties(error=0.5)
+
+
+@pytest.fixture
+def transpiler() -> OuquTpTranspiler:
+    transpiler = OuquTpTranspiler(program_lib="openqasm3")
+    transpiler._ouqu_tp = FakeOuquTp(  # noqa: SLF001
+        FakeResponse("SUCCESS", "", TRANSPILED_PROGRAM, {0: 1, 1: 0})
+    )
+    return transpiler
+
+
+@pytest.fixture
+def forbid_loads(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(_program: str) -> None:
+        pytest.fail("The program should not be parsed.")
+
+    monkeypatch.setattr(ouqu_tp_module, "loads", fail)
+
+
+@pytest.mark.usefixtures("forbid_loads")
+def test_transpile_without_parsing(transpiler: OuquTpTranspiler) -> None:
+    result = transpiler.transpile(SOURCE_PROGRAM)
+
+    assert result.stats.before.n_gates == 2
+    assert result.stats.after.n_gates_1q == 3
+    assert result.stats.after.n_gates_2q == 1
+    assert result.stats.after.depth == 5
+    assert result.virtual_physical_mapping.qubit_mapping == {1: 0, 0: 1}
+    assert result.virtual_physical_mapping.bit_mapping == {0: 0, 1: 1}
+
+
+@pytest.mark.usefixtures("forbid_loads")
+def test_before_stats_from_qiskit_source(transpiler: OuquTpTranspiler) -> None:
+    circuit = QuantumCircuit(3)
+    circuit.h(0)
+
+    result = transpiler.transpile_with_hints(
+        SOURCE_PROGRAM,
+        hints=TranspileHints(source_programs={"qiskit": circuit}),
+    )
+
+    assert result.stats.before.n_qubits == 3
+
+
+def test_falls_back_to_parsing_unsupported_programs(
+    transpiler: OuquTpTranspiler,
+) -> None:
+    program = """OPENQASM 3.0;
+include "stdgates.inc";
+gate g a { h a; }
+qubit[1] q;
+g q[0];
+"""
+
+    result = transpiler.transpile(program)
+
+    assert result.stats.before.n_gates == 1
+
+
+def test_failure_is_raised(transpiler: OuquTpTranspiler) -> None:
+    transpiler._ouqu_tp = FakeOuquTp(FakeResponse("FAILURE", "boom", ""))  # noqa: SLF001
+
+    with pytest.raises(OuquTpTranspilerError, match="boom"):
+        transpiler.transpile(SOURCE_PROGRAM)
+
+
+def test_metrics_parse_both_programs(transpiler: OuquTpTranspiler) -> None:
+    hints = TranspileHints(
+        metrics={
+            "gate_counts": GateCountsMetric(),
+            "success_probability": SuccessProbabilityMetric(),
+        },
+        device_properties=UniformDeviceProperties(),
+    )
+
+    result = transpiler.transpile_with_hints(SOURCE_PROGRAM, hints=hints)
+
+    assert result.stats.before.gate_counts.to_dict() == {
+        "h": 1,
+        "cx": 1,
+        "measure": 2,
+    }
+    assert result.stats.before.success_probability is None
+    assert result.stats.after.gate_counts.to_dict() == {
+        "rz": 2,
+        "sx": 1,
+        "cx": 1,
+        "measure": 2,
+    }
+    assert result.stats.after.success_probability == pytest.approx(0.5**6)
+    assert result.stats.after.depth == 5
@@ -0,0 +1,135 @@
+# mypy: disable-error-code="import-untyped"
+
+from itertools import pairwise
+
+import pytest
+from qiskit import QuantumCircuit, transpile
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import InstructionProperties, Target
+
+from tranqu.transpiler.qiskit_retranspiler import QiskitRetranspiler
+
+LINE = [[0, 1], [1, 2], [2, 3], [3, 4]]
+
+
+def line_backend() -> GenericBackendV2:
+    return GenericBackendV2(
+        5, basis_gates=["cx", "rz", "sx", "x"], coupling_map=LINE, seed=1
+    )
+
+
+def degrade(target: Target, qubits: set[int]) -> None:
+    """Give the specified qubits high error rates."""
+    for name in ("sx", "x", "measure"):
+        for qubit in qubits:
+            target.update_instruction_properties(
+                name, (qubit,), InstructionProperties(error=0.3)
+            )
+    for qargs in target["cx"]:
+        error = 0.4 if set(qargs) & qubits else 0.001
+        target.update_instruction_properties(
+            "cx", qargs, InstructionProperties(error=error)
+        )
+
+
+def ghz_on(qubits: list[int], n_qubits: int = 5) -> QuantumCircuit:
+    circuit = QuantumCircuit(n_qubits, len(qubits))
+    circuit.h(qubits[0])
+    for control, target in pairwise(qubits):
+        circuit.cx(control, target)
+    circuit.measure(qubits, range(len(qubits)))
+    return circuit
+
+
+@pytest.fixture
+def retranspiler() -> QiskitRetranspiler:
+    return QiskitRetranspiler()
+
+
+class TestQiskitRetranspiler:
+    class TestFits:
+        def test_coupled_gates_fit(self, retranspiler: QiskitRetranspiler):
+            circuit = ghz_on([2, 1, 0])
+
+            assert retranspiler.fits(circuit, line_backend().target)
+
+        def test_uncoupled_gate_does_not_fit(self, retranspiler: QiskitRetranspiler):
+            circuit = QuantumCircuit(5)
+            circuit.cx(0, 2)
+
+            assert not retranspiler.fits(circuit, line_backend().target)
+
+        def test_too_many_qubits_do_not_fit(self, retranspiler: QiskitRetranspiler):
+            assert not retranspiler.fits(QuantumCircuit(6), line_backend().target)
+
+        def test_barriers_are_ignored(self, retranspiler: QiskitRetranspiler):
+            circuit = QuantumCircuit(5)
+            circuit.barrier()
+
+            assert retranspiler.fits(circuit, line_backend().target)
+
+    class TestRetranspile:
+        def test_moves_to_qubits_with_lower_errors(
+            self, retranspiler: QiskitRetranspiler
+        ):
+            backend = line_backend()
+            degrade(backend.target, {0, 1, 2})
+            circuit = ghz_on([0, 1, 2])
+
+            retranspiled = retranspiler.retranspile(
+                circuit, {0: 0, 1: 1, 2: 2}, backend.target
+            )
+
+            assert retranspiled is not None
+            program, qubit_mapping = retranspiled
+            assert set(qubit_mapping.values()) == {2, 3, 4}
+            for instruction in program.data:
+                if instruction.operation.name == "cx":
+                    qubits = [program.find_bit(q).index for q in instruction.qubits]
+                    assert tuple(qubits) in backend.target["cx"]
+
+        def test_keeps_the_layout_when_it_is_still_best(
+            self, retranspiler: QiskitRetranspiler
+        ):
+            backend = line_backend()
+            degrade(backend.target, {0, 1})
+            circuit = ghz_on([2, 3, 4])
+
+            retranspiled = retranspiler.retranspile(
+                circuit, {0: 4, 1: 3, 2: 2}, backend.target
+            )
+
+            assert retranspiled is not None
+            assert retranspiled[1] == {0: 4, 1: 3, 2: 2}
+
+        def test_translates_to_the_basis_of_the_target(
+            self, retranspiler: QiskitRetranspiler
+        ):
+            circuit = transpile(
+                ghz_on([0, 1]),
+                basis_gates=["cz", "rz", "sx", "x"],
+                coupling_map=LINE,
+                optimization_level=0,
+            )
+            target = line_backend().target
+
+            retranspiled = retranspiler.retranspile(circuit, None, target)
+
+            assert retranspiled is not None
+            assert set(retranspiled[0].count_ops()) <= {
+                "cx",
+                "rz",
+                "sx",
+                "x",
+                "measure",
+            }
+
+        def test_returns_none_when_the_topology_changed(
+            self, retranspiler: QiskitRetranspiler
+        ):
+            circuit = QuantumCircuit(5)
+            circuit.cx(0, 4)
+
+            assert (
+                retranspiler.retranspile(circuit, None, line_backend().target) is None
+            )
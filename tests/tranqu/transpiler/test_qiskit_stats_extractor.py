@@ -2,11 +2,82 @@
 
 from __future__ import annotations
 
+import pytest
 from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, Qubit
+from qiskit.circuit.classical import expr, types
+from qiskit.circuit.random import random_circuit
 
+from tranqu.stats_metric import GateCountsMetric, MeasurementCountMetric
 from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
 
 
+def reference_stats(circuit: QuantumCircuit) -> dict[str, int]:
+    # Counts each statistic in its own pass, as the extractor used to
+    gates = [
+        instruction
+        for instruction in circuit.data
+        if instruction.operation.name not in QiskitStatsExtractor._NON_GATE_OPERATION  # noqa: SLF001
+    ]
+    return {
+        "n_qubits": circuit.num_qubits,
+        "n_gates": len(gates),
+        "n_gates_1q": sum(1 for gate in gates if len(gate.qubits) == 1),
+        "n_gates_2q": sum(1 for gate in gates if len(gate.qubits) == 2),
+        "depth": circuit.depth(),
+    }
+
+
+def corpus() -> list[QuantumCircuit]:
+    circuits = []
+    for seed in range(30):
+        circuit = random_circuit(
+            5,
+            8,
+            max_operands=3,
+            measure=seed % 2 == 0,
+            conditional=seed % 3 == 0,
+            reset=seed % 4 == 0,
+            seed=seed,
+        )
+        circuit.name = f"random_{seed}"
+        circuits.append(circuit)
+
+    directives = QuantumCircuit(3, 2, name="directives")
+    directives.h(0)
+    directives.barrier(0, 1)
+    directives.x(1)
+    directives.delay(100, 2)
+    directives.initialize([0, 1], 2)
+    directives.ccx(0, 1, 2)
+    directives.measure([0, 1], [0, 1])
+    directives.barrier()
+    directives.cx(2, 0)
+    circuits.append(directives)
+
+    control_flow = QuantumCircuit(2, 2, name="control_flow")
+    control_flow.h(0)
+    control_flow.measure(0, 0)
+    with control_flow.if_test((control_flow.clbits[0], True)):
+        control_flow.x(1)
+    control_flow.cx(0, 1)
+    circuits.append(control_flow)
+
+    variables = QuantumCircuit(2, 1, name="variables")
+    flag = variables.add_var("flag", expr.lift(True, type=types.Bool()))  # noqa: FBT003
+    variables.h(0)
+    variables.store(flag, expr.logic_not(flag))
+    variables.cx(0, 1)
+    circuits.append(variables)
+
+    loose_bits = QuantumCircuit([Qubit(), Qubit(), Clbit()], name="loose_bits")
+    loose_bits.h(0)
+    loose_bits.cx(0, 1)
+    loose_bits.measure(1, 0)
+    circuits.extend((loose_bits, QuantumCircuit(name="no_bits")))
+    return circuits
+
+
 class TestQiskitStatsExtractor:
     def test_simple_circuit_counts(self) -> None:
         """Check that basic 1-qubit / 2-qubit gate counts are correct."""
@@ -65,3 +136,57 @@ class TestQiskitStatsExtractor:
         assert stats["n_gates_1q"] == 0
         assert stats["n_gates_2q"] == 0
         assert stats["depth"] == 0
+
+    @pytest.mark.parametrize("circuit", corpus(), ids=lambda circuit: circuit.name)
+    def test_matches_reference_on_corpus(self, circuit: QuantumCircuit) -> None:
+        """Check that the single-pass extraction equals the multi-pass one."""
+        extractor = QiskitStatsExtractor()
+
+        assert extractor.extract_stats_from(circuit) == reference_stats(circuit)
+
+    def test_depth_can_be_skipped(self) -> None:
+        """Check that the depth is omitted when it is not requested."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        stats = QiskitStatsExtractor().extract_stats_from(circuit, depth=False)
+
+        assert stats == {"n_qubits": 2, "n_gates": 2, "n_gates_1q": 1, "n_gates_2q": 1}
+
+    def test_metrics_are_added_to_the_stats(self) -> None:
+        """Check that metrics are computed alongside the core statistics."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        stats = QiskitStatsExtractor().extract_stats_from(
+            circuit,
+            metrics={
+                "gate_counts": GateCountsMetric(),
+                "n_measurements": MeasurementCountMetric(),
+            },
+        )
+
+        assert stats == {
+            "n_qubits": 2,
+            "n_gates": 2,
+            "n_gates_1q": 1,
+            "n_gates_2q": 1,
+            "depth": 3,
+            "gate_counts": {"h": 1, "cx": 1, "measure": 2},
+            "n_measurements": 2,
+        }
+
+    @pytest.mark.parametrize("circuit", corpus())
+    def test_metrics_do_not_change_the_core_statistics(
+        self, circuit: QuantumCircuit
+    ) -> None:
+        """Check that feeding metrics does not disturb the single pass."""
+        stats = QiskitStatsExtractor().extract_stats_from(
+            circuit, metrics={"gate_counts": GateCountsMetric()}
+        )
+
+        assert stats.pop("gate_counts") == dict(circuit.count_ops())
+        assert stats == reference_stats(circuit)
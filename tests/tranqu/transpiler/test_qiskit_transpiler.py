@@ -552,3 +552,34 @@ h q;
             for i in range(custom_dt_result.transpiled_program.num_qubits)
         )
         assert default_duration == custom_duration * 2
+
+    class TestTranspileMany:
+        def test_transpile_many_uses_single_transpile_call(self, tranqu: Tranqu):
+            circuits = []
+            for n_qubits in range(1, 4):
+                circuit = QuantumCircuit(n_qubits)
+                circuit.h(0)
+                circuit.h(0)
+                circuits.append(circuit)
+
+            results = tranqu.transpile_many(
+                circuits,
+                program_lib="qiskit",
+                transpiler_lib="qiskit",
+                transpiler_options={"optimization_level": 1},
+            )
+
+            assert [r.stats.before.n_qubits for r in results] == [1, 2, 3]
+            assert all(r.stats.after.n_gates == 0 for r in results)
+
+        def test_transpile_many_does_not_modify_options(self, tranqu: Tranqu):
+            options = {"optimization_level": 1}
+
+            tranqu.transpile_many(
+                [QuantumCircuit(1), QuantumCircuit(1)],
+                transpiler_lib="qiskit",
+                transpiler_options=options,
+                device=FakeSantiagoV2(),
+            )
+
+            assert options == {"optimization_level": 1}
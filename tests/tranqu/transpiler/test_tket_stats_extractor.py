@@ -0,0 +1,126 @@
+import pytest
+from pytket import Circuit, OpType  # type: ignore[attr-defined]
+from pytket.circuit import Node  # type: ignore[attr-defined]
+from pytket.extensions.qiskit import qiskit_to_tk  # type: ignore[attr-defined]
+from qiskit import QuantumCircuit  # type: ignore[import-untyped]
+from qiskit.circuit.random import random_circuit  # type: ignore[import-untyped]
+
+from tranqu.stats_metric import (
+    DeviceProperties,
+    GateCountsMetric,
+    InstructionProperties,
+    SuccessProbabilityMetric,
+    TwoQubitDepthMetric,
+)
+from tranqu.transpiler.qiskit_stats_extractor import QiskitStatsExtractor
+from tranqu.transpiler.tket_stats_extractor import TketStatsExtractor
+
+
+class RecordingDeviceProperties(DeviceProperties):
+    def __init__(self) -> None:
+        self.lookups: list[tuple[str, tuple[int, ...]]] = []
+
+    def instruction_properties(
+        self, name: str, qubits: tuple[int, ...]
+    ) -> InstructionProperties | None:
+        self.lookups.append((name, qubits))
+        return InstructionProperties(error=0.5)
+
+
+def reference_stats(circuit: Circuit) -> dict[str, int]:
+    # Counts each statistic in its own pass, as the extractor used to
+    return {
+        "n_qubits": circuit.n_qubits,
+        "n_gates": circuit.n_gates,
+        "n_gates_1q": sum(1 for cmd in circuit.get_commands() if len(cmd.qubits) == 1),
+        "n_gates_2q": sum(1 for cmd in circuit.get_commands() if len(cmd.qubits) == 2),
+        "depth": circuit.depth(),
+    }
+
+
+def corpus() -> list[Circuit]:
+    circuits = [
+        qiskit_to_tk(
+            random_circuit(
+                5, 8, max_operands=3, measure=seed % 2 == 0, seed=seed
+            ).decompose()
+        )
+        for seed in range(20)
+    ]
+
+    mixed = Circuit(3, 2)
+    mixed.H(0).CX(0, 1).Measure(0, 0)
+    mixed.add_barrier([0])
+    mixed.add_barrier([0, 1])
+    mixed.CCX(0, 1, 2)
+    mixed.add_gate(OpType.Reset, [1])
+    mixed.H(2, condition_bits=[0], condition_value=1)
+    mixed.add_c_setbits([True], [1])
+    circuits.extend((mixed, Circuit(2)))
+    return circuits
+
+
+class TestTketStatsExtractor:
+    def test_simple_circuit_counts(self):
+        circuit = Circuit(2).H(0).X(0).CX(0, 1)
+
+        stats = TketStatsExtractor.extract_stats_from(circuit)
+
+        assert stats == {
+            "n_qubits": 2,
+            "n_gates": 3,
+            "n_gates_1q": 2,
+            "n_gates_2q": 1,
+            "depth": 3,
+        }
+
+    @pytest.mark.parametrize("circuit", corpus())
+    def test_matches_reference_on_corpus(self, circuit: Circuit):
+        stats = TketStatsExtractor.extract_stats_from(circuit)
+
+        assert stats == reference_stats(circuit)
+
+    def test_depth_can_be_skipped(self):
+        circuit = Circuit(2).H(0).CX(0, 1)
+
+        stats = TketStatsExtractor.extract_stats_from(circuit, depth=False)
+
+        assert "depth" not in stats
+        assert stats["n_gates_2q"] == 1
+
+    def test_metrics_match_qiskit(self):
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.x(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1, 2], [0, 1, 2])
+        metrics = {
+            "gate_counts": GateCountsMetric(),
+            "depth_2q": TwoQubitDepthMetric(),
+        }
+
+        stats = TketStatsExtractor.extract_stats_from(
+            qiskit_to_tk(circuit), metrics=metrics
+        )
+        expected = QiskitStatsExtractor().extract_stats_from(circuit, metrics=metrics)
+
+        assert stats["gate_counts"] == expected["gate_counts"]
+        assert stats["depth_2q"] == expected["depth_2q"] == 3
+
+    def test_metrics_see_device_qubit_indices(self):
+        circuit = Circuit()
+        circuit.add_qubit(Node(3))
+        circuit.add_qubit(Node(1))
+        circuit.CX(Node(3), Node(1))
+        device_properties = RecordingDeviceProperties()
+
+        stats = TketStatsExtractor.extract_stats_from(
+            circuit,
+            metrics={"success_probability": SuccessProbabilityMetric()},
+            device_properties=device_properties,
+        )
+
+        assert device_properties.lookups == [("cx", (3, 1))]
+        assert stats["success_probability"] == pytest.approx(0.5)
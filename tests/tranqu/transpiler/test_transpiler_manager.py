@@ -3,6 +3,7 @@ from typing import Any
 import pytest
 
 from tranqu import Tranqu
+from tranqu.lazy_import import LazyFactory
 from tranqu.program_converter import ProgramConverter
 from tranqu.transpile_result import TranspileResult
 from tranqu.transpiler import (
@@ -92,3 +93,14 @@ class TestTranspilerManager:
 
         with pytest.raises(TranspilerNotFoundError):
             manager.fetch_transpiler("non_existent_transpiler")
+
+    def test_fetch_transpiler_created_by_lazy_factory(self):
+        manager = TranspilerManager()
+        manager.register_transpiler(
+            "nop", LazyFactory(__name__, "NopTranspiler", {"program_lib": "nop"})
+        )
+
+        transpiler = manager.fetch_transpiler("nop")
+
+        assert isinstance(transpiler, NopTranspiler)
+        assert manager.fetch_transpiler("nop") is transpiler